@@ -13,18 +13,28 @@ This command cancels a release by:
 6. Closing the related issue (if provided or found)
 
 All operations are idempotent and will succeed if resources don't exist.
+
+In batch mode (--pattern, --older-than, --keep-last) it cancels many
+releases in one run: the targets come from one database query, the API
+deletions run concurrently, and the tags are deleted with a single push.
 """
 
+import re
 import sys
-from typing import Optional, Tuple
+from datetime import datetime, timedelta
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 import click
 from rich.console import Console
 from rich.prompt import Confirm
+from rich.table import Table
 
 from ..config import Config
 from ..db import Database
 from ..github_utils import GitHubClient
 from ..models import SemanticVersion, PullRequest
+from ..operations import OperationGraph
 from ..policies import IssueExtractor
 
 console = Console()
@@ -36,7 +46,8 @@ def find_pr_for_issue_using_patterns(
     repo_full_name: str,
     config: Config,
     target_issue_number: int,
-    debug: bool = False
+    debug: bool = False,
+    all_prs: Optional[List[Dict[str, Any]]] = None
 ) -> Optional[int]:
     """
     Find PR associated with an issue using issue_policy.patterns.
@@ -53,6 +64,8 @@ def find_pr_for_issue_using_patterns(
         config: Config instance with issue_policy.patterns
         target_issue_number: Issue number to find PR for
         debug: Enable debug output
+        all_prs: PRs to check, as returned by Database.find_prs_for_issue
+            (default: load them from the database)
 
     Returns:
         PR number if found, None otherwise
@@ -65,7 +78,8 @@ def find_pr_for_issue_using_patterns(
 
     # Get all PRs (use issue_number=0 to get all, not filter by issue)
     # Increased limit to 1000 to ensure we don't miss PRs in large repos
-    all_prs = db.find_prs_for_issue(repo_full_name, issue_number=0, limit=1000)
+    if all_prs is None:
+        all_prs = db.find_prs_for_issue(repo_full_name, issue_number=0, limit=1000)
 
     if debug:
         console.print(f"[dim]Found {len(all_prs)} PRs to check[/dim]")
@@ -279,6 +293,103 @@ def _check_published_status(
     return True
 
 
+# Rough REST calls per batch step (repository lookup, object lookup, change)
+_CALLS_PER_STEP = 3
+
+_AGE_UNITS = {'h': 'hours', 'd': 'days', 'w': 'weeks'}
+
+
+def _parse_age(ctx, param, value: Optional[str]) -> Optional[timedelta]:
+    """Parse an age such as 12h, 30d or 6w (click callback)."""
+    if value is None:
+        return None
+    match = re.fullmatch(r'(\d+)([hdw])', value.strip().lower())
+    if not match:
+        raise click.BadParameter("expected a number followed by h, d or w (e.g. 30d)")
+    return timedelta(**{_AGE_UNITS[match.group(2)]: int(match.group(1))})
+
+
+def _version_sort_key(version: str):
+    """Sort key putting versions that do not parse before all others."""
+    try:
+        return (1, SemanticVersion.parse(version))
+    except ValueError:
+        return (0, version)
+
+
+def _select_batch_targets(
+    releases: List[Dict[str, Any]],
+    pattern: Optional[str],
+    older_than: Optional[timedelta],
+    keep_last: Optional[int],
+    force: bool,
+    now: datetime
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Pick the releases to cancel in batch mode.
+
+    Releases matching the version pattern are candidates; the keep_last
+    newest of them (by version) are kept, and of the rest only those
+    older than older_than (by publication, or creation for drafts) are
+    selected. Published releases are only selected with force.
+
+    Args:
+        releases: Rows from Database.get_release_cancel_targets
+        pattern: Shell-style version pattern (e.g. "9.2.*-rc.*"), None for all
+        older_than: Minimum age, None for any age
+        keep_last: Number of newest matching releases to keep, None to keep none
+        force: Whether published releases can be selected
+        now: Reference time for ages
+
+    Returns:
+        Tuple of (selected releases, published releases left out), oldest version first
+    """
+    matches = [release for release in releases if fnmatch(release['version'], pattern or '*')]
+    matches.sort(key=lambda release: _version_sort_key(release['version']), reverse=True)
+    if keep_last:
+        matches = matches[keep_last:]
+
+    selected = []
+    published = []
+    for release in reversed(matches):
+        if older_than is not None:
+            timestamp = release['published_at'] or release['created_at']
+            if not timestamp or now - datetime.fromisoformat(timestamp).replace(tzinfo=None) < older_than:
+                continue
+        if release['published_at'] and not force:
+            published.append(release)
+            continue
+        selected.append(release)
+    return selected, published
+
+
+def _find_release_pr(
+    db: Database,
+    repo_id: int,
+    repo_full_name: str,
+    config: Config,
+    version: str,
+    issue_number: Optional[int],
+    all_prs: List[Dict[str, Any]],
+    debug: bool = False
+) -> Optional[int]:
+    """
+    Find the PR of a release in a preloaded PR list (as _resolve_version_pr_issue does).
+
+    The version must appear as a whole token of the title or body, so
+    9.2.0-rc.1 does not match the PR of 9.2.0-rc.10.
+    """
+    mentions = re.compile(rf'(?<![\w.-])v?{re.escape(version)}(?![\w-]|\.\w)')
+    for pr in all_prs:
+        if mentions.search(pr.get('title') or '') or mentions.search(pr.get('body') or ''):
+            return pr.get('number')
+    if issue_number:
+        return find_pr_for_issue_using_patterns(
+            db, repo_id, repo_full_name, config, issue_number, debug, all_prs=all_prs
+        )
+    return None
+
+
 @click.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument('version', required=False)
 @click.option(
@@ -304,6 +415,20 @@ def _check_published_status(
     is_flag=True,
     help='Show what would be deleted without actually deleting'
 )
+@click.option(
+    '--pattern',
+    help='Batch mode: cancel the releases whose version matches a shell pattern (e.g. "9.2.*-rc.*")'
+)
+@click.option(
+    '--older-than',
+    callback=_parse_age,
+    help='Batch mode: only cancel releases older than an age (e.g. 12h, 30d, 6w)'
+)
+@click.option(
+    '--keep-last',
+    type=click.IntRange(min=0),
+    help='Batch mode: keep the N newest matching releases'
+)
 @click.pass_context
 def cancel(
     ctx,
@@ -311,7 +436,10 @@ def cancel(
     issue: Optional[int],
     pr: Optional[int],
     force: bool,
-    dry_run: bool
+    dry_run: bool,
+    pattern: Optional[str],
+    older_than: Optional[timedelta],
+    keep_last: Optional[int]
 ):
     """
     Cancel a release by deleting all associated resources.
@@ -326,6 +454,9 @@ def cancel(
 
     All operations are idempotent and stop on first failure.
 
+    With --pattern, --older-than or --keep-last it cancels every matching
+    release known to the database instead (published ones need --force).
+
     Examples:
 
       release-tool cancel 1.2.3-rc.1              # Cancel draft release
@@ -335,10 +466,17 @@ def cancel(
       release-tool cancel 1.2.3 --pr 42 --issue 1 # Cancel with specific PR and issue
 
       release-tool cancel 1.2.3 --dry-run         # Show what would be deleted
+
+      release-tool cancel --pattern '9.2.*-rc.*' --keep-last 1  # Prune old RCs
     """
     config: Config = ctx.obj['config']
     debug = ctx.obj.get('debug', False)
     assume_yes = ctx.obj.get('assume_yes', False)
+    batch = pattern is not None or older_than is not None or keep_last is not None
+
+    if batch and (version or pr or issue):
+        console.print("[red]Error: VERSION, --pr and --issue cannot be combined with --pattern, --older-than or --keep-last[/red]")
+        sys.exit(1)
 
     # Use first code repo as default
     if not config.repository.code_repos:
@@ -360,6 +498,12 @@ def cancel(
 
         repo_id = repo.id
 
+        if batch:
+            _cancel_batch(
+                ctx, config, db, repo_id, repo_full_name, pattern, older_than, keep_last, force, dry_run, debug
+            )
+            return
+
         # Auto-detect version, PR, and issue if not all provided
         version, pr_number, issue_number, issue_repo_full_name = _resolve_version_pr_issue(
             db, repo_id, repo_full_name, config, version, pr, issue, debug
@@ -487,6 +631,9 @@ def cancel(
             try:
                 # Delete release record
                 if db.delete_release(repo_id, version):
+                    # Steps of an interrupted push and what was published are undone too
+                    db.clear_push_journal(repo_full_name, version)
+                    db.clear_publish_state(repo_full_name, version)
                     console.print(f"  ✓ Deleted database records for {version}")
                     success_operations.append(f"Delete database records for {version}")
                 else:
@@ -522,3 +669,189 @@ def cancel(
 
     finally:
         db.close()
+
+
+def _cancel_batch(
+    ctx,
+    config: Config,
+    db: Database,
+    repo_id: int,
+    repo_full_name: str,
+    pattern: Optional[str],
+    older_than: Optional[timedelta],
+    keep_last: Optional[int],
+    force: bool,
+    dry_run: bool,
+    debug: bool
+) -> None:
+    """
+    Cancel every release selected by --pattern, --older-than and --keep-last.
+
+    Each release goes through the same operations as a single cancel. The
+    PRs, branches, GitHub releases and issues are handled concurrently
+    (see operations.py); the tags are deleted once all releases are, with
+    one push from the local clone (or through the API without a clone).
+    Database records are deleted when everything else succeeded. All
+    operations are idempotent, so a failed batch can simply be rerun.
+    """
+    releases = db.get_release_cancel_targets(repo_id, repo_full_name)
+    selected, published = _select_batch_targets(releases, pattern, older_than, keep_last, force, datetime.now())
+
+    if published:
+        console.print(
+            f"[yellow]Skipping {len(published)} published release(s) "
+            f"({', '.join(release['version'] for release in published)}). Use --force to cancel them.[/yellow]"
+        )
+    if not selected:
+        console.print("[yellow]No releases to cancel.[/yellow]")
+        return
+
+    # PRs are loaded once for all releases
+    all_prs = db.find_prs_for_issue(repo_full_name, 0, limit=1000)
+    for release in selected:
+        release['tag_name'] = release['tag_name'] or f"v{release['version']}"
+
+    # A PR is only closed if no other release (selected or kept) resolves to it
+    pr_owners: Dict[int, List[str]] = {}
+    for release in releases:
+        release['pr_number'] = _find_release_pr(
+            db, repo_id, repo_full_name, config, release['version'], release['issue_number'], all_prs, debug
+        )
+        if release['pr_number']:
+            pr_owners.setdefault(release['pr_number'], []).append(release['version'])
+    shared = {
+        release['pr_number']: pr_owners[release['pr_number']]
+        for release in selected
+        if release['pr_number'] and len(pr_owners[release['pr_number']]) > 1
+    }
+    if shared:
+        for number, versions in sorted(shared.items()):
+            console.print(f"[red]Error: PR #{number} belongs to several releases ({', '.join(versions)})[/red]")
+        console.print("[yellow]Cancel these releases one by one with --pr, or narrow the selection.[/yellow]")
+        sys.exit(1)
+
+    table = Table(title=f"Releases to cancel ({len(selected)})")
+    for column in ("Version", "Tag", "Status", "PR", "Issue"):
+        table.add_column(column)
+    for release in selected:
+        table.add_row(
+            release['version'],
+            release['tag_name'],
+            "published" if release['published_at'] else "draft",
+            f"#{release['pr_number']}" if release['pr_number'] else "-",
+            f"#{release['issue_number']}" if release['issue_number'] else "-",
+        )
+
+    if dry_run:
+        console.print("[bold yellow]DRY RUN - No changes will be made[/bold yellow]")
+    console.print(table)
+
+    if dry_run:
+        console.print("\n[dim]Dry run complete. Use without --dry-run to execute.[/dim]")
+        return
+
+    if not ctx.obj.get('assume_yes', False) and not ctx.obj.get('auto', False):
+        if not Confirm.ask(f"[yellow]Cancel {len(selected)} release(s)?[/yellow]"):
+            console.print("[yellow]Cancelled by user.[/yellow]")
+            sys.exit(0)
+
+    github_client = GitHubClient(config)
+    issue_repo = config.get_issue_repos()[0]
+    code_repo = config.repository.code_repos[0]
+    repo_path = Path(config.get_code_repo_path(code_repo.alias))
+    git_ops = None
+    if (repo_path / ".git").exists():
+        from ..git_ops import GitOperations
+        git_ops = GitOperations(str(repo_path))
+
+    def succeeded(ok: bool, action: str) -> None:
+        if not ok:
+            raise RuntimeError(f"Failed to {action}")
+
+    def close_pr(number):
+        def run(results):
+            pr_obj = github_client.get_pull_request(repo_full_name, number)
+            succeeded(github_client.close_pull_request(repo_full_name, number), f"close PR #{number}")
+            return pr_obj.head.ref if pr_obj else None
+        return run
+
+    def delete_branch(step):
+        def run(results):
+            branch_name = results[step]
+            if branch_name:
+                succeeded(github_client.delete_branch(repo_full_name, branch_name), f"delete branch {branch_name}")
+            return branch_name
+        return run
+
+    def delete_release(tag_name):
+        def run(results):
+            succeeded(github_client.delete_release(repo_full_name, tag_name), f"delete GitHub release {tag_name}")
+            return tag_name
+        return run
+
+    def delete_api_tag(tag_name):
+        def run(results):
+            succeeded(github_client.delete_tag(repo_full_name, tag_name), f"delete git tag {tag_name}")
+            return tag_name
+        return run
+
+    def close_issue(number):
+        def run(results):
+            succeeded(github_client.close_issue(issue_repo, number), f"close issue #{number}")
+            return number
+        return run
+
+    graph = OperationGraph()
+    release_steps = []
+    for release in selected:
+        version = release['version']
+        if release['pr_number']:
+            step = graph.add(f"pr:{version}", close_pr(release['pr_number']))
+            graph.add(f"branch:{version}", delete_branch(step), requires=[step])
+        release_steps.append(graph.add(f"release:{version}", delete_release(release['tag_name'])))
+        if release['issue_number']:
+            graph.add(f"issue:{version}", close_issue(release['issue_number']))
+        if git_ops is None:
+            # Tags go after their release, which would otherwise become untagged
+            graph.add(f"tag:{version}", delete_api_tag(release['tag_name']), requires=[f"release:{version}"])
+
+    tag_names = [release['tag_name'] for release in selected]
+    if git_ops is not None:
+        def delete_tags(results):
+            deleted = git_ops.delete_remote_tags(tag_names)
+            console.print(f"  ✓ Deleted {len(deleted)} git tag(s) with one push"
+                          + (f" ({len(tag_names) - len(deleted)} already gone)" if len(deleted) < len(tag_names) else ""))
+            return deleted
+
+        graph.add('tags', delete_tags, requires=release_steps)
+
+    api_steps = len(graph) - ('tags' in graph)
+    budget = github_client.get_rate_limit_budget()
+    if budget is not None:
+        remaining, reset = budget
+        needed = api_steps * _CALLS_PER_STEP
+        if needed > remaining:
+            console.print(
+                f"[red]Error: Cancelling {len(selected)} release(s) needs about {needed} API calls, "
+                f"but only {remaining} are left until {datetime.fromtimestamp(reset):%H:%M}.[/red]"
+            )
+            console.print("[yellow]Narrow the selection (e.g. --keep-last or --older-than) or wait for the reset.[/yellow]")
+            sys.exit(1)
+
+    console.print(f"\n[bold]Cancelling {len(selected)} release(s)...[/bold]")
+    try:
+        graph.run()
+    except Exception as e:
+        console.print(f"[red]✗ {e}[/red]")
+        console.print("[red]Stopping due to failure. Rerun the same command to retry (all operations are idempotent).[/red]")
+        sys.exit(1)
+
+    for release in selected:
+        if not db.delete_release(repo_id, release['version']):
+            console.print(f"[red]✗ Failed to delete database records for {release['version']}[/red]")
+            sys.exit(1)
+        db.clear_push_journal(repo_full_name, release['version'])
+        db.clear_publish_state(repo_full_name, release['version'])
+
+    console.print(f"\n[bold green]✓ Successfully cancelled {len(selected)} release(s)[/bold green]")
+    console.print(f"[dim]Operations completed: {len(graph)}[/dim]")
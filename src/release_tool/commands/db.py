@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Database maintenance commands for release-tool."""
+
+from datetime import datetime, timedelta
+from typing import Optional
+import click
+from rich.console import Console
+
+from ..config import Config
+from ..db import Database
+
+console = Console()
+
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count for display (e.g., 1.2 MB)."""
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@click.group(context_settings={'help_option_names': ['-h', '--help']})
+def db():
+    """Maintain the local release-tool database."""
+
+
+@db.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option(
+    '--retention-days',
+    type=click.IntRange(min=0),
+    default=None,
+    help='Drop bodies of issues closed more than this many days ago '
+         '(pre-extracted description/migration notes are kept)'
+)
+@click.pass_context
+def compact(ctx, retention_days: Optional[int]):
+    """
+    Compact the database.
+
+    Compresses issue bodies stored by older versions, optionally drops old
+    issue bodies, and vacuums the database file.
+
+    Examples:
+
+      release-tool db compact
+
+      release-tool db compact --retention-days 365
+    """
+    config: Config = ctx.obj['config']
+
+    database = Database(config.database.path)
+    database.connect()
+
+    try:
+        # Make sure note sections are extracted before any body is dropped
+        database.configure_note_sections(
+            config.issue_policy.description_section_regex,
+            config.issue_policy.migration_section_regex
+        )
+
+        cutoff = None
+        if retention_days is not None:
+            cutoff = datetime.now() - timedelta(days=retention_days)
+
+        console.print(f"[blue]Compacting {config.database.path}...[/blue]")
+        stats = database.compact(drop_bodies_before=cutoff)
+
+        console.print(f"  Compressed issue bodies: {stats['compressed']}")
+        if cutoff:
+            console.print(
+                f"  Dropped bodies closed before {cutoff.date().isoformat()}: {stats['dropped']}"
+            )
+        console.print(
+            f"[green]✓ Size: {_format_size(stats['size_before'])} → "
+            f"{_format_size(stats['size_after'])}[/green]"
+        )
+    finally:
+        database.close()
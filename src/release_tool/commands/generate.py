@@ -2,9 +2,14 @@
 #
 # SPDX-License-Identifier: MIT
 
+import os
 import sys
 import click
-from typing import Optional, List, Set
+import tempfile
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Optional, List, Set, Callable, TextIO
 from collections import defaultdict
 from rich.console import Console
 
@@ -12,6 +17,7 @@ from ..config import Config, PolicyAction, DetectMode, OutputFormat, VersionBump
 from ..db import Database
 from ..github_utils import GitHubClient
 from ..git_ops import GitOperations, get_release_commit_range, determine_release_branch_strategy, find_comparison_version, find_comparison_version_for_docs
+from ..media_utils import ASSET_FILE_MODE
 from ..models import SemanticVersion
 from ..template_utils import render_template, TemplateError, build_repo_context
 from ..policies import (
@@ -22,7 +28,8 @@ from ..policies import (
     PartialIssueMatch,
     PartialIssueReason
 )
-from ..media_utils import MediaDownloader
+from ..profiling import cache as record_cache, timed
+from ..release_plan import content_hash, plan_path, write_plan
 
 console = Console()
 
@@ -107,10 +114,11 @@ def _filter_changes_by_repos(consolidated_changes: List, target_repo_aliases: Op
 @click.option('--new', type=click.Choice([e.value for e in VersionBumpType], case_sensitive=False), help='Auto-bump version')
 @click.option('--detect-mode', type=click.Choice([e.value for e in DetectMode], case_sensitive=False), default=DetectMode.PUBLISHED.value, help='Detection mode for existing releases (default: published)')
 @click.option('--format', type=click.Choice([e.value for e in OutputFormat], case_sensitive=False), default=OutputFormat.MARKDOWN.value, help='Output format (default: markdown)')
+@click.option('--stream', is_flag=True, help='Render pr_code templates and the draft straight to their files (bounded memory for very large releases)')
 @click.pass_context
 def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path: Optional[str],
              output: Optional[str], dry_run: bool, new: Optional[str], detect_mode: str,
-             format: str):
+             format: str, stream: bool = False):
     """
     Generate release notes for a version.
 
@@ -133,6 +141,8 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
       release-tool generate --new patch --repo-path /custom/path
 
       release-tool generate 9.2 --new patch
+
+      release-tool generate 10.0.0 --stream
     """
     # Get debug flag from global context
     debug = ctx.obj.get('debug', False)
@@ -371,6 +381,10 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
     # Initialize database once (shared across all repos)
     db = Database(config.database.path)
     db.connect()
+    db.configure_note_sections(
+        config.issue_policy.description_section_regex,
+        config.issue_policy.migration_section_regex
+    )
 
     try:
         # Loop through each repo that has pr_code configuration
@@ -504,7 +518,7 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
 
             # Determine release branch strategy
             # Fetch remote refs first to ensure accurate branch detection
-            git_ops.fetch_remote_refs()
+            refs_fetched_at = datetime.now().isoformat() if git_ops.fetch_remote_refs() else None
             available_versions = git_ops.get_version_tags()
             release_branch, source_branch, should_create_branch = determine_release_branch_strategy(
                 target_version,
@@ -523,6 +537,7 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                 console.print(f"[blue]→ Using existing branch (analyzing commits from {release_branch})[/blue]")
 
             # Create branch if needed (unless dry-run)
+            branch_created = False
             if should_create_branch and config.branch_policy.create_branches:
                 if dry_run:
                     console.print(f"[yellow]DRY RUN: Would create branch '{release_branch}' from '{source_branch}'[/yellow]")
@@ -533,6 +548,7 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
 
                         # Create the new release branch
                         git_ops.create_branch(release_branch, source_branch)
+                        branch_created = True
                         console.print(f"[green]✓ Created branch '{release_branch}' from '{source_branch}'[/green]")
 
                         # Optionally checkout the new branch
@@ -546,6 +562,7 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                 console.print(f"[yellow]→ Branch creation disabled in config[/yellow]")
 
             # Helper function to generate notes for a specific comparison policy
+            @timed('generate.notes_for_policy')
             def generate_notes_for_policy(policy: ReleaseVersionPolicy, explicit_from_ver: Optional[SemanticVersion] = None):
                 """Generate release notes using the specified version comparison policy."""
                 # Determine comparison version
@@ -623,13 +640,23 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
 
                 console.print(f"[blue]Found {len(commits)} commits for policy '{policy}'[/blue]")
 
-                # Convert git commits to models
+                # Load commits indexed by pull; only convert the ones not indexed yet
+                indexed_commits = db.get_commits_by_shas(repo_id, [c.hexsha for c in commits])
+                record_cache('commit_index', hits=len(indexed_commits), misses=len(commits) - len(indexed_commits))
                 commit_models = []
                 for git_commit in commits:
-                    commit_model = git_ops.commit_to_model(git_commit, repo_id)
-                    db.upsert_commit(commit_model)
+                    commit_model = indexed_commits.get(git_commit.hexsha)
+                    if commit_model is None:
+                        commit_model = git_ops.commit_to_model(git_commit, repo_id)
+                        db.upsert_commit(commit_model)
                     commit_models.append(commit_model)
 
+                if debug:
+                    console.print(
+                        f"[dim]Commit index: {len(indexed_commits)} cached, "
+                        f"{len(commits) - len(indexed_commits)} converted from git[/dim]"
+                    )
+
                 # Build PR map
                 pr_map = {}
                 for commit in commit_models:
@@ -880,6 +907,7 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                 # Process each pr_code template with its own policy's notes
                 elif repo_pr_code.templates:
                     note_generator = ReleaseNoteGenerator(config)
+                    jobs = []
 
                     for idx, template_config in enumerate(repo_pr_code.templates):
                         template_policy = template_config.release_version_policy
@@ -892,10 +920,6 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                         # Set output_file_type for pr_code templates: code-0, code-1, etc.
                         path_context['output_file_type'] = f'code-{idx}'
 
-                        # Get grouped_notes for this template's policy
-                        policy_data = notes_by_policy[template_policy]
-                        grouped_notes = policy_data['grouped_notes']
-
                         # Render output path using draft_output_path (not template_config.output_path)
                         # This ensures all drafts are in one predictable location
                         try:
@@ -904,24 +928,14 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                             console.print(f"[red]Error rendering draft_output_path for pr_code template #{idx}: {e}[/red]")
                             sys.exit(1)
 
-                        # Initialize media downloader if enabled
-                        media_downloader = None
-                        if config.output.download_media and output_path:
-                            media_downloader = MediaDownloader(
-                                config.output.assets_path,
-                                download_enabled=True
-                            )
-
-                        # Format using pr_code template directly
-                        content = note_generator._format_with_pr_code_template(
+                        # Format using pr_code template directly, with this template's policy's notes
+                        jobs.append((output_path, partial(
+                            note_generator._format_with_pr_code_template,
                             template_config.output_template,
-                            grouped_notes,
+                            notes_by_policy[template_policy]['grouped_notes'],
                             version,
-                            output_path,
-                            media_downloader
-                        )
-
-                        formatted_outputs.append({'content': content, 'path': output_path})
+                            output_path
+                        )))
 
                     # ALWAYS write draft file in addition to pr_code templates
                     # Draft file uses DEFAULT_RELEASE_NOTES_TEMPLATE for GitHub releases
@@ -930,32 +944,34 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                         draft_context = template_context.copy()
                         draft_context['output_file_type'] = 'release'
                         draft_path = render_template(config.output.draft_output_path, draft_context)
-
-                        # Use INCLUDE_RCS policy notes for draft (for GitHub releases)
-                        policy_data = notes_by_policy[ReleaseVersionPolicy.INCLUDE_RCS]
-                        draft_grouped_notes = policy_data['grouped_notes']
-
-                        # Initialize media downloader if enabled
-                        draft_media_downloader = None
-                        if config.output.download_media and draft_path:
-                            draft_media_downloader = MediaDownloader(
-                                config.output.assets_path,
-                                download_enabled=True
-                            )
-
-                        # Format using DEFAULT_RELEASE_NOTES_TEMPLATE directly (for GitHub releases)
-                        draft_content = note_generator._format_with_master_template(
-                            draft_grouped_notes,
-                            version,
-                            draft_path,
-                            draft_media_downloader
-                        )
-
-                        formatted_outputs.append({'content': draft_content, 'path': draft_path})
-
                     except TemplateError as e:
                         console.print(f"[red]Error rendering draft_output_path: {e}[/red]")
                         sys.exit(1)
+                    jobs.append((draft_path, partial(
+                        note_generator._format_with_master_template,
+                        notes_by_policy[ReleaseVersionPolicy.INCLUDE_RCS]['grouped_notes'],
+                        version,
+                        draft_path
+                    )))
+
+                    # Render all outputs concurrently, sharing note contexts and media
+                    with note_generator.shared_rendering():
+                        media_store = None
+                        if config.output.download_media:
+                            media_store = note_generator.prefetch_media(
+                                [policy_data['grouped_notes'] for policy_data in notes_by_policy.values()]
+                            )
+
+                        def render_job(output_path: str, render: Callable) -> dict:
+                            media_downloader = note_generator._media_downloader(output_path, media_store)
+                            if stream and not dry_run:
+                                written = _stream_to_file(output_path, lambda out: render(media_downloader, out=out))
+                                return {'content': None, 'path': output_path, 'streamed': written}
+                            return {'content': render(media_downloader), 'path': output_path}
+
+                        formatted_outputs = note_generator.render_concurrently(
+                            [partial(render_job, output_path, render) for output_path, render in jobs]
+                        )
 
                 # Backward compatibility: support old doc_output_path config
                 elif config.release_notes.doc_output_template:
@@ -1008,7 +1024,13 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                 # Write all output files
                 written_files = []
                 for output_data in formatted_outputs:
-                    if output_data['path'] and output_data['content']:
+                    if output_data.get('streamed'):
+                        # Already rendered straight to the file
+                        output_path_obj = Path(output_data['path'])
+                        written_files.append(output_path_obj.absolute())
+                        console.print(f"[green]✓ Release notes written to:[/green]")
+                        console.print(f"[green]  {output_path_obj.absolute()}[/green]")
+                    elif output_data['path'] and output_data['content']:
                         output_path_obj = Path(output_data['path'])
                         output_path_obj.parent.mkdir(parents=True, exist_ok=True)
                         output_path_obj.write_text(output_data['content'])
@@ -1016,6 +1038,20 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
                         console.print(f"[green]✓ Release notes written to:[/green]")
                         console.print(f"[green]  {output_path_obj.absolute()}[/green]")
 
+                if written_files and not output and format_enum != OutputFormat.JSON:
+                    # Let push reuse what was resolved here (see release_plan.py)
+                    if repo_pr_code.templates:
+                        comparison_versions = {
+                            policy.value: data['comparison_version']
+                            for policy, data in notes_by_policy.items()
+                        }
+                    else:
+                        comparison_versions = {ReleaseVersionPolicy.INCLUDE_RCS.value: comparison_version}
+                    _write_release_plan(
+                        config, repo_info, git_ops, version, comparison_versions, release_branch, source_branch,
+                        should_create_branch, branch_created, refs_fetched_at, written_files
+                    )
+
                 if written_files:
                     first_file = written_files[0]
                     console.print(f"[blue]→ Review and edit the files, then use 'release-tool push {version} -f {first_file}' to upload to GitHub[/blue]")
@@ -1033,6 +1069,104 @@ def generate(ctx, version: Optional[str], from_version: Optional[str], repo_path
         db.close()
 
 
+def _write_release_plan(
+    config: Config,
+    repo_info,
+    git_ops: GitOperations,
+    version: str,
+    comparison_versions: dict,
+    release_branch: str,
+    source_branch: str,
+    should_create_branch: bool,
+    branch_created: bool,
+    refs_fetched_at: Optional[str],
+    draft_files: List[Path]
+) -> None:
+    """
+    Write the release plan of a repository next to its drafts (see release_plan.py).
+
+    Args:
+        config: Configuration object
+        repo_info: Code repository the drafts belong to
+        git_ops: Git operations of the repository
+        version: Release version
+        comparison_versions: Comparison version (or None) of each version policy
+        release_branch: Release branch
+        source_branch: Branch the release branch is created from
+        should_create_branch: Whether the release branch did not exist
+        branch_created: Whether the release branch was created locally here
+        refs_fetched_at: When the remote refs were fetched (None if the fetch failed)
+        draft_files: Draft files written
+    """
+    # The commit the notes were generated from
+    head_ref = source_branch if should_create_branch else release_branch
+    head_sha = None
+    for ref in (head_ref, f"origin/{head_ref}"):
+        try:
+            head_sha = git_ops.repo.commit(ref).hexsha
+            head_ref = ref
+            break
+        except Exception:
+            continue
+
+    path = plan_path(config, repo_info.alias, version)
+    try:
+        write_plan(path, {
+            'repo': repo_info.link,
+            'version': version,
+            'comparison_versions': {
+                policy: comparison.to_string() if comparison else None
+                for policy, comparison in comparison_versions.items()
+            },
+            'release_branch': release_branch,
+            'source_branch': source_branch,
+            # What push would work out now: a branch created here exists
+            'should_create_branch': should_create_branch and not branch_created,
+            'head_ref': head_ref,
+            'head_sha': head_sha,
+            'refs_fetched_at': refs_fetched_at,
+            'drafts': [
+                {'path': str(draft), 'sha256': content_hash(draft.read_text())}
+                for draft in draft_files
+            ],
+        })
+    except (OSError, TemplateError) as e:
+        console.print(f"[yellow]Warning: Could not write release plan: {e}[/yellow]")
+        return
+    console.print(f"[dim]Release plan written to {path}[/dim]")
+
+
+def _stream_to_file(path: str, render: Callable[[TextIO], None]) -> bool:
+    """
+    Stream rendered release notes into a file.
+
+    Content is written to a temporary file next to the target and renamed
+    into place, so a failed render never leaves a truncated file behind.
+    Empty output is discarded, matching the non-streaming behavior.
+
+    Args:
+        path: Output file path
+        render: Callable writing the content to the given text file
+
+    Returns:
+        True if the file was written
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as out:
+            render(out)
+        if os.path.getsize(tmp_name) == 0:
+            return False
+        os.chmod(tmp_name, ASSET_FILE_MODE)
+        os.replace(tmp_name, target)
+        return True
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
 def _get_extraction_source(change, commits_map=None, prs_map=None):
     """
     Get human-readable description of where a issue was extracted from.
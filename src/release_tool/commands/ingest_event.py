@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Event ingestion command for release-tool."""
+
+import json
+import os
+import sys
+from typing import Optional, Tuple
+import click
+from rich.console import Console
+
+from ..config import Config
+from ..db import Database
+from ..event_ingest import EventIngestor, SUPPORTED_EVENTS, detect_event_name
+
+console = Console()
+
+
+@click.command('ingest-event', context_settings={'help_option_names': ['-h', '--help']})
+@click.argument('payload_files', nargs=-1, type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option(
+    '--event-name', '-e',
+    type=click.Choice(sorted(SUPPORTED_EVENTS)),
+    default=None,
+    help='GitHub event name (default: $GITHUB_EVENT_NAME for $GITHUB_EVENT_PATH, '
+         'otherwise detected from each payload)'
+)
+@click.pass_context
+def ingest_event(ctx, payload_files: Tuple[str, ...], event_name: Optional[str]):
+    """
+    Ingest GitHub event payloads into the local database (no API calls).
+
+    Upserts the issue, merged pull request, release or pushed commits
+    carried by webhook or GitHub Actions event payloads, so the database
+    reflects the triggering change without a full pull. Without arguments,
+    reads the payload of the running GitHub Actions workflow
+    ($GITHUB_EVENT_PATH). Use - to read a payload from stdin.
+
+    Examples:
+
+      release-tool ingest-event
+
+      release-tool ingest-event issue-opened.json pr-merged.json
+
+      release-tool ingest-event --event-name release release.json
+    """
+    config: Config = ctx.obj['config']
+    debug = ctx.obj.get('debug', False)
+
+    if not payload_files:
+        event_path = os.environ.get('GITHUB_EVENT_PATH')
+        if not event_path:
+            console.print("[red]Error: No payload files given and GITHUB_EVENT_PATH is not set[/red]")
+            sys.exit(1)
+        payload_files = (event_path,)
+        event_name = event_name or os.environ.get('GITHUB_EVENT_NAME')
+
+    db = Database(config.database.path)
+    db.connect()
+    db.configure_note_sections(
+        config.issue_policy.description_section_regex,
+        config.issue_policy.migration_section_regex
+    )
+
+    try:
+        ingestor = EventIngestor(config, db)
+        totals = {'issues': 0, 'pull_requests': 0, 'releases': 0, 'releases_deleted': 0, 'commits': 0}
+
+        for payload_file in payload_files:
+            try:
+                with click.open_file(payload_file, 'r', encoding='utf-8') as f:
+                    payload = json.load(f)
+            except (OSError, ValueError) as e:
+                console.print(f"[red]Error: Could not read event payload {payload_file}: {e}[/red]")
+                sys.exit(1)
+
+            name = event_name or detect_event_name(payload) or 'unknown'
+            stats = ingestor.ingest(name, payload)
+            for key in totals:
+                totals[key] += stats[key]
+
+            label = f"{name} ({payload['action']})" if payload.get('action') else name
+            if stats['skipped']:
+                console.print(f"  [yellow]Skipped {label} from {payload_file}: {stats['skipped']}[/yellow]")
+            elif debug:
+                console.print(f"  [dim]Ingested {label} from {payload_file}[/dim]")
+
+        console.print(
+            f"[green]✓ Ingested {totals['issues']} issue(s), {totals['pull_requests']} PR(s), "
+            f"{totals['releases']} release(s), {totals['commits']} commit(s)[/green]"
+        )
+        if totals['releases_deleted']:
+            console.print(f"  Deleted {totals['releases_deleted']} release(s)")
+    finally:
+        db.close()
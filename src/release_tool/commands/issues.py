@@ -4,13 +4,12 @@
 
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, TextIO
 import click
 from rich.console import Console
 from rich.table import Table
 import csv
 import json
-from io import StringIO
 import re
 
 from ..config import Config
@@ -62,14 +61,20 @@ def _parse_issue_key_arg(issue_key_arg: str) -> tuple[Optional[str], Optional[st
     return None, issue_key_arg, is_proximity
 
 
-def _display_issues_table(issues: List, limit: int, offset: int):
+def _display_issues_table(issues: List, limit: int, offset: int, after: Optional[str] = None):
     """Display issues in a formatted table."""
     if not issues:
         console.print("[yellow]No issues found.[/yellow]")
         console.print("[dim]Tip: Run 'release-tool pull' to fetch latest issues.[/dim]")
         return
 
-    table = Table(title="Issues" if offset == 0 else f"Issues (offset: {offset})")
+    if after:
+        title = "Issues (continued)"
+    elif offset:
+        title = f"Issues (offset: {offset})"
+    else:
+        title = "Issues"
+    table = Table(title=title)
     table.add_column("Key", style="cyan", no_wrap=True)
     table.add_column("Repository", style="blue")
     table.add_column("Title")
@@ -102,22 +107,42 @@ def _display_issues_table(issues: List, limit: int, offset: int):
 
     # Show pagination info
     total_shown = len(issues)
-    start_num = offset + 1
-    end_num = offset + total_shown
 
-    if total_shown == limit:
-        console.print(f"\n[dim]Showing {start_num}-{end_num} issues (use --offset to see more)[/dim]")
+    if after:
+        summary = f"Showing {total_shown} issues"
     else:
-        console.print(f"\n[dim]Showing {start_num}-{end_num} issues (all results)[/dim]")
-
+        summary = f"Showing {offset + 1}-{offset + total_shown} issues"
 
-def _display_issues_csv(issues: List):
-    """Display issues in CSV format."""
-    if not issues:
-        return
-
-    # Use StringIO to build CSV, then print
-    output = StringIO()
+    if total_shown == limit:
+        next_cursor = Database.encode_issue_cursor(issues[-1])
+        console.print(f"\n[dim]{summary} (use --after '{next_cursor}' to see more)[/dim]")
+    else:
+        console.print(f"\n[dim]{summary} (all results)[/dim]")
+
+
+def _issue_export_row(issue) -> dict:
+    """Flatten an issue into the fields exported by CSV/JSON output."""
+    return {
+        'id': issue.id,
+        'repo_id': issue.repo_id,
+        'number': issue.number,
+        'key': issue.key,
+        'title': issue.title,
+        'body': issue.body[:500] if issue.body else "",  # Truncate long bodies
+        'state': issue.state,
+        'labels': [l.name for l in issue.labels],
+        'url': issue.url or "",
+        'created_at': issue.created_at.isoformat() if issue.created_at else "",
+        'closed_at': issue.closed_at.isoformat() if issue.closed_at else "",
+        'category': issue.category or "",
+        'tags': issue.tags,
+        'repo_full_name': getattr(issue, '_repo_full_name', '')
+    }
+
+
+def _display_issues_csv(issues: Iterable, out: TextIO = None):
+    """Stream issues in CSV format (one row written per issue, nothing buffered)."""
+    out = out or sys.stdout
 
     # Define all fields to export
     fieldnames = [
@@ -126,44 +151,42 @@ def _display_issues_csv(issues: List):
         'repo_full_name'
     ]
 
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
-    writer.writeheader()
-
+    writer = None
     for issue in issues:
-        row = {
-            'id': issue.id,
-            'repo_id': issue.repo_id,
-            'number': issue.number,
-            'key': issue.key,
-            'title': issue.title,
-            'body': issue.body[:500] if issue.body else "",  # Truncate long bodies
-            'state': issue.state,
-            'labels': json.dumps([l.name for l in issue.labels]),
-            'url': issue.url or "",
-            'created_at': issue.created_at.isoformat() if issue.created_at else "",
-            'closed_at': issue.closed_at.isoformat() if issue.closed_at else "",
-            'category': issue.category or "",
-            'tags': json.dumps(issue.tags),
-            'repo_full_name': getattr(issue, '_repo_full_name', '')
-        }
+        if writer is None:
+            # Only emit a header when there is at least one row
+            writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+        row = _issue_export_row(issue)
+        row['labels'] = json.dumps(row['labels'])
+        row['tags'] = json.dumps(row['tags'])
         writer.writerow(row)
 
-    # Print to stdout (user can redirect with >)
-    print(output.getvalue(), end='')
+
+def _display_issues_json(issues: Iterable, out: TextIO = None):
+    """Stream issues as a JSON array, writing each element as it is read."""
+    out = out or sys.stdout
+
+    out.write('[')
+    for index, issue in enumerate(issues):
+        out.write(',\n' if index else '\n')
+        out.write(json.dumps(_issue_export_row(issue)))
+    out.write('\n]\n')
 
 
 @click.command(name='issues', context_settings={'help_option_names': ['-h', '--help']})
 @click.argument('issue_key', required=False)
 @click.option('--repo', '-r', help='Filter by repository (owner/name)')
-@click.option('--limit', '-n', type=int, default=20, help='Max number of results (default: 20)')
+@click.option('--limit', '-n', type=int, default=20, help='Max number of results (default: 20, use 0 for all)')
 @click.option('--offset', type=int, default=0, help='Skip first N results (for pagination)')
-@click.option('--format', '-f', 'output_format', type=click.Choice(['table', 'csv']), default='table', help='Output format')
+@click.option('--after', 'after_cursor', help='Continue after this cursor (keyset pagination, printed by table output)')
+@click.option('--format', '-f', 'output_format', type=click.Choice(['table', 'csv', 'json']), default='table', help='Output format (csv/json are streamed)')
 @click.option('--starts-with', help='Find issues starting with prefix (fuzzy match)')
 @click.option('--ends-with', help='Find issues ending with suffix (fuzzy match)')
 @click.option('--close-to', help='Find issues numerically close to this number')
 @click.option('--range', 'close_range', type=int, default=10, help='Range for --close-to (default: ±10)')
 @click.pass_context
-def issues(ctx, issue_key, repo, limit, offset, output_format, starts_with, ends_with, close_to, close_range):
+def issues(ctx, issue_key, repo, limit, offset, after_cursor, output_format, starts_with, ends_with, close_to, close_range):
     """Query issues from local database (offline).
 
     IMPORTANT: This command works offline and only searches pulled data.
@@ -195,6 +218,8 @@ def issues(ctx, issue_key, repo, limit, offset, output_format, starts_with, ends
       release-tool issues --close-to 8624 --range 50
 
       release-tool issues --repo sequentech/meta --format csv > issues.csv
+
+      release-tool issues --limit 0 --format json > issues.json
     """
     config: Config = ctx.obj['config']
 
@@ -231,14 +256,21 @@ def issues(ctx, issue_key, repo, limit, offset, output_format, starts_with, ends
         console.print("[red]Error: --range must be >= 0[/red]")
         sys.exit(1)
 
-    if limit <= 0:
-        console.print("[red]Error: --limit must be > 0[/red]")
+    if limit < 0:
+        console.print("[red]Error: --limit must be >= 0[/red]")
         sys.exit(1)
 
     if offset < 0:
         console.print("[red]Error: --offset must be >= 0[/red]")
         sys.exit(1)
 
+    if after_cursor:
+        try:
+            Database.decode_issue_cursor(after_cursor)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            sys.exit(1)
+
     # Cannot combine close_to with starts_with or ends_with
     if close_to and (starts_with or ends_with):
         console.print("[red]Error: Cannot combine --close-to with --starts-with or --ends-with[/red]")
@@ -278,24 +310,29 @@ def issues(ctx, issue_key, repo, limit, offset, output_format, starts_with, ends
             sys.exit(1)
         repo_id = repo_obj.id
 
-    # Query issues
+    # Query issues (streamed; only the table output materializes the page)
     try:
-        issues = db.query_issues(
+        issues = db.iter_issues(
             issue_key=issue_key,
             repo_id=repo_id,
             starts_with=starts_with,
             ends_with=ends_with,
             close_to=close_to,
             close_range=close_range,
-            limit=limit,
-            offset=offset
+            limit=limit or None,
+            offset=offset,
+            after=after_cursor
         )
+
+        # Display results
+        if output_format == 'table':
+            _display_issues_table(list(issues), limit, offset, after_cursor)
+        elif output_format == 'json':
+            _display_issues_json(issues)
+        else:
+            _display_issues_csv(issues)
     except Exception as e:
         console.print(f"[red]Error querying issues: {e}[/red]")
         sys.exit(1)
-
-    # Display results
-    if output_format == 'table':
-        _display_issues_table(issues, limit, offset)
-    else:
-        _display_issues_csv(issues)
+    finally:
+        db.close()
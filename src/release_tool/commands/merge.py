@@ -8,6 +8,10 @@ This command automates the final steps of the release process by:
 1. Merging the associated PR (if not already merged)
 2. Marking the release as published (from draft to published)
 3. Closing the related issue (if not already closed)
+
+Each finished step is recorded in the publish state shared with `push`
+(see Database.get_publish_state), so running merge again makes no GitHub
+calls for the steps already done.
 """
 
 import sys
@@ -21,7 +25,7 @@ from rich.table import Table
 from rich.prompt import Prompt
 
 from ..config import Config
-from ..db import Database
+from ..db import Database, publish_hash
 from ..github_utils import GitHubClient
 from ..models import SemanticVersion
 
@@ -460,8 +464,11 @@ def _resolve_version_pr_issue(
 @click.option('--issue', type=int, help='Issue number to associate with release')
 @click.option('--pr', type=int, help='PR number to merge (auto-detected if not provided)')
 @click.option('--dry-run', is_flag=True, help='Show what would be done without executing')
+@click.option('--skip-unchanged/--no-skip-unchanged', default=True,
+              help='Skip the steps a previous merge or push already did, as recorded locally (default: skip)')
 @click.pass_context
-def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int], dry_run: bool):
+def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int], dry_run: bool,
+          skip_unchanged: bool):
     """
     Merge a release by:
     1. Merging the associated PR (if not already merged)
@@ -504,7 +511,7 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
 
     # Initialize clients
     github_client = GitHubClient(config)
-    db = Database()
+    db = Database(config.database.path)
     db.connect()
 
     try:
@@ -524,6 +531,12 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
         if not resolved_version:
             sys.exit(1)
 
+        # What earlier pushes and merges of this release already did on GitHub
+        published = db.get_publish_state(repo_full_name, resolved_version) if skip_unchanged and not dry_run else {}
+
+        def already_done(artifact: str, content_hash: str) -> bool:
+            return published.get(artifact, {}).get('hash') == content_hash
+
         console.print(f"\n[bold cyan]Release Merge Plan for {resolved_version}[/bold cyan]")
         console.print(f"  Repository: {repo_full_name}")
         console.print(f"  Version: {resolved_version}")
@@ -542,7 +555,10 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
         # Step 1: Merge PR
         if resolved_pr:
             console.print(f"\n[bold cyan]Step 1: Merging PR #{resolved_pr}[/bold cyan]")
-            if not dry_run:
+            merged_hash = publish_hash({'pr': resolved_pr})
+            if not dry_run and already_done('pr.merged', merged_hash):
+                console.print(f"[dim]PR #{resolved_pr} already merged by a previous run, skipping[/dim]")
+            elif not dry_run:
                 # Fetch PR details to use for commit message
                 try:
                     repo = github_client.gh.get_repo(repo_full_name)
@@ -565,6 +581,10 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
                     if not success:
                         console.print(f"[red]Failed to merge PR #{resolved_pr}. Aborting.[/red]")
                         sys.exit(1)
+                    db.record_publish_state(
+                        repo_full_name, resolved_version, 'pr.merged', merged_hash,
+                        f"https://github.com/{repo_full_name}/pull/{resolved_pr}"
+                    )
 
                 except Exception as e:
                     console.print(f"[red]Error fetching PR details: {e}[/red]")
@@ -584,57 +604,67 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
                 tag_prefix = config.version_policy.tag_prefix if hasattr(config, 'version_policy') else 'v'
                 tag_name = f"{tag_prefix}{resolved_version}" if not resolved_version.startswith(tag_prefix) else resolved_version
 
-                if debug:
-                    console.print(f"[dim]  Checking for existing release with tag: {tag_name}[/dim]")
-
-                existing_release = github_client.get_release_by_tag(repo_full_name, tag_name)
-
-                if existing_release:
-                    if existing_release.draft:
-                        console.print(f"[cyan]  Found existing draft release, marking as published...[/cyan]")
-
-                        # Preserve existing release details
-                        release_title = existing_release.title
-                        release_body = existing_release.body
-                        release_prerelease = existing_release.prerelease
-                        release_target = existing_release.target_commitish
-
-                        if debug:
-                            console.print(f"[dim]  Preserving title: {release_title}[/dim]")
-                            console.print(f"[dim]  Preserving body length: {len(release_body or '')} chars[/dim]")
-                            console.print(f"[dim]  Prerelease: {release_prerelease}[/dim]")
-
-                        # Mark release as published using direct GitHub API
-                        # IMPORTANT: Must pass name and body to preserve them (in case of untagged release recreation)
-                        release_url = github_client.update_release(
-                            repo_full_name,
-                            tag_name,
-                            name=release_title,  # Preserve title
-                            body=release_body,   # Preserve body
-                            draft=False,         # Mark as published
-                            prerelease=release_prerelease,  # Preserve prerelease status
-                            target_commitish=release_target  # Preserve target
-                        )
-
-                        if release_url:
-                            console.print(f"[green]✓ Release {resolved_version} marked as published[/green]")
+                published_hash = publish_hash(tag_name)
+                if already_done('release.published', published_hash):
+                    release_url = published['release.published']['url']
+                    console.print(f"[green]  Release already published by a previous run, skipping[/green]")
+                else:
+                    if debug:
+                        console.print(f"[dim]  Checking for existing release with tag: {tag_name}[/dim]")
+
+                    existing_release = github_client.get_release_by_tag(repo_full_name, tag_name)
+
+                    if existing_release:
+                        if existing_release.draft:
+                            console.print(f"[cyan]  Found existing draft release, marking as published...[/cyan]")
+
+                            # Preserve existing release details
+                            release_title = existing_release.title
+                            release_body = existing_release.body
+                            release_prerelease = existing_release.prerelease
+                            release_target = existing_release.target_commitish
+
                             if debug:
-                                console.print(f"[dim]  URL: {release_url}[/dim]")
+                                console.print(f"[dim]  Preserving title: {release_title}[/dim]")
+                                console.print(f"[dim]  Preserving body length: {len(release_body or '')} chars[/dim]")
+                                console.print(f"[dim]  Prerelease: {release_prerelease}[/dim]")
+
+                            # Mark release as published using direct GitHub API
+                            # IMPORTANT: Must pass name and body to preserve them (in case of untagged release recreation)
+                            release_url = github_client.update_release(
+                                repo_full_name,
+                                tag_name,
+                                name=release_title,  # Preserve title
+                                body=release_body,   # Preserve body
+                                draft=False,         # Mark as published
+                                prerelease=release_prerelease,  # Preserve prerelease status
+                                target_commitish=release_target  # Preserve target
+                            )
+
+                            if release_url:
+                                console.print(f"[green]✓ Release {resolved_version} marked as published[/green]")
+                                if debug:
+                                    console.print(f"[dim]  URL: {release_url}[/dim]")
+                            else:
+                                raise Exception("Failed to update release")
                         else:
-                            raise Exception("Failed to update release")
+                            console.print(f"[green]  Release already published, skipping[/green]")
+                            # Get URL from existing release
+                            release_url = existing_release.html_url
                     else:
-                        console.print(f"[green]  Release already published, skipping[/green]")
-                        # Get URL from existing release
-                        release_url = existing_release.html_url
-                else:
-                    # No release exists - this is an error since merge should only finalize
-                    console.print(f"[red]Error: No GitHub release found for {tag_name}[/red]")
-                    console.print(f"[yellow]The merge command finalizes an existing release.[/yellow]")
-                    console.print(f"[yellow]Please create the release first:[/yellow]")
-                    console.print(f"[yellow]  1. Generate release notes: release-tool generate {resolved_version}[/yellow]")
-                    console.print(f"[yellow]  2. Create draft release: release-tool push {resolved_version} --release-mode draft[/yellow]")
-                    console.print(f"[yellow]  3. Then run merge again[/yellow]")
-                    raise Exception("No release found to publish")
+                        # No release exists - this is an error since merge should only finalize
+                        console.print(f"[red]Error: No GitHub release found for {tag_name}[/red]")
+                        console.print(f"[yellow]The merge command finalizes an existing release.[/yellow]")
+                        console.print(f"[yellow]Please create the release first:[/yellow]")
+                        console.print(f"[yellow]  1. Generate release notes: release-tool generate {resolved_version}[/yellow]")
+                        console.print(f"[yellow]  2. Create draft release: release-tool push {resolved_version} --release-mode draft[/yellow]")
+                        console.print(f"[yellow]  3. Then run merge again[/yellow]")
+                        raise Exception("No release found to publish")
+                    db.record_publish_state(
+                        repo_full_name, resolved_version, 'release.published', published_hash, release_url
+                    )
+                    # The draft recorded by push is no longer what GitHub has
+                    db.clear_publish_state(repo_full_name, resolved_version, ['release'])
 
             except Exception as e:
                 if "No release found" in str(e):
@@ -651,7 +681,11 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
         # Step 3: Add summary comment to issue
         if resolved_issue:
             console.print(f"\n[bold cyan]Step 3: Adding summary comment to issue #{resolved_issue}[/bold cyan]")
-            if not dry_run:
+            issue_repo = resolved_issue_repo if resolved_issue_repo else config.get_issue_repos()[0]
+            comment_hash = publish_hash({'issue': f"{issue_repo}#{resolved_issue}", 'pr': resolved_pr, 'release': release_url})
+            if not dry_run and already_done('issue.comment', comment_hash):
+                console.print(f"[dim]Summary comment already added by a previous run, skipping[/dim]")
+            elif not dry_run:
                 # Build comprehensive comment with all actions performed
                 comment_parts = [f"## ✅ Release {resolved_version} Merged\n"]
                 comment_parts.append("### Actions Completed\n")
@@ -701,6 +735,7 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
 
                 if success:
                     console.print(f"[green]  ✓ Added summary comment to issue #{resolved_issue}[/green]")
+                    db.record_publish_state(repo_full_name, resolved_version, 'issue.comment', comment_hash)
                 else:
                     console.print(f"[yellow]  Warning: Failed to add comment to issue #{resolved_issue}[/yellow]")
             else:
@@ -711,7 +746,10 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
         # Step 4: Close issue
         if resolved_issue:
             console.print(f"\n[bold cyan]Step 4: Closing issue #{resolved_issue}[/bold cyan]")
-            if not dry_run:
+            closed_hash = publish_hash({'issue': f"{issue_repo}#{resolved_issue}"})
+            if not dry_run and already_done('issue.closed', closed_hash):
+                console.print(f"[dim]Issue #{resolved_issue} already closed by a previous run, skipping[/dim]")
+            elif not dry_run:
                 # Determine which repository the issue is in
                 # Use resolved_issue_repo if we found it, otherwise use the primary issue_repo from config
                 target_repo = resolved_issue_repo if resolved_issue_repo else config.get_issue_repos()[0]
@@ -727,6 +765,8 @@ def merge(ctx, version: Optional[str], issue: Optional[int], pr: Optional[int],
                 if not success:
                     console.print(f"[yellow]Warning: Failed to close issue #{resolved_issue}[/yellow]")
                     # Don't exit on issue close failure - release is already published
+                else:
+                    db.record_publish_state(repo_full_name, resolved_version, 'issue.closed', closed_hash)
             else:
                 console.print(f"[dim]Would close issue #{resolved_issue}[/dim]")
         else:
@@ -14,13 +14,23 @@ console = Console()
 @click.command(context_settings={'help_option_names': ['-h', '--help']})
 @click.argument('repository', required=False)
 @click.option('--repo-path', type=click.Path(exists=True), help='Path to local git repository')
+@click.option(
+    '--watch',
+    is_flag=True,
+    help='After pulling, keep polling the repositories\' events feeds and refresh what changes (Ctrl+C to stop)'
+)
 @click.pass_context
-def pull(ctx, repository, repo_path):
+def pull(ctx, repository, repo_path, watch: bool):
     """
     Pull repository data to local database.
 
     Fetches issues, PRs, releases, and commits from GitHub and stores them locally.
     Uses highly parallelized fetching with incremental pull.
+
+    With --watch, the pull is followed by a polling loop over each
+    repository's events feed: unchanged feeds cost nothing against the rate
+    limit, and each new event refreshes only the issue, PR, release or
+    commits it touched.
     """
     # Get debug flag from global context
     debug = ctx.obj.get('debug', False)
@@ -43,6 +53,10 @@ def pull(ctx, repository, repo_path):
     # Initialize components
     db = Database(config.database.path)
     db.connect()
+    db.configure_note_sections(
+        config.issue_policy.description_section_regex,
+        config.issue_policy.migration_section_regex
+    )
 
     try:
         github_client = GitHubClient(config)
@@ -78,5 +92,12 @@ def pull(ctx, repository, repo_path):
             for repo_path in stats['git_repo_paths']:
                 console.print(f"    {repo_path}")
 
+        if watch:
+            console.print("[bold blue]Watching repository events (Ctrl+C to stop)...[/bold blue]")
+            try:
+                pull_manager.watch()
+            except KeyboardInterrupt:
+                console.print("[dim]Stopped watching[/dim]")
+
     finally:
         db.close()
@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import functools
+import hashlib
+import json
 import sys
 import time
 from pathlib import Path
@@ -13,9 +16,11 @@ from rich.console import Console
 from rich.table import Table
 
 from ..config import Config
-from ..db import Database
-from ..github_utils import GitHubClient
+from ..db import Database, publish_hash
+from ..github_utils import GitHubClient, git_blob_sha
 from ..models import SemanticVersion, Release
+from ..operations import MAX_WORKERS, OperationGraph
+from ..release_plan import draft_paths, edited_drafts, is_plan_file, load_plans, plan_path, refs_are_fresh
 from ..template_utils import render_template, validate_template_vars, get_template_variables, TemplateError, build_repo_context
 from ..git_ops import GitOperations, determine_release_branch_strategy
 
@@ -39,13 +44,14 @@ def _get_issues_repo(config: Config) -> str:
 def _create_release_issue(
     config: Config,
     github_client: GitHubClient,
-    db: Database,
+    existing_association: Optional[dict],
     template_context: dict,
     version: str,
     prs: list = None,
     override: bool = False,
     dry_run: bool = False,
-    debug: bool = False
+    debug: bool = False,
+    published_hash: Optional[str] = None
 ) -> Optional[dict]:
     """
     Create or update a GitHub issue for tracking the release.
@@ -53,16 +59,23 @@ def _create_release_issue(
     Args:
         config: Configuration object
         github_client: GitHub client instance
-        db: Database instance for checking/saving associations
+        existing_association: Issue already associated with the release
+            (from Database.get_issue_association), if any
         template_context: Template context for rendering issue templates (must include 'prs' if available)
         version: Release version
         prs: List of PR dictionaries with keys: repo_alias, repo_link, number, url, branch
         override: If True, reuse existing issue if found
         dry_run: If True, only show what would be created
         debug: If True, show verbose output
+        published_hash: Content hash of the issue as last written by push;
+            a reused issue with the same content is not updated
 
     Returns:
-        Dictionary with 'number' and 'url' keys if created, None otherwise
+        Dictionary with 'number', 'url', 'source' ('created' or 'reused')
+        and 'content_hash' keys if created or reused, None otherwise. The
+        caller saves the association of created issues, and assigns them and
+        adds them to the project (see _assign_release_issue,
+        _add_release_issue_to_project).
     """
     if not config.output.create_issue:
         if debug:
@@ -70,14 +83,12 @@ def _create_release_issue(
         return None
 
     issues_repo = _get_issues_repo(config)
-    # Use first code repo as the reference repo for issue associations
-    repo_full_name = config.repository.code_repos[0].link if config.repository.code_repos else issues_repo
 
     # Prepare labels
     final_labels = config.output.issue_templates.labels.copy()
     # Note: Issue type is handled separately via GraphQL, not as a label
 
-    # Prepare milestone
+    # Prepare milestone (looked up on GitHub only when the issue is written)
     milestone_obj = None
     milestone_name = None
     
@@ -87,13 +98,9 @@ def _create_release_issue(
                 config.output.issue_templates.milestone,
                 template_context
             )
-            if not dry_run:
-                milestone_obj = github_client.get_milestone_by_title(issues_repo, milestone_name)
         except TemplateError as e:
             console.print(f"[red]Error rendering milestone template: {e}[/red]")
 
-    # Check for existing issue association if override is enabled
-    existing_association = db.get_issue_association(repo_full_name, version) if not dry_run else None
     result = None
 
     # Ensure prs is in the template context (even if empty list)
@@ -114,13 +121,26 @@ def _create_release_issue(
         console.print(f"[red]Error rendering issue template: {e}[/red]")
         return None
 
+    content_hash = publish_hash({
+        'repo': issues_repo,
+        'title': title,
+        'body': body,
+        'labels': final_labels,
+        'milestone': milestone_name,
+        'type': config.output.issue_templates.type,
+    })
+    if milestone_name and not dry_run and not (existing_association and content_hash == published_hash):
+        milestone_obj = github_client.get_milestone_by_title(issues_repo, milestone_name)
+
     if existing_association and override:
         # Reuse existing issue
         if debug or not dry_run:
             console.print(f"[blue]Reusing existing issue #{existing_association['issue_number']} (--force)[/blue]")
             console.print(f"[dim]  URL: {existing_association['issue_url']}[/dim]")
 
-        if not dry_run:
+        if content_hash == published_hash:
+            console.print(f"[dim]Issue #{existing_association['issue_number']} unchanged since the last push, skipping update[/dim]")
+        elif not dry_run:
             github_client.update_issue(
                 repo_full_name=issues_repo,
                 issue_number=existing_association['issue_number'],
@@ -142,7 +162,9 @@ def _create_release_issue(
 
         result = {
             'number': str(existing_association['issue_number']),
-            'url': existing_association['issue_url']
+            'url': existing_association['issue_url'],
+            'source': 'reused',
+            'content_hash': content_hash
         }
     elif existing_association and not override:
         console.print(f"[yellow]Warning: Issue already exists for {version} (#{existing_association['issue_number']})[/yellow]")
@@ -183,7 +205,7 @@ def _create_release_issue(
             console.print(f"[dim]{'─' * 60}[/dim]\n")
 
         if dry_run:
-            return {'number': 'XXXX', 'url': f'https://github.com/{issues_repo}/issues/XXXX'}
+            return {'number': 'XXXX', 'url': f'https://github.com/{issues_repo}/issues/XXXX', 'source': 'created'}
 
         # Create the issue
         if debug:
@@ -199,56 +221,341 @@ def _create_release_issue(
         )
 
         if result:
-            # Save association to database
-            db.save_issue_association(
-                repo_full_name=repo_full_name,
-                version=version,
-                issue_number=int(result['number']),
-                issue_url=result['url']
-            )
+            result['source'] = 'created'
+            result['content_hash'] = content_hash
 
-            if debug:
-                console.print(f"[dim]Saved issue association to database[/dim]")
+    return result
+
+
+def _issue_assignment_hash(config: Config, issue_result: dict) -> str:
+    """Publish state hash of a tracking issue's assignment."""
+    return publish_hash({'issue': issue_result['url'], 'assignee': config.output.issue_templates.assignee})
 
-    if not result:
+
+def _issue_project_hash(config: Config, issue_result: dict) -> str:
+    """Publish state hash of a tracking issue's project item and fields."""
+    templates = config.output.issue_templates
+    return publish_hash({
+        'issue': issue_result['url'],
+        'project': templates.project_id,
+        'status': templates.project_status,
+        'fields': templates.project_fields,
+    })
+
+
+def _assign_release_issue(
+    config: Config,
+    github_client: GitHubClient,
+    issue_result: Optional[dict],
+    published_hash: Optional[str] = None
+) -> Optional[str]:
+    """
+    Assign a created or reused tracking issue (push step 'issue.assign').
+
+    Args:
+        published_hash: Assignment hash recorded by the last push; the
+            issue is not assigned again if it is unchanged
+
+    Returns:
+        The assignee, or None if there was nothing to assign
+    """
+    if not issue_result or issue_result.get('source') not in ('created', 'reused'):
+        return None
+    if _issue_assignment_hash(config, issue_result) == published_hash:
+        console.print(f"[dim]Issue #{issue_result['number']} assignment unchanged since the last push, skipping[/dim]")
         return None
 
-    # Assign issue to user (for both new and updated issues)
-    if not dry_run:
-        assignee = config.output.issue_templates.assignee
-        if not assignee:
-            assignee = github_client.get_authenticated_user()
+    assignee = config.output.issue_templates.assignee
+    if not assignee:
+        assignee = github_client.get_authenticated_user()
 
-        if assignee:
-            github_client.assign_issue(
-                repo_full_name=issues_repo,
-                issue_number=int(result['number']),
-                assignee=assignee
-            )
+    if assignee:
+        github_client.assign_issue(
+            repo_full_name=_get_issues_repo(config),
+            issue_number=int(issue_result['number']),
+            assignee=assignee
+        )
+    return assignee
 
-        # Add to project if configured (for both new and updated issues)
-        if config.output.issue_templates.project_id:
-            # Resolve project ID (number) to node ID
-            org_name = issues_repo.split('/')[0]
-            try:
-                project_number = int(config.output.issue_templates.project_id)
-                project_node_id = github_client.get_project_node_id(org_name, project_number)
-                
-                if project_node_id:
-                    github_client.assign_issue_to_project(
-                        issue_url=result['url'],
-                        project_id=project_node_id,
-                        status=config.output.issue_templates.project_status,
-                        custom_fields=config.output.issue_templates.project_fields,
-                        debug=debug
-                    )
-            except ValueError:
-                console.print(f"[yellow]Warning: Invalid project ID '{config.output.issue_templates.project_id}'. Expected a number.[/yellow]")
 
-    return result
+def _add_release_issue_to_project(
+    config: Config,
+    github_client: GitHubClient,
+    issue_result: Optional[dict],
+    debug: bool = False,
+    published_hash: Optional[str] = None
+) -> Optional[str]:
+    """
+    Add a created or reused tracking issue to the configured project and set
+    its fields (push step 'issue.project').
+
+    Args:
+        published_hash: Project hash recorded by the last push; the issue's
+            project fields are not set again if they are unchanged
+
+    Returns:
+        The project node ID, or None if the issue was not added
+    """
+    if not issue_result or issue_result.get('source') not in ('created', 'reused'):
+        return None
+    if not config.output.issue_templates.project_id:
+        return None
+    if _issue_project_hash(config, issue_result) == published_hash:
+        console.print(f"[dim]Issue #{issue_result['number']} project fields unchanged since the last push, skipping[/dim]")
+        return None
 
+    # Resolve project ID (number) to node ID
+    org_name = _get_issues_repo(config).split('/')[0]
+    try:
+        project_number = int(config.output.issue_templates.project_id)
+    except ValueError:
+        console.print(f"[yellow]Warning: Invalid project ID '{config.output.issue_templates.project_id}'. Expected a number.[/yellow]")
+        return None
+
+    project_node_id = github_client.get_project_node_id(org_name, project_number)
+    if not project_node_id:
+        return None
 
-def _find_draft_releases(config: Config, version_filter: Optional[str] = None, repo_alias_filter: Optional[str] = None) -> list[Path]:
+    github_client.assign_issue_to_project(
+        issue_url=issue_result['url'],
+        project_id=project_node_id,
+        status=config.output.issue_templates.project_status,
+        custom_fields=config.output.issue_templates.project_fields,
+        debug=debug
+    )
+    return project_node_id
+
+
+def _push_fingerprint(
+    config: Config,
+    version: str,
+    release_notes: Optional[str],
+    mode: str,
+    prerelease: bool,
+    create_release: bool,
+    create_pr: bool,
+    force: str,
+    issue: Optional[int],
+    target_branch: str,
+    plans: Optional[dict] = None
+) -> str:
+    """
+    Fingerprint the inputs of a push, so a rerun only resumes an interrupted
+    push of the same release notes, drafts and options.
+    """
+    drafts = {
+        str(path.resolve()): path.read_text()
+        for path in _find_draft_releases(config, version_filter=version, plans=plans)
+    }
+    inputs = {
+        'version': version,
+        'release_notes': release_notes,
+        'drafts': drafts,
+        'mode': mode,
+        'prerelease': prerelease,
+        'create_release': create_release,
+        'create_pr': create_pr,
+        'force': force,
+        'issue': issue,
+        'target_branch': target_branch,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def _pull_request_hash(
+    repo_name: str,
+    branch_name: str,
+    title: str,
+    body: str,
+    target_branch: str,
+    file_path: Optional[str],
+    content: Optional[str],
+    additional_files: dict
+) -> str:
+    """Publish state hash of a release notes PR: its title, body, branches and file blobs."""
+    files = {file_path: content, **additional_files}
+    return publish_hash({
+        'repo': repo_name,
+        'branch': branch_name,
+        'target': target_branch,
+        'title': title,
+        'body': body,
+        'files': {path: git_blob_sha(text or '') for path, text in files.items() if path},
+    })
+
+
+def _create_pull_request(
+    github_client: Optional[GitHubClient],
+    repo_alias: str,
+    repo_name: str,
+    branch_name: str,
+    title: str,
+    body: str,
+    target_branch: str,
+    file_path: Optional[str],
+    content: Optional[str],
+    additional_files: dict,
+    dry_run: bool,
+    results: dict,
+    published_url: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Create the release notes PR of a repository (push step 'pr:<alias>').
+
+    Args:
+        published_url: URL of the PR if the last push wrote the same
+            content (see _pull_request_hash); GitHub is then not called
+
+    Returns:
+        PR info dict (repo_alias, repo_link, number, url, branch), or None if it failed
+    """
+    if dry_run:
+        console.print(f"[yellow]Would create pull request for {repo_alias}:[/yellow]")
+        console.print(f"[yellow]  Repository: {repo_name}[/yellow]")
+        console.print(f"[yellow]  Branch: {branch_name}[/yellow]")
+        console.print(f"[yellow]  Title: {title}[/yellow]")
+        console.print(f"[yellow]  Target: {target_branch}[/yellow]")
+        if file_path:
+            console.print(f"[yellow]  Primary file (will be committed to): {file_path}[/yellow]")
+        if additional_files:
+            console.print(f"[yellow]  Additional files (will be committed to):[/yellow]")
+            for path in additional_files:
+                console.print(f"[yellow]    - {path}[/yellow]")
+        console.print(f"\n[yellow]PR body:[/yellow]")
+        console.print(f"[dim]{body}[/dim]\n")
+
+        # In dry-run, create a mock PR info
+        return {
+            'repo_alias': repo_alias,
+            'repo_link': repo_name,
+            'number': 'XXX',
+            'url': f'https://github.com/{repo_name}/pull/XXX',
+            'branch': branch_name
+        }
+
+    if published_url:
+        pr_url = published_url
+        console.print(f"[green]✓ Pull request for {repo_alias} unchanged since the last push[/green]")
+        console.print(f"[blue]→ {pr_url}[/blue]")
+    else:
+        console.print(f"[blue]Creating PR for {repo_alias} with release notes...[/blue]")
+        pr_url = github_client.create_pr_for_release_notes(
+            repo_name,
+            title,
+            file_path,
+            content,
+            branch_name,
+            target_branch,
+            body,
+            additional_files=additional_files
+        )
+
+        if not pr_url:
+            console.print(f"[red]✗ Failed to create PR for {repo_alias}[/red]")
+            # Continue with other repos even if one fails
+            return None
+
+        console.print(f"[green]✓ Pull request for {repo_alias} processed successfully[/green]")
+        console.print(f"[blue]→ {pr_url}[/blue]")
+
+    return {
+        'repo_alias': repo_alias,
+        'repo_link': repo_name,
+        # Extract PR number from URL
+        'number': pr_url.split('/')[-1] if '/' in pr_url else 'unknown',
+        'url': pr_url,
+        'branch': branch_name
+    }
+
+
+def _resolve_release_issue(
+    config: Config,
+    github_client: Optional[GitHubClient],
+    version: str,
+    target_version: SemanticVersion,
+    issue_repo_name: str,
+    created_prs: list,
+    issue: Optional[int],
+    force: str,
+    existing_association: Optional[dict],
+    dry_run: bool,
+    debug: bool,
+    published_hash: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Use, find or create the release tracking issue listing the PRs (push step 'issue').
+
+    A reused issue whose content hash matches published_hash (recorded by
+    the last push) is not updated.
+
+    Returns:
+        Dictionary with 'number', 'url' and 'source' keys ('provided', 'found',
+        'created' or 'reused'), or None if there is no issue
+    """
+    console.print(f"\n[bold blue]Creating release tracking issue with {len(created_prs)} PR(s)...[/bold blue]\n")
+
+    # Build template context for issue
+    issues_repo = _get_issues_repo(config)
+    now = datetime.now()
+    quarter = (now.month - 1) // 3 + 1
+    quarter_uppercase = f"Q{quarter}"
+
+    issue_template_context = build_repo_context(config)
+    issue_template_context.update({
+        'issue_repo': issues_repo,
+        'issue_repo_name': issue_repo_name,
+        'version': version,
+        'major': str(target_version.major),
+        'minor': str(target_version.minor),
+        'patch': str(target_version.patch),
+        'year': str(now.year),
+        'quarter_uppercase': quarter_uppercase,
+        'num_changes': 'multiple',
+        'num_categories': 'multiple',
+        'prs': created_prs  # Pass the list of PRs to the template
+    })
+
+    # If issue number provided explicitly, use it directly
+    issue_result = None
+    if issue and not dry_run:
+        try:
+            issue_obj = github_client.gh.get_repo(issues_repo).get_issue(issue)
+            issue_result = {'number': str(issue_obj.number), 'url': issue_obj.html_url, 'source': 'provided'}
+            console.print(f"[blue]Using provided issue #{issue}[/blue]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not use issue #{issue}: {e}[/yellow]")
+            issue_result = None
+
+    # If force=draft, try to find existing issue automatically
+    if force == 'draft' and not dry_run and not issue_result and not existing_association:
+        issue_result = _find_existing_issue_auto(config, github_client, version, debug)
+        if issue_result:
+            issue_result['source'] = 'found'
+            console.print(f"[blue]Auto-selected open issue #{issue_result['number']}[/blue]")
+
+    # Create or update issue
+    if not issue_result:
+        issue_result = _create_release_issue(
+            config=config,
+            github_client=github_client,
+            existing_association=existing_association,
+            template_context=issue_template_context,
+            version=version,
+            prs=created_prs,
+            override=(force != 'none'),
+            dry_run=dry_run,
+            debug=debug,
+            published_hash=published_hash
+        )
+
+    if issue_result:
+        console.print(f"[green]✓ Release tracking issue: #{issue_result['number']}[/green]")
+        console.print(f"[blue]→ {issue_result['url']}[/blue]")
+    return issue_result
+
+
+def _find_draft_releases(config: Config, version_filter: Optional[str] = None, repo_alias_filter: Optional[str] = None,
+                         plans: Optional[dict] = None) -> list[Path]:
     """
     Find draft release files matching the configured path template.
 
@@ -256,10 +563,21 @@ def _find_draft_releases(config: Config, version_filter: Optional[str] = None, r
         config: Configuration object
         version_filter: Optional version string to filter results (e.g., "9.2.0")
         repo_alias_filter: Optional repo alias to filter results (e.g., "step")
+        plans: Release plans of version_filter (see release_plan.load_plans);
+            when they cover the repositories searched and their drafts
+            still exist, the drafts are taken from them instead of globbing
 
     Returns:
         List of Path objects for draft release files, sorted by modification time (newest first)
     """
+    if plans and version_filter:
+        aliases = [repo_alias_filter] if repo_alias_filter else config.get_pr_code_repos()
+        planned = [draft_paths(plans[alias]) if alias in plans else None for alias in aliases]
+        if aliases and all(paths is not None for paths in planned):
+            draft_files = [path for paths in planned for path in paths]
+            draft_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+            return draft_files
+
     template = config.output.draft_output_path
 
     # If repo_alias_filter is provided, convert alias to the format used in file paths
@@ -349,12 +667,55 @@ def _find_draft_releases(config: Config, version_filter: Optional[str] = None, r
         # Relative path, use current directory
         draft_files = list(Path('.').glob(glob_pattern))
 
+    # Plans written by generate sit next to the drafts
+    draft_files = [path for path in draft_files if not is_plan_file(path)]
+
     # Sort by modification time desc (newest first)
     draft_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
 
     return draft_files
 
 
+def _resolve_branches(
+    config: Config,
+    git_ops: GitOperations,
+    target_version: SemanticVersion,
+    plan: Optional[dict],
+    debug: bool = False
+) -> tuple:
+    """
+    Work out the release branch of a repository, reusing generate's plan.
+
+    The plan is used while its remote refs are fresh (see
+    release_plan.refs_are_fresh); otherwise the remote refs are fetched and
+    the branch strategy is determined again.
+
+    Returns:
+        Tuple of (release branch, source branch, whether to create the release branch)
+    """
+    if plan is not None and refs_are_fresh(plan, git_ops):
+        console.print(
+            f"[dim]Using the release plan from generate ({plan['release_branch']} at "
+            f"{plan['head_sha'][:8]}); skipping the remote fetch[/dim]"
+        )
+        if debug:
+            for path in edited_drafts(plan):
+                console.print(f"[dim]Draft edited since generate: {path}[/dim]")
+        return plan['release_branch'], plan['source_branch'], plan['should_create_branch']
+
+    # Fetch remote refs first to ensure accurate branch detection
+    git_ops.fetch_remote_refs()
+    available_versions = git_ops.get_version_tags()
+    return determine_release_branch_strategy(
+        version=target_version,
+        git_ops=git_ops,
+        available_versions=available_versions,
+        branch_template=config.branch_policy.release_branch_template,
+        default_branch=config.branch_policy.default_branch,
+        branch_from_previous=config.branch_policy.branch_from_previous_release
+    )
+
+
 def _display_draft_releases(draft_files: list[Path], title: str = "Draft Releases"):
     """
     Display a table of draft release files.
@@ -460,10 +821,14 @@ def _display_draft_releases(draft_files: list[Path], title: str = "Draft Release
 @click.option('--force', type=click.Choice(['none', 'draft', 'published'], case_sensitive=False), default='none', help='Force overwrite existing release (default: none)')
 @click.option('--issue', type=int, default=None, help='Issue/issue number to associate with this release')
 @click.option('--dry-run', is_flag=True, help='Show what would be pushed without making changes')
+@click.option('--resume/--no-resume', default=True,
+              help='Skip the steps finished by an interrupted push with the same inputs (default: resume)')
+@click.option('--skip-unchanged/--no-skip-unchanged', default=True,
+              help='Skip GitHub writes for content unchanged since the last push, as recorded locally (default: skip)')
 @click.pass_context
 def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, notes_file: Optional[str], create_release: Optional[bool],
            create_pr: Optional[bool], release_mode: Optional[str], prerelease: Optional[str], force: str, issue: Optional[int],
-           dry_run: bool):
+           dry_run: bool, resume: bool, skip_unchanged: bool):
     """
     Push a release to GitHub.
 
@@ -472,6 +837,12 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
 
     Flags default to config values but can be overridden via CLI.
 
+    Independent steps run concurrently (the release alongside the PRs of
+    each repository, then the tracking issue). Finished steps are recorded,
+    so if a push fails, running the same command again resumes after them.
+    A hash of everything written to GitHub is kept as well, so pushing the
+    same content again skips the GitHub calls.
+
     Examples:
 
       release-tool push 9.1.0 -f docs/releases/9.1.0.md
@@ -557,6 +928,9 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                     console.print(f"[red]Error deleting {draft_path}: {e}[/red]")
 
         if not dry_run:
+            # Release plans of the version point at the deleted drafts
+            for repo_alias in load_plans(config, version):
+                plan_path(config, repo_alias, version).unlink(missing_ok=True)
             console.print(f"\n[green]✓ Deleted {deleted_count} of {len(matching_drafts)} draft file(s)[/green]")
 
         return
@@ -622,6 +996,9 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
         # Parse version
         target_version = SemanticVersion.parse(version)
 
+        # What generate resolved for this version (drafts, branches), if anything
+        plans = load_plans(config, version)
+
         if debug:
             console.print("[bold cyan]Debug Mode: Version Information[/bold cyan]")
             console.print("[dim]" + "=" * 60 + "[/dim]")
@@ -674,7 +1051,7 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                 console.print(f"[dim]Search pattern:[/dim] {config.output.draft_output_path}")
                 console.print(f"[dim]Searching for version:[/dim] {version}")
 
-            matching_drafts = _find_draft_releases(config, version_filter=version)
+            matching_drafts = _find_draft_releases(config, version_filter=version, plans=plans)
 
             if debug:
                 console.print(f"[dim]Matches found:[/dim] {len(matching_drafts)}")
@@ -803,69 +1180,50 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
         # (This is used for branch/tag operations for GitHub releases)
         first_repo_path = config.get_code_repo_path(first_code_repo.alias)
         git_ops = GitOperations(first_repo_path)
-        # Fetch remote refs first to ensure accurate branch detection
-        git_ops.fetch_remote_refs()
-        available_versions = git_ops.get_version_tags()
-
-        target_branch, source_branch, should_create_branch = determine_release_branch_strategy(
-            version=target_version,
-            git_ops=git_ops,
-            available_versions=available_versions,
-            branch_template=config.branch_policy.release_branch_template,
-            default_branch=config.branch_policy.default_branch,
-            branch_from_previous=config.branch_policy.branch_from_previous_release
+        target_branch, source_branch, should_create_branch = _resolve_branches(
+            config, git_ops, target_version, plans.get(first_code_repo.alias), debug
         )
 
-        # Handle release branch creation/fetching (before creating GitHub release)
-        if should_create_branch and config.branch_policy.create_branches:
-            if debug:
-                console.print(f"[dim]Release branch {target_branch} doesn't exist locally. Creating from {source_branch}...[/dim]")
-
-            if not dry_run:
-                try:
-                    # Check if branch exists remotely first
-                    if git_ops.branch_exists(target_branch, remote=True):
-                        # Branch exists remotely, fetch it instead of creating
-                        if debug:
-                            console.print(f"[dim]Branch exists remotely, fetching {target_branch}...[/dim]")
-                        try:
-                            git_ops.repo.git.fetch('origin', f"{target_branch}:{target_branch}")
-                            if debug:
-                                console.print(f"[dim]✓ Fetched {target_branch} from remote[/dim]")
-                        except Exception as fetch_error:
-                            console.print(f"[yellow]Warning: Could not fetch {target_branch}: {fetch_error}[/yellow]")
-                    else:
-                        # Branch doesn't exist remotely, create and push
-                        git_ops.create_branch(target_branch, source_branch)
-                        git_ops.push_branch(target_branch)
-                        if debug:
-                            console.print(f"[dim]✓ Created and pushed {target_branch} to remote[/dim]")
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Could not create/push release branch: {e}[/yellow]")
-                    console.print(f"[yellow]Continuing with release creation...[/yellow]")
-            elif debug:
-                console.print(f"[yellow]Would create and push branch {target_branch} from {source_branch}[/yellow]")
-        else:
-            if debug:
-                console.print(f"[dim]Using existing release branch {target_branch}[/dim]")
-                
-            # Even if not creating, ensure we have the branch locally if it exists remotely
-            if not dry_run and not git_ops.branch_exists(target_branch) and git_ops.branch_exists(target_branch, remote=True):
-                try:
-                    git_ops.repo.git.fetch('origin', f"{target_branch}:{target_branch}")
-                    if debug:
-                        console.print(f"[dim]✓ Fetched {target_branch} from remote[/dim]")
-                except Exception as e:
-                    if debug:
-                        console.print(f"[dim]Could not fetch {target_branch}: {e}[/dim]")
-
         # Initialize database connection
         db = Database(config.database.path)
         db.connect()
 
-        # Check for existing release
+        # Steps finished by an interrupted push of the same inputs are skipped
+        fingerprint = _push_fingerprint(
+            config, version, release_notes, mode, prerelease_flag, create_release, create_pr, force, issue,
+            target_branch, plans
+        )
+        journal = {}
+        if not dry_run:
+            if not resume:
+                db.clear_push_journal(repo_name, version)
+            journal = db.get_push_journal(repo_name, version, fingerprint)
+            if journal:
+                console.print(
+                    f"[blue]Resuming push of {version}: skipping {len(journal)} finished step(s) "
+                    f"({', '.join(sorted(journal))})[/blue]"
+                )
+
+        # Content hashes of what earlier pushes wrote to GitHub (see publish_state)
+        published = db.get_publish_state(repo_name, version) if skip_unchanged and not dry_run else {}
+        release_hash = publish_hash({
+            'repo': repo_name,
+            'tag': f"v{version}",
+            'name': f"Release {version}",
+            'body': release_notes,
+            'prerelease': prerelease_flag,
+            'draft': is_draft,
+            'target': target_branch,
+        })
+        release_unchanged = (
+            bool(create_release) and not is_mark_published
+            and published.get('release', {}).get('hash') == release_hash
+        )
+
+        # Check for existing release (unless an interrupted push created it,
+        # or the last push created it with the same content)
         repo = db.get_repository(repo_name)
-        if repo:
+        if repo and 'release' not in journal and not release_unchanged:
             existing_release = db.get_release(repo.id, version)
             if existing_release:
                 if force == 'none':
@@ -891,78 +1249,73 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
             console.print(f"[yellow]DRY RUN - Push release {version}[/yellow]")
             console.print(f"[yellow]{'='*80}[/yellow]\n")
 
-        # Create GitHub release
-        if create_release:
-            tag_name = f"v{version}"
-            release_url = None  # Will be set by create/update operations
+        # Side effects run as a graph of steps (see operations.py), so the
+        # GitHub release, the PRs and the tracking issue's metadata overlap:
+        #
+        #   branch -> tag -> release
+        #   branch -> pr:<alias> (all repositories) -> issue -> issue.assign, issue.project
+        graph = OperationGraph()
 
-            # Handle mark-published mode: only update existing draft release to published
-            if is_mark_published:
-                if dry_run:
-                    console.print(f"[yellow]Would mark existing GitHub release as published:[/yellow]")
-                    console.print(f"[yellow]  Repository: {repo_name}[/yellow]")
-                    console.print(f"[yellow]  Version: {version}[/yellow]")
-                    console.print(f"[yellow]  Tag: {tag_name}[/yellow]")
-                else:
-                    # Check if release exists
-                    existing_gh_release = github_client.get_release_by_tag(repo_name, tag_name)
-                    
-                    if not existing_gh_release:
-                        console.print(f"[red]Error: No existing GitHub release found for {tag_name}[/red]")
-                        console.print(f"[yellow]Use --release-mode published or draft to create a new release[/yellow]")
-                        sys.exit(1)
-                    
-                    # Update existing release to published (draft=False)
-                    console.print(f"[blue]Marking existing GitHub release as published for {version}...[/blue]")
-                    if debug:
-                        console.print(f"[dim]Existing release URL: {existing_gh_release.html_url}[/dim]")
-                        console.print(f"[dim]Current draft status: {existing_gh_release.draft}[/dim]")
-                    
-                    release_url = github_client.update_release(
-                        repo_name,
-                        tag_name,
-                        name=existing_gh_release.title or f"Release {version}",
-                        body=existing_gh_release.body or "",
-                        prerelease=existing_gh_release.prerelease,
-                        draft=False,  # Mark as published
-                        target_commitish=existing_gh_release.target_commitish
-                    )
-                    
-                    if release_url:
-                        console.print(f"[green]✓ GitHub release marked as published successfully[/green]")
-                        console.print(f"[blue]→ {release_url}[/blue]")
-                    else:
-                        console.print(f"[red]✗ Failed to update GitHub release[/red]")
-                        sys.exit(1)
+        def ensure_branch(results):
+            # Handle release branch creation/fetching (before creating GitHub release)
+            if should_create_branch and config.branch_policy.create_branches:
+                if debug:
+                    console.print(f"[dim]Release branch {target_branch} doesn't exist locally. Creating from {source_branch}...[/dim]")
+
+                if not dry_run:
+                    try:
+                        # Check if branch exists remotely first
+                        if git_ops.branch_exists(target_branch, remote=True):
+                            # Branch exists remotely, fetch it instead of creating
+                            if debug:
+                                console.print(f"[dim]Branch exists remotely, fetching {target_branch}...[/dim]")
+                            try:
+                                git_ops.repo.git.fetch('origin', f"{target_branch}:{target_branch}")
+                                if debug:
+                                    console.print(f"[dim]✓ Fetched {target_branch} from remote[/dim]")
+                            except Exception as fetch_error:
+                                console.print(f"[yellow]Warning: Could not fetch {target_branch}: {fetch_error}[/yellow]")
+                        else:
+                            # Branch doesn't exist remotely, create and push
+                            git_ops.create_branch(target_branch, source_branch)
+                            git_ops.push_branch(target_branch)
+                            if debug:
+                                console.print(f"[dim]✓ Created and pushed {target_branch} to remote[/dim]")
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Could not create/push release branch: {e}[/yellow]")
+                        console.print(f"[yellow]Continuing with release creation...[/yellow]")
+                elif debug:
+                    console.print(f"[yellow]Would create and push branch {target_branch} from {source_branch}[/yellow]")
             else:
-                # Normal mode: create or update release with full tag/notes handling
-                status = "draft " if is_draft else ("prerelease " if prerelease_flag else "")
-                release_type = "draft" if is_draft else ("prerelease" if prerelease_flag else "final release")
+                if debug:
+                    console.print(f"[dim]Using existing release branch {target_branch}[/dim]")
 
-                if dry_run:
-                    console.print(f"[yellow]Would create git tag and {status}GitHub release:[/yellow]")
-                    console.print(f"[yellow]  Repository: {repo_name}[/yellow]")
-                    console.print(f"[yellow]  Version: {version}[/yellow]")
-                    console.print(f"[yellow]  Tag: {tag_name}[/yellow]")
-                    console.print(f"[yellow]  Target: {target_branch}[/yellow]")
-                    console.print(f"[yellow]  Type: {release_type.capitalize()}[/yellow]")
-                    console.print(f"[yellow]  Status: {'Draft' if is_draft else 'Published'}[/yellow]")
-                    console.print(f"[yellow]  URL: https://github.com/{repo_name}/releases/tag/{tag_name}[/yellow]")
+                # Even if not creating, ensure we have the branch locally if it exists remotely
+                if not dry_run and not git_ops.branch_exists(target_branch) and git_ops.branch_exists(target_branch, remote=True):
+                    try:
+                        git_ops.repo.git.fetch('origin', f"{target_branch}:{target_branch}")
+                        if debug:
+                            console.print(f"[dim]✓ Fetched {target_branch} from remote[/dim]")
+                    except Exception as e:
+                        if debug:
+                            console.print(f"[dim]Could not fetch {target_branch}: {e}[/dim]")
+            return target_branch
 
-                    # Show release notes preview (only if not in debug mode to avoid duplication)
-                    if not debug:
-                        preview_length = 500
-                        preview = release_notes[:preview_length]
-                        if len(release_notes) > preview_length:
-                            preview += "\n[... truncated ...]"
-                        console.print(f"\n[yellow]Release notes preview ({len(release_notes)} characters):[/yellow]")
-                        console.print(f"[dim]{preview}[/dim]\n")
-                else:
+        graph.add('branch', ensure_branch)
+
+        # Create GitHub release
+        if create_release:
+            tag_name = f"v{version}"
+            status = "draft " if is_draft else ("prerelease " if prerelease_flag else "")
+            release_type = "draft" if is_draft else ("prerelease" if prerelease_flag else "final release")
+
+            if not is_mark_published and not dry_run:
+                def push_tag(results):
                     # Create and push git tag before creating GitHub release
                     tag_exists_locally = git_ops.tag_exists(tag_name, remote=False)
                     tag_exists_remotely = git_ops.tag_exists(tag_name, remote=True)
                     should_force_tag = force != 'none'
-                    
+
                     # Handle local tag
                     if not tag_exists_locally:
                         if debug:
@@ -1033,14 +1386,88 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                             if debug:
                                 console.print(f"[dim]Tag push skipped (already up to date or would fail): {e}[/dim]")
 
-                    # Wait for GitHub to index the tag (prevent "untagged" releases)
-                    if debug:
-                        console.print(f"[dim]Waiting for GitHub to index tag {tag_name}...[/dim]")
-                    time.sleep(2)  # 2 second delay to allow GitHub to process the tag
-                    
+                    # Wait for GitHub to index the tag (prevent "untagged" releases),
+                    # unless the release is left as it is
+                    if not release_unchanged:
+                        if debug:
+                            console.print(f"[dim]Waiting for GitHub to index tag {tag_name}...[/dim]")
+                        time.sleep(2)  # 2 second delay to allow GitHub to process the tag
+                    return tag_name
+
+                graph.add('tag', push_tag, requires=['branch'])
+
+            def publish_release(results):
+                release_url = None  # Will be set by create/update operations
+
+                # Handle mark-published mode: only update existing draft release to published
+                if is_mark_published:
+                    if dry_run:
+                        console.print(f"[yellow]Would mark existing GitHub release as published:[/yellow]")
+                        console.print(f"[yellow]  Repository: {repo_name}[/yellow]")
+                        console.print(f"[yellow]  Version: {version}[/yellow]")
+                        console.print(f"[yellow]  Tag: {tag_name}[/yellow]")
+                    elif 'release.published' in published:
+                        release_url = published['release.published']['url']
+                        console.print(f"[green]✓ GitHub release already marked as published[/green]")
+                        console.print(f"[blue]→ {release_url}[/blue]")
+                    else:
+                        # Check if release exists
+                        existing_gh_release = github_client.get_release_by_tag(repo_name, tag_name)
+
+                        if not existing_gh_release:
+                            console.print(f"[red]Error: No existing GitHub release found for {tag_name}[/red]")
+                            console.print(f"[yellow]Use --release-mode published or draft to create a new release[/yellow]")
+                            sys.exit(1)
+
+                        # Update existing release to published (draft=False)
+                        console.print(f"[blue]Marking existing GitHub release as published for {version}...[/blue]")
+                        if debug:
+                            console.print(f"[dim]Existing release URL: {existing_gh_release.html_url}[/dim]")
+                            console.print(f"[dim]Current draft status: {existing_gh_release.draft}[/dim]")
+
+                        release_url = github_client.update_release(
+                            repo_name,
+                            tag_name,
+                            name=existing_gh_release.title or f"Release {version}",
+                            body=existing_gh_release.body or "",
+                            prerelease=existing_gh_release.prerelease,
+                            draft=False,  # Mark as published
+                            target_commitish=existing_gh_release.target_commitish
+                        )
+
+                        if release_url:
+                            console.print(f"[green]✓ GitHub release marked as published successfully[/green]")
+                            console.print(f"[blue]→ {release_url}[/blue]")
+                        else:
+                            console.print(f"[red]✗ Failed to update GitHub release[/red]")
+                            sys.exit(1)
+                elif dry_run:
+                    console.print(f"[yellow]Would create git tag and {status}GitHub release:[/yellow]")
+                    console.print(f"[yellow]  Repository: {repo_name}[/yellow]")
+                    console.print(f"[yellow]  Version: {version}[/yellow]")
+                    console.print(f"[yellow]  Tag: {tag_name}[/yellow]")
+                    console.print(f"[yellow]  Target: {target_branch}[/yellow]")
+                    console.print(f"[yellow]  Type: {release_type.capitalize()}[/yellow]")
+                    console.print(f"[yellow]  Status: {'Draft' if is_draft else 'Published'}[/yellow]")
+                    console.print(f"[yellow]  URL: https://github.com/{repo_name}/releases/tag/{tag_name}[/yellow]")
+
+                    # Show release notes preview (only if not in debug mode to avoid duplication)
+                    if not debug:
+                        preview_length = 500
+                        preview = release_notes[:preview_length]
+                        if len(release_notes) > preview_length:
+                            preview += "\n[... truncated ...]"
+                        console.print(f"\n[yellow]Release notes preview ({len(release_notes)} characters):[/yellow]")
+                        console.print(f"[dim]{preview}[/dim]\n")
+                elif release_unchanged:
+                    release_url = published['release']['url']
+                    console.print(f"[green]✓ GitHub release unchanged since the last push[/green]")
+                    console.print(f"[blue]→ {release_url}[/blue]")
+                else:
+                    # Normal mode: create or update release with full tag/notes handling
                     # Check if release already exists on GitHub
                     existing_gh_release = github_client.get_release_by_tag(repo_name, tag_name)
-                    
+
                     if existing_gh_release:
                         if force == 'none':
                             console.print(f"[red]Error: GitHub release {tag_name} already exists.[/red]")
@@ -1052,7 +1479,7 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                             console.print(f"[blue]Updating existing {status}GitHub release for {version}...[/blue]")
                             if debug:
                                 console.print(f"[dim]Existing release URL: {existing_gh_release.html_url}[/dim]")
-                            
+
                             release_name = f"Release {version}"
                             release_url = github_client.update_release(
                                 repo_name,
@@ -1063,7 +1490,7 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                                 draft=is_draft,
                                 target_commitish=target_branch
                             )
-                            
+
                             if release_url:
                                 console.print(f"[green]✓ GitHub release updated successfully[/green]")
                                 console.print(f"[blue]→ {release_url}[/blue]")
@@ -1088,7 +1515,7 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                         if release_url:
                             console.print(f"[green]✓ GitHub release created successfully[/green]")
                             console.print(f"[blue]→ {release_url}[/blue]")
-                            
+
                             # Verify the release URL doesn't contain "untagged"
                             if "untagged" in release_url:
                                 console.print(f"[yellow]⚠ Warning: Release created but appears to be untagged. This may indicate the git tag was not properly created.[/yellow]")
@@ -1098,33 +1525,50 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                             console.print(f"[red]✗ Failed to create GitHub release[/red]")
                             console.print(f"[red]Error: Release creation failed. See error message above for details.[/red]")
                             sys.exit(1)
+                return release_url
+
+            def save_release(release_url):
+                # Save release to database
+                if not dry_run and repo:
+                    # Use the actual release URL from GitHub if available, otherwise construct it
+                    actual_url = release_url if release_url else f"https://github.com/{repo_name}/releases/tag/v{version}"
+
+                    release = Release(
+                        repo_id=repo.id,
+                        version=version,
+                        tag_name=f"v{version}",
+                        name=f"Release {version}",
+                        body=release_notes,
+                        created_at=datetime.now(),
+                        published_at=datetime.now() if not is_draft else None,
+                        is_draft=is_draft,
+                        is_prerelease=prerelease_flag,
+                        url=actual_url,
+                        target_commitish=target_branch
+                    )
+                    db.upsert_release(release)
+                if debug:
+                    console.print(f"[dim]Saved release to database (is_draft={is_draft})[/dim]")
 
-            # Save release to database
-            if not dry_run and repo:
-                # Use the actual release URL from GitHub if available, otherwise construct it
-                actual_url = release_url if release_url else f"https://github.com/{repo_name}/releases/tag/v{version}"
-
-                release = Release(
-                    repo_id=repo.id,
-                    version=version,
-                    tag_name=f"v{version}",
-                    name=f"Release {version}",
-                    body=release_notes,
-                    created_at=datetime.now(),
-                    published_at=datetime.now() if not is_draft else None,
-                    is_draft=is_draft,
-                    is_prerelease=prerelease_flag,
-                    url=actual_url,
-                    target_commitish=target_branch
-                )
-                db.upsert_release(release)
-            if debug:
-                console.print(f"[dim]Saved release to database (is_draft={is_draft})[/dim]")
+                # Remember what was written, so an unchanged release is skipped next time
+                if not dry_run and release_url:
+                    if is_mark_published:
+                        db.clear_publish_state(repo_name, version, ['release'])
+                    else:
+                        db.record_publish_state(repo_name, version, 'release', release_hash, release_url)
+                    if is_draft:
+                        db.clear_publish_state(repo_name, version, ['release.published'])
+                    else:
+                        db.record_publish_state(
+                            repo_name, version, 'release.published', publish_hash(tag_name), release_url
+                        )
+
+            graph.add('release', publish_release, requires=['tag'] if 'tag' in graph else [], on_done=save_release)
         elif dry_run:
             console.print(f"[yellow]Would NOT create GitHub release (--no-release or config setting)[/yellow]\n")
 
         # Create PRs for all repos with draft notes
-        created_prs = []  # List of PR info dicts: {repo_alias, repo_link, number, url, branch}
+        pr_steps = []
 
         if create_pr:
             # Get list of repos that have pr_code configuration
@@ -1162,7 +1606,9 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                     if debug:
                         console.print(f"[dim]Looking for draft notes for {repo_alias} version {version}...[/dim]")
 
-                    matching_drafts = _find_draft_releases(config, version_filter=version, repo_alias_filter=repo_alias)
+                    matching_drafts = _find_draft_releases(
+                        config, version_filter=version, repo_alias_filter=repo_alias, plans=plans
+                    )
 
                     if not matching_drafts:
                         console.print(f"[yellow]No draft notes found for {repo_alias} version {version}, skipping PR creation[/yellow]")
@@ -1216,17 +1662,10 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
 
                     # Initialize GitOperations for this repo
                     repo_git_ops = GitOperations(current_repo_path)
-                    repo_git_ops.fetch_remote_refs()
-                    repo_available_versions = repo_git_ops.get_version_tags()
 
                     # Determine target_branch for this repo
-                    repo_target_branch, repo_source_branch, repo_should_create_branch = determine_release_branch_strategy(
-                        version=target_version,
-                        git_ops=repo_git_ops,
-                        available_versions=repo_available_versions,
-                        branch_template=config.branch_policy.release_branch_template,
-                        default_branch=config.branch_policy.default_branch,
-                        branch_from_previous=config.branch_policy.branch_from_previous_release
+                    repo_target_branch, repo_source_branch, repo_should_create_branch = _resolve_branches(
+                        config, repo_git_ops, target_version, plans.get(repo_alias), debug
                     )
 
                     # Build template context with repo namespaces
@@ -1353,144 +1792,114 @@ def push(ctx, version: Optional[str], list_drafts: bool, delete_drafts: bool, no
                         console.print(f"[dim]{pr_body}[/dim]")
                         console.print("[dim]" + "=" * 60 + "[/dim]\n")
 
-                    if dry_run:
-                        console.print(f"[yellow]Would create pull request for {repo_alias}:[/yellow]")
-                        console.print(f"[yellow]  Repository: {current_repo_name}[/yellow]")
-                        console.print(f"[yellow]  Branch: {branch_name}[/yellow]")
-                        console.print(f"[yellow]  Title: {pr_title}[/yellow]")
-                        console.print(f"[yellow]  Target: {repo_target_branch}[/yellow]")
-                        if pr_file_path:
-                            console.print(f"[yellow]  Primary file (will be committed to): {pr_file_path}[/yellow]")
-                        if additional_files:
-                            console.print(f"[yellow]  Additional files (will be committed to):[/yellow]")
-                            for path in additional_files:
-                                console.print(f"[yellow]    - {path}[/yellow]")
-                        console.print(f"\n[yellow]PR body:[/yellow]")
-                        console.print(f"[dim]{pr_body}[/dim]\n")
-
-                        # In dry-run, create a mock PR info
-                        pr_info = {
-                            'repo_alias': repo_alias,
-                            'repo_link': current_repo_name,
-                            'number': 'XXX',
-                            'url': f'https://github.com/{current_repo_name}/pull/XXX',
-                            'branch': branch_name
-                        }
-                        created_prs.append(pr_info)
-                    else:
-                        console.print(f"[blue]Creating PR for {repo_alias} with release notes...[/blue]")
-                        pr_url = github_client.create_pr_for_release_notes(
-                            current_repo_name,
-                            pr_title,
-                            pr_file_path,
-                            pr_content,
-                            branch_name,
-                            repo_target_branch,
-                            pr_body,
-                            additional_files=additional_files
-                        )
-
-                        if pr_url:
-                            console.print(f"[green]✓ Pull request for {repo_alias} processed successfully[/green]")
-                            console.print(f"[blue]→ {pr_url}[/blue]")
-
-                            # Extract PR number from URL
-                            pr_number = pr_url.split('/')[-1] if '/' in pr_url else 'unknown'
-
-                            # Collect PR info
-                            pr_info = {
-                                'repo_alias': repo_alias,
-                                'repo_link': current_repo_name,
-                                'number': pr_number,
-                                'url': pr_url,
-                                'branch': branch_name
-                            }
-                            created_prs.append(pr_info)
-                        else:
-                            console.print(f"[red]✗ Failed to create PR for {repo_alias}[/red]")
-                            # Continue with other repos even if one fails
+                    pr_hash = _pull_request_hash(
+                        current_repo_name, branch_name, pr_title, pr_body, repo_target_branch, pr_file_path,
+                        pr_content, additional_files
+                    )
+                    pr_state = published.get(f"pr:{repo_alias}", {})
+
+                    def save_pr(pr_info, artifact=f"pr:{repo_alias}", content_hash=pr_hash):
+                        if pr_info and not dry_run:
+                            db.record_publish_state(repo_name, version, artifact, content_hash, pr_info['url'])
+
+                    pr_steps.append(graph.add(
+                        f"pr:{repo_alias}",
+                        functools.partial(
+                            _create_pull_request, github_client, repo_alias, current_repo_name, branch_name,
+                            pr_title, pr_body, repo_target_branch, pr_file_path, pr_content, additional_files,
+                            dry_run, published_url=pr_state.get('url') if pr_state.get('hash') == pr_hash else None
+                        ),
+                        # The release branch is created in the first code repository
+                        requires=['branch'] if repo_alias == first_code_repo.alias else [],
+                        on_done=save_pr
+                    ))
 
                 # After PR loop, create tracking issue with all PR info
-                if config.output.create_issue and created_prs:
-                    console.print(f"\n[bold blue]Creating release tracking issue with {len(created_prs)} PR(s)...[/bold blue]\n")
-
-                    # Build template context for issue
-                    issues_repo = _get_issues_repo(config)
-                    now = datetime.now()
-                    quarter = (now.month - 1) // 3 + 1
-                    quarter_uppercase = f"Q{quarter}"
-
-                    issue_template_context = build_repo_context(config)
-                    issue_template_context.update({
-                        'issue_repo': issues_repo,
-                        'issue_repo_name': issue_repo_name,
-                        'version': version,
-                        'major': str(target_version.major),
-                        'minor': str(target_version.minor),
-                        'patch': str(target_version.patch),
-                        'year': str(now.year),
-                        'quarter_uppercase': quarter_uppercase,
-                        'num_changes': 'multiple',
-                        'num_categories': 'multiple',
-                        'prs': created_prs  # Pass the list of PRs to the template
-                    })
+                if config.output.create_issue and pr_steps:
+                    # Looked up here: the database is only used from this thread
+                    existing_association = db.get_issue_association(repo_name, version) if not dry_run else None
+
+                    def track_release(results):
+                        created_prs = [results[step] for step in pr_steps if results[step]]
+                        if not created_prs:
+                            return None
+                        return _resolve_release_issue(
+                            config, github_client, version, target_version, issue_repo_name, created_prs,
+                            issue, force, existing_association, dry_run, debug,
+                            published_hash=published.get('issue', {}).get('hash')
+                        )
 
-                    # If issue number provided explicitly, use it directly
-                    issue_result = None
-                    if issue and not dry_run:
-                        try:
-                            issue_obj = github_client.gh.get_repo(issues_repo).get_issue(issue)
-                            issue_result = {'number': str(issue_obj.number), 'url': issue_obj.html_url}
-                            console.print(f"[blue]Using provided issue #{issue}[/blue]")
-                            # Save association to database
+                    def save_issue(issue_result):
+                        if issue_result and not dry_run and issue_result['source'] != 'reused':
                             db.save_issue_association(
                                 repo_full_name=repo_name,
                                 version=version,
-                                issue_number=issue_obj.number,
-                                issue_url=issue_obj.html_url
+                                issue_number=int(issue_result['number']),
+                                issue_url=issue_result['url']
                             )
                             if debug:
                                 console.print(f"[dim]Saved issue association to database[/dim]")
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Could not use issue #{issue}: {e}[/yellow]")
-                            issue_result = None
-
-                    # If force=draft, try to find existing issue automatically
-                    if force == 'draft' and not dry_run and not issue_result:
-                        existing_association = db.get_issue_association(repo_name, version)
-                        if not existing_association:
-                            issue_result = _find_existing_issue_auto(config, github_client, version, debug)
-                            if issue_result:
-                                console.print(f"[blue]Auto-selected open issue #{issue_result['number']}[/blue]")
-                                # Save association
-                                db.save_issue_association(
-                                    repo_full_name=repo_name,
-                                    version=version,
-                                    issue_number=int(issue_result['number']),
-                                    issue_url=issue_result['url']
-                                )
+                        if issue_result and not dry_run and issue_result.get('content_hash'):
+                            db.record_publish_state(
+                                repo_name, version, 'issue', issue_result['content_hash'], issue_result['url']
+                            )
 
-                    # Create or update issue
-                    if not issue_result:
-                        issue_result = _create_release_issue(
-                            config=config,
-                            github_client=github_client,
-                            db=db,
-                            template_context=issue_template_context,
-                            version=version,
-                            prs=created_prs,
-                            override=(force != 'none'),
-                            dry_run=dry_run,
-                            debug=debug
+                    def save_issue_metadata(artifact, content_hash):
+                        def save(result):
+                            issue_result = graph.results['issue']
+                            if result is not None:
+                                db.record_publish_state(
+                                    repo_name, version, artifact, content_hash(config, issue_result),
+                                    issue_result['url']
+                                )
+                        return save
+
+                    graph.add('issue', track_release, requires=pr_steps, on_done=save_issue)
+                    if not dry_run:
+                        graph.add(
+                            'issue.assign',
+                            lambda results: _assign_release_issue(
+                                config, github_client, results['issue'],
+                                published_hash=published.get('issue.assign', {}).get('hash')
+                            ),
+                            requires=['issue'],
+                            on_done=save_issue_metadata('issue.assign', _issue_assignment_hash)
+                        )
+                        graph.add(
+                            'issue.project',
+                            lambda results: _add_release_issue_to_project(
+                                config, github_client, results['issue'], debug,
+                                published_hash=published.get('issue.project', {}).get('hash')
+                            ),
+                            requires=['issue'],
+                            on_done=save_issue_metadata('issue.project', _issue_project_hash)
                         )
-
-                    if issue_result:
-                        console.print(f"[green]✓ Release tracking issue: #{issue_result['number']}[/green]")
-                        console.print(f"[blue]→ {issue_result['url']}[/blue]")
 
         elif dry_run:
             console.print(f"[yellow]Would NOT create pull request (--no-pr or config setting)[/yellow]\n")
 
+        def record_step(step, result):
+            db.record_push_step(repo_name, version, fingerprint, step, result)
+
+        try:
+            graph.run(
+                journal=journal,
+                record=None if dry_run else record_step,
+                # One step at a time keeps the dry-run report in order
+                max_workers=1 if dry_run else MAX_WORKERS
+            )
+        except BaseException:
+            if not dry_run:
+                done = [step for step in graph.names if step in graph.results and step not in graph.skipped]
+                if done or graph.skipped:
+                    console.print(
+                        f"[yellow]Push of {version} stopped; {len(done) + len(graph.skipped)} of "
+                        f"{len(graph)} step(s) finished. Rerun the same command to resume.[/yellow]"
+                    )
+            raise
+        if not dry_run:
+            db.clear_push_journal(repo_name, version)
+
         # Dry-run summary
         if dry_run:
             console.print(f"\n[yellow]{'='*80}[/yellow]")
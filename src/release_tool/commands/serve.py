@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Daemon command for release-tool."""
+
+import os
+import sys
+from typing import Optional
+import click
+from rich.console import Console
+
+from ..config import Config
+from ..daemon import (
+    DAEMON_COMMANDS, DEFAULT_SOCKET_PATH, SOCKET_ENV, ReleaseToolDaemon,
+    enable_warm_state, stop,
+)
+
+console = Console()
+
+
+def _warm_up(ctx: click.Context, config: Config) -> None:
+    """Load command modules and open the state requests will reuse."""
+    from ..db import Database
+    from ..media_utils import get_media_store
+    from ..policies import compile_policy
+
+    for name in DAEMON_COMMANDS:
+        ctx.find_root().command.get_command(ctx, name)
+
+    compile_policy(config)
+    get_media_store(config)
+    database = Database(config.database.path)
+    database.connect()
+    database.close()
+
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option(
+    '--socket', 'socket_path',
+    default=None,
+    help=f'Unix socket to listen on (default: ${SOCKET_ENV} or {DEFAULT_SOCKET_PATH})'
+)
+@click.option(
+    '--idle-timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help='Exit after this many seconds without requests (default: run until stopped)'
+)
+@click.option(
+    '--stop', 'stop_daemon',
+    is_flag=True,
+    help='Ask a running daemon to exit and return'
+)
+@click.pass_context
+def serve(ctx, socket_path: Optional[str], idle_timeout: Optional[float], stop_daemon: bool):
+    """
+    Run a daemon that serves CLI requests with warm state.
+
+    The daemon keeps the database connection, git repositories, version
+    catalogues, compiled templates and policies, and GitHub sessions warm
+    between requests. It serves the generate, push, merge, cancel and issues
+    commands; point the CLI at it with RELEASE_TOOL_DAEMON_SOCKET and those
+    commands are forwarded to the daemon (or run locally if it is not running).
+
+    Examples:
+
+      release-tool serve
+
+      release-tool serve --socket /run/release-tool.sock --idle-timeout 3600
+
+      RELEASE_TOOL_DAEMON_SOCKET=.release_tool_cache/daemon.sock release-tool generate 1.2.0
+
+      release-tool serve --stop
+    """
+    socket_path = socket_path or os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET_PATH
+
+    if stop_daemon:
+        if stop(socket_path):
+            console.print(f"[green]✓ Daemon on {socket_path} is stopping[/green]")
+        else:
+            console.print(f"[yellow]No daemon is listening on {socket_path}[/yellow]")
+        return
+
+    config: Config = ctx.obj['config']
+    enable_warm_state()
+    _warm_up(ctx, config)
+
+    daemon = ReleaseToolDaemon(socket_path, idle_timeout=idle_timeout)
+    console.print(f"[blue]Serving release-tool requests on {socket_path}[/blue]")
+    try:
+        daemon.serve_forever()
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+    console.print(f"[dim]Daemon stopped after {daemon.requests_served} request(s)[/dim]")
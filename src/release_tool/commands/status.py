@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Operational status report for release-tool."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+import click
+from rich.console import Console
+from rich.table import Table
+
+from ..config import Config
+from ..metrics import collect_status, format_openmetrics, write_openmetrics
+from .db import _format_size
+
+console = Console()
+
+
+def _format_age(seconds: Optional[float]) -> str:
+    """Format an age in seconds for display (e.g., 2h 5m)."""
+    if seconds is None:
+        return "-"
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 24:
+        return f"{hours}h {minutes}m"
+    days, hours = divmod(hours, 24)
+    return f"{days}d {hours}h"
+
+
+def _format_rate_limits(rate_limits: Dict[str, Dict[str, int]]) -> str:
+    """Format the remaining budget per resource (e.g., core 4870/5000, resets 14:05)."""
+    parts = []
+    for resource, limits in sorted(rate_limits.items()):
+        reset = datetime.fromtimestamp(limits['reset']).strftime('%H:%M') if limits['reset'] else '?'
+        parts.append(f"{resource} {limits['remaining']}/{limits['limit']}, resets {reset}")
+    return "; ".join(parts) or "-"
+
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option(
+    '--openmetrics',
+    'openmetrics_path',
+    type=click.Path(dir_okay=False),
+    help='Also write the report as an OpenMetrics textfile to PATH ("-" for stdout only)'
+)
+@click.pass_context
+def status(ctx, openmetrics_path: Optional[str]):
+    """
+    Report sync freshness, API budget, database size and cache statistics.
+
+    Shows when each repository was last pulled, row counts and page usage
+    of the database, the size of the on-disk caches, and for the last run
+    of each command (pull, generate, push, merge, cancel) its GitHub API
+    calls, remaining rate limit and cache hit rates. Works offline.
+
+    The OpenMetrics textfile can be picked up by the node_exporter textfile
+    collector (write it to the collector's directory from a cron job).
+
+    Examples:
+
+      release-tool status
+
+      release-tool status --openmetrics /var/lib/node_exporter/release_tool.prom
+    """
+    config: Config = ctx.obj['config']
+    now = datetime.now()
+    report = collect_status(config, now)
+
+    if openmetrics_path == '-':
+        click.echo(format_openmetrics(report, now), nl=False)
+        return
+
+    _print_report(report)
+
+    if openmetrics_path:
+        write_openmetrics(openmetrics_path, format_openmetrics(report, now))
+        console.print(f"[green]✓ OpenMetrics written to {openmetrics_path}[/green]")
+
+
+def _print_report(report: Dict) -> None:
+    sync = report['sync']
+    if sync:
+        table = Table(title="Sync freshness")
+        for column in ("Repository", "Entity", "Last sync", "Age", "Fetched"):
+            table.add_column(column, justify="right" if column in ("Age", "Fetched") else "left")
+        for entry in sync:
+            last_sync = entry['last_sync_at'][:19].replace('T', ' ') if entry['last_sync_at'] else "-"
+            fetched = entry['total_fetched']
+            table.add_row(entry['repo'], entry['entity'], last_sync, _format_age(entry['age']),
+                          str(fetched) if fetched is not None else "-")
+        console.print(table)
+    else:
+        console.print("[yellow]Nothing pulled yet (run 'release-tool pull')[/yellow]")
+
+    database = report['database']
+    console.print(
+        f"\n[bold]Database[/bold] {database['path']}: {_format_size(database['file_size'])}, "
+        f"{database['page_count']} pages of {database['page_size']} B "
+        f"({database['freelist_count']} free)"
+    )
+    rows = ", ".join(f"{table} {count}" for table, count in database['tables'].items())
+    console.print(f"  Rows: {rows}")
+
+    caches = ", ".join(
+        f"{name} {_format_size(size)}" for name, size in report['caches'].items() if size is not None
+    )
+    console.print(f"  Caches on disk: {caches or 'none'}")
+
+    runs = report['runs']
+    if not runs:
+        console.print("\n[dim]No recorded runs yet[/dim]")
+        return
+
+    table = Table(title="Last runs")
+    for column in ("Command", "Started", "Duration", "API calls", "304s", "Rate limit"):
+        table.add_column(column, justify="left" if column in ("Command", "Started", "Rate limit") else "right")
+    for run in runs:
+        table.add_row(
+            run['command'],
+            f"{run['started_at'][:19].replace('T', ' ')} ({_format_age(run['age'])} ago)",
+            f"{run['duration']:.1f}s",
+            str(run['api_calls']),
+            str(run['api_not_modified']),
+            _format_rate_limits(run['rate_limits']),
+        )
+    console.print(table)
+
+    totals: Dict[str, List[int]] = {}
+    for run in runs:
+        for name, (hits, misses) in run['caches'].items():
+            stats = totals.setdefault(name, [0, 0])
+            stats[0] += hits
+            stats[1] += misses
+    if totals:
+        table = Table(title="Cache hit rates (last runs)")
+        for column in ("Cache", "Hits", "Misses", "Hit rate"):
+            table.add_column(column, justify="left" if column == "Cache" else "right")
+        for name, (hits, misses) in sorted(totals.items()):
+            rate = f"{hits / (hits + misses):.0%}" if hits + misses else "-"
+            table.add_row(name, str(hits), str(misses), rate)
+        console.print(table)
@@ -10,7 +10,8 @@ from typing import Dict, List, Optional, Any, Union, Literal
 from enum import Enum
 from pydantic import BaseModel, Field, model_validator
 import tomli
-import tomlkit
+
+from .profiling import cache as record_cache, timed
 
 
 class PolicyAction(str, Enum):
@@ -536,6 +537,18 @@ class GitHubConfig(BaseModel):
         description="GitHub API URL"
     )
 
+    @property
+    def graphql_url(self) -> str:
+        """GraphQL endpoint for api_url.
+
+        GitHub Enterprise serves REST under /api/v3 and GraphQL under
+        /api/graphql; elsewhere GraphQL lives at {api_url}/graphql.
+        """
+        base = self.api_url.rstrip('/')
+        if base.endswith('/api/v3'):
+            return base[:-len('/v3')] + '/graphql'
+        return base + '/graphql'
+
     @property
     def token(self) -> str:
         """Get GitHub token from environment variable.
@@ -581,6 +594,33 @@ class OutputConfig(BaseModel):
         default=True,
         description="Download and include images/videos from issue descriptions"
     )
+    media_cache_dir: str = Field(
+        default=".release_tool_cache/media",
+        description="Directory of the persistent media cache. Downloaded media is stored once per "
+                    "content hash with a manifest of URLs, so later runs only revalidate it."
+    )
+    media_download_workers: int = Field(
+        default=8,
+        description="Number of concurrent media downloads"
+    )
+    media_max_file_size_mb: Optional[float] = Field(
+        default=50,
+        description="Skip media files larger than this many megabytes (no limit when not set)"
+    )
+    media_download_budget_mb: Optional[float] = Field(
+        default=None,
+        description="Maximum megabytes of media downloaded per run (no limit when not set)"
+    )
+    media_download_time_budget: Optional[float] = Field(
+        default=300,
+        description="Maximum seconds spent downloading a batch of media (no limit when not set). "
+                    "Media not fetched in time keeps its original URL or uses a cached copy."
+    )
+    template_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the on-disk Jinja2 bytecode cache (e.g., '.release_tool_cache/templates'). "
+                    "Compiled templates are reused across runs. Disabled when not set."
+    )
     create_github_release: bool = Field(
         default=False,
         description="Whether to create a GitHub release"
@@ -625,6 +665,18 @@ class Config(BaseModel):
     release_notes: ReleaseNoteConfig = Field(default_factory=ReleaseNoteConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
 
+    @model_validator(mode='after')
+    def _compile_templates(self) -> "Config":
+        """Compile all configured templates once, failing early on syntax errors."""
+        from .template_utils import compile_config_templates, configure_bytecode_cache, TemplateError
+
+        configure_bytecode_cache(self.output.template_cache_dir)
+        try:
+            compile_config_templates(self)
+        except TemplateError as e:
+            raise ValueError(str(e))
+        return self
+
     @classmethod
     def from_file(cls, config_path: str, auto_upgrade: bool = False) -> "Config":
         """Load configuration from TOML file.
@@ -640,48 +692,60 @@ class Config(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(path, 'rb') as f:
-            data = tomli.load(f)
+        raw = path.read_bytes()
+        cache_key = _config_cache_key(path, raw)
+        cached = _load_cached_config(cache_key)
+        record_cache('config', hits=int(cached is not None), misses=int(cached is None))
+        if cached is not None:
+            return cached
+
+        data = tomli.loads(raw.decode('utf-8'))
 
         # Check and upgrade config version if needed
         from .migrations import MigrationManager
         manager = MigrationManager()
         current_version = data.get('config_version', '1.0')
 
-        if manager.needs_upgrade(current_version):
-            # Config is out of date
-            target_version = manager.CURRENT_VERSION
-            changes = manager.get_changes_description(current_version, target_version)
-
-            if auto_upgrade:
-                # Auto-upgrade without prompting
-                print(f"Auto-upgrading config from v{current_version} to v{target_version}...")
+        if not manager.needs_upgrade(current_version):
+            config = cls(**data)
+            _store_cached_config(cache_key, config)
+            return config
+
+        import tomlkit
+
+        # Config is out of date (upgraded configs are cached on the next load)
+        target_version = manager.CURRENT_VERSION
+        changes = manager.get_changes_description(current_version, target_version)
+
+        if auto_upgrade:
+            # Auto-upgrade without prompting
+            print(f"Auto-upgrading config from v{current_version} to v{target_version}...")
+            data = manager.upgrade_config(data, target_version)
+
+            # Save upgraded config back to file
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(tomlkit.dumps(data))
+            print(f"Config upgraded and saved to {config_path}")
+        else:
+            # Prompt user to upgrade
+            print(f"\n⚠️  Config file is version {current_version}, but current version is {target_version}")
+            print(f"\nChanges in v{target_version}:")
+            print(changes)
+            print(f"\nYou need to upgrade your config file to continue.")
+
+            response = input("\nUpgrade now? [Y/n]: ").strip().lower()
+            if response in ['', 'y', 'yes']:
                 data = manager.upgrade_config(data, target_version)
 
                 # Save upgraded config back to file
                 with open(path, 'w', encoding='utf-8') as f:
                     f.write(tomlkit.dumps(data))
-                print(f"Config upgraded and saved to {config_path}")
+                print(f"✓ Config upgraded to v{target_version} and saved to {config_path}")
             else:
-                # Prompt user to upgrade
-                print(f"\n⚠️  Config file is version {current_version}, but current version is {target_version}")
-                print(f"\nChanges in v{target_version}:")
-                print(changes)
-                print(f"\nYou need to upgrade your config file to continue.")
-
-                response = input("\nUpgrade now? [Y/n]: ").strip().lower()
-                if response in ['', 'y', 'yes']:
-                    data = manager.upgrade_config(data, target_version)
-
-                    # Save upgraded config back to file
-                    with open(path, 'w', encoding='utf-8') as f:
-                        f.write(tomlkit.dumps(data))
-                    print(f"✓ Config upgraded to v{target_version} and saved to {config_path}")
-                else:
-                    raise ValueError(
-                        f"Config version {current_version} is not supported. "
-                        f"Please upgrade to v{target_version} using: release-tool update-config"
-                    )
+                raise ValueError(
+                    f"Config version {current_version} is not supported. "
+                    f"Please upgrade to v{target_version} using: release-tool update-config"
+                )
 
         return cls(**data)
 
@@ -751,6 +815,96 @@ class Config(BaseModel):
         return [cat.name for cat in sorted_cats]
 
 
+# Config cache: validated Config objects pickled per config file, so repeated
+# invocations skip TOML parsing, migration checks and model validation.
+CONFIG_CACHE_DIR_ENV = "RELEASE_TOOL_CONFIG_CACHE_DIR"
+NO_CONFIG_CACHE_ENV = "RELEASE_TOOL_NO_CONFIG_CACHE"
+
+
+def _config_cache_dir() -> Optional[Path]:
+    """Get the config cache directory, or None if caching is disabled."""
+    if os.getenv(NO_CONFIG_CACHE_ENV):
+        return None
+    directory = os.getenv(CONFIG_CACHE_DIR_ENV)
+    if directory:
+        return Path(directory)
+    base = os.getenv('XDG_CACHE_HOME') or str(Path.home() / ".cache")
+    return Path(base) / "release-tool" / "config"
+
+
+def _config_cache_key(path: Path, raw: bytes) -> tuple:
+    """
+    Build the cache key for a config file.
+
+    The key covers the file (path, mtime, content hash), the tool version,
+    the config schema module and the current config format version, so any
+    change to either the file or the code invalidates the cached entry.
+    """
+    import hashlib
+    from . import __version__
+    from .migrations.manager import MigrationManager
+
+    resolved = path.resolve()
+    return (
+        str(resolved),
+        resolved.stat().st_mtime_ns,
+        hashlib.sha256(raw).hexdigest(),
+        __version__,
+        Path(__file__).stat().st_mtime_ns,
+        MigrationManager.CURRENT_VERSION,
+    )
+
+
+def _config_cache_file(key: tuple) -> Optional[Path]:
+    import hashlib
+
+    directory = _config_cache_dir()
+    if directory is None:
+        return None
+    return directory / f"{hashlib.sha1(key[0].encode('utf-8')).hexdigest()}.pickle"
+
+
+def _load_cached_config(key: tuple) -> Optional["Config"]:
+    """Load a cached Config for the key, or None on a miss (or any error)."""
+    import pickle
+
+    cache_file = _config_cache_file(key)
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, config = pickle.load(f)
+    except Exception:
+        return None
+    if cached_key != key or not isinstance(config, Config):
+        return None
+
+    # Unpickling skips validation: reapply its side effects
+    from .template_utils import configure_bytecode_cache
+    configure_bytecode_cache(config.output.template_cache_dir)
+    return config
+
+
+def _store_cached_config(key: tuple, config: "Config") -> None:
+    """Store a validated Config in the cache (best effort)."""
+    import pickle
+    import tempfile
+
+    cache_file = _config_cache_file(key)
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix='.config-')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except Exception:
+        # The cache is an optimization only
+        pass
+
+
+@timed('config.load')
 def load_config(config_path: Optional[str] = None, auto_upgrade: bool = False) -> Config:
     """Load configuration from file or use defaults.
 
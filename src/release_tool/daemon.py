@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Long-running daemon that serves CLI requests with warm state.
+
+The daemon listens on a local Unix socket. Each connection carries one CLI
+invocation (argv, working directory and the client's GITHUB_* and
+RELEASE_TOOL_* environment variables) as a JSON line; the daemon runs it
+in-process through the regular click group and streams the output back as
+JSON lines, followed by the exit code. Between requests it keeps warm the
+imported modules, compiled templates and policies, SQLite connections, git
+repository handles and version catalogues, and GitHub sessions.
+
+The client side is `forward()`: main() uses it to send supported commands
+to the daemon when RELEASE_TOOL_DAEMON_SOCKET is set.
+
+Only the standard library is imported at module level so that the client
+path stays as cheap as the regular CLI startup.
+"""
+
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO
+
+# Environment variable the client reads to find the daemon socket
+SOCKET_ENV = "RELEASE_TOOL_DAEMON_SOCKET"
+
+DEFAULT_SOCKET_PATH = ".release_tool_cache/daemon.sock"
+
+# Commands the daemon runs; anything else always runs locally
+DAEMON_COMMANDS = frozenset({'generate', 'push', 'merge', 'cancel', 'issues'})
+
+# Global options of the `cli` group, needed to find the subcommand in argv
+_GLOBAL_FLAGS = frozenset({'--auto', '-y', '--assume-yes', '--debug'})
+_GLOBAL_VALUE_OPTIONS = frozenset({'-c', '--config', '--output-mode', '--profile', '--profile-pstats'})
+
+# Environment variables a request takes from the client instead of the
+# daemon: the GitHub token and Actions context, and release-tool settings
+FORWARDED_ENV_PREFIXES = ('GITHUB_', 'RELEASE_TOOL_')
+
+
+def subcommand_of(argv: Iterable[str]) -> Optional[str]:
+    """Return the subcommand named in a CLI argv, or None if there is none."""
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif arg in _GLOBAL_FLAGS or arg.split('=', 1)[0] in _GLOBAL_VALUE_OPTIONS:
+            continue
+        elif arg.startswith('-'):
+            # Help or an unknown global option: let the local CLI handle it
+            return None
+        else:
+            return arg
+    return None
+
+
+def forwarded_environment() -> Dict[str, str]:
+    """Return the variables of this process's environment that requests forward."""
+    return {name: value for name, value in os.environ.items() if name.startswith(FORWARDED_ENV_PREFIXES)}
+
+
+def _set_forwarded_environment(values: Dict[str, str]) -> None:
+    """Make the forwarded variables of this process's environment exactly `values`."""
+    for name in forwarded_environment().keys() - values.keys():
+        del os.environ[name]
+    os.environ.update(values)
+
+
+def _send(sock: socket.socket, message: Dict) -> None:
+    sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+class _SocketStream(io.TextIOBase):
+    """Text stream that forwards writes to the client as JSON messages."""
+
+    def __init__(self, sock: socket.socket, name: str, lock: threading.Lock):
+        self._sock = sock
+        self._name = name
+        self._lock = lock
+        self._connected = True
+
+    @property
+    def encoding(self) -> str:
+        return 'utf-8'
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, data: str) -> int:
+        if not isinstance(data, str):
+            # click probes streams with write(b"") to detect binary writers
+            raise TypeError(f"write() argument must be str, not {type(data).__name__}")
+        if data and self._connected:
+            with self._lock:
+                try:
+                    _send(self._sock, {'stream': self._name, 'data': data})
+                except OSError:
+                    # Client went away: finish the command, drop its output
+                    self._connected = False
+        return len(data)
+
+
+def enable_warm_state() -> None:
+    """Keep connections and handles open across commands in this process."""
+    from .db import Database
+    from .git_ops import GitOperations
+    from .github_utils import GitHubClient
+
+    Database.enable_shared_connections()
+    GitOperations.enable_shared_repos()
+    GitHubClient.enable_shared_sessions()
+
+
+def close_warm_state() -> None:
+    """Close everything opened by enable_warm_state()."""
+    from .db import Database
+    from .git_ops import GitOperations
+    from .github_utils import GitHubClient
+
+    Database.close_shared_connections()
+    GitOperations.close_shared_repos()
+    GitHubClient.close_shared_sessions()
+
+
+class ReleaseToolDaemon:
+    """Unix socket server that runs CLI requests one at a time."""
+
+    def __init__(self, socket_path: str, idle_timeout: Optional[float] = None):
+        """
+        Args:
+            socket_path: Path of the Unix socket to listen on.
+            idle_timeout: Exit after this many seconds without requests (None: never).
+        """
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self.requests_served = 0
+        self._stopping = False
+        self._server: Optional[socket.socket] = None
+        self.ready = threading.Event()
+
+    def _bind(self) -> socket.socket:
+        if self.socket_path.exists():
+            # Refuse to steal the socket of a daemon that is still running
+            if ping(str(self.socket_path)):
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        # Requests run as the daemon's user: only that user may connect
+        os.chmod(self.socket_path, 0o600)
+        server.listen()
+        server.settimeout(self.idle_timeout)
+        return server
+
+    def serve_forever(self) -> None:
+        """Accept and serve requests until stopped, idle or terminated."""
+        self._server = self._bind()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        self.ready.set()
+        try:
+            while not self._stopping:
+                try:
+                    conn, _ = self._server.accept()
+                except socket.timeout:
+                    break
+                with conn:
+                    conn.settimeout(None)
+                    self.handle(conn)
+        finally:
+            self._server.close()
+            self.socket_path.unlink(missing_ok=True)
+            close_warm_state()
+
+    def handle(self, conn: socket.socket) -> None:
+        """Serve one connection: read the request, run it, stream the result."""
+        try:
+            with conn.makefile('rb') as reader:
+                request = json.loads(reader.readline() or b'{}')
+        except (OSError, ValueError):
+            return
+
+        op = request.get('op', 'run')
+        if op == 'ping':
+            _send(conn, {'exit': 0})
+            return
+        if op == 'stop':
+            self._stopping = True
+            _send(conn, {'exit': 0})
+            return
+
+        argv = [str(arg) for arg in request.get('argv', [])]
+        command = subcommand_of(argv)
+        if command not in DAEMON_COMMANDS:
+            _send(conn, {'stream': 'stderr', 'data': f"Error: '{command}' is not served by the daemon\n"})
+            _send(conn, {'exit': 2})
+            return
+
+        env = request.get('env')
+        lock = threading.Lock()
+        exit_code = self.run(
+            argv,
+            request.get('cwd') or os.getcwd(),
+            _SocketStream(conn, 'stdout', lock),
+            _SocketStream(conn, 'stderr', lock),
+            env={str(name): str(value) for name, value in env.items()} if isinstance(env, dict) else None,
+        )
+        self.requests_served += 1
+        try:
+            _send(conn, {'exit': exit_code})
+        except OSError:
+            pass
+
+    def run(
+        self,
+        argv: List[str],
+        cwd: str,
+        stdout: TextIO,
+        stderr: TextIO,
+        env: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Run a CLI invocation in-process and return its exit code.
+
+        Args:
+            argv: CLI arguments (without the program name).
+            cwd: Working directory to run in.
+            stdout: Stream for the command's standard output.
+            stderr: Stream for the command's error output.
+            env: The client's forwarded environment variables (see
+                FORWARDED_ENV_PREFIXES); they replace the daemon's own for
+                this invocation. None keeps the daemon's environment.
+        """
+        from .main import cli
+        from .db import Database
+
+        previous_cwd = os.getcwd()
+        previous_env = forwarded_environment()
+        previous_stdin = sys.stdin
+        # Prompts read an empty stdin and abort, as in a non-interactive shell
+        sys.stdin = io.StringIO()
+        try:
+            if env is not None:
+                _set_forwarded_environment(env)
+            os.chdir(cwd)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    cli.main(args=argv, prog_name='release-tool', obj={})
+                except SystemExit as e:
+                    return _exit_code(e.code)
+                except Exception:
+                    traceback.print_exc()
+                    return 1
+            return 0
+        finally:
+            sys.stdin = previous_stdin
+            _set_forwarded_environment(previous_env)
+            os.chdir(previous_cwd)
+            Database.rollback_shared_connections()
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # sys.exit("message") prints the message and exits with 1
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _request(socket_path: str, message: Dict, timeout: Optional[float] = None) -> Optional[socket.socket]:
+    """Connect to the daemon and send a message; None if no daemon is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    _send(sock, message)
+    return sock
+
+
+def forward(
+    argv: List[str],
+    socket_path: str,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> Optional[int]:
+    """
+    Run a CLI invocation on the daemon, relaying its output.
+
+    Args:
+        argv: CLI arguments (without the program name).
+        socket_path: Path of the daemon socket.
+        stdout: Stream for the command's standard output (default: sys.stdout).
+        stderr: Stream for the command's error output (default: sys.stderr).
+
+    Returns:
+        The command's exit code, or None if no daemon is listening (the
+        caller should then run the command locally).
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    sock = _request(socket_path, {
+        'op': 'run', 'argv': list(argv), 'cwd': os.getcwd(), 'env': forwarded_environment(),
+    })
+    if sock is None:
+        return None
+    with sock, sock.makefile('rb') as reader:
+        for line in reader:
+            message = json.loads(line)
+            if 'exit' in message:
+                return message['exit']
+            stream = stderr if message.get('stream') == 'stderr' else stdout
+            stream.write(message.get('data', ''))
+            stream.flush()
+    stderr.write("Error: the release-tool daemon closed the connection\n")
+    return 1
+
+
+def _control(socket_path: str, op: str, timeout: float) -> bool:
+    try:
+        sock = _request(socket_path, {'op': op}, timeout=timeout)
+        if sock is None:
+            return False
+        with sock, sock.makefile('rb') as reader:
+            return json.loads(reader.readline() or b'{}').get('exit') == 0
+    except (OSError, ValueError):
+        return False
+
+
+def ping(socket_path: str, timeout: float = 2.0) -> bool:
+    """Return True if a daemon answers on the socket."""
+    return _control(socket_path, 'ping', timeout)
+
+
+def stop(socket_path: str, timeout: float = 30.0) -> bool:
+    """Ask the daemon to exit after its current request; True if it acknowledged."""
+    return _control(socket_path, 'stop', timeout)
@@ -6,31 +6,112 @@
 
 import sqlite3
 import json
+import re
+import hashlib
+import zlib
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from pathlib import Path
 
 from .models import (
-    Repository, PullRequest, Commit, Issue, Release, Label
+    Repository, PullRequest, Commit, Issue, Release, Label, Author
 )
+from .profiling import cache as record_cache, instrument_sqlite, release_sqlite, timed
+
+# Author columns persisted in the interned authors table (same order as the model)
+_AUTHOR_FIELDS = (
+    'name', 'email', 'username', 'github_id', 'display_name', 'avatar_url',
+    'profile_url', 'company', 'location', 'bio', 'blog', 'user_type'
+)
+
+
+def publish_hash(value: Any) -> str:
+    """
+    Content hash of an artifact written to GitHub (see publish_state).
+
+    Args:
+        value: JSON-serializable description of the artifact (body, title,
+            flags, file contents, ...)
+    """
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
 
 
 class Database:
     """SQLite database manager."""
 
+    # Connections kept open across Database instances (daemon mode), keyed by
+    # resolved path: (connection, inode of the file it was opened on).
+    # None when sharing is disabled (the default for one-shot CLI runs).
+    _shared_connections: Optional[Dict[str, Tuple[sqlite3.Connection, int]]] = None
+
     def __init__(self, db_path: str = "release_tool.db"):
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
+        # In-process identity caches for interned authors and labels.
+        # Rows that reference the same author/label share a single model instance.
+        self._authors_by_id: Dict[int, Author] = {}
+        self._author_ids: Dict[str, int] = {}
+        self._labels_by_id: Dict[int, Label] = {}
+        self._label_ids: Dict[Tuple[str, str, str], int] = {}
+        # Note section extraction (set via configure_note_sections)
+        self._description_re: Optional[re.Pattern] = None
+        self._migration_re: Optional[re.Pattern] = None
+        self._sections_key: Optional[str] = None
+        self._shared = False
+
+    @classmethod
+    def enable_shared_connections(cls) -> None:
+        """Keep connections open after close() so later instances reuse them."""
+        if cls._shared_connections is None:
+            cls._shared_connections = {}
+
+    @classmethod
+    def rollback_shared_connections(cls) -> None:
+        """Roll back transactions left open on shared connections (e.g. by a failed command)."""
+        for conn, _ in (cls._shared_connections or {}).values():
+            if conn.in_transaction:
+                conn.rollback()
+
+    @classmethod
+    def close_shared_connections(cls) -> None:
+        """Close all shared connections and disable sharing."""
+        for conn, _ in (cls._shared_connections or {}).values():
+            conn.close()
+        cls._shared_connections = None
 
     def connect(self):
         """Connect to the database and initialize schema."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
+        shared = Database._shared_connections
+        if shared is not None:
+            key = str(Path(self.db_path).resolve())
+            entry = shared.get(key)
+            if entry is not None:
+                conn, inode = entry
+                if Path(key).exists() and Path(key).stat().st_ino == inode:
+                    # Schema is already initialized on this connection
+                    self.conn = conn
+                    self.cursor = conn.cursor()
+                    self._shared = True
+                    return
+                # The file was replaced or removed: drop the stale connection
+                del shared[key]
+                conn.close()
+
+        # Shared connections may be opened during warm-up on another thread;
+        # the daemon serves requests one at a time
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=shared is None)
         self.conn.row_factory = sqlite3.Row
+        # Before creating cursors: they copy the connection's row factory
+        instrument_sqlite(self.conn)
         self.cursor = self.conn.cursor()
         self._init_db()
 
+        if shared is not None:
+            shared[key] = (self.conn, Path(key).stat().st_ino)
+            self._shared = True
+
     def _init_db(self):
         """Create database schema."""
         # Repositories table
@@ -60,7 +141,18 @@ class Database:
                 location TEXT,
                 bio TEXT,
                 blog TEXT,
-                user_type TEXT
+                user_type TEXT,
+                identity_key TEXT
+            )
+        """)
+
+        # Labels table - stores unique labels, referenced from join tables
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS labels (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                color TEXT,
+                description TEXT
             )
         """)
 
@@ -75,6 +167,7 @@ class Database:
                 state TEXT,
                 merged_at TEXT,
                 author_json TEXT,
+                author_id INTEGER,
                 base_branch TEXT,
                 head_branch TEXT,
                 head_sha TEXT,
@@ -91,10 +184,26 @@ class Database:
                 sha TEXT PRIMARY KEY,
                 repo_id INTEGER NOT NULL,
                 message TEXT NOT NULL,
-                author_json TEXT NOT NULL,
+                author_json TEXT,
+                author_id INTEGER,
                 date TEXT NOT NULL,
                 url TEXT,
                 pr_number INTEGER,
+                issue_keys TEXT,
+                issue_patterns_key TEXT,
+                FOREIGN KEY (repo_id) REFERENCES repositories (id),
+                FOREIGN KEY (author_id) REFERENCES authors (id)
+            )
+        """)
+
+        # Commit index state - last indexed head per remote branch (see pull)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS commit_index_heads (
+                repo_id INTEGER NOT NULL,
+                ref TEXT NOT NULL,
+                head_sha TEXT NOT NULL,
+                indexed_at TEXT NOT NULL,
+                PRIMARY KEY (repo_id, ref),
                 FOREIGN KEY (repo_id) REFERENCES repositories (id)
             )
         """)
@@ -115,6 +224,10 @@ class Database:
                 closed_at TEXT,
                 category TEXT,
                 tags TEXT,
+                body_z BLOB,
+                description TEXT,
+                migration_notes TEXT,
+                sections_key TEXT,
                 FOREIGN KEY (repo_id) REFERENCES repositories (id),
                 UNIQUE(repo_id, key)
             )
@@ -140,6 +253,29 @@ class Database:
             )
         """)
 
+        # Join tables linking PRs/issues to interned labels (position keeps label order)
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS pull_request_labels (
+                pull_request_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                label_id INTEGER NOT NULL,
+                PRIMARY KEY (pull_request_id, position),
+                FOREIGN KEY (pull_request_id) REFERENCES pull_requests (id),
+                FOREIGN KEY (label_id) REFERENCES labels (id)
+            ) WITHOUT ROWID
+        """)
+
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS issue_labels (
+                issue_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                label_id INTEGER NOT NULL,
+                PRIMARY KEY (issue_id, position),
+                FOREIGN KEY (issue_id) REFERENCES issues (id),
+                FOREIGN KEY (label_id) REFERENCES labels (id)
+            ) WITHOUT ROWID
+        """)
+
         # Migration for existing tables
         try:
             self.cursor.execute("ALTER TABLE releases ADD COLUMN target_commitish TEXT")
@@ -147,6 +283,44 @@ class Database:
             # Column likely already exists
             pass
 
+        # Migration: interned authors (author_id references instead of author_json blobs)
+        for table in ('pull_requests', 'commits'):
+            try:
+                self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN author_id INTEGER")
+            except sqlite3.OperationalError:
+                # Column likely already exists
+                pass
+        try:
+            self.cursor.execute("ALTER TABLE authors ADD COLUMN identity_key TEXT")
+        except sqlite3.OperationalError:
+            # Column likely already exists
+            pass
+
+        try:
+            self.cursor.execute("ALTER TABLE commits ADD COLUMN issue_keys TEXT")
+        except sqlite3.OperationalError:
+            # Column likely already exists
+            pass
+
+        try:
+            self.cursor.execute("ALTER TABLE commits ADD COLUMN issue_patterns_key TEXT")
+        except sqlite3.OperationalError:
+            # Column likely already exists
+            pass
+
+        # Migration: compressed issue bodies and pre-extracted note sections
+        for column, column_type in (
+            ('body_z', 'BLOB'),
+            ('description', 'TEXT'),
+            ('migration_notes', 'TEXT'),
+            ('sections_key', 'TEXT'),
+        ):
+            try:
+                self.cursor.execute(f"ALTER TABLE issues ADD COLUMN {column} {column_type}")
+            except sqlite3.OperationalError:
+                # Column likely already exists
+                pass
+
         # Migration v1.5: Rename issues table to issues
         try:
             # Check if old issues table exists
@@ -177,18 +351,52 @@ class Database:
             # Migration might have already happened
             pass
 
-        # Pull metadata table - tracks last pull timestamp per repository
+        # Pull metadata table - tracks last pull timestamp per repository and
+        # entity type, plus the events-feed state of `pull --watch`
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS sync_metadata (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                repo_full_name TEXT NOT NULL UNIQUE,
+                repo_full_name TEXT NOT NULL,
                 entity_type TEXT NOT NULL,
                 last_sync_at TEXT NOT NULL,
                 cutoff_date TEXT,
                 total_fetched INTEGER DEFAULT 0,
+                etag TEXT,
+                last_event_id TEXT,
+                poll_interval INTEGER,
                 UNIQUE(repo_full_name, entity_type)
             )
         """)
+        self._migrate_sync_metadata()
+
+        # Run metrics table - API usage and cache statistics of recent runs,
+        # reported by `release-tool status`
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS run_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                command TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                duration REAL NOT NULL,
+                api_calls INTEGER NOT NULL DEFAULT 0,
+                api_not_modified INTEGER NOT NULL DEFAULT 0,
+                rate_limits TEXT,
+                caches TEXT
+            )
+        """)
+
+        # Push journal table - steps finished by an interrupted `push`, so a
+        # rerun with the same inputs (fingerprint) resumes after them
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS push_journal (
+                repo_full_name TEXT NOT NULL,
+                version TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                step TEXT NOT NULL,
+                result TEXT,
+                completed_at TEXT NOT NULL,
+                PRIMARY KEY(repo_full_name, version, step)
+            )
+        """)
 
         # Release issues table - tracks association between releases and tracking issues
         self.cursor.execute("""
@@ -203,6 +411,21 @@ class Database:
             )
         """)
 
+        # Publish state table - content hash of every artifact push/merge last
+        # wrote to GitHub for a release (release, PRs, tracking issue, ...), so
+        # unchanged artifacts are not looked up or written again
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS publish_state (
+                repo_full_name TEXT NOT NULL,
+                version TEXT NOT NULL,
+                artifact TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                url TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY(repo_full_name, version, artifact)
+            )
+        """)
+
         # Create indexes for performance
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_pr_repo_merged
@@ -219,24 +442,348 @@ class Database:
             ON issues(repo_id, state)
         """)
 
+        # Issue query indexes (see iter_issues): proximity search, newest-first
+        # keyset pagination, and prefix search on key / number text
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_issue_repo_number
+            ON issues(repo_id, number)
+        """)
+
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_issue_created
+            ON issues(created_at, id)
+        """)
+
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_issue_repo_created
+            ON issues(repo_id, created_at, id)
+        """)
+
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_issue_key_nocase
+            ON issues(key COLLATE NOCASE)
+        """)
+
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_issue_number_text
+            ON issues(CAST(number AS TEXT))
+        """)
+
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_release_issue_repo_version
             ON release_issues(repo_full_name, version)
         """)
 
+        self.cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_author_identity
+            ON authors(identity_key)
+        """)
+
+        self.cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_label_identity
+            ON labels(name, IFNULL(color, ''), IFNULL(description, ''))
+        """)
+
+        self.conn.commit()
+
+        self._migrate_inline_authors_and_labels()
+
+    def _migrate_inline_authors_and_labels(self) -> None:
+        """
+        Move legacy per-row author_json/labels blobs into the interned tables.
+
+        Databases created before authors and labels were normalized store a
+        full JSON copy on every PR, commit and issue row. This converts those
+        rows in place (once) and clears the blobs.
+        """
+        self.cursor.execute("PRAGMA user_version")
+        if self.cursor.fetchone()[0] >= 1:
+            return
+
+        # Older schemas declared commits.author_json NOT NULL; rebuild the table
+        # so migrated rows can drop their blob.
+        self.cursor.execute("PRAGMA table_info(commits)")
+        columns = {row['name']: row for row in self.cursor.fetchall()}
+        if columns['author_json']['notnull']:
+            self.cursor.execute("ALTER TABLE commits RENAME TO commits_legacy")
+            self.cursor.execute("""
+                CREATE TABLE commits (
+                    sha TEXT PRIMARY KEY,
+                    repo_id INTEGER NOT NULL,
+                    message TEXT NOT NULL,
+                    author_json TEXT,
+                    author_id INTEGER,
+                    date TEXT NOT NULL,
+                    url TEXT,
+                    pr_number INTEGER,
+                    issue_keys TEXT,
+                    issue_patterns_key TEXT,
+                    FOREIGN KEY (repo_id) REFERENCES repositories (id),
+                    FOREIGN KEY (author_id) REFERENCES authors (id)
+                )
+            """)
+            self.cursor.execute("""
+                INSERT INTO commits (
+                    sha, repo_id, message, author_json, author_id, date, url, pr_number, issue_keys,
+                    issue_patterns_key
+                )
+                SELECT sha, repo_id, message, author_json, author_id, date, url, pr_number, issue_keys,
+                       issue_patterns_key
+                FROM commits_legacy
+            """)
+            self.cursor.execute("DROP TABLE commits_legacy")
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_commit_repo
+                ON commits(repo_id, date)
+            """)
+
+        for table, key in (('pull_requests', 'id'), ('commits', 'sha')):
+            rows = self.conn.execute(
+                f"SELECT {key}, author_json FROM {table} WHERE author_json IS NOT NULL"
+            ).fetchall()
+            for row in rows:
+                author_id = None
+                if row['author_json']:
+                    author_id = self._intern_author(Author(**json.loads(row['author_json'])))
+                self.cursor.execute(
+                    f"UPDATE {table} SET author_id=?, author_json=NULL WHERE {key}=?",
+                    (author_id, row[key])
+                )
+
+        for table, join_table, fk in (
+            ('pull_requests', 'pull_request_labels', 'pull_request_id'),
+            ('issues', 'issue_labels', 'issue_id'),
+        ):
+            rows = self.conn.execute(
+                f"SELECT id, labels FROM {table} WHERE labels IS NOT NULL"
+            ).fetchall()
+            for row in rows:
+                labels = [Label(**l) for l in json.loads(row['labels'] or '[]')]
+                self._set_row_labels(join_table, fk, row['id'], labels)
+                self.cursor.execute(f"UPDATE {table} SET labels=NULL WHERE id=?", (row['id'],))
+
+        self.cursor.execute("PRAGMA user_version = 1")
         self.conn.commit()
 
     def close(self):
         """Close database connection."""
         if self.conn:
-            self.conn.close()
+            if self._shared:
+                # Keep the shared connection open for the next instance
+                self.conn.commit()
+                self._shared = False
+            else:
+                release_sqlite(self.conn)
+                self.conn.close()
             self.conn = None
             self.cursor = None
+        self._authors_by_id.clear()
+        self._author_ids.clear()
+        self._labels_by_id.clear()
+        self._label_ids.clear()
+
+    # =========================================================================
+    # Interned Authors and Labels
+    # =========================================================================
+
+    @staticmethod
+    def _author_identity(author: Author) -> str:
+        """
+        Build the interning key for an author.
+
+        GitHub ID is the most stable identity, then email (git authors),
+        then username and finally the plain name.
+        """
+        if author.github_id is not None:
+            return f"github:{author.github_id}"
+        if author.email:
+            return f"email:{author.email.lower()}"
+        if author.username:
+            return f"user:{author.username}"
+        return f"name:{author.name or ''}"
+
+    def _intern_author(self, author: Optional[Author]) -> Optional[int]:
+        """
+        Get the authors row ID for an author, inserting or refreshing it as needed.
+
+        Fields that are known on the stored author but missing on the incoming
+        one are preserved; non-empty incoming fields win.
+
+        Args:
+            author: Author to intern (None is passed through)
+
+        Returns:
+            Row ID in the authors table, or None if author is None
+        """
+        if author is None:
+            return None
+
+        identity = self._author_identity(author)
+        author_id = self._author_ids.get(identity)
+        record_cache('db.authors', hits=int(author_id is not None), misses=int(author_id is None))
+        if author_id is None:
+            self.cursor.execute(
+                "SELECT * FROM authors WHERE identity_key=?", (identity,)
+            )
+            row = self.cursor.fetchone()
+            if row is None:
+                self.cursor.execute(
+                    f"""INSERT INTO authors ({', '.join(_AUTHOR_FIELDS)}, identity_key)
+                        VALUES ({', '.join('?' * len(_AUTHOR_FIELDS))}, ?)""",
+                    tuple(getattr(author, f) for f in _AUTHOR_FIELDS) + (identity,)
+                )
+                author_id = self.cursor.lastrowid
+                self._cache_author(author_id, identity, author)
+                return author_id
+            author_id = row['id']
+            self._cache_author(author_id, identity, self._author_from_row(row))
+
+        cached = self._authors_by_id[author_id]
+        updates = {
+            f: getattr(author, f) for f in _AUTHOR_FIELDS
+            if getattr(author, f) is not None and getattr(author, f) != getattr(cached, f)
+        }
+        if updates:
+            assignments = ', '.join(f"{f}=?" for f in updates)
+            self.cursor.execute(
+                f"UPDATE authors SET {assignments} WHERE id=?",
+                tuple(updates.values()) + (author_id,)
+            )
+            self._cache_author(author_id, identity, cached.model_copy(update=updates))
+        return author_id
+
+    def _cache_author(self, author_id: int, identity: str, author: Author) -> None:
+        self._authors_by_id[author_id] = author
+        self._author_ids[identity] = author_id
+
+    @staticmethod
+    def _author_from_row(row: sqlite3.Row) -> Author:
+        return Author.model_construct(**{f: row[f] for f in _AUTHOR_FIELDS})
+
+    def _get_authors(self, author_ids: Iterable[Optional[int]]) -> Dict[int, Author]:
+        """Resolve author IDs through the identity cache, loading misses in bulk."""
+        author_ids = [aid for aid in author_ids if aid is not None]
+        missing = list({aid for aid in author_ids if aid not in self._authors_by_id})
+        record_cache('db.authors', hits=len(author_ids) - len(missing), misses=len(missing))
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(missing), 500):
+            chunk = missing[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT * FROM authors WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            for row in rows:
+                self._cache_author(row['id'], row['identity_key'], self._author_from_row(row))
+        return self._authors_by_id
+
+    def _intern_label(self, label: Label) -> int:
+        """Get the labels row ID for a label, inserting it if new."""
+        identity = (label.name, label.color or '', label.description or '')
+        label_id = self._label_ids.get(identity)
+        record_cache('db.labels', hits=int(label_id is not None), misses=int(label_id is None))
+        if label_id is not None:
+            return label_id
+
+        self.cursor.execute(
+            """SELECT id FROM labels
+               WHERE name=? AND IFNULL(color, '')=? AND IFNULL(description, '')=?""",
+            identity
+        )
+        row = self.cursor.fetchone()
+        if row:
+            label_id = row['id']
+        else:
+            self.cursor.execute(
+                "INSERT INTO labels (name, color, description) VALUES (?, ?, ?)",
+                (label.name, label.color, label.description)
+            )
+            label_id = self.cursor.lastrowid
+        self._label_ids[identity] = label_id
+        self._labels_by_id[label_id] = label
+        return label_id
+
+    def _get_labels(self, label_ids: List[int]) -> List[Label]:
+        """Resolve label IDs through the identity cache (labels are few, load all on miss)."""
+        if any(lid not in self._labels_by_id for lid in label_ids):
+            for row in self.conn.execute("SELECT * FROM labels").fetchall():
+                label = Label.model_construct(
+                    name=row['name'], color=row['color'], description=row['description']
+                )
+                self._labels_by_id[row['id']] = label
+                self._label_ids[(label.name, label.color or '', label.description or '')] = row['id']
+        return [self._labels_by_id[lid] for lid in label_ids if lid in self._labels_by_id]
+
+    @staticmethod
+    def _parse_label_ids(label_ids: Optional[str]) -> List[int]:
+        """Parse the GROUP_CONCAT'ed label IDs selected alongside a PR/issue row."""
+        if not label_ids:
+            return []
+        return [int(lid) for lid in label_ids.split(',')]
+
+    def _set_row_labels(
+        self, join_table: str, fk_column: str, row_id: int, labels: List[Label]
+    ) -> None:
+        """Replace the labels linked to a PR or issue row."""
+        self.cursor.execute(f"DELETE FROM {join_table} WHERE {fk_column}=?", (row_id,))
+        if labels:
+            self.cursor.executemany(
+                f"INSERT INTO {join_table} ({fk_column}, position, label_id) VALUES (?, ?, ?)",
+                [(row_id, pos, self._intern_label(label)) for pos, label in enumerate(labels)]
+            )
 
     # =========================================================================
     # Pull Metadata Methods
     # =========================================================================
 
+    def _migrate_sync_metadata(self) -> None:
+        """
+        Bring sync_metadata to the current schema.
+
+        Older schemas also declared repo_full_name UNIQUE on its own, so
+        recording one entity type replaced the row of every other type of the
+        same repository. The table is rebuilt without that constraint.
+        """
+        for column, column_type in (
+            ('etag', 'TEXT'),
+            ('last_event_id', 'TEXT'),
+            ('poll_interval', 'INTEGER'),
+        ):
+            try:
+                self.cursor.execute(f"ALTER TABLE sync_metadata ADD COLUMN {column} {column_type}")
+            except sqlite3.OperationalError:
+                # Column likely already exists
+                pass
+
+        self.cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='sync_metadata'"
+        )
+        if 'repo_full_name TEXT NOT NULL UNIQUE' not in self.cursor.fetchone()['sql']:
+            return
+        columns = (
+            'repo_full_name, entity_type, last_sync_at, cutoff_date, total_fetched, '
+            'etag, last_event_id, poll_interval'
+        )
+        self.cursor.execute("ALTER TABLE sync_metadata RENAME TO sync_metadata_legacy")
+        self.cursor.execute("""
+            CREATE TABLE sync_metadata (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                repo_full_name TEXT NOT NULL,
+                entity_type TEXT NOT NULL,
+                last_sync_at TEXT NOT NULL,
+                cutoff_date TEXT,
+                total_fetched INTEGER DEFAULT 0,
+                etag TEXT,
+                last_event_id TEXT,
+                poll_interval INTEGER,
+                UNIQUE(repo_full_name, entity_type)
+            )
+        """)
+        self.cursor.execute(
+            f"INSERT INTO sync_metadata ({columns}) SELECT {columns} FROM sync_metadata_legacy"
+        )
+        self.cursor.execute("DROP TABLE sync_metadata_legacy")
+        self.conn.commit()
+
     def get_last_pull(self, repo_full_name: str, entity_type: str) -> Optional[datetime]:
         """
         Get the last pull timestamp for a repository and entity type.
@@ -284,6 +831,54 @@ class Database:
         )
         self.conn.commit()
 
+    def get_watch_state(self, repo_full_name: str) -> Dict[str, Any]:
+        """
+        Get the events-feed state of `pull --watch` for a repository.
+
+        Returns:
+            Dictionary with 'etag', 'last_event_id', 'poll_interval' and
+            'last_sync_at' (empty if the repository was never watched)
+        """
+        self.cursor.execute(
+            """SELECT etag, last_event_id, poll_interval, last_sync_at FROM sync_metadata
+               WHERE repo_full_name=? AND entity_type='events'""",
+            (repo_full_name,)
+        )
+        row = self.cursor.fetchone()
+        return dict(row) if row else {}
+
+    def update_watch_state(
+        self,
+        repo_full_name: str,
+        etag: Optional[str],
+        last_event_id: Optional[str],
+        poll_interval: int,
+        total_fetched: int = 0
+    ) -> None:
+        """
+        Record the events-feed state of `pull --watch` for a repository.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            etag: ETag of the last events response (sent as If-None-Match)
+            last_event_id: ID of the newest event already processed
+            poll_interval: Polling interval requested by GitHub (X-Poll-Interval)
+            total_fetched: Number of items refreshed from the processed events
+        """
+        self.cursor.execute(
+            """INSERT INTO sync_metadata
+               (repo_full_name, entity_type, last_sync_at, total_fetched, etag, last_event_id, poll_interval)
+               VALUES (?, 'events', ?, ?, ?, ?, ?)
+               ON CONFLICT(repo_full_name, entity_type) DO UPDATE SET
+                   last_sync_at=excluded.last_sync_at,
+                   total_fetched=sync_metadata.total_fetched + excluded.total_fetched,
+                   etag=excluded.etag,
+                   last_event_id=excluded.last_event_id,
+                   poll_interval=excluded.poll_interval""",
+            (repo_full_name, datetime.now().isoformat(), total_fetched, etag, last_event_id, poll_interval)
+        )
+        self.conn.commit()
+
     def get_all_pull_status(self) -> List[Dict[str, Any]]:
         """Get pull status for all repositories and entity types."""
         self.cursor.execute(
@@ -293,6 +888,97 @@ class Database:
         )
         return [dict(row) for row in self.cursor.fetchall()]
 
+    def get_commit_index_status(self) -> List[Dict[str, Any]]:
+        """Get the commit index head of every repository and remote branch."""
+        rows = self.conn.execute(
+            """SELECT r.full_name AS repo_full_name, h.ref, h.head_sha, h.indexed_at
+               FROM commit_index_heads h JOIN repositories r ON h.repo_id = r.id
+               ORDER BY r.full_name, h.ref"""
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def record_run(
+        self,
+        command: str,
+        started_at: datetime,
+        duration: float,
+        api_calls: int = 0,
+        api_not_modified: int = 0,
+        rate_limits: Optional[Dict[str, Dict[str, int]]] = None,
+        caches: Optional[Dict[str, List[int]]] = None,
+        keep: int = 200
+    ) -> None:
+        """
+        Store the metrics of a finished run, keeping the newest `keep` runs.
+
+        Args:
+            command: Subcommand that ran (e.g. 'pull')
+            started_at: When the run started
+            duration: Wall time in seconds
+            api_calls: Requests made to the GitHub API
+            api_not_modified: Conditional requests answered with 304
+            rate_limits: Last rate limit seen per resource
+                ({'core': {'limit', 'remaining', 'reset'}, ...})
+            caches: Cache name -> [hits, misses] during the run
+            keep: Number of runs to keep
+        """
+        self.cursor.execute(
+            """INSERT INTO run_metrics
+               (command, started_at, duration, api_calls, api_not_modified, rate_limits, caches)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (command, started_at.isoformat(), duration, api_calls, api_not_modified,
+             json.dumps(rate_limits or {}), json.dumps(caches or {}))
+        )
+        self.cursor.execute(
+            "DELETE FROM run_metrics WHERE id <= (SELECT MAX(id) FROM run_metrics) - ?",
+            (keep,)
+        )
+        self.conn.commit()
+
+    def get_last_runs(self) -> List[Dict[str, Any]]:
+        """Get the most recent run of each command, newest first."""
+        rows = self.conn.execute(
+            """SELECT * FROM run_metrics WHERE id IN
+               (SELECT MAX(id) FROM run_metrics GROUP BY command)
+               ORDER BY id DESC"""
+        ).fetchall()
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run['rate_limits'] = json.loads(run['rate_limits'] or '{}')
+            run['caches'] = json.loads(run['caches'] or '{}')
+            runs.append(run)
+        return runs
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """
+        Get the size of the database file and the row count of every table.
+
+        Returns:
+            Dictionary with file_size (bytes, including the WAL file), page_size,
+            page_count, freelist_count and tables (table name -> rows)
+        """
+        file_size = 0
+        for suffix in ('', '-wal'):
+            path = Path(f"{self.db_path}{suffix}")
+            if path.exists():
+                file_size += path.stat().st_size
+        tables = [
+            row['name'] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            ).fetchall()
+        ]
+        return {
+            'file_size': file_size,
+            'page_size': self.conn.execute("PRAGMA page_size").fetchone()[0],
+            'page_count': self.conn.execute("PRAGMA page_count").fetchone()[0],
+            'freelist_count': self.conn.execute("PRAGMA freelist_count").fetchone()[0],
+            'tables': {
+                table: self.conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+                for table in tables
+            },
+        }
+
     def get_existing_issue_numbers(self, repo_full_name: str) -> set:
         """Get set of issue numbers already in database for a repository."""
         self.cursor.execute(
@@ -362,35 +1048,37 @@ class Database:
         return [Repository(**dict(row)) for row in rows]
 
     # Pull request operations
+    @timed('db.upsert_pull_request')
     def upsert_pull_request(self, pr: PullRequest) -> int:
         """Insert or update a pull request."""
-        labels_json = json.dumps([label.model_dump() for label in pr.labels])
         merged_at_str = pr.merged_at.isoformat() if pr.merged_at else None
-        author_json = json.dumps(pr.author.model_dump()) if pr.author else None
+        author_id = self._intern_author(pr.author)
 
         try:
             self.cursor.execute(
                 """INSERT INTO pull_requests (
-                    repo_id, number, title, body, state, merged_at, author_json,
-                    base_branch, head_branch, head_sha, labels, url
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    repo_id, number, title, body, state, merged_at, author_id,
+                    base_branch, head_branch, head_sha, url
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (pr.repo_id, pr.number, pr.title, pr.body, pr.state, merged_at_str,
-                 author_json, pr.base_branch, pr.head_branch, pr.head_sha, labels_json, pr.url)
+                 author_id, pr.base_branch, pr.head_branch, pr.head_sha, pr.url)
             )
-            self.conn.commit()
-            return self.cursor.lastrowid
+            pr_id = self.cursor.lastrowid
         except sqlite3.IntegrityError:
             self.cursor.execute(
                 """UPDATE pull_requests SET
-                    title=?, body=?, state=?, merged_at=?, author_json=?,
-                    base_branch=?, head_branch=?, head_sha=?, labels=?, url=?
+                    title=?, body=?, state=?, merged_at=?, author_json=NULL, author_id=?,
+                    base_branch=?, head_branch=?, head_sha=?, labels=NULL, url=?
                 WHERE repo_id=? AND number=?""",
-                (pr.title, pr.body, pr.state, merged_at_str, author_json,
-                 pr.base_branch, pr.head_branch, pr.head_sha, labels_json, pr.url,
+                (pr.title, pr.body, pr.state, merged_at_str, author_id,
+                 pr.base_branch, pr.head_branch, pr.head_sha, pr.url,
                  pr.repo_id, pr.number)
             )
-            self.conn.commit()
-            return self.get_pull_request_id(pr.repo_id, pr.number)
+            pr_id = self.get_pull_request_id(pr.repo_id, pr.number)
+
+        self._set_row_labels('pull_request_labels', 'pull_request_id', pr_id, pr.labels)
+        self.conn.commit()
+        return pr_id
 
     def get_pull_request_id(self, repo_id: int, number: int) -> Optional[int]:
         """Get PR ID by repo and number."""
@@ -401,61 +1089,74 @@ class Database:
         row = self.cursor.fetchone()
         return row["id"] if row else None
 
+    # Selects a PR row along with its interned label IDs (in label order)
+    _PR_SELECT = """
+        SELECT pr.*,
+               (SELECT GROUP_CONCAT(label_id) FROM pull_request_labels
+                WHERE pull_request_id = pr.id) AS label_ids
+        FROM pull_requests pr
+    """
+
+    def _pr_from_rows(self, rows: List[sqlite3.Row]) -> List[PullRequest]:
+        """
+        Build PullRequest models from rows selected with _PR_SELECT.
+
+        Rows were validated when written, so models are built with
+        model_construct instead of re-running pydantic validation.
+        """
+        authors = self._get_authors(row['author_id'] for row in rows)
+
+        prs = []
+        for row in rows:
+            data = dict(row)
+            label_ids = self._parse_label_ids(data.pop('label_ids'))
+            legacy_labels = data.pop('labels')
+            legacy_author = data.pop('author_json')
+            author_id = data.pop('author_id')
+
+            if legacy_labels:
+                data['labels'] = [Label(**l) for l in json.loads(legacy_labels)]
+            else:
+                data['labels'] = self._get_labels(label_ids)
+            if author_id is not None:
+                data['author'] = authors.get(author_id)
+            elif legacy_author:
+                data['author'] = Author(**json.loads(legacy_author))
+            if data.get('merged_at'):
+                data['merged_at'] = datetime.fromisoformat(data['merged_at'])
+            prs.append(PullRequest.model_construct(**data))
+        return prs
+
+    @timed('db.get_pull_request')
     def get_pull_request(self, repo_id: int, number: int) -> Optional[PullRequest]:
         """Get pull request by repo and number."""
-        from .models import Author
-
         self.cursor.execute(
-            "SELECT * FROM pull_requests WHERE repo_id=? AND number=?",
+            self._PR_SELECT + " WHERE pr.repo_id=? AND pr.number=?",
             (repo_id, number)
         )
         row = self.cursor.fetchone()
         if row:
-            data = dict(row)
-            data['labels'] = [Label(**l) for l in json.loads(data.get('labels', '[]'))]
-            if data.get('merged_at'):
-                data['merged_at'] = datetime.fromisoformat(data['merged_at'])
-            # Deserialize author from JSON
-            if data.get('author_json'):
-                data['author'] = Author(**json.loads(data['author_json']))
-                del data['author_json']
-            return PullRequest(**data)
+            return self._pr_from_rows([row])[0]
         return None
 
     def get_merged_prs_between_dates(
         self, repo_id: int, start_date: Optional[datetime], end_date: Optional[datetime]
     ) -> List[PullRequest]:
         """Get merged PRs in a date range."""
-        query = "SELECT * FROM pull_requests WHERE repo_id=? AND merged_at IS NOT NULL"
+        query = self._PR_SELECT + " WHERE pr.repo_id=? AND pr.merged_at IS NOT NULL"
         params = [repo_id]
 
         if start_date:
-            query += " AND merged_at >= ?"
+            query += " AND pr.merged_at >= ?"
             params.append(start_date.isoformat())
         if end_date:
-            query += " AND merged_at <= ?"
+            query += " AND pr.merged_at <= ?"
             params.append(end_date.isoformat())
 
-        query += " ORDER BY merged_at ASC"
+        query += " ORDER BY pr.merged_at ASC"
 
         self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-
-        from .models import Author
-
-        prs = []
-        for row in rows:
-            data = dict(row)
-            data['labels'] = [Label(**l) for l in json.loads(data.get('labels', '[]'))]
-            if data.get('merged_at'):
-                data['merged_at'] = datetime.fromisoformat(data['merged_at'])
-            # Deserialize author from JSON
-            if data.get('author_json'):
-                data['author'] = Author(**json.loads(data['author_json']))
-                del data['author_json']
-            prs.append(PullRequest(**data))
-
-        return prs
+        return self._pr_from_rows(self.cursor.fetchall())
 
     def find_prs_for_issue(
         self,
@@ -544,91 +1245,238 @@ class Database:
     # Commit operations
     def upsert_commit(self, commit: Commit) -> None:
         """Insert or update a commit."""
-        import json
-        date_str = commit.date.isoformat()
-        author_json = json.dumps(commit.author.model_dump())
+        self.upsert_commits([commit])
 
-        self.cursor.execute(
+    @timed('db.upsert_commits')
+    def upsert_commits(self, commits: List[Commit]) -> None:
+        """Insert or update a batch of commits in a single transaction."""
+        self.cursor.executemany(
             """INSERT OR REPLACE INTO commits (
-                sha, repo_id, message, author_json, date, url, pr_number
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (commit.sha, commit.repo_id, commit.message, author_json,
-             date_str, commit.url, commit.pr_number)
+                sha, repo_id, message, author_id, date, url, pr_number, issue_keys, issue_patterns_key
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (commit.sha, commit.repo_id, commit.message,
+                 self._intern_author(commit.author), commit.date.isoformat(),
+                 commit.url, commit.pr_number,
+                 json.dumps(commit.issue_keys) if commit.issue_keys else None,
+                 commit.issue_patterns_key)
+                for commit in commits
+            ]
+        )
+        self.conn.commit()
+
+    def get_existing_commit_shas(self, shas: List[str]) -> set:
+        """Get the subset of SHAs already stored in the commits table."""
+        existing = set()
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(shas), 500):
+            chunk = shas[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT sha FROM commits WHERE sha IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            existing.update(row['sha'] for row in rows)
+        return existing
+
+    @timed('db.get_commits_by_shas')
+    def get_commits_by_shas(self, repo_id: int, shas: List[str]) -> Dict[str, Commit]:
+        """
+        Get indexed commits of a repository by SHA.
+
+        Args:
+            repo_id: Repository ID
+            shas: Commit SHAs (e.g., the output of a rev-list)
+
+        Returns:
+            Dictionary mapping SHA to Commit for the SHAs found in the index
+        """
+        rows = []
+        for start in range(0, len(shas), 500):
+            chunk = shas[start:start + 500]
+            rows.extend(self.conn.execute(
+                f"""SELECT * FROM commits
+                    WHERE repo_id=? AND sha IN ({', '.join('?' * len(chunk))})""",
+                [repo_id] + chunk
+            ).fetchall())
+        return {commit.sha: commit for commit in self._commits_from_rows(rows)}
+
+    def get_commit_index_heads(self, repo_id: int) -> Dict[str, str]:
+        """Get the last indexed head SHA per remote branch of a repository."""
+        rows = self.conn.execute(
+            "SELECT ref, head_sha FROM commit_index_heads WHERE repo_id=?",
+            (repo_id,)
+        ).fetchall()
+        return {row['ref']: row['head_sha'] for row in rows}
+
+    def set_commit_index_head(self, repo_id: int, ref: str, head_sha: str) -> None:
+        """Record that every commit reachable from head_sha on ref has been indexed."""
+        self.cursor.execute(
+            """INSERT OR REPLACE INTO commit_index_heads (repo_id, ref, head_sha, indexed_at)
+               VALUES (?, ?, ?, ?)""",
+            (repo_id, ref, head_sha, datetime.now().isoformat())
         )
         self.conn.commit()
 
+    def _commits_from_rows(self, rows: List[sqlite3.Row]) -> List[Commit]:
+        """Build Commit models from trusted commits rows (no validation)."""
+        authors = self._get_authors(row['author_id'] for row in rows)
+
+        commits = []
+        for row in rows:
+            data = dict(row)
+            data['date'] = datetime.fromisoformat(data['date'])
+            legacy_author = data.pop('author_json')
+            author_id = data.pop('author_id')
+            if author_id is not None:
+                data['author'] = authors.get(author_id)
+            elif legacy_author:
+                data['author'] = Author(**json.loads(legacy_author))
+            issue_keys = data.pop('issue_keys')
+            data['issue_keys'] = json.loads(issue_keys) if issue_keys else []
+            commits.append(Commit.model_construct(**data))
+        return commits
+
     def get_commit(self, sha: str) -> Optional[Commit]:
         """Get commit by SHA."""
-        import json
-        from .models import Author
-
         self.cursor.execute("SELECT * FROM commits WHERE sha=?", (sha,))
         row = self.cursor.fetchone()
         if row:
-            data = dict(row)
-            data['date'] = datetime.fromisoformat(data['date'])
-            # Deserialize author from JSON
-            if 'author_json' in data:
-                data['author'] = Author(**json.loads(data['author_json']))
-                del data['author_json']
-            return Commit(**data)
+            return self._commits_from_rows([row])[0]
         return None
 
     def get_commits_by_repo(self, repo_id: int) -> List[Commit]:
         """Get all commits for a repository."""
-        import json
-        from .models import Author
-
         self.cursor.execute(
             "SELECT * FROM commits WHERE repo_id=? ORDER BY date ASC",
             (repo_id,)
         )
-        rows = self.cursor.fetchall()
+        return self._commits_from_rows(self.cursor.fetchall())
 
-        commits = []
-        for row in rows:
-            data = dict(row)
-            data['date'] = datetime.fromisoformat(data['date'])
-            # Deserialize author from JSON
-            if 'author_json' in data:
-                data['author'] = Author(**json.loads(data['author_json']))
-                del data['author_json']
-            commits.append(Commit(**data))
+    # Issue operations
+    def configure_note_sections(
+        self,
+        description_regex: Optional[str],
+        migration_regex: Optional[str]
+    ) -> int:
+        """
+        Enable pre-extraction of note sections from issue bodies.
 
-        return commits
+        Once configured, upsert_issue stores the description and migration
+        notes sections next to the body, and reads return them with
+        sections_extracted=True. Rows extracted with a different regex
+        configuration are re-extracted here, so this is only expensive
+        right after the configured regexes change.
 
-    # Issue operations
+        Args:
+            description_regex: Regex whose first group is the description section
+            migration_regex: Regex whose first group is the migration notes section
+
+        Returns:
+            Number of issues whose sections were (re-)extracted
+        """
+        flags = re.DOTALL | re.IGNORECASE
+        self._description_re = re.compile(description_regex, flags) if description_regex else None
+        self._migration_re = re.compile(migration_regex, flags) if migration_regex else None
+        self._sections_key = hashlib.sha1(
+            f"{description_regex}\0{migration_regex}".encode()
+        ).hexdigest()[:16]
+
+        rows = self.conn.execute(
+            """SELECT id, body, body_z FROM issues
+               WHERE sections_key IS NULL OR sections_key != ?""",
+            (self._sections_key,)
+        ).fetchall()
+
+        updates = []
+        for row in rows:
+            if row['body'] is None and row['body_z'] is None:
+                # No body (or dropped by compaction): keep the sections extracted before
+                self.cursor.execute(
+                    "UPDATE issues SET sections_key=? WHERE id=?", (self._sections_key, row['id'])
+                )
+                continue
+            description, migration_notes = self._extract_note_sections(
+                self._decode_body(row['body'], row['body_z'])
+            )
+            updates.append((description, migration_notes, self._sections_key, row['id']))
+
+        if updates:
+            self.cursor.executemany(
+                """UPDATE issues SET description=?, migration_notes=?, sections_key=?
+                   WHERE id=?""",
+                updates
+            )
+        self.conn.commit()
+        return len(updates)
+
+    def _extract_note_sections(self, body: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Extract (description, migration_notes) from an issue body."""
+        if not body:
+            return None, None
+        sections = []
+        for pattern in (self._description_re, self._migration_re):
+            match = pattern.search(body) if pattern else None
+            sections.append(match.group(1).strip() if match else None)
+        return sections[0], sections[1]
+
+    @staticmethod
+    def _encode_body(body: Optional[str]) -> Optional[bytes]:
+        """Compress an issue body for storage."""
+        if body is None:
+            return None
+        return zlib.compress(body.encode('utf-8'))
+
+    @staticmethod
+    def _decode_body(body: Optional[str], body_z: Optional[bytes]) -> Optional[str]:
+        """Return the issue body from either the compressed or the legacy plain column."""
+        if body_z is not None:
+            return zlib.decompress(body_z).decode('utf-8')
+        return body
+
+    @timed('db.upsert_issue')
     def upsert_issue(self, issue: Issue) -> int:
         """Insert or update a issue."""
-        labels_json = json.dumps([label.model_dump() for label in issue.labels])
         tags_json = json.dumps(issue.tags)
         created_at_str = issue.created_at.isoformat() if issue.created_at else None
         closed_at_str = issue.closed_at.isoformat() if issue.closed_at else None
+        body_z = self._encode_body(issue.body)
+
+        # Without a section configuration, leave sections unset so they are
+        # extracted the next time configure_note_sections runs
+        description = migration_notes = sections_key = None
+        if self._sections_key is not None:
+            description, migration_notes = self._extract_note_sections(issue.body)
+            sections_key = self._sections_key
 
         try:
             self.cursor.execute(
                 """INSERT INTO issues (
-                    repo_id, number, key, title, body, state, labels, url,
-                    created_at, closed_at, category, tags
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (issue.repo_id, issue.number, issue.key, issue.title, issue.body,
-                 issue.state, labels_json, issue.url, created_at_str, closed_at_str,
-                 issue.category, tags_json)
+                    repo_id, number, key, title, body_z, state, url,
+                    created_at, closed_at, category, tags,
+                    description, migration_notes, sections_key
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (issue.repo_id, issue.number, issue.key, issue.title, body_z,
+                 issue.state, issue.url, created_at_str, closed_at_str,
+                 issue.category, tags_json, description, migration_notes, sections_key)
             )
-            self.conn.commit()
-            return self.cursor.lastrowid
+            issue_id = self.cursor.lastrowid
         except sqlite3.IntegrityError:
             self.cursor.execute(
                 """UPDATE issues SET
-                    number=?, title=?, body=?, state=?, labels=?, url=?,
-                    created_at=?, closed_at=?, category=?, tags=?
+                    number=?, title=?, body=NULL, body_z=?, state=?, labels=NULL, url=?,
+                    created_at=?, closed_at=?, category=?, tags=?,
+                    description=?, migration_notes=?, sections_key=?
                 WHERE repo_id=? AND key=?""",
-                (issue.number, issue.title, issue.body, issue.state, labels_json,
+                (issue.number, issue.title, body_z, issue.state,
                  issue.url, created_at_str, closed_at_str, issue.category, tags_json,
+                 description, migration_notes, sections_key,
                  issue.repo_id, issue.key)
             )
-            self.conn.commit()
-            return self.get_issue_id(issue.repo_id, issue.key)
+            issue_id = self.get_issue_id(issue.repo_id, issue.key)
+
+        self._set_row_labels('issue_labels', 'issue_id', issue_id, issue.labels)
+        self.conn.commit()
+        return issue_id
 
     def get_issue_id(self, repo_id: int, key: str) -> Optional[int]:
         """Get issue ID by repo and key."""
@@ -639,24 +1487,47 @@ class Database:
         row = self.cursor.fetchone()
         return row["id"] if row else None
 
+    # Label IDs column selected alongside an issue row aliased as "t"
+    _ISSUE_LABEL_IDS = """
+        (SELECT GROUP_CONCAT(label_id) FROM issue_labels
+         WHERE issue_id = t.id) AS label_ids
+    """
+
+    def _issue_from_data(self, data: Dict[str, Any]) -> Issue:
+        """Build an Issue model from a trusted row dict selected with _ISSUE_LABEL_IDS (no validation)."""
+        label_ids = self._parse_label_ids(data.pop('label_ids'))
+        legacy_labels = data.pop('labels')
+        if legacy_labels:
+            data['labels'] = [Label(**l) for l in json.loads(legacy_labels)]
+        else:
+            data['labels'] = self._get_labels(label_ids)
+        tags = data.get('tags')
+        data['tags'] = json.loads(tags) if tags and tags != '{}' else {}
+        data['body'] = self._decode_body(data['body'], data.pop('body_z'))
+        sections_key = data.pop('sections_key')
+        data['sections_extracted'] = (
+            sections_key is not None and sections_key == self._sections_key
+        )
+        if not data['sections_extracted']:
+            data['description'] = data['migration_notes'] = None
+        if data.get('created_at'):
+            data['created_at'] = datetime.fromisoformat(data['created_at'])
+        if data.get('closed_at'):
+            data['closed_at'] = datetime.fromisoformat(data['closed_at'])
+        return Issue.model_construct(**data)
+
     def get_issue(self, repo_id: int, key: str) -> Optional[Issue]:
         """Get issue by repo and key."""
         self.cursor.execute(
-            "SELECT * FROM issues WHERE repo_id=? AND key=?",
+            f"SELECT t.*, {self._ISSUE_LABEL_IDS} FROM issues t WHERE t.repo_id=? AND t.key=?",
             (repo_id, key)
         )
         row = self.cursor.fetchone()
         if row:
-            data = dict(row)
-            data['labels'] = [Label(**l) for l in json.loads(data.get('labels', '[]'))]
-            data['tags'] = json.loads(data.get('tags', '{}'))
-            if data.get('created_at'):
-                data['created_at'] = datetime.fromisoformat(data['created_at'])
-            if data.get('closed_at'):
-                data['closed_at'] = datetime.fromisoformat(data['closed_at'])
-            return Issue(**data)
+            return self._issue_from_data(dict(row))
         return None
 
+    @timed('db.get_issue_by_key')
     def get_issue_by_key(self, key: str) -> Optional[Issue]:
         """
         Get issue by key across all repositories.
@@ -674,19 +1545,13 @@ class Database:
         normalized_key = key.lstrip('#') if key.startswith('#') else key
 
         self.cursor.execute(
-            "SELECT * FROM issues WHERE key=? ORDER BY created_at DESC LIMIT 1",
+            f"""SELECT t.*, {self._ISSUE_LABEL_IDS} FROM issues t
+                WHERE t.key=? ORDER BY t.created_at DESC LIMIT 1""",
             (normalized_key,)
         )
         row = self.cursor.fetchone()
         if row:
-            data = dict(row)
-            data['labels'] = [Label(**l) for l in json.loads(data.get('labels', '[]'))]
-            data['tags'] = json.loads(data.get('tags', '{}'))
-            if data.get('created_at'):
-                data['created_at'] = datetime.fromisoformat(data['created_at'])
-            if data.get('closed_at'):
-                data['closed_at'] = datetime.fromisoformat(data['closed_at'])
-            return Issue(**data)
+            return self._issue_from_data(dict(row))
         return None
 
     def _parse_issue_number(self, key: str) -> Optional[int]:
@@ -715,6 +1580,34 @@ class Database:
                 return None
         return None
 
+    @staticmethod
+    def _prefix_upper_bound(prefix: str) -> str:
+        """Smallest string greater than every string starting with prefix."""
+        return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    @staticmethod
+    def encode_issue_cursor(issue: Issue) -> str:
+        """
+        Build a keyset pagination cursor pointing after the given issue.
+
+        The cursor encodes the (created_at, id) sort key used by query_issues.
+        """
+        created_at = issue.created_at.isoformat() if issue.created_at else ''
+        return f"{created_at}@{issue.id}"
+
+    @staticmethod
+    def decode_issue_cursor(cursor: str) -> Tuple[Optional[str], int]:
+        """
+        Parse a cursor produced by encode_issue_cursor.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        created_at, sep, issue_id = cursor.rpartition('@')
+        if not sep or not issue_id.isdigit():
+            raise ValueError(f"Invalid issue cursor: {cursor}")
+        return created_at or None, int(issue_id)
+
     def query_issues(
         self,
         issue_key: Optional[str] = None,
@@ -724,8 +1617,9 @@ class Database:
         ends_with: Optional[str] = None,
         close_to: Optional[str] = None,
         close_range: int = 10,
-        limit: int = 20,
-        offset: int = 0
+        limit: Optional[int] = 20,
+        offset: int = 0,
+        after: Optional[str] = None
     ) -> List[Issue]:
         """
         Query issues with flexible filtering and fuzzy matching.
@@ -744,8 +1638,9 @@ class Database:
             ends_with: Find issues where key ends with this suffix
             close_to: Find issues numerically close to this number
             close_range: Range for close_to search (default: ±10)
-            limit: Maximum number of results (default: 20)
+            limit: Maximum number of results (default: 20, None for all)
             offset: Skip first N results (for pagination)
+            after: Keyset cursor (see encode_issue_cursor); returns issues after it
 
         Returns:
             List of Issue objects matching the query
@@ -763,9 +1658,43 @@ class Database:
             # Find issues close to 8624 (8604-8644)
             query_issues(close_to="8624", close_range=10)
         """
+        return list(self.iter_issues(
+            issue_key=issue_key,
+            repo_id=repo_id,
+            repo_full_name=repo_full_name,
+            starts_with=starts_with,
+            ends_with=ends_with,
+            close_to=close_to,
+            close_range=close_range,
+            limit=limit,
+            offset=offset,
+            after=after
+        ))
+
+    def iter_issues(
+        self,
+        issue_key: Optional[str] = None,
+        repo_id: Optional[int] = None,
+        repo_full_name: Optional[str] = None,
+        starts_with: Optional[str] = None,
+        ends_with: Optional[str] = None,
+        close_to: Optional[str] = None,
+        close_range: int = 10,
+        limit: Optional[int] = 20,
+        offset: int = 0,
+        after: Optional[str] = None
+    ) -> Iterator[Issue]:
+        """
+        Stream issues matching a query, newest first.
+
+        Same filters as query_issues, but rows are yielded as they are read
+        so large exports never hold the full result set in memory. Results
+        are ordered by (created_at, id) descending, which keyset cursors
+        (the after argument) continue from.
+        """
         # Build the SQL query dynamically based on filters
         conditions = []
-        params = []
+        params: List[Any] = []
 
         # Handle repo filter (either by id or full_name)
         if repo_id is not None:
@@ -783,13 +1712,18 @@ class Database:
             conditions.append("t.key = ?")
             params.append(normalized_key)
 
-        # Handle fuzzy matching
+        # Handle fuzzy matching. Prefixes are expressed as ranges so the
+        # idx_issue_key_nocase and idx_issue_number_text indexes can serve them.
         if starts_with:
-            conditions.append("(t.key LIKE ? OR CAST(t.number AS TEXT) LIKE ?)")
-            params.append(f"{starts_with}%")
-            params.append(f"{starts_with}%")
+            upper = self._prefix_upper_bound(starts_with)
+            conditions.append(
+                "((t.key COLLATE NOCASE >= ? AND t.key COLLATE NOCASE < ?)"
+                " OR (CAST(t.number AS TEXT) >= ? AND CAST(t.number AS TEXT) < ?))"
+            )
+            params.extend([starts_with, upper, starts_with, upper])
 
         if ends_with:
+            # Suffix matches cannot use a b-tree index
             conditions.append("(t.key LIKE ? OR CAST(t.number AS TEXT) LIKE ?)")
             params.append(f"%{ends_with}")
             params.append(f"%{ends_with}")
@@ -804,6 +1738,20 @@ class Database:
                 params.append(lower)
                 params.append(upper)
 
+        # Keyset pagination: continue strictly after the cursor's (created_at, id).
+        # NULL created_at sorts last in DESC order.
+        if after:
+            cursor_created_at, cursor_id = self.decode_issue_cursor(after)
+            if cursor_created_at is None:
+                conditions.append("(t.created_at IS NULL AND t.id < ?)")
+                params.append(cursor_id)
+            else:
+                conditions.append(
+                    "(t.created_at < ? OR t.created_at IS NULL"
+                    " OR (t.created_at = ? AND t.id < ?))"
+                )
+                params.extend([cursor_created_at, cursor_created_at, cursor_id])
+
         # Build the WHERE clause
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
@@ -811,48 +1759,33 @@ class Database:
         query = f"""
             SELECT
                 t.*,
+                {self._ISSUE_LABEL_IDS},
                 r.full_name as repo_full_name,
                 r.owner as repo_owner,
                 r.name as repo_name
             FROM issues t
             LEFT JOIN repositories r ON t.repo_id = r.id
             WHERE {where_clause}
-            ORDER BY t.created_at DESC
+            ORDER BY t.created_at DESC, t.id DESC
             LIMIT ? OFFSET ?
         """
 
-        params.extend([limit, offset])
-
-        # Execute query
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
+        # SQLite treats a negative LIMIT as "no limit"
+        params.extend([limit if limit else -1, offset])
 
-        # Parse results into Issue objects with repo info stored separately
-        issues = []
-        for row in rows:
+        # Use a dedicated cursor so callers can run other queries while iterating
+        for row in self.conn.execute(query, params):
             data = dict(row)
             # Extract the joined repo fields (not part of Issue model)
             repo_full_name_val = data.pop('repo_full_name', None)
             data.pop('repo_owner', None)
             data.pop('repo_name', None)
 
-            # Parse JSON fields
-            data['labels'] = [Label(**l) for l in json.loads(data.get('labels', '[]'))]
-            data['tags'] = json.loads(data.get('tags', '{}'))
-
-            # Parse dates
-            if data.get('created_at'):
-                data['created_at'] = datetime.fromisoformat(data['created_at'])
-            if data.get('closed_at'):
-                data['closed_at'] = datetime.fromisoformat(data['closed_at'])
-
-            issue = Issue(**data)
+            issue = self._issue_from_data(data)
             # Store repo info in a way that won't conflict with Pydantic
             # Use object.__setattr__ to bypass Pydantic's validation
             object.__setattr__(issue, '_repo_full_name', repo_full_name_val)
-            issues.append(issue)
-
-        return issues
+            yield issue
 
     # Release operations
     def upsert_release(self, release: Release) -> int:
@@ -895,6 +1828,18 @@ class Database:
         row = self.cursor.fetchone()
         return row["id"] if row else None
 
+    @staticmethod
+    def _release_from_row(row: sqlite3.Row) -> Release:
+        """Build a Release model from a trusted releases row (no validation)."""
+        data = dict(row)
+        data['is_draft'] = bool(data['is_draft'])
+        data['is_prerelease'] = bool(data['is_prerelease'])
+        if data.get('created_at'):
+            data['created_at'] = datetime.fromisoformat(data['created_at'])
+        if data.get('published_at'):
+            data['published_at'] = datetime.fromisoformat(data['published_at'])
+        return Release.model_construct(**data)
+
     def get_release(self, repo_id: int, version: str) -> Optional[Release]:
         """Get release by repo and version."""
         self.cursor.execute(
@@ -903,14 +1848,7 @@ class Database:
         )
         row = self.cursor.fetchone()
         if row:
-            data = dict(row)
-            data['is_draft'] = bool(data['is_draft'])
-            data['is_prerelease'] = bool(data['is_prerelease'])
-            if data.get('created_at'):
-                data['created_at'] = datetime.fromisoformat(data['created_at'])
-            if data.get('published_at'):
-                data['published_at'] = datetime.fromisoformat(data['published_at'])
-            return Release(**data)
+            return self._release_from_row(row)
         return None
 
     def delete_release(self, repo_id: int, version: str) -> bool:
@@ -934,6 +1872,31 @@ class Database:
         except Exception:
             return False
 
+    def get_release_cancel_targets(self, repo_id: int, repo_full_name: str) -> List[Dict[str, Any]]:
+        """
+        Get every release of a repository with its tracking issue, in one query.
+
+        Used by `cancel` in batch mode to pick the releases to delete.
+
+        Args:
+            repo_id: Repository ID
+            repo_full_name: Full repository name (owner/repo) of the issue associations
+
+        Returns:
+            List of dictionaries with version, tag_name, created_at,
+            published_at, is_draft and issue_number (None without an issue)
+        """
+        self.cursor.execute(
+            """SELECT r.version, r.tag_name, r.created_at, r.published_at, r.is_draft,
+                      ri.issue_number
+               FROM releases r
+               LEFT JOIN release_issues ri
+                 ON ri.repo_full_name = ? AND ri.version = r.version
+               WHERE r.repo_id = ?""",
+            (repo_full_name, repo_id)
+        )
+        return [dict(row) for row in self.cursor.fetchall()]
+
     def get_all_releases(
         self,
         repo_id: int,
@@ -998,15 +1961,7 @@ class Database:
 
         releases = []
         for row in rows:
-            data = dict(row)
-            data['is_draft'] = bool(data['is_draft'])
-            data['is_prerelease'] = bool(data['is_prerelease'])
-            if data.get('created_at'):
-                data['created_at'] = datetime.fromisoformat(data['created_at'])
-            if data.get('published_at'):
-                data['published_at'] = datetime.fromisoformat(data['published_at'])
-
-            release = Release(**data)
+            release = self._release_from_row(row)
 
             # Apply version prefix filter (client-side since version format varies)
             if version_prefix:
@@ -1046,6 +2001,50 @@ class Database:
 
         return releases
 
+    def compact(self, drop_bodies_before: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Shrink the database file.
+
+        Compresses issue bodies still stored as plain text by older versions,
+        optionally drops the bodies of issues closed before a cutoff (their
+        pre-extracted note sections are kept), and runs VACUUM.
+
+        Args:
+            drop_bodies_before: Drop bodies of issues closed before this date
+
+        Returns:
+            Dictionary with compressed, dropped, size_before and size_after (bytes)
+        """
+        size_before = Path(self.db_path).stat().st_size
+
+        rows = self.conn.execute(
+            "SELECT id, body FROM issues WHERE body IS NOT NULL"
+        ).fetchall()
+        self.cursor.executemany(
+            "UPDATE issues SET body=NULL, body_z=? WHERE id=?",
+            [(self._encode_body(row['body']), row['id']) for row in rows]
+        )
+
+        dropped = 0
+        if drop_bodies_before:
+            self.cursor.execute(
+                """UPDATE issues SET body=NULL, body_z=NULL
+                   WHERE closed_at IS NOT NULL AND closed_at < ?
+                   AND (body IS NOT NULL OR body_z IS NOT NULL)""",
+                (drop_bodies_before.isoformat(),)
+            )
+            dropped = self.cursor.rowcount
+        self.conn.commit()
+
+        self.conn.execute("VACUUM")
+
+        return {
+            'compressed': len(rows),
+            'dropped': dropped,
+            'size_before': size_before,
+            'size_after': Path(self.db_path).stat().st_size,
+        }
+
     def migrate_issue_keys_strip_hash(self) -> int:
         """
         Migrate database: strip "#" prefix from all issue keys.
@@ -1068,6 +2067,136 @@ class Database:
 
         return updated_count
 
+    # Push journal operations
+    def get_push_journal(self, repo_full_name: str, version: str, fingerprint: str) -> Dict[str, Any]:
+        """
+        Get the steps journaled by an earlier push of a release.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            version: Release version
+            fingerprint: Fingerprint of the push inputs; steps journaled with
+                another fingerprint are ignored
+
+        Returns:
+            Dictionary of step name -> result
+        """
+        self.cursor.execute(
+            """SELECT step, result FROM push_journal
+               WHERE repo_full_name=? AND version=? AND fingerprint=?""",
+            (repo_full_name, version, fingerprint)
+        )
+        return {row['step']: json.loads(row['result']) for row in self.cursor.fetchall()}
+
+    def record_push_step(
+        self,
+        repo_full_name: str,
+        version: str,
+        fingerprint: str,
+        step: str,
+        result: Any
+    ) -> None:
+        """
+        Journal a finished push step, dropping steps of pushes with other inputs.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            version: Release version
+            fingerprint: Fingerprint of the push inputs
+            step: Step name (e.g. 'release')
+            result: JSON-serializable result of the step
+        """
+        self.cursor.execute(
+            "DELETE FROM push_journal WHERE repo_full_name=? AND version=? AND fingerprint!=?",
+            (repo_full_name, version, fingerprint)
+        )
+        self.cursor.execute(
+            """INSERT OR REPLACE INTO push_journal
+               (repo_full_name, version, fingerprint, step, result, completed_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (repo_full_name, version, fingerprint, step, json.dumps(result), datetime.now().isoformat())
+        )
+        self.conn.commit()
+
+    def clear_push_journal(self, repo_full_name: str, version: str) -> None:
+        """Delete the journaled push steps of a release."""
+        self.cursor.execute(
+            "DELETE FROM push_journal WHERE repo_full_name=? AND version=?",
+            (repo_full_name, version)
+        )
+        self.conn.commit()
+
+    # Publish state operations
+    def get_publish_state(self, repo_full_name: str, version: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get what push/merge last wrote to GitHub for a release.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            version: Release version
+
+        Returns:
+            Dictionary of artifact (e.g. 'release', 'pr:<alias>', 'issue') ->
+            {'hash': content hash, 'url': URL or None}
+        """
+        self.cursor.execute(
+            """SELECT artifact, content_hash, url FROM publish_state
+               WHERE repo_full_name=? AND version=?""",
+            (repo_full_name, version)
+        )
+        return {
+            row['artifact']: {'hash': row['content_hash'], 'url': row['url']}
+            for row in self.cursor.fetchall()
+        }
+
+    def record_publish_state(
+        self,
+        repo_full_name: str,
+        version: str,
+        artifact: str,
+        content_hash: str,
+        url: Optional[str] = None
+    ) -> None:
+        """
+        Record the content hash of an artifact written to GitHub.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            version: Release version
+            artifact: Artifact name (e.g. 'release')
+            content_hash: Hash of the written content (see publish_hash)
+            url: URL of the artifact on GitHub
+        """
+        self.cursor.execute(
+            """INSERT OR REPLACE INTO publish_state
+               (repo_full_name, version, artifact, content_hash, url, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (repo_full_name, version, artifact, content_hash, url, datetime.now().isoformat())
+        )
+        self.conn.commit()
+
+    def clear_publish_state(
+        self,
+        repo_full_name: str,
+        version: str,
+        artifacts: Optional[List[str]] = None
+    ) -> None:
+        """
+        Forget the publish state of a release.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            version: Release version
+            artifacts: Artifacts to forget (default: all)
+        """
+        query = "DELETE FROM publish_state WHERE repo_full_name=? AND version=?"
+        params: List[Any] = [repo_full_name, version]
+        if artifacts is not None:
+            query += f" AND artifact IN ({','.join('?' * len(artifacts))})"
+            params.extend(artifacts)
+        self.cursor.execute(query, params)
+        self.conn.commit()
+
     # Release issue association operations
     def save_issue_association(
         self,
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Ingestion of GitHub webhook / Actions event payloads.
+
+Events already carry the full issue, pull request, release or pushed
+commits, so the affected rows are upserted straight into the database
+without any GitHub API call. Payloads are converted with the same
+converters `pull` uses, and the same rules apply: only merged PRs are
+stored, and only repositories from the configuration are accepted.
+"""
+
+from typing import Any, Dict, Optional
+
+from .config import Config
+from .db import Database
+from .github_payloads import (
+    issue_from_payload, pull_request_from_payload, push_commit_from_payload,
+    release_from_payload, repository_from_payload,
+)
+
+# Event name -> handler method
+SUPPORTED_EVENTS = {
+    'issues': '_ingest_issue',
+    'issue_comment': '_ingest_issue',
+    'pull_request': '_ingest_pull_request',
+    'pull_request_target': '_ingest_pull_request',
+    'pull_request_review': '_ingest_pull_request',
+    'release': '_ingest_release',
+    'push': '_ingest_push',
+}
+
+
+def detect_event_name(payload: Dict[str, Any]) -> Optional[str]:
+    """Guess the event name from the shape of a payload (None if unknown)."""
+    if 'pull_request' in payload:
+        return 'pull_request'
+    if 'release' in payload:
+        return 'release'
+    if 'issue' in payload:
+        return 'issue_comment' if 'comment' in payload else 'issues'
+    if 'commits' in payload and 'ref' in payload:
+        return 'push'
+    return None
+
+
+class EventIngestor:
+    """Upserts the objects carried by GitHub event payloads."""
+
+    def __init__(self, config: Config, db: Database):
+        self.config = config
+        self.db = db
+        self._extractor = None
+
+    def ingest(self, event_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ingest one event payload.
+
+        Args:
+            event_name: GitHub event name (e.g. "issues", "pull_request").
+            payload: Parsed event payload.
+
+        Returns:
+            Dictionary with counts of upserted 'issues', 'pull_requests',
+            'releases' and 'commits', deleted 'releases_deleted', and a
+            'skipped' reason (None when something was ingested or checked).
+        """
+        stats: Dict[str, Any] = {
+            'issues': 0,
+            'pull_requests': 0,
+            'releases': 0,
+            'releases_deleted': 0,
+            'commits': 0,
+            'skipped': None,
+        }
+
+        handler = SUPPORTED_EVENTS.get(event_name)
+        if handler is None:
+            stats['skipped'] = f"unsupported event '{event_name}'"
+            return stats
+
+        repository = payload.get('repository') or {}
+        full_name = repository.get('full_name')
+        if event_name in ('issues', 'issue_comment'):
+            accepted = self.config.get_issue_repos()
+        else:
+            accepted = [repo.link for repo in self.config.repository.code_repos]
+        if full_name not in accepted:
+            stats['skipped'] = f"repository '{full_name}' is not configured"
+            return stats
+
+        repo_id = self.db.upsert_repository(repository_from_payload(repository))
+        getattr(self, handler)(payload, repo_id, stats)
+        return stats
+
+    def _ingest_issue(self, payload: Dict[str, Any], repo_id: int, stats: Dict[str, Any]) -> None:
+        raw = payload.get('issue') or {}
+        if raw.get('pull_request') is not None:
+            # Comments on PRs arrive as issue events: PRs are stored from PR events
+            stats['skipped'] = "issue is a pull request"
+            return
+        self.db.upsert_issue(issue_from_payload(raw, repo_id))
+        stats['issues'] += 1
+
+    def _ingest_pull_request(self, payload: Dict[str, Any], repo_id: int, stats: Dict[str, Any]) -> None:
+        pr = pull_request_from_payload(payload.get('pull_request') or {}, repo_id)
+        if not pr.merged_at:
+            # Same rule as pull: only merged PRs take part in release notes
+            stats['skipped'] = f"PR #{pr.number} is not merged"
+            return
+        self.db.upsert_pull_request(pr)
+        stats['pull_requests'] += 1
+
+    def _ingest_release(self, payload: Dict[str, Any], repo_id: int, stats: Dict[str, Any]) -> None:
+        release = release_from_payload(payload.get('release') or {}, repo_id)
+        if payload.get('action') == 'deleted':
+            if self.db.delete_release(repo_id, release.version):
+                stats['releases_deleted'] += 1
+            return
+        self.db.upsert_release(release)
+        stats['releases'] += 1
+
+    def _ingest_push(self, payload: Dict[str, Any], repo_id: int, stats: Dict[str, Any]) -> None:
+        if not (payload.get('ref') or '').startswith('refs/heads/'):
+            stats['skipped'] = f"push to {payload.get('ref')} is not a branch"
+            return
+
+        from .git_ops import extract_pr_number
+        from .policies import IssueExtractor
+
+        # Push payloads list at most 20 commits: the commit index heads are
+        # left alone, so the next pull still walks the full branch history
+        commits = [
+            push_commit_from_payload(raw, repo_id)
+            for raw in payload.get('commits') or []
+            if raw.get('id')
+        ]
+        existing = self.db.get_existing_commit_shas([c.sha for c in commits])
+        new_commits = [c for c in commits if c.sha not in existing]
+        if new_commits and self._extractor is None:
+            self._extractor = IssueExtractor(self.config)
+        for commit in new_commits:
+            commit.pr_number = extract_pr_number(commit.message)
+            self._extractor.index_commit(commit)
+
+        self.db.upsert_commits(new_commits)
+        stats['commits'] += len(new_commits)
@@ -7,27 +7,108 @@
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from git import Repo, Commit as GitCommit
 from .models import Commit, SemanticVersion, VersionType
 from .template_utils import render_template, TemplateError
 from .config import ReleaseVersionPolicy
+from .profiling import cache as record_cache, timed
+
+# PR number patterns in commit messages:
+# - "Merge pull request #123 from..."
+# - "... (#123)"
+# - "PR #123:"
+_PR_NUMBER_PATTERNS = [
+    re.compile(r'[Mm]erge pull request #(\d+)'),
+    re.compile(r'\(#(\d+)\)'),
+    re.compile(r'[Pp][Rr]\s*#(\d+)'),
+]
+
+# git log format used for bulk commit reads: fields separated by US, records by RS
+_LOG_FORMAT = '%H%x1f%an%x1f%ae%x1f%ct%x1f%B%x1e'
+
+
+def extract_pr_number(message: str) -> Optional[int]:
+    """Extract a PR number from a commit message, if it references one."""
+    for pattern in _PR_NUMBER_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return int(match.group(1))
+    return None
 
 
 class GitOperations:
     """Git operations wrapper."""
 
+    # Repo handles shared across instances (daemon mode), keyed by resolved
+    # path, and version catalogues keyed by path -> (refs fingerprint, versions).
+    # None when sharing is disabled (the default for one-shot CLI runs).
+    _shared_repos: Optional[Dict[str, Repo]] = None
+    _version_catalogues: Dict[str, Tuple[tuple, List[SemanticVersion]]] = {}
+
     def __init__(self, repo_path: str):
         """Initialize with path to git repository."""
         self.repo_path = Path(repo_path)
-        self.repo = Repo(str(self.repo_path))
+        shared = GitOperations._shared_repos
+        if shared is None:
+            self.repo = Repo(str(self.repo_path))
+            return
+        key = str(self.repo_path.resolve())
+        if key not in shared:
+            shared[key] = Repo(key)
+        self.repo = shared[key]
+
+    @classmethod
+    def enable_shared_repos(cls) -> None:
+        """Reuse Repo handles (and their git helper processes) across instances."""
+        if cls._shared_repos is None:
+            cls._shared_repos = {}
+
+    @classmethod
+    def close_shared_repos(cls) -> None:
+        """Close all shared Repo handles and disable sharing."""
+        for repo in (cls._shared_repos or {}).values():
+            repo.close()
+        cls._shared_repos = None
+        cls._version_catalogues = {}
+
+    def _refs_fingerprint(self) -> tuple:
+        """Cheap fingerprint of the tag refs: changes whenever a tag is added or removed."""
+        git_dir = Path(self.repo.git_dir)
+        stamps = []
+        packed = git_dir / 'packed-refs'
+        if packed.exists():
+            stat = packed.stat()
+            stamps.append(('packed-refs', stat.st_mtime_ns, stat.st_size))
+        tags_dir = git_dir / 'refs' / 'tags'
+        if tags_dir.exists():
+            # Directory mtimes change when entries are created or deleted
+            for directory in [tags_dir, *(p for p in tags_dir.rglob('*') if p.is_dir())]:
+                stamps.append((str(directory), directory.stat().st_mtime_ns))
+        return tuple(stamps)
 
     def get_tags(self) -> List[str]:
         """Get all tags in the repository."""
         return [tag.name for tag in self.repo.tags]
 
+    @timed('git.get_version_tags')
     def get_version_tags(self) -> List[SemanticVersion]:
         """Get all version tags, parsed as semantic versions."""
+        if GitOperations._shared_repos is not None:
+            key = str(Path(self.repo.git_dir).resolve())
+            fingerprint = self._refs_fingerprint()
+            cached = GitOperations._version_catalogues.get(key)
+            hit = cached is not None and cached[0] == fingerprint
+            record_cache('git.version_tags', hits=int(hit), misses=int(not hit))
+            if hit:
+                return list(cached[1])
+            versions = self._parse_version_tags()
+            GitOperations._version_catalogues[key] = (fingerprint, versions)
+            return list(versions)
+        return self._parse_version_tags()
+
+    def _parse_version_tags(self) -> List[SemanticVersion]:
+        """Parse all semver tags, sorted ascending."""
         versions = []
         for tag in self.get_tags():
             try:
@@ -66,6 +147,7 @@ class GitOperations:
         except Exception:
             return None
 
+    @timed('git.get_commits_between_refs')
     def get_commits_between_refs(
         self, base_ref: str, head_ref: str = "HEAD"
     ) -> List[GitCommit]:
@@ -103,23 +185,9 @@ class GitOperations:
 
     def extract_pr_number_from_commit(self, commit: GitCommit) -> Optional[int]:
         """Extract PR number from commit message."""
-        # Common patterns:
-        # - "Merge pull request #123 from..."
-        # - "... (#123)"
-        # - "PR #123:"
-        patterns = [
-            r'[Mm]erge pull request #(\d+)',
-            r'\(#(\d+)\)',
-            r'[Pp][Rr]\s*#(\d+)',
-        ]
-
-        message = commit.message
-        for pattern in patterns:
-            match = re.search(pattern, message)
-            if match:
-                return int(match.group(1))
-        return None
+        return extract_pr_number(commit.message)
 
+    @timed('git.commit_to_model')
     def commit_to_model(self, git_commit: GitCommit, repo_id: int) -> Commit:
         """Convert GitPython commit to our model."""
         from .models import Author
@@ -144,6 +212,58 @@ class GitOperations:
             pr_number=pr_number
         )
 
+    def iter_commit_models(self, rev_args: List[str], repo_id: int) -> Iterator[Commit]:
+        """
+        Stream commits selected by rev-list arguments as Commit models.
+
+        Uses a single `git log` call instead of loading each GitPython commit
+        object, which makes indexing large histories cheap.
+
+        Args:
+            rev_args: Revision arguments (e.g., ["origin/main", "^<old-head>"])
+            repo_id: Repository ID to set on the models
+
+        Returns:
+            Iterator of Commit models, newest first
+        """
+        from .models import Author
+
+        output = self.repo.git.log(*rev_args, f'--format={_LOG_FORMAT}')
+        for record in output.split('\x1e'):
+            record = record.lstrip('\n')
+            if not record:
+                continue
+            sha, name, email, committed, message = record.split('\x1f', 4)
+            yield Commit.model_construct(
+                sha=sha,
+                repo_id=repo_id,
+                message=message,
+                author=Author.model_construct(name=name or "Unknown", email=email or None),
+                date=datetime.fromtimestamp(int(committed)),
+                pr_number=extract_pr_number(message)
+            )
+
+    @timed('git.get_remote_branch_heads')
+    def get_remote_branch_heads(self, remote: str = "origin") -> Dict[str, str]:
+        """
+        Get the head commit SHA of every remote-tracking branch.
+
+        Args:
+            remote: Remote name (default: "origin")
+
+        Returns:
+            Dictionary mapping ref name (e.g., "origin/main") to commit SHA
+        """
+        output = self.repo.git.for_each_ref(
+            '--format=%(refname:short) %(objectname)', f'refs/remotes/{remote}'
+        )
+        heads = {}
+        for line in output.splitlines():
+            ref, _, sha = line.partition(' ')
+            if ref and sha and not ref.endswith('/HEAD') and ref != remote:
+                heads[ref] = sha
+        return heads
+
     def get_current_branch(self) -> str:
         """Get the current branch name."""
         return self.repo.active_branch.name
@@ -172,18 +292,23 @@ class GitOperations:
             # Return current branch as last resort
             return self.get_current_branch()
 
-    def fetch_remote_refs(self, remote: str = "origin") -> None:
+    @timed('git.fetch_remote_refs')
+    def fetch_remote_refs(self, remote: str = "origin") -> bool:
         """
         Fetch remote references to ensure we have up-to-date remote branch info.
         
         Args:
             remote: Remote name (default: "origin")
+
+        Returns:
+            True if the refs were fetched
         """
         try:
             self.repo.git.fetch(remote)
+            return True
         except Exception as e:
             # Non-fatal - remote might not exist in tests or offline scenarios
-            pass
+            return False
 
     def get_all_branches(self, remote: bool = False) -> List[str]:
         """Get all branch names (local or remote)."""
@@ -201,6 +326,7 @@ class GitOperations:
         branches = self.get_all_branches(remote=remote)
         return branch_name in branches
 
+    @timed('git.create_branch')
     def create_branch(self, branch_name: str, start_point: str = "HEAD") -> None:
         """Create a new branch from a starting point."""
         if self.branch_exists(branch_name):
@@ -215,6 +341,7 @@ class GitOperations:
 
         self.repo.git.checkout(branch_name)
 
+    @timed('git.push_branch')
     def push_branch(self, branch_name: str, remote: str = "origin", set_upstream: bool = True) -> None:
         """
         Push a branch to remote repository.
@@ -229,6 +356,7 @@ class GitOperations:
         else:
             self.repo.git.push(remote, branch_name)
 
+    @timed('git.create_tag')
     def create_tag(self, tag_name: str, ref: str = "HEAD", message: Optional[str] = None) -> None:
         """
         Create a git tag.
@@ -243,6 +371,7 @@ class GitOperations:
         else:
             self.repo.create_tag(tag_name, ref=ref)
 
+    @timed('git.push_tag')
     def push_tag(self, tag_name: str, remote: str = "origin", force: bool = False) -> None:
         """
         Push a tag to remote repository.
@@ -257,6 +386,32 @@ class GitOperations:
         else:
             self.repo.git.push(remote, tag_name)
 
+    @timed('git.delete_remote_tags')
+    def delete_remote_tags(self, tag_names: List[str], remote: str = "origin") -> List[str]:
+        """
+        Delete tags from the remote repository with a single push.
+
+        Tags missing on the remote are skipped, so deleting them again
+        succeeds. Local tags are kept.
+
+        Args:
+            tag_names: Names of the tags to delete (e.g., ["v1.2.3-rc.0"])
+            remote: Remote name (default: "origin")
+
+        Returns:
+            Names of the tags that were deleted
+        """
+        if not tag_names:
+            return []
+        refs = [f"refs/tags/{name}" for name in tag_names]
+        listed = self.repo.git.ls_remote(remote, *refs)
+        # Annotated tags are also listed peeled ("refs/tags/v1.0.0^{}")
+        existing = {line.split('\t', 1)[1].removesuffix('^{}') for line in listed.splitlines() if '\t' in line}
+        to_delete = [ref for ref in refs if ref in existing]
+        if to_delete:
+            self.repo.git.push(remote, "--delete", *to_delete)
+        return [ref[len("refs/tags/"):] for ref in to_delete]
+
     def tag_exists(self, tag_name: str, remote: bool = False) -> bool:
         """
         Check if a tag exists.
@@ -522,6 +677,7 @@ def find_comparison_version_for_docs(
     return find_comparison_version(target_version, available_versions)
 
 
+@timed('git.release_commit_range')
 def get_release_commit_range(
     git_ops: GitOperations,
     target_version: SemanticVersion,
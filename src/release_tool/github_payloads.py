@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Converters from raw GitHub JSON payloads to models.
+
+The same JSON objects come back from the REST API (PyGithub keeps them in
+`_rawData`) and arrive in webhook/Actions event payloads, so both the
+GitHub client and `ingest-event` convert them here. This module does not
+import PyGithub, which keeps event ingestion free of its import cost.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .models import Author, Commit, Issue, Label, PullRequest, Release, Repository
+
+
+def parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a GitHub API timestamp (e.g. "2024-01-31T12:00:00Z").
+
+    The ingest path builds models with model_construct (GitHub payloads are
+    trusted), so timestamps have to be parsed here instead of by pydantic.
+    datetime.fromisoformat only accepts a trailing "Z" from Python 3.11.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def author_from_payload(user: Optional[Dict[str, Any]]) -> Optional[Author]:
+    """Convert a GitHub user object to an Author."""
+    if not user:
+        return None
+    # Trusted GitHub payload: skip pydantic validation
+    return Author.model_construct(
+        username=user.get('login'),
+        github_id=user.get('id'),
+        name=user.get('name'),
+        email=user.get('email'),
+        display_name=user.get('name') or user.get('login'),
+        avatar_url=user.get('avatar_url'),
+        profile_url=user.get('html_url'),
+        company=user.get('company'),
+        location=user.get('location'),
+        bio=user.get('bio'),
+        blog=user.get('blog'),
+        user_type=user.get('type')
+    )
+
+
+def labels_from_payload(raw: Dict[str, Any]) -> List[Label]:
+    """Convert the `labels` array of an issue or PR object."""
+    return [
+        Label.model_construct(
+            name=label_data.get('name', ''),
+            color=label_data.get('color', ''),
+            description=label_data.get('description')
+        )
+        for label_data in raw.get('labels') or []
+    ]
+
+
+def pull_request_from_payload(raw: Dict[str, Any], repo_id: int) -> PullRequest:
+    """Convert a GitHub pull request object to a PullRequest."""
+    base_data = raw.get('base') or {}
+    head_data = raw.get('head') or {}
+
+    # Trusted GitHub payload: skip pydantic validation
+    return PullRequest.model_construct(
+        repo_id=repo_id,
+        number=raw.get('number'),
+        title=raw.get('title') or '',
+        body=raw.get('body'),
+        state=raw.get('state'),
+        merged_at=parse_github_datetime(raw.get('merged_at')),
+        author=author_from_payload(raw.get('user')),
+        base_branch=base_data.get('ref'),
+        head_branch=head_data.get('ref'),
+        head_sha=head_data.get('sha'),
+        labels=labels_from_payload(raw),
+        url=raw.get('html_url')
+    )
+
+
+def issue_from_payload(raw: Dict[str, Any], repo_id: int) -> Issue:
+    """Convert a GitHub issue object to an Issue."""
+    number = raw.get('number')
+    # Trusted GitHub payload: skip pydantic validation
+    return Issue.model_construct(
+        repo_id=repo_id,
+        number=number,
+        key=str(number),
+        title=raw.get('title') or '',
+        body=raw.get('body'),
+        state=raw.get('state'),
+        labels=labels_from_payload(raw),
+        url=raw.get('html_url'),
+        created_at=parse_github_datetime(raw.get('created_at')),
+        closed_at=parse_github_datetime(raw.get('closed_at'))
+    )
+
+
+def release_from_payload(raw: Dict[str, Any], repo_id: int) -> Release:
+    """Convert a GitHub release object to a Release."""
+    tag_name = raw.get('tag_name') or ''
+    return Release(
+        repo_id=repo_id,
+        version=tag_name.lstrip('v'),
+        tag_name=tag_name,
+        name=raw.get('name'),
+        body=raw.get('body'),
+        created_at=parse_github_datetime(raw.get('created_at')),
+        published_at=parse_github_datetime(raw.get('published_at')),
+        is_draft=bool(raw.get('draft')),
+        is_prerelease=bool(raw.get('prerelease')),
+        url=raw.get('html_url'),
+        target_commitish=raw.get('target_commitish')
+    )
+
+
+def repository_from_payload(raw: Dict[str, Any]) -> Repository:
+    """Convert a GitHub repository object to a Repository."""
+    owner = raw.get('owner') or {}
+    full_name = raw.get('full_name') or ''
+    return Repository(
+        owner=owner.get('login') or owner.get('name') or full_name.split('/')[0],
+        name=raw.get('name') or full_name.split('/')[-1],
+        full_name=full_name,
+        url=raw.get('html_url') or '',
+        default_branch=raw.get('default_branch') or 'main'
+    )
+
+
+def push_commit_from_payload(raw: Dict[str, Any], repo_id: int) -> Commit:
+    """
+    Convert a commit of a `push` event to a Commit.
+
+    Push events carry a shortened commit format (id, message, timestamp and
+    the git author), not the REST commit object. The PR number and issue
+    keys are left for the caller to extract.
+    """
+    author = raw.get('author') or {}
+    date = parse_github_datetime(raw.get('timestamp'))
+    if date is not None and date.tzinfo is not None:
+        # Same representation as commits indexed from git (naive local time)
+        date = datetime.fromtimestamp(date.timestamp())
+    # Trusted GitHub payload: skip pydantic validation
+    return Commit.model_construct(
+        sha=raw.get('id'),
+        repo_id=repo_id,
+        message=raw.get('message') or '',
+        author=Author.model_construct(
+            name=author.get('name') or "Unknown",
+            email=author.get('email') or None,
+            username=author.get('username'),
+            display_name=author.get('name') or author.get('username')
+        ),
+        date=date,
+        url=raw.get('url'),
+        pr_number=None,
+        issue_keys=[],
+        issue_patterns_key=None
+    )
@@ -4,8 +4,9 @@
 
 """GitHub API utilities."""
 
+import hashlib
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from github import Github, GithubException
 from rich.console import Console
 
@@ -13,25 +14,66 @@ from .models import (
     Repository, PullRequest, Issue, Release, Label
 )
 from .config import Config
+from .metrics import track_api_usage
+from .output import Progress
+from .profiling import timed
+from .github_payloads import (
+    author_from_payload, issue_from_payload, pull_request_from_payload, release_from_payload
+)
 
 console = Console()
 
 
+def git_blob_sha(content: str) -> str:
+    """Git blob SHA of a UTF-8 text file, as listed in GitHub trees."""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
 class GitHubClient:
     """GitHub API client wrapper."""
 
+    # Github sessions shared across instances (daemon mode), keyed by
+    # (token, API URL) so pooled HTTPS connections stay open between commands.
+    # None when sharing is disabled (the default for one-shot CLI runs).
+    _shared_sessions: Optional[Dict[tuple, Github]] = None
+
     def __init__(self, config: Config):
         """Initialize GitHub client."""
         self.config = config
+        # Plain REST session for conditional and single-object requests (lazy)
+        self._http = None
         token = config.github.token
         if not token:
             raise ValueError(
                 "GitHub token not found. Set GITHUB_TOKEN environment variable "
                 "or configure it in release_tool.toml"
             )
+        track_api_usage(config)
+        shared = GitHubClient._shared_sessions
+        key = (token, config.github.api_url)
+        if shared is not None and key in shared:
+            self.gh = shared[key]
+            return
         # Set per_page=100 (max) for efficient pagination across all API calls
         self.gh = Github(token, base_url=config.github.api_url, per_page=100)
-
+        if shared is not None:
+            shared[key] = self.gh
+
+    @classmethod
+    def enable_shared_sessions(cls) -> None:
+        """Reuse Github sessions across instances that use the same token."""
+        if cls._shared_sessions is None:
+            cls._shared_sessions = {}
+
+    @classmethod
+    def close_shared_sessions(cls) -> None:
+        """Close all shared Github sessions and disable sharing."""
+        for gh in (cls._shared_sessions or {}).values():
+            gh.close()
+        cls._shared_sessions = None
+
+    @timed('github.get_repository_info')
     def get_repository_info(self, full_name: str) -> Repository:
         """Get repository information."""
         try:
@@ -47,6 +89,7 @@ class GitHubClient:
         except GithubException as e:
             raise ValueError(f"Failed to fetch repository {full_name}: {e}")
 
+    @timed('github.fetch_pull_requests')
     def fetch_pull_requests(
         self,
         repo_full_name: str,
@@ -55,7 +98,6 @@ class GitHubClient:
     ) -> List[PullRequest]:
         """Fetch pull requests from GitHub with parallel processing."""
         from concurrent.futures import ThreadPoolExecutor, as_completed
-        from rich.progress import Progress, SpinnerColumn, TextColumn
 
         try:
             repo = self.gh.get_repo(repo_full_name)
@@ -70,12 +112,7 @@ class GitHubClient:
             batch_size = 100  # Increased for better GitHub API throughput
             processed = 0
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Processing pull requests...", total=None)
+            with Progress('github.merged_prs', "Processing pull requests...", console) as progress:
 
                 pr_batch = []
                 for pr in gh_prs:
@@ -94,8 +131,8 @@ class GitHubClient:
                         processed += len(pr_batch)
 
                         progress.update(
-                            task,
-                            description=f"Processed {processed} pull requests ({len(prs_data)} merged)"
+                            f"Processed {processed} pull requests ({len(prs_data)} merged)",
+                            processed=processed, merged=len(prs_data)
                         )
                         pr_batch = []
 
@@ -106,8 +143,8 @@ class GitHubClient:
                     processed += len(pr_batch)
 
                     progress.update(
-                        task,
-                        description=f"Processed {processed} pull requests ({len(prs_data)} merged)"
+                        f"Processed {processed} pull requests ({len(prs_data)} merged)",
+                        processed=processed, merged=len(prs_data)
                     )
 
             console.print(f"[green]✓[/green] Fetched {len(prs_data)} merged PRs from {processed} candidates")
@@ -141,128 +178,109 @@ class GitHubClient:
 
         return results
 
+    @staticmethod
+    def _raw_data(gh_object) -> Dict[str, Any]:
+        """Return the raw JSON of a PyGithub object without triggering lazy loads."""
+        # PyGithub keeps the raw dictionary in _rawData (public raw_data may refetch)
+        raw = getattr(gh_object, '_rawData', None)
+        if raw is None:
+            raw = getattr(gh_object, 'raw_data', {})
+        return raw
+
     def _github_user_to_author(self, gh_user) -> Optional['Author']:
         """Convert PyGithub NamedUser to Author model."""
-        from .models import Author
-
         if not gh_user:
             return None
-
-        try:
-            # Use raw_data to avoid lazy loading of fields not in the partial response
-            # PyGithub 2.x exposes raw_data
-            raw = getattr(gh_user, '_rawData', None)
-            if raw is None:
-                raw = getattr(gh_user, 'raw_data', {})
-            
-            return Author(
-                username=gh_user.login,
-                github_id=gh_user.id,
-                name=raw.get('name'),  # Avoid gh_user.name which triggers fetch
-                email=raw.get('email'),
-                display_name=raw.get('name') or gh_user.login,
-                avatar_url=gh_user.avatar_url,
-                profile_url=gh_user.html_url,
-                company=raw.get('company'),
-                location=raw.get('location'),
-                bio=raw.get('bio'),
-                blog=raw.get('blog'),
-                user_type=gh_user.type
-            )
-        except Exception as e:
-            console.print(f"[yellow]Warning: Error creating author from GitHub user: {e}[/yellow]")
-            # Return minimal author with just username
-            return Author(username=gh_user.login if hasattr(gh_user, 'login') else None)
+        return author_from_payload(self._raw_data(gh_user))
 
     def _pr_to_model(self, gh_pr, repo_id: int) -> PullRequest:
         """Convert PyGithub PR to our model, avoiding lazy loads."""
-        # Use internal _rawData if available to avoid any property overhead or lazy loading checks
-        raw = getattr(gh_pr, '_rawData', None)
-        if raw is None:
-             raw = getattr(gh_pr, 'raw_data', {})
-
-        # Extract labels from raw data to avoid lazy load
-        labels = []
-        for label_data in raw.get('labels', []):
-            labels.append(Label(
-                name=label_data.get('name', ''),
-                color=label_data.get('color', ''),
-                description=label_data.get('description')
-            ))
-
-        # Extract base/head branches from raw data to avoid lazy load
-        base_data = raw.get('base', {})
-        head_data = raw.get('head', {})
-
-        # Get user data from raw to avoid lazy load
-        user_data = raw.get('user')
-        # Create a mock object with raw_data for _github_user_to_author
-        from types import SimpleNamespace
-        gh_user = None
-        if user_data:
-            gh_user = SimpleNamespace(
-                login=user_data.get('login'),
-                id=user_data.get('id'),
-                avatar_url=user_data.get('avatar_url'),
-                html_url=user_data.get('html_url'),
-                type=user_data.get('type'),
-                raw_data=user_data
-            )
-
-        return PullRequest(
-            repo_id=repo_id,
-            number=raw.get('number'),
-            title=raw.get('title'),
-            body=raw.get('body'),
-            state=raw.get('state'),
-            merged_at=raw.get('merged_at'),
-            author=self._github_user_to_author(gh_user),
-            base_branch=base_data.get('ref'),
-            head_branch=head_data.get('ref'),
-            head_sha=head_data.get('sha'),
-            labels=labels,
-            url=raw.get('html_url')
-        )
+        return pull_request_from_payload(self._raw_data(gh_pr), repo_id)
 
     def _issue_to_issue(self, gh_issue, repo_id: int) -> Issue:
         """Convert PyGithub Issue to our Issue model, avoiding lazy loads."""
-        # Use internal _rawData if available to avoid any property overhead or lazy loading checks
-        # PyGithub stores the raw dictionary in _rawData
-        raw = getattr(gh_issue, '_rawData', None)
-        if raw is None:
-             # Fallback to public raw_data
-             raw = getattr(gh_issue, 'raw_data', {})
-        
-        # Extract labels from raw data to avoid lazy load
-        labels = []
-        for label_data in raw.get('labels', []):
-            labels.append(Label(
-                name=label_data.get('name', ''),
-                color=label_data.get('color', ''),
-                description=label_data.get('description')
-            ))
-            
-        # Get number from raw_data to be absolutely sure we avoid any lazy loads
-        number = raw.get('number')
-        if number is None:
-             # Only access gh_issue.number if absolutely necessary (fallback)
-             number = gh_issue.number
-             
-        issue = Issue(
-            repo_id=repo_id,
-            number=number,
-            key=str(number),
-            title=raw.get('title'),
-            body=raw.get('body'),
-            state=raw.get('state'),
-            labels=labels,
-            url=raw.get('html_url'),
-            created_at=raw.get('created_at'),
-            closed_at=raw.get('closed_at')
+        raw = self._raw_data(gh_issue)
+        if raw.get('number') is None:
+            # Only access gh_issue.number if absolutely necessary (fallback)
+            raw = dict(raw, number=gh_issue.number)
+        return issue_from_payload(raw, repo_id)
+
+    # Default polling interval when GitHub sends no X-Poll-Interval header
+    DEFAULT_EVENTS_POLL_INTERVAL = 60
+    EVENTS_PAGE_SIZE = 100
+
+    def _rest_get(self, path: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None):
+        """GET a REST API path (e.g. "repos/owner/name/issues/1") with the client's token."""
+        import requests
+
+        if self._http is None:
+            self._http = requests.Session()
+            self._http.headers.update({
+                "Authorization": f"Bearer {self.config.github.token}",
+                "Accept": "application/vnd.github+json",
+            })
+        url = f"{self.config.github.api_url.rstrip('/')}/{path.lstrip('/')}"
+        return self._http.get(url, params=params, headers=headers, timeout=30)
+
+    def _rest_get_json(self, path: str) -> Optional[Dict[str, Any]]:
+        """GET a single REST object; None if it does not exist (or is not accessible)."""
+        response = self._rest_get(path)
+        if response.status_code in (404, 410):
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    @timed('github.fetch_repository_events')
+    def fetch_repository_events(
+        self,
+        repo_full_name: str,
+        etag: Optional[str] = None
+    ) -> Tuple[int, List[Dict[str, Any]], Optional[str], int]:
+        """
+        Fetch the newest page of a repository's events feed.
+
+        Sends If-None-Match when an ETag is given: an unchanged feed returns
+        304, which does not count against the rate limit.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            etag: ETag of the previous response
+
+        Returns:
+            Tuple of (HTTP status, events newest first, ETag, poll interval in
+            seconds from X-Poll-Interval)
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        response = self._rest_get(
+            f"repos/{repo_full_name}/events",
+            params={"per_page": self.EVENTS_PAGE_SIZE},
+            headers=headers
         )
-        
-        return issue
+        poll_interval = int(response.headers.get("X-Poll-Interval") or self.DEFAULT_EVENTS_POLL_INTERVAL)
+        if response.status_code == 304:
+            return 304, [], etag, poll_interval
+        response.raise_for_status()
+        return response.status_code, response.json(), response.headers.get("ETag"), poll_interval
+
+    def refetch_issue(self, repo_full_name: str, number: int, repo_id: int) -> Optional[Issue]:
+        """Fetch one issue with a single request (None if missing or a pull request)."""
+        raw = self._rest_get_json(f"repos/{repo_full_name}/issues/{number}")
+        if raw is None or raw.get('pull_request') is not None:
+            return None
+        return issue_from_payload(raw, repo_id)
+
+    def refetch_pull_request(self, repo_full_name: str, number: int, repo_id: int) -> Optional[PullRequest]:
+        """Fetch one pull request with a single request (None if missing)."""
+        raw = self._rest_get_json(f"repos/{repo_full_name}/pulls/{number}")
+        return pull_request_from_payload(raw, repo_id) if raw is not None else None
+
+    def refetch_release(self, repo_full_name: str, release_id: int, repo_id: int) -> Optional[Release]:
+        """Fetch one release by ID with a single request (None if missing)."""
+        raw = self._rest_get_json(f"repos/{repo_full_name}/releases/{release_id}")
+        return release_from_payload(raw, repo_id) if raw is not None else None
 
+    @timed('github.fetch_issue')
     def fetch_issue(self, repo_full_name: str, issue_number: int, repo_id: int) -> Optional[Issue]:
         """Fetch a single issue/issue from GitHub."""
         try:
@@ -329,8 +347,6 @@ class GitHubClient:
         Returns:
             List of issue numbers (includes both issues and PRs)
         """
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-
         try:
             repo = self.gh.get_repo(repo_full_name)
 
@@ -347,13 +363,7 @@ class GitHubClient:
             issue_numbers = []
             page_num = 0
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching issues...", total=None)
-
+            with Progress('github.issue_numbers', "Fetching issues...", console) as progress:
                 # Explicitly paginates through results to fetch 100 at a time
                 while True:
                     try:
@@ -369,7 +379,8 @@ class GitHubClient:
                             issue_numbers.append(issue.number)
 
                         page_num += 1
-                        progress.update(task, description=f"Fetching issues... {len(issue_numbers)} found (page {page_num})")
+                        progress.update(f"Fetching issues... {len(issue_numbers)} found (page {page_num})",
+                                        pages=page_num, items=len(issue_numbers))
 
                     except Exception as e:
                         # No more pages
@@ -386,6 +397,7 @@ class GitHubClient:
         """Deprecated: Use search_issue_numbers() instead."""
         return self.search_issue_numbers(repo_full_name, since)
 
+    @timed('github.fetch_all_issues')
     def fetch_all_issues(
         self,
         repo_full_name: str,
@@ -411,7 +423,6 @@ class GitHubClient:
         Returns:
             List of Issue objects (PRs excluded)
         """
-        from rich.progress import Progress, SpinnerColumn, TextColumn
         import time
 
         try:
@@ -432,18 +443,13 @@ class GitHubClient:
             issues = []
             page_num = 0
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching issues...", total=None)
-
+            with Progress('github.issues', "Fetching issues...", console) as progress:
                 # Explicitly paginate through results to fetch 100 at a time
                 while True:
                     try:
                         page_start = time.time()
-                        progress.update(task, description=f"Fetching issues... page {page_num + 1} (fetching...)")
+                        if progress.due():
+                            progress.update(f"Fetching issues... page {page_num + 1} (fetching...)")
 
                         # Get page (100 items) - force to list to avoid lazy iteration
                         page = issues_paginated.get_page(page_num)
@@ -455,7 +461,10 @@ class GitHubClient:
                         page = list(page)
 
                         page_fetch_time = time.time() - page_start
-                        progress.update(task, description=f"Fetching issues... page {page_num + 1} ({len(page)} items in {page_fetch_time:.1f}s, converting...)")
+                        if progress.due():
+                            progress.update(
+                                f"Fetching issues... page {page_num + 1} ({len(page)} items in {page_fetch_time:.1f}s, converting...)"
+                            )
 
                         # Convert issues to Issue objects directly
                         convert_start = time.time()
@@ -466,20 +475,23 @@ class GitHubClient:
                             if raw.get('pull_request') is not None:
                                 continue
                             
-                            item_start = time.time()
                             # Convert to Issue using helper (doesn't trigger extra API calls)
-                            issue_obj = self._issue_to_issue(gh_item, repo_id)
-                            issues.append(issue_obj)
-                            item_time = time.time() - item_start
+                            issues.append(self._issue_to_issue(gh_item, repo_id))
 
                             # Update every 10 items to show progress
-                            if len(issues) % 10 == 0:
+                            if len(issues) % 10 == 0 and progress.due():
                                 avg_time = (time.time() - convert_start) / len(issues)
-                                progress.update(task, description=f"Fetching issues... page {page_num + 1} (converting {len(issues)} issues... {avg_time*1000:.0f}ms/item)")
+                                progress.update(
+                                    f"Fetching issues... page {page_num + 1} (converting {len(issues)} issues... {avg_time*1000:.0f}ms/item)",
+                                    page=page_num + 1, items=len(issues)
+                                )
 
                         convert_time = time.time() - convert_start
                         page_num += 1
-                        progress.update(task, description=f"Fetching issues... {len(issues)} found (page {page_num} done in {page_fetch_time + convert_time:.1f}s)")
+                        progress.update(
+                            f"Fetching issues... {len(issues)} found (page {page_num} done in {page_fetch_time + convert_time:.1f}s)",
+                            pages=page_num, items=len(issues)
+                        )
 
                     except Exception as e:
                         # No more pages
@@ -602,8 +614,6 @@ class GitHubClient:
         Returns:
             List of PR numbers
         """
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-
         try:
             repo = self.gh.get_repo(repo_full_name)
 
@@ -618,13 +628,7 @@ class GitHubClient:
             pr_numbers = []
             page_num = 0
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching PRs...", total=None)
-
+            with Progress('github.pr_numbers', "Fetching PRs...", console) as progress:
                 # Explicitly paginate through results to fetch 100 at a time
                 while True:
                     try:
@@ -642,7 +646,8 @@ class GitHubClient:
                                     pr_numbers.append(pr.number)
 
                         page_num += 1
-                        progress.update(task, description=f"Fetching PRs... {len(pr_numbers)} found (page {page_num})")
+                        progress.update(f"Fetching PRs... {len(pr_numbers)} found (page {page_num})",
+                                        pages=page_num, items=len(pr_numbers))
 
                     except Exception as e:
                         # No more pages
@@ -655,6 +660,7 @@ class GitHubClient:
             console.print(f"[red]Error fetching PRs from {repo_full_name}: {e}[/red]")
             return []
 
+    @timed('github.fetch_all_pull_requests')
     def fetch_all_pull_requests(
         self,
         repo_full_name: str,
@@ -679,7 +685,6 @@ class GitHubClient:
         Returns:
             List of PullRequest objects (all closed PRs)
         """
-        from rich.progress import Progress, SpinnerColumn, TextColumn
         import time
 
         try:
@@ -696,18 +701,13 @@ class GitHubClient:
             pull_requests = []
             page_num = 0
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching PRs...", total=None)
-
+            with Progress('github.pull_requests', "Fetching PRs...", console) as progress:
                 # Explicitly paginate through results to fetch 100 at a time
                 while True:
                     try:
                         page_start = time.time()
-                        progress.update(task, description=f"Fetching PRs... page {page_num + 1} (fetching...)")
+                        if progress.due():
+                            progress.update(f"Fetching PRs... page {page_num + 1} (fetching...)")
 
                         # Get page (100 items) - force to list to avoid lazy iteration
                         page = prs_paginated.get_page(page_num)
@@ -719,24 +719,30 @@ class GitHubClient:
                         page = list(page)
 
                         page_fetch_time = time.time() - page_start
-                        progress.update(task, description=f"Fetching PRs... page {page_num + 1} ({len(page)} items in {page_fetch_time:.1f}s, converting...)")
+                        if progress.due():
+                            progress.update(
+                                f"Fetching PRs... page {page_num + 1} ({len(page)} items in {page_fetch_time:.1f}s, converting...)"
+                            )
 
                         # Convert all PRs to PullRequest objects directly (no filtering here)
                         convert_start = time.time()
                         for idx, pr in enumerate(page):
-                            item_start = time.time()
-                            pr_obj = self._pr_to_model(pr, repo_id)
-                            pull_requests.append(pr_obj)
-                            item_time = time.time() - item_start
+                            pull_requests.append(self._pr_to_model(pr, repo_id))
 
                             # Update every 10 items to show progress
-                            if (idx + 1) % 10 == 0:
+                            if (idx + 1) % 10 == 0 and progress.due():
                                 avg_time = (time.time() - convert_start) / (idx + 1)
-                                progress.update(task, description=f"Fetching PRs... page {page_num + 1} (converting {idx + 1}/{len(page)}... {avg_time*1000:.0f}ms/item)")
+                                progress.update(
+                                    f"Fetching PRs... page {page_num + 1} (converting {idx + 1}/{len(page)}... {avg_time*1000:.0f}ms/item)",
+                                    page=page_num + 1, items=len(pull_requests)
+                                )
 
                         convert_time = time.time() - convert_start
                         page_num += 1
-                        progress.update(task, description=f"Fetching PRs... {len(pull_requests)} found (page {page_num} done in {page_fetch_time + convert_time:.1f}s)")
+                        progress.update(
+                            f"Fetching PRs... {len(pull_requests)} found (page {page_num} done in {page_fetch_time + convert_time:.1f}s)",
+                            pages=page_num, items=len(pull_requests)
+                        )
 
                     except Exception as e:
                         # No more pages
@@ -885,6 +891,7 @@ class GitHubClient:
             console.print(f"[yellow]Warning: Could not fetch PR #{pr_number}: {e}[/yellow]")
             return None
 
+    @timed('github.fetch_releases')
     def fetch_releases(self, repo_full_name: str, repo_id: int) -> List[Release]:
         """Fetch releases from GitHub with parallel processing."""
         from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -902,18 +909,7 @@ class GitHubClient:
             # Process releases in parallel
             def process_release(gh_release):
                 try:
-                    return Release(
-                        repo_id=repo_id,
-                        version=gh_release.tag_name.lstrip('v'),
-                        tag_name=gh_release.tag_name,
-                        name=gh_release.title,
-                        body=gh_release.body,
-                        created_at=gh_release.created_at,
-                        published_at=gh_release.published_at,
-                        is_draft=gh_release.draft,
-                        is_prerelease=gh_release.prerelease,
-                        url=gh_release.html_url
-                    )
+                    return release_from_payload(self._raw_data(gh_release), repo_id)
                 except Exception as e:
                     console.print(f"[yellow]Warning: Error processing release: {e}[/yellow]")
                     return None
@@ -934,6 +930,7 @@ class GitHubClient:
             console.print(f"[yellow]Warning: Could not fetch releases: {e}[/yellow]")
             return []
 
+    @timed('github.get_release_by_tag')
     def get_release_by_tag(
         self,
         repo_full_name: str,
@@ -978,6 +975,7 @@ class GitHubClient:
             # Repository not found or other error
             return None
 
+    @timed('github.update_release')
     def update_release(
         self,
         repo_full_name: str,
@@ -1074,6 +1072,7 @@ class GitHubClient:
             console.print(f"[red]Error updating release: {e}[/red]")
             return None
 
+    @timed('github.create_release')
     def create_release(
         self,
         repo_full_name: str,
@@ -1108,6 +1107,7 @@ class GitHubClient:
             console.print(f"[red]Error creating release: {e}[/red]")
             return None
 
+    @timed('github.create_issue')
     def create_issue(
         self,
         repo_full_name: str,
@@ -1185,6 +1185,7 @@ class GitHubClient:
             console.print(f"[yellow]Warning: Error fetching milestones: {e}[/yellow]")
             return None
 
+    @timed('github.create_pr_for_release_notes')
     def create_pr_for_release_notes(
         self,
         repo_full_name: str,
@@ -1199,6 +1200,11 @@ class GitHubClient:
         """
         Create a PR with release notes.
 
+        All changed files land in a single commit built with the Git Data API
+        (one tree, one commit, one ref update), so the number of API calls
+        does not grow with the number of files. Unchanged files are detected
+        by comparing local blob SHAs with the branch's tree.
+
         Args:
             repo_full_name: Full repository name (owner/repo)
             pr_title: Title for the pull request
@@ -1212,69 +1218,57 @@ class GitHubClient:
         Returns:
             URL of the created PR or None if failed
         """
+        from github import InputGitTreeElement
+
         try:
             repo = self.gh.get_repo(repo_full_name)
 
-            # Get base branch reference
-            base_ref = repo.get_git_ref(f"heads/{target_branch}")
-            base_sha = base_ref.object.sha
-
-            # Create new branch
+            # Build on the release branch if it exists, else on the target branch
             try:
-                repo.create_git_ref(f"refs/heads/{branch_name}", base_sha)
-            except GithubException:
-                # Branch might already exist
-                pass
-
-            # Track if any changes were made
-            changes_made = False
-
-            # Helper to update/create a file
-            def update_file(path: str, file_content: str) -> bool:
-                commit_msg = f"Update {path}"
-                try:
-                    file_contents = repo.get_contents(path, ref=branch_name)
-                    
-                    # Check if content is identical
-                    try:
-                        existing_content = file_contents.decoded_content.decode('utf-8')
-                        if existing_content == file_content:
-                            console.print(f"[dim]Content unchanged for {path}, skipping commit[/dim]")
-                            return False
-                    except Exception:
-                        # If comparison fails, proceed with update
-                        pass
-
-                    # Update existing file
-                    repo.update_file(
-                        path,
-                        commit_msg,
-                        file_content,
-                        file_contents.sha,
-                        branch=branch_name
-                    )
-                    return True
-                except GithubException:
-                    # Create new file
-                    repo.create_file(
-                        path,
-                        commit_msg,
-                        file_content,
-                        branch=branch_name
+                branch_ref = repo.get_git_ref(f"heads/{branch_name}")
+            except GithubException as e:
+                if e.status != 404:
+                    raise
+                branch_ref = None
+            head_ref = branch_ref or repo.get_git_ref(f"heads/{target_branch}")
+            parent = repo.get_git_commit(head_ref.object.sha)
+            base_tree = repo.get_git_tree(parent.tree.sha, recursive=True)
+
+            # Compare local blob SHAs with the tree instead of downloading files
+            existing = {
+                element.path: element for element in base_tree.tree if element.type == 'blob'
+            }
+            files = {file_path: content, **(additional_files or {})}
+            changes = []
+            paths = []
+            for path, file_content in files.items():
+                element = existing.get(path)
+                if element is not None and element.sha == git_blob_sha(file_content):
+                    console.print(f"[dim]Content unchanged for {path}, skipping commit[/dim]")
+                    continue
+                mode = element.mode if element is not None else '100644'
+                changes.append(InputGitTreeElement(path, mode, 'blob', content=file_content))
+                paths.append(path)
+
+            head_sha = parent.sha
+            if changes:
+                # One tree and one commit for the whole change set
+                tree = repo.create_git_tree(changes, base_tree)
+                if tree.sha == base_tree.sha:
+                    # Paths missing from a truncated tree listing held the same content
+                    changes = []
+                else:
+                    message = f"Update {paths[0]}" if len(paths) == 1 else (
+                        f"Update {len(paths)} files\n\n" + "\n".join(f"- {path}" for path in paths)
                     )
-                    return True
+                    head_sha = repo.create_git_commit(message, tree, [parent]).sha
 
-            # Update main release notes file
-            if update_file(file_path, content):
-                changes_made = True
+            if branch_ref is None:
+                repo.create_git_ref(f"refs/heads/{branch_name}", head_sha)
+            elif head_sha != parent.sha:
+                branch_ref.edit(head_sha)
 
-            # Update additional files if any
-            if additional_files:
-                for path, file_content in additional_files.items():
-                    if update_file(path, file_content):
-                        changes_made = True
-            
-            if not changes_made:
+            if not changes:
                 console.print("[yellow]No changes detected in release notes (diff is empty). Skipping commit/push.[/yellow]")
 
             # Create PR with custom title and body
@@ -1328,6 +1322,21 @@ class GitHubClient:
             console.print(f"[yellow]Warning: Could not fetch authenticated user: {e}[/yellow]")
             return None
 
+    def get_rate_limit_budget(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the REST API requests left in the current rate limit window.
+
+        Returns:
+            Tuple of (remaining requests, reset time as a Unix timestamp), or
+            None if unknown (e.g. rate limiting disabled on GitHub Enterprise)
+        """
+        try:
+            remaining, _ = self.gh.rate_limiting
+            return remaining, self.gh.rate_limiting_resettime
+        except GithubException:
+            return None
+
+    @timed('github.assign_issue_to_project')
     def assign_issue_to_project(
         self,
         issue_url: str,
@@ -1417,7 +1426,7 @@ class GitHubClient:
                 "Content-Type": "application/json"
             }
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": query, "variables": {"owner": owner, "repo": repo, "number": int(number)}},
                 headers=headers
             )
@@ -1466,7 +1475,7 @@ class GitHubClient:
                 "Content-Type": "application/json"
             }
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": query, "variables": {"org": org_name}},
                 headers=headers
             )
@@ -1521,7 +1530,7 @@ class GitHubClient:
                 "Content-Type": "application/json"
             }
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": mutation, "variables": {"projectId": project_node_id, "contentId": issue_node_id}},
                 headers=headers
             )
@@ -1576,7 +1585,7 @@ class GitHubClient:
                 "Content-Type": "application/json"
             }
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": mutation, "variables": {
                     "projectId": project_node_id,
                     "itemId": item_id,
@@ -1761,7 +1770,7 @@ class GitHubClient:
                 console.print(f"[dim]Setting field '{field_name}' ({field_id}) to {value_arg}[/dim]")
             
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": mutation, "variables": {
                     "projectId": project_node_id,
                     "itemId": item_id,
@@ -1839,7 +1848,7 @@ class GitHubClient:
                 console.print(f"[dim]Fetching project fields...[/dim]")
             
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": query, "variables": {"projectId": project_node_id}},
                 headers=headers
             )
@@ -1905,7 +1914,7 @@ class GitHubClient:
                 console.print(f"[dim]Variables: projectId={project_node_id}[/dim]")
             
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": query, "variables": {"projectId": project_node_id}},
                 headers=headers
             )
@@ -2049,7 +2058,7 @@ class GitHubClient:
                 "Content-Type": "application/json"
             }
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": query, "variables": {"owner": owner, "repo": repo, "number": int(issue_number)}},
                 headers=headers
             )
@@ -2094,7 +2103,7 @@ class GitHubClient:
             """
 
             response = requests.post(
-                "https://api.github.com/graphql",
+                self.config.github.graphql_url,
                 json={"query": mutation, "variables": {"issueId": issue_id, "issueTypeId": type_id}},
                 headers=headers
             )
@@ -2112,6 +2121,7 @@ class GitHubClient:
             console.print(f"[yellow]Warning: Error setting issue type: {e}[/yellow]")
             return False
 
+    @timed('github.merge_pull_request')
     def merge_pull_request(
         self,
         repo_full_name: str,
@@ -2204,6 +2214,7 @@ class GitHubClient:
             console.print(f"[red]Error merging PR #{pr_number}{user_info}: {e}[/red]")
             return False
 
+    @timed('github.close_issue')
     def close_issue(
         self,
         repo_full_name: str,
@@ -2276,6 +2287,7 @@ class GitHubClient:
             console.print(f"[red]Error adding comment to issue #{issue_number}{user_info}: {e}[/red]")
             return False
 
+    @timed('github.close_pull_request')
     def close_pull_request(
         self,
         repo_full_name: str,
@@ -2319,6 +2331,7 @@ class GitHubClient:
             console.print(f"[red]Error closing PR #{pr_number}{user_info}: {e}[/red]")
             return False
 
+    @timed('github.delete_branch')
     def delete_branch(
         self,
         repo_full_name: str,
@@ -2357,6 +2370,7 @@ class GitHubClient:
             console.print(f"[red]Error deleting branch '{branch_name}'{user_info}: {e}[/red]")
             return False
 
+    @timed('github.delete_tag')
     def delete_tag(
         self,
         repo_full_name: str,
@@ -2419,6 +2433,7 @@ class GitHubClient:
             console.print(f"[red]Error deleting tag '{tag_name}'{user_info}: {e}[/red]")
             return False
 
+    @timed('github.delete_release')
     def delete_release(
         self,
         repo_full_name: str,
@@ -2456,6 +2471,7 @@ class GitHubClient:
             console.print(f"[red]Error deleting release '{tag_name}'{user_info}: {e}[/red]")
             return False
 
+    @timed('github.find_prs_referencing_issue')
     def find_prs_referencing_issue(
         self,
         repo_full_name: str,
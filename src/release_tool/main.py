@@ -4,27 +4,78 @@
 
 """Main CLI for the release tool."""
 
+import os
 import sys
 import logging
-from typing import Optional
+import importlib
+from typing import Dict, List, Optional, Tuple
 import click
 from rich.console import Console
 
-from .config import load_config
-from .commands.pull import pull
-from .commands.generate import generate
-from .commands.push import push
-from .commands.merge import merge
-from .commands.cancel import cancel
-from .commands.list_releases import list_releases
-from .commands.init_config import init_config
-from .commands.update_config import update_config
-from .commands.issues import issues
-
 console = Console()
 
+# Subcommands: name -> (module, attribute, short help).
+# Modules are imported only when their command is invoked, so each process
+# only pays for the dependencies (PyGithub, GitPython, ...) it actually uses.
+# Short help is listed here so `release-tool -h` imports no command at all.
+LAZY_COMMANDS: Dict[str, Tuple[str, str, str]] = {
+    'pull': ('release_tool.commands.pull', 'pull', 'Pull repository data to local database.'),
+    'generate': ('release_tool.commands.generate', 'generate', 'Generate release notes for a version.'),
+    'push': ('release_tool.commands.push', 'push', 'Push a release to GitHub.'),
+    'merge': ('release_tool.commands.merge', 'merge', 'Merge the release PR, publish the release and close its issue.'),
+    'cancel': ('release_tool.commands.cancel', 'cancel', 'Cancel a release by deleting all associated resources.'),
+    'ingest-event': ('release_tool.commands.ingest_event', 'ingest_event', 'Ingest GitHub event payloads into the local database (no API calls).'),
+    'list-releases': ('release_tool.commands.list_releases', 'list_releases', 'List releases in the database.'),
+    'init-config': ('release_tool.commands.init_config', 'init_config', 'Create an example configuration file.'),
+    'update-config': ('release_tool.commands.update_config', 'update_config', 'Update configuration file to the latest version.'),
+    'issues': ('release_tool.commands.issues', 'issues', 'Query issues from local database (offline).'),
+    'db': ('release_tool.commands.db', 'db', 'Maintain the local release-tool database.'),
+    'status': ('release_tool.commands.status', 'status', 'Report sync freshness, API budget, database size and cache statistics.'),
+    'serve': ('release_tool.commands.serve', 'serve', 'Run a daemon that serves CLI requests with warm state.'),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str, str]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
 
-@click.group(context_settings={'help_option_names': ['-h', '--help']})
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        module_name, attr, _ = self.lazy_commands[cmd_name]
+        command = getattr(importlib.import_module(module_name), attr)
+        # Cache on the group so later lookups skip the import machinery
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands using the registered short help, without importing them."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(formatter.width)))
+            else:
+                rows.append((name, self.lazy_commands[name][2]))
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands=LAZY_COMMANDS,
+    context_settings={'help_option_names': ['-h', '--help']}
+)
 @click.option(
     '--config',
     '-c',
@@ -46,32 +97,83 @@ console = Console()
     is_flag=True,
     help='Show detailed debug output'
 )
+@click.option(
+    '--output-mode',
+    type=click.Choice(['auto', 'human', 'machine']),
+    default='auto',
+    envvar='RELEASE_TOOL_OUTPUT_MODE',
+    help='Progress and debug output: rich spinners (human) or rate-limited JSON lines on '
+         'stderr (machine). auto (default) uses machine when stdout is not a terminal'
+)
+@click.option(
+    '--profile',
+    'profile_path',
+    type=click.Path(dir_okay=False),
+    help='Write a Chrome trace of this run to PATH and print a timing summary'
+)
+@click.option(
+    '--profile-pstats',
+    type=click.Path(dir_okay=False),
+    help='Also run under cProfile and dump its statistics (.pstats) to PATH'
+)
 @click.pass_context
-def cli(ctx, config: Optional[str], auto: bool, assume_yes: bool, debug: bool):
+def cli(ctx, config: Optional[str], auto: bool, assume_yes: bool, debug: bool, output_mode: str,
+        profile_path: Optional[str], profile_pstats: Optional[str]):
     """Release tool for managing semantic versioned releases."""
     ctx.ensure_object(dict)
     ctx.obj['auto'] = auto
     ctx.obj['assume_yes'] = assume_yes
     ctx.obj['debug'] = debug
+    from . import output
+    previous_mode = output.set_machine_mode(output.resolve_mode(output_mode))
+    ctx.call_on_close(lambda: output.set_machine_mode(previous_mode))
+    if profile_path or profile_pstats:
+        _start_profiling(ctx, profile_path, profile_pstats)
+    from . import metrics
+    recorded = ctx.invoked_subcommand in metrics.RECORDED_COMMANDS
+    if recorded:
+        metrics.begin_run(ctx.invoked_subcommand)
     # Don't load config for init-config and update-config commands
     if ctx.invoked_subcommand not in ['init-config', 'update-config']:
+        from .config import load_config
         try:
             ctx.obj['config'] = load_config(config, auto_upgrade=auto)
         except FileNotFoundError as e:
             console.print(f"[red]Error: {e}[/red]")
             sys.exit(1)
+        if recorded:
+            # Store the API usage and cache statistics of the run for `status`
+            db_path = ctx.obj['config'].database.path
+            ctx.call_on_close(lambda: metrics.finish_run(db_path))
 
 
-# Register commands
-cli.add_command(pull)
-cli.add_command(generate)
-cli.add_command(push)
-cli.add_command(merge)
-cli.add_command(cancel)
-cli.add_command(list_releases)
-cli.add_command(init_config)
-cli.add_command(update_config)
-cli.add_command(issues)
+def _start_profiling(ctx: click.Context, trace_path: Optional[str], pstats_path: Optional[str]) -> None:
+    """Profile the rest of this invocation; results are written when the context closes."""
+    from . import profiling
+
+    profiler = profiling.start()
+    cprofile = None
+    if pstats_path:
+        import cProfile
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+
+    def finish() -> None:
+        if cprofile is not None:
+            cprofile.disable()
+            cprofile.dump_stats(pstats_path)
+        profiling.stop()
+        report = Console(stderr=True)
+        profiler.print_summary(report)
+        if trace_path:
+            profiler.write_trace(trace_path, sys.argv[1:])
+            report.print(f"[green]✓ Trace written to {trace_path}[/green]")
+        if pstats_path:
+            report.print(f"[green]✓ cProfile statistics written to {pstats_path}[/green]")
+
+    # Close callbacks run last-in first-out: the root span ends before finish()
+    ctx.call_on_close(finish)
+    ctx.with_resource(profiling.span('release-tool', command=ctx.invoked_subcommand))
 
 
 def main():
@@ -90,6 +192,21 @@ def main():
         logger = logging.getLogger(logger_name)
         logger.addFilter(SupressUserEndpoint403Filter())
 
+    # Thin client mode: forward supported commands to a running daemon
+    # (environment variable name: daemon.SOCKET_ENV)
+    socket_path = os.environ.get('RELEASE_TOOL_DAEMON_SOCKET')
+    if socket_path:
+        from .daemon import DAEMON_COMMANDS, forward, subcommand_of
+        if subcommand_of(sys.argv[1:]) in DAEMON_COMMANDS:
+            # The daemon's streams are not terminals: pass on the client's mode
+            # (an explicit --output-mode later in argv still wins)
+            from .output import resolve_mode
+            mode = resolve_mode(os.environ.get('RELEASE_TOOL_OUTPUT_MODE', 'auto'))
+            argv = ['--output-mode', 'machine' if mode else 'human'] + sys.argv[1:]
+            exit_code = forward(argv, socket_path)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
     cli(obj={})
 
 
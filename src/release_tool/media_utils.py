@@ -4,33 +4,374 @@
 
 """Media download and processing utilities for release notes."""
 
+import os
 import re
+import json
+import time
+import shutil
 import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Iterable, List, Set, TYPE_CHECKING
 from urllib.parse import urlparse
 import requests
 from rich.console import Console
+from .profiling import cache as record_cache
 from .template_utils import render_template, TemplateError
 
+if TYPE_CHECKING:
+    from .config import Config
+
 console = Console()
 
+DEFAULT_MEDIA_CACHE_DIR = ".release_tool_cache/media"
+
+# Mode of files created with open() (mkstemp creates them 0600). Read once:
+# os.umask can only be read by setting it, which races with other threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+ASSET_FILE_MODE = 0o666 & ~_UMASK
+
+# Markdown images: ![alt](url)
+MARKDOWN_MEDIA_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+# HTML images: <img ... src="url" ... />
+HTML_IMG_SRC_PATTERN = re.compile(r'<img\s+[^>]*?src="([^"]+)"[^>]*?/>')
+
+
+def find_media_urls(text: str, include_html: bool = False) -> List[str]:
+    """
+    Find remote media URLs referenced in a Markdown text.
+
+    Args:
+        text: Markdown text (may contain HTML img tags)
+        include_html: Also return the src of HTML img tags
+
+    Returns:
+        List of http(s) URLs in order of appearance
+    """
+    if not text:
+        return []
+    urls = [m.group(2) for m in MARKDOWN_MEDIA_PATTERN.finditer(text)]
+    if include_html:
+        urls.extend(m.group(1) for m in HTML_IMG_SRC_PATTERN.finditer(text))
+    return [url for url in urls if url.startswith(('http://', 'https://'))]
+
+
+class MediaStore:
+    """
+    Persistent, content-addressed cache of downloaded media.
+
+    Blobs are stored once per content hash under ``blobs/<sha[:2]>/<sha>``,
+    so the same image referenced by several versions (or under several URLs)
+    is kept only once. ``manifest.json`` maps each URL to its blob hash and
+    the validators (ETag/Last-Modified) used for conditional requests, so
+    later runs revalidate cached media instead of downloading it again.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(
+        self,
+        root: str = DEFAULT_MEDIA_CACHE_DIR,
+        max_workers: int = 8,
+        max_file_bytes: Optional[int] = None,
+        max_total_bytes: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        request_timeout: float = 30
+    ):
+        """
+        Initialize the media store.
+
+        Args:
+            root: Cache directory
+            max_workers: Concurrent downloads
+            max_file_bytes: Skip media larger than this (None = unlimited)
+            max_total_bytes: Total bytes downloaded per store (None = unlimited)
+            time_budget: Seconds allowed per fetch batch (None = unlimited)
+            request_timeout: Timeout for each HTTP request in seconds
+        """
+        self.root = Path(root)
+        self.max_workers = max(1, max_workers)
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.time_budget = time_budget
+        self.request_timeout = request_timeout
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, object]] = self._load_manifest()
+        self._validated: Set[str] = set()  # URLs checked during this run
+        self._failed: Set[str] = set()
+        self._dirty = False
+        self.bytes_downloaded = 0
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'deduplicated': 0, 'skipped': 0, 'failed': 0}
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / self.MANIFEST_NAME
+
+    def _load_manifest(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('urls', {})
+        except (OSError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Write the manifest if it changed (atomically)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps({'version': 1, 'urls': self._entries}, indent=1, sort_keys=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix='.manifest-')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_name, self.manifest_path)
+            self._dirty = False
+
+    def blob_path(self, sha256: str) -> Path:
+        """Get the path of a blob by content hash."""
+        return self.root / "blobs" / sha256[:2] / sha256
+
+    def get(self, url: str) -> Optional[Path]:
+        """
+        Get the cached blob for a URL without any network access.
+
+        Returns:
+            Path to the blob, or None if the URL is not cached
+        """
+        entry = self._entries.get(url)
+        if not entry:
+            return None
+        blob = self.blob_path(str(entry['sha256']))
+        return blob if blob.exists() else None
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, Optional[Path]]:
+        """
+        Make sure the given URLs are cached, downloading them concurrently.
+
+        URLs already cached are revalidated with conditional requests
+        (If-None-Match / If-Modified-Since) once per run. When the time or
+        size budget is exhausted, remaining URLs fall back to any cached copy.
+
+        Args:
+            urls: Media URLs
+
+        Returns:
+            Mapping of URL to blob path (None if unavailable)
+        """
+        pending = list(dict.fromkeys(
+            url for url in urls if url not in self._validated and url not in self._failed
+        ))
+        if pending:
+            deadline = time.monotonic() + self.time_budget if self.time_budget else None
+            if len(pending) == 1 or self.max_workers == 1:
+                for url in pending:
+                    self._fetch(url, deadline)
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                    list(executor.map(lambda u: self._fetch(u, deadline), pending))
+            self.save()
+
+        return {url: self.get(url) for url in urls}
+
+    def _fetch(self, url: str, deadline: Optional[float]) -> None:
+        """Download or revalidate a single URL into the store."""
+        entry = self._entries.get(url)
+        cached = self.get(url)
+
+        if deadline is not None and time.monotonic() >= deadline:
+            self._skip(url, cached, "time budget exhausted")
+            return
+        with self._lock:
+            over_budget = (
+                self.max_total_bytes is not None and self.bytes_downloaded >= self.max_total_bytes
+            )
+        if over_budget:
+            self._skip(url, cached, "download size budget exhausted")
+            return
+
+        headers = {}
+        if entry and cached:
+            if entry.get('etag'):
+                headers['If-None-Match'] = str(entry['etag'])
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = str(entry['last_modified'])
+
+        timeout = self.request_timeout
+        if deadline is not None:
+            timeout = max(1.0, min(timeout, deadline - time.monotonic()))
+
+        try:
+            response = requests.get(url, timeout=timeout, stream=True, headers=headers)
+            if response.status_code == 304 and cached:
+                with self._lock:
+                    self._validated.add(url)
+                    self.stats['not_modified'] += 1
+                record_cache('media', hits=1)
+                return
+            response.raise_for_status()
+
+            length = response.headers.get('Content-Length')
+            if self.max_file_bytes is not None and length and int(length) > self.max_file_bytes:
+                raise ValueError(f"{int(length)} bytes exceeds the per-file limit")
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            console.print(f"[blue]Downloading media: {url}[/blue]")
+            digest = hashlib.sha256()
+            size = 0
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix='.download-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        size += len(chunk)
+                        if self.max_file_bytes is not None and size > self.max_file_bytes:
+                            raise ValueError("download exceeds the per-file limit")
+                        digest.update(chunk)
+                        f.write(chunk)
+
+                sha256 = digest.hexdigest()
+                blob = self.blob_path(sha256)
+                deduplicated = blob.exists()
+                if deduplicated:
+                    os.unlink(tmp_name)
+                else:
+                    blob.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(tmp_name, blob)
+            except BaseException:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+
+            with self._lock:
+                self._entries[url] = {
+                    'sha256': sha256,
+                    'size': size,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'content_type': response.headers.get('Content-Type'),
+                    'fetched_at': datetime.now().isoformat(timespec='seconds'),
+                }
+                self._validated.add(url)
+                self._dirty = True
+                self.bytes_downloaded += size
+                self.stats['downloaded'] += 1
+                if deduplicated:
+                    self.stats['deduplicated'] += 1
+            record_cache('media', misses=1)
+
+        except Exception as e:
+            if cached:
+                # Keep serving the cached copy when revalidation fails
+                with self._lock:
+                    self._validated.add(url)
+                return
+            console.print(f"[yellow]Warning: Failed to download {url}: {e}[/yellow]")
+            with self._lock:
+                self._failed.add(url)
+                self.stats['failed'] += 1
+
+    def _skip(self, url: str, cached: Optional[Path], reason: str) -> None:
+        """Skip fetching a URL because a budget is exhausted."""
+        with self._lock:
+            self.stats['skipped'] += 1
+            if cached:
+                self._validated.add(url)
+            else:
+                self._failed.add(url)
+        if not cached:
+            console.print(f"[yellow]Warning: Skipped {url} ({reason})[/yellow]")
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of a file's content (the name of its blob in a MediaStore)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+_stores: Dict[str, MediaStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_media_store(config: "Config") -> MediaStore:
+    """
+    Get the shared media store for a config.
+
+    One store is kept per cache directory, so every MediaDownloader in a run
+    shares the same manifest and per-run revalidation state.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        MediaStore for config.output.media_cache_dir
+    """
+    output = config.output
+    root = str(Path(output.media_cache_dir).resolve())
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            mb = 1024 * 1024
+            store = MediaStore(
+                output.media_cache_dir,
+                max_workers=output.media_download_workers,
+                max_file_bytes=int(output.media_max_file_size_mb * mb) if output.media_max_file_size_mb else None,
+                max_total_bytes=int(output.media_download_budget_mb * mb) if output.media_download_budget_mb else None,
+                time_budget=output.media_download_time_budget,
+            )
+            _stores[root] = store
+        return store
+
 
 class MediaDownloader:
     """Download and manage media assets for release notes."""
 
-    def __init__(self, assets_path: str, download_enabled: bool = True):
+    def __init__(
+        self,
+        assets_path: str,
+        download_enabled: bool = True,
+        store: Optional[MediaStore] = None
+    ):
         """
         Initialize media downloader.
 
         Args:
             assets_path: Path template for downloaded assets
             download_enabled: Whether to download media or keep URLs
+            store: Media cache to download through (see get_media_store);
+                required when download_enabled
+
+        Raises:
+            ValueError: If downloads are enabled without a store
         """
+        if download_enabled and store is None:
+            raise ValueError("MediaDownloader needs a media store to download media (see get_media_store)")
         self.assets_path = assets_path
         self.download_enabled = download_enabled
+        self.store = store
         self.downloaded_files: Dict[str, str] = {}  # URL -> local path mapping
 
+    def prefetch(self, texts: Iterable[Optional[str]], include_html: bool = False) -> None:
+        """
+        Download all media referenced in the given texts concurrently.
+
+        Args:
+            texts: Markdown texts (descriptions, migration notes)
+            include_html: Also fetch media referenced by HTML img tags
+        """
+        if not self.download_enabled:
+            return
+        urls = [url for text in texts if text for url in find_media_urls(text, include_html)]
+        if urls:
+            self.store.fetch_many(urls)
+
     def process_description(
         self,
         description: str,
@@ -88,7 +429,6 @@ class MediaDownloader:
 
         # Find all image and video references in markdown
         # Matches: ![alt](url) and videos with .mp4, .webm, etc.
-        media_pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
 
         def replace_media(match):
             alt_text = match.group(1)
@@ -106,7 +446,7 @@ class MediaDownloader:
             # If download fails, keep original
             return match.group(0)
 
-        return re.sub(media_pattern, replace_media, description)
+        return MARKDOWN_MEDIA_PATTERN.sub(replace_media, description)
 
     def _download_media(
         self,
@@ -141,8 +481,6 @@ class MediaDownloader:
                 console.print(f"[red]Error rendering assets_path template: {e}[/red]")
                 return None
 
-            assets_dir.mkdir(parents=True, exist_ok=True)
-
             # Generate filename from URL
             parsed_url = urlparse(url)
             original_filename = Path(parsed_url.path).name
@@ -153,14 +491,13 @@ class MediaDownloader:
 
             local_file = assets_dir / filename
 
-            # Download file
-            console.print(f"[blue]Downloading media: {url}[/blue]")
-            response = requests.get(url, timeout=30, stream=True)
-            response.raise_for_status()
+            # Fetch through the persistent store (no-op if prefetched this run)
+            blob = self.store.fetch_many([url]).get(url)
+            if blob is None:
+                return None
 
-            with open(local_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            assets_dir.mkdir(parents=True, exist_ok=True)
+            self._materialize(blob, local_file)
 
             # Calculate relative path from output_path to media file
             output_dir = Path(output_path).parent
@@ -172,14 +509,31 @@ class MediaDownloader:
 
             relative_path_str = str(relative_path).replace('\\', '/')
             self.downloaded_files[url] = relative_path_str
-
-            console.print(f"[green]Downloaded: {relative_path_str}[/green]")
             return relative_path_str
 
         except Exception as e:
             console.print(f"[yellow]Warning: Failed to download {url}: {e}[/yellow]")
             return None
 
+    @staticmethod
+    def _materialize(blob: Path, local_file: Path) -> None:
+        """Copy a cached blob to local_file unless an identical copy exists."""
+        # Assets are copied rather than linked: they usually end up committed
+        # to a docs repo and must not alias the cache. Blobs are named by
+        # their SHA-256, so a changed image of the same size is still copied.
+        if local_file.exists() and _file_sha256(local_file) == blob.name:
+            return
+        # Copy then rename, so concurrent renders never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=local_file.parent, prefix='.media-')
+        os.close(fd)
+        try:
+            shutil.copyfile(blob, tmp_name)
+            os.chmod(tmp_name, ASSET_FILE_MODE)
+            os.replace(tmp_name, local_file)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
     def _parse_version(self, version: str) -> Dict[str, str]:
         """
         Parse version string into components for path substitution.
@@ -0,0 +1,323 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Run metrics and the operational status report.
+
+Commands in RECORDED_COMMANDS store one row in the run_metrics table when
+they finish: GitHub API calls, conditional requests answered with 304, the
+last X-RateLimit-* headers seen per resource, and the hits and misses of
+each cache during the run. `release-tool status` combines them with sync
+freshness and database size (see `collect_status()`), and can export the
+report as an OpenMetrics textfile (see `format_openmetrics()`).
+
+Only the standard library is imported at module level.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from . import profiling
+
+if TYPE_CHECKING:
+    from .config import Config
+
+# Subcommands whose runs are recorded
+RECORDED_COMMANDS = frozenset({'pull', 'generate', 'push', 'merge', 'cancel'})
+
+
+class ApiUsage:
+    """HTTP observer counting the GitHub API requests of a run."""
+
+    def __init__(self, api_url: str, graphql_url: str):
+        self.api_prefix = api_url.rstrip('/') + '/'
+        self.graphql_url = graphql_url
+        self.calls = 0
+        self.not_modified = 0
+        # resource ('core', 'graphql', 'search', ...) -> {'limit', 'remaining', 'reset'}
+        self.rate_limits: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, request, response, start: float, duration: float) -> None:
+        url = request.url
+        graphql = url.startswith(self.graphql_url)
+        if not graphql and not url.startswith(self.api_prefix):
+            # Media downloads and other hosts do not use the API budget
+            return
+        not_modified = response.status_code == 304
+        if 'If-None-Match' in request.headers or 'If-Modified-Since' in request.headers:
+            profiling.cache('github.conditional', hits=int(not_modified), misses=int(not not_modified))
+
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining')
+        with self._lock:
+            self.calls += 1
+            self.not_modified += int(not_modified)
+            if remaining is not None:
+                resource = headers.get('X-RateLimit-Resource') or ('graphql' if graphql else 'core')
+                self.rate_limits[resource] = {
+                    'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                    'remaining': int(remaining),
+                    'reset': int(headers.get('X-RateLimit-Reset', 0)),
+                }
+
+
+class _Run:
+    """State of the run being recorded."""
+
+    def __init__(self, command: str):
+        self.command = command
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+        self.caches = profiling.cache_totals()
+        self.usage: Optional[ApiUsage] = None
+
+
+_run: Optional[_Run] = None
+
+
+def begin_run(command: str) -> None:
+    """Start recording a run of a subcommand."""
+    global _run
+    _run = _Run(command)
+
+
+def track_api_usage(config: "Config") -> None:
+    """Count the GitHub API requests of the current run (called by GitHubClient)."""
+    run = _run
+    if run is None or run.usage is not None:
+        return
+    run.usage = ApiUsage(config.github.api_url, config.github.graphql_url)
+    profiling.add_http_observer(run.usage.observe)
+
+
+def finish_run(db_path: str) -> None:
+    """
+    Store the current run in the database at db_path.
+
+    Nothing is stored if the database does not exist (the command failed
+    before using it); a locked or unwritable database only loses the row.
+    """
+    import sqlite3
+    from .db import Database
+
+    global _run
+    run, _run = _run, None
+    if run is None:
+        return
+    usage = run.usage
+    if usage is not None:
+        profiling.remove_http_observer(usage.observe)
+    if not Path(db_path).exists():
+        return
+
+    caches = {}
+    for name, (hits, misses) in profiling.cache_totals().items():
+        before_hits, before_misses = run.caches.get(name, (0, 0))
+        if hits - before_hits or misses - before_misses:
+            caches[name] = [hits - before_hits, misses - before_misses]
+
+    db = Database(db_path)
+    try:
+        db.connect()
+        db.record_run(
+            run.command,
+            run.started_at,
+            time.perf_counter() - run.start,
+            api_calls=usage.calls if usage else 0,
+            api_not_modified=usage.not_modified if usage else 0,
+            rate_limits=usage.rate_limits if usage else None,
+            caches=caches,
+        )
+    except sqlite3.Error:
+        pass
+    finally:
+        db.close()
+
+
+def _directory_size(path: Optional[str]) -> Optional[int]:
+    """Total size in bytes of the files under a directory (None if missing)."""
+    if not path or not Path(path).is_dir():
+        return None
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _age(timestamp: Optional[str], now: datetime) -> Optional[float]:
+    """Seconds elapsed since an ISO timestamp (naive timestamps are local time)."""
+    if not timestamp:
+        return None
+    moment = datetime.fromisoformat(timestamp)
+    if moment.tzinfo is not None:
+        return (now.astimezone() - moment).total_seconds()
+    return (now - moment).total_seconds()
+
+
+def collect_status(config: "Config", now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Collect the operational status of the local database and caches.
+
+    Args:
+        config: Loaded configuration
+        now: Reference time for ages (default: now)
+
+    Returns:
+        Dictionary with:
+        - sync: one entry per repository and entity ('issues', 'pull_requests',
+          'events', 'commits:<ref>') with last_sync_at, age (seconds) and total_fetched
+        - database: path, file_size, page_size, page_count, freelist_count, tables
+        - caches: cache directory -> size in bytes (None if not created)
+        - runs: last run of each command with its API usage and cache statistics
+    """
+    from .config import _config_cache_dir
+    from .db import Database
+
+    now = now or datetime.now()
+    db = Database(config.database.path)
+    db.connect()
+    try:
+        sync = [
+            {
+                'repo': row['repo_full_name'],
+                'entity': row['entity_type'],
+                'last_sync_at': row['last_sync_at'],
+                'age': _age(row['last_sync_at'], now),
+                'total_fetched': row['total_fetched'],
+            }
+            for row in db.get_all_pull_status()
+        ]
+        sync += [
+            {
+                'repo': row['repo_full_name'],
+                'entity': f"commits:{row['ref']}",
+                'last_sync_at': row['indexed_at'],
+                'age': _age(row['indexed_at'], now),
+                'total_fetched': None,
+            }
+            for row in db.get_commit_index_status()
+        ]
+        database = {'path': config.database.path, **db.get_storage_stats()}
+        runs = db.get_last_runs()
+    finally:
+        db.close()
+
+    for run in runs:
+        run['age'] = _age(run['started_at'], now)
+
+    config_cache = _config_cache_dir()
+    return {
+        'sync': sorted(sync, key=lambda entry: (entry['repo'], entry['entity'])),
+        'database': database,
+        'caches': {
+            'media': _directory_size(config.output.media_cache_dir),
+            'templates': _directory_size(config.output.template_cache_dir),
+            'config': _directory_size(str(config_cache) if config_cache else None),
+        },
+        'runs': runs,
+    }
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+        name = f"{name}{{{rendered}}}"
+    return f"{name} {value}"
+
+
+def format_openmetrics(status: Dict[str, Any], now: Optional[datetime] = None) -> str:
+    """
+    Render a status report in the OpenMetrics text format.
+
+    All metrics are gauges prefixed with `release_tool_`, suitable for the
+    node_exporter textfile collector.
+
+    Args:
+        status: Report returned by collect_status()
+        now: Time the report was made (default: now)
+
+    Returns:
+        Exposition text ending with "# EOF"
+    """
+    families: Dict[str, Dict[str, Any]] = {}
+
+    def add(name: str, help_text: str, value: Optional[float], unit: Optional[str] = None, **labels: str) -> None:
+        if value is None:
+            return
+        family = families.setdefault(name, {'help': help_text, 'unit': unit, 'samples': []})
+        family['samples'].append(_sample(f"release_tool_{name}", labels, value))
+
+    now = now or datetime.now()
+    add('status_timestamp_seconds', "Time this report was made", now.timestamp(), 'seconds')
+
+    for entry in status['sync']:
+        labels = {'repo': entry['repo'], 'entity': entry['entity']}
+        if entry['last_sync_at']:
+            add('sync_timestamp_seconds', "Time of the last sync",
+                datetime.fromisoformat(entry['last_sync_at']).timestamp(), 'seconds', **labels)
+        add('sync_age_seconds', "Seconds since the last sync", entry['age'], 'seconds', **labels)
+
+    database = status['database']
+    add('db_size_bytes', "Size of the database file (with its WAL)", database['file_size'], 'bytes')
+    add('db_page_size_bytes', "SQLite page size", database['page_size'], 'bytes')
+    add('db_pages', "SQLite pages in use or free", database['page_count'])
+    add('db_free_pages', "SQLite pages on the freelist", database['freelist_count'])
+    for table, rows in database['tables'].items():
+        add('db_table_rows', "Rows per table", rows, table=table)
+
+    for cache, size in status['caches'].items():
+        add('cache_size_bytes', "Size of a cache directory", size, 'bytes', cache=cache)
+
+    for run in status['runs']:
+        command = run['command']
+        add('last_run_timestamp_seconds', "Start time of the last run",
+            datetime.fromisoformat(run['started_at']).timestamp(), 'seconds', command=command)
+        add('last_run_duration_seconds', "Duration of the last run", float(run['duration']), 'seconds',
+            command=command)
+        add('last_run_api_calls', "GitHub API requests of the last run", run['api_calls'], command=command)
+        add('last_run_api_not_modified', "Conditional API requests answered with 304",
+            run['api_not_modified'], command=command)
+        for resource, limits in sorted(run['rate_limits'].items()):
+            add('rate_limit_remaining', "API requests left in the window (last run)",
+                limits['remaining'], command=command, resource=resource)
+            add('rate_limit_limit', "API requests allowed per window (last run)",
+                limits['limit'], command=command, resource=resource)
+            add('rate_limit_reset_timestamp_seconds', "Time the rate limit window resets (last run)",
+                limits['reset'], 'seconds', command=command, resource=resource)
+        for cache, (hits, misses) in sorted(run['caches'].items()):
+            add('last_run_cache_hits', "Cache hits of the last run", hits, command=command, cache=cache)
+            add('last_run_cache_misses', "Cache misses of the last run", misses, command=command, cache=cache)
+
+    lines: List[str] = []
+    for name, family in families.items():
+        metric = f"release_tool_{name}"
+        lines.append(f"# TYPE {metric} gauge")
+        if family['unit']:
+            lines.append(f"# UNIT {metric} {family['unit']}")
+        lines.append(f"# HELP {metric} {family['help']}")
+        lines.extend(family['samples'])
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_openmetrics(path: str, text: str) -> None:
+    """Write a textfile atomically, so a collector never reads a partial file."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, target)
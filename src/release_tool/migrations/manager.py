@@ -7,10 +7,9 @@
 Handles upgrading config files between versions when format changes.
 """
 
+import importlib
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Callable
-import importlib.util
-from packaging import version
 
 
 class MigrationError(Exception):
@@ -18,6 +17,22 @@ class MigrationError(Exception):
     pass
 
 
+# Static registry of migrations: (from_version, to_version) -> module name.
+# Add an entry here together with each new vX_Y_to_vX_Z.py module.
+MIGRATIONS: Dict[Tuple[str, str], str] = {
+    ("1.0", "1.1"): "v1_0_to_v1_1",
+    ("1.1", "1.2"): "v1_1_to_v1_2",
+    ("1.2", "1.3"): "v1_2_to_v1_3",
+    ("1.3", "1.4"): "v1_3_to_v1_4",
+    ("1.4", "1.5"): "v1_4_to_v1_5",
+    ("1.5", "1.6"): "v1_5_to_v1_6",
+    ("1.6", "1.7"): "v1_6_to_v1_7",
+    ("1.7", "1.8"): "v1_7_to_v1_8",
+    ("1.8", "1.9"): "v1_8_to_v1_9",
+    ("1.9", "1.10"): "v1_9_to_v1_10",
+}
+
+
 class MigrationManager:
     """Manages config file migrations."""
 
@@ -37,6 +52,10 @@ class MigrationManager:
             0 if v1 == v2
             1 if v1 > v2
         """
+        if v1 == v2:
+            return 0
+
+        from packaging import version
         ver1 = version.parse(v1)
         ver2 = version.parse(v2)
 
@@ -89,59 +108,30 @@ class MigrationManager:
         return path
 
     def _discover_migrations(self) -> List[Tuple[str, str]]:
-        """Discover available migration scripts."""
-        migrations = []
-
-        if not self.migrations_dir.exists():
-            return migrations
-
-        for file in self.migrations_dir.glob("v*_to_v*.py"):
-            # Parse filename: v1_0_to_v1_1.py -> ("1.0", "1.1")
-            name = file.stem
-            parts = name.split("_to_")
-            if len(parts) != 2:
-                continue
-
-            from_part = parts[0].replace("v", "").replace("_", ".")
-            to_part = parts[1].replace("v", "").replace("_", ".")
-
-            migrations.append((from_part, to_part))
-
-        return migrations
+        """List available migrations (from the static MIGRATIONS registry)."""
+        return list(MIGRATIONS)
 
     def load_migration(self, from_version: str, to_version: str) -> Callable:
-        """Load a migration function from file."""
+        """Load a migration function from the registry."""
         key = (from_version, to_version)
 
         if key in self._loaded_migrations:
             return self._loaded_migrations[key]
 
-        # Build filename: v1_0_to_v1_1.py
-        from_part = "v" + from_version.replace(".", "_")
-        to_part = "v" + to_version.replace(".", "_")
-        filename = f"{from_part}_to_{to_part}.py"
-
-        migration_file = self.migrations_dir / filename
-
-        if not migration_file.exists():
+        module_name = MIGRATIONS.get(key)
+        if module_name is None:
             raise MigrationError(
-                f"Migration file not found: {migration_file}"
+                f"No migration registered from {from_version} to {to_version}"
             )
 
-        # Dynamically load the migration module
-        spec = importlib.util.spec_from_file_location(
-            f"migration_{from_part}_to_{to_part}",
-            migration_file
-        )
-        if not spec or not spec.loader:
-            raise MigrationError(f"Failed to load migration: {migration_file}")
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        try:
+            module = importlib.import_module(f"{__package__}.{module_name}")
+        except ImportError as e:
+            raise MigrationError(f"Failed to load migration {module_name}: {e}") from e
 
         if not hasattr(module, 'migrate'):
             raise MigrationError(
-                f"Migration {filename} must have a 'migrate' function"
+                f"Migration {module_name}.py must have a 'migrate' function"
             )
 
         self._loaded_migrations[key] = module.migrate
@@ -356,6 +356,8 @@ class Commit(BaseModel):
     date: datetime
     url: Optional[str] = None
     pr_number: Optional[int] = None
+    issue_keys: List[str] = Field(default_factory=list)  # Issue keys extracted when indexed
+    issue_patterns_key: Optional[str] = None  # Commit patterns issue_keys were extracted with (None: not extracted)
 
 
 class Issue(BaseModel):
@@ -373,6 +375,10 @@ class Issue(BaseModel):
     closed_at: Optional[datetime] = None
     category: Optional[str] = None
     tags: Dict[str, str] = Field(default_factory=dict)
+    # Note sections pre-extracted from body at upsert time (see Database.configure_note_sections)
+    description: Optional[str] = None
+    migration_notes: Optional[str] = None
+    sections_extracted: bool = False
 
 
 class Release(BaseModel):
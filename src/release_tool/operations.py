@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Dependency-aware execution of side-effect steps.
+
+An OperationGraph holds named steps and the steps each one requires.
+`run()` starts every step whose requirements have finished on a thread
+pool, so independent steps overlap (in `push`: the GitHub release and the
+pull requests, then the issue assignment and its project fields).
+
+Finished steps can be journaled (see `run()`'s `journal` and `record`
+arguments): a later run skips a journaled step, and reuses its result, as
+long as every step it requires was skipped as well. Steps can only require
+steps added before them, so the graph has no cycles.
+
+Only the standard library is imported at module level.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from . import profiling
+
+# Steps running at once (GitHub asks clients to avoid many concurrent requests)
+MAX_WORKERS = 4
+
+
+class Operation:
+    """
+    A step of an OperationGraph.
+
+    Args:
+        name: Unique step name (also its journal key)
+        func: Called with the results of finished steps (name -> result);
+            runs on a worker thread
+        requires: Names of the steps that must finish first
+        on_done: Called with the result on the thread running the graph,
+            e.g. to write it to the database
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        requires: Iterable[str] = (),
+        on_done: Optional[Callable[[Any], None]] = None
+    ):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.on_done = on_done
+
+
+class OperationGraph:
+    """Steps with dependencies, run concurrently in dependency order."""
+
+    def __init__(self):
+        self._operations: Dict[str, Operation] = {}
+        # Results of the finished and skipped steps of the last run
+        self.results: Dict[str, Any] = {}
+        # Steps of the last run skipped thanks to the journal
+        self.skipped: Set[str] = set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._operations
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    @property
+    def names(self) -> List[str]:
+        """Step names in the order they were added."""
+        return list(self._operations)
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        requires: Iterable[str] = (),
+        on_done: Optional[Callable[[Any], None]] = None
+    ) -> str:
+        """
+        Add a step (see Operation) and return its name.
+
+        Raises:
+            ValueError: If the name is taken or a required step was not added yet
+        """
+        if name in self._operations:
+            raise ValueError(f"Duplicate operation: {name}")
+        operation = Operation(name, func, requires, on_done)
+        unknown = [required for required in operation.requires if required not in self._operations]
+        if unknown:
+            raise ValueError(f"Operation {name} requires unknown operation(s): {', '.join(unknown)}")
+        self._operations[name] = operation
+        return name
+
+    def run(
+        self,
+        journal: Optional[Dict[str, Any]] = None,
+        record: Optional[Callable[[str, Any], None]] = None,
+        max_workers: int = MAX_WORKERS
+    ) -> Dict[str, Any]:
+        """
+        Run every step, starting each one as soon as its requirements finish.
+
+        With max_workers=1 steps run one at a time in the order they were
+        added (a ready step waits for the steps added before it). When a step fails no further steps start; the steps already
+        running finish (and are recorded) before the error is raised.
+
+        Args:
+            journal: Results of steps finished by an earlier run (name -> result)
+            record: Called on this thread with (name, result) for each step
+                that finishes with a result other than None
+            max_workers: Maximum number of steps running at once
+
+        Returns:
+            Results of all steps (name -> result)
+
+        Raises:
+            The first exception raised by a step (or its on_done callback)
+        """
+        journal = journal or {}
+        self.results = {}
+        self.skipped = set()
+        pending = dict(self._operations)
+        running = {}
+        failure: Optional[BaseException] = None
+        sequential = max_workers == 1
+
+        def run_step(operation: Operation) -> Any:
+            with profiling.span(operation.name, 'operation'):
+                return operation.func(self.results)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='operation') as pool:
+            while True:
+                started = True
+                while failure is None and started:
+                    started = False
+                    for name, operation in list(pending.items()):
+                        if sequential and running:
+                            break
+                        if not all(required in self.results for required in operation.requires):
+                            if sequential:
+                                break
+                            continue
+                        del pending[name]
+                        started = True
+                        if name in journal and all(required in self.skipped for required in operation.requires):
+                            self.results[name] = journal[name]
+                            self.skipped.add(name)
+                        else:
+                            running[pool.submit(run_step, operation)] = operation
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    operation = running.pop(future)
+                    try:
+                        result = future.result()
+                        if operation.on_done is not None:
+                            operation.on_done(result)
+                    except BaseException as exc:
+                        failure = failure or exc
+                        continue
+                    self.results[operation.name] = result
+                    if record is not None and result is not None:
+                        record(operation.name, result)
+
+        if failure is not None:
+            raise failure
+        return self.results
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Human (rich) and machine (JSON lines) output modes.
+
+The CLI picks the mode with `--output-mode`; `auto`, the default, uses the
+machine mode when stdout is not a terminal (CI logs, pipes). In machine mode:
+
+- `Progress` writes JSON lines to stderr instead of driving a rich spinner,
+  at most one line every PROGRESS_INTERVAL seconds per task plus a final
+  `progress.done` line. Hot loops call `Progress.due()` before formatting
+  anything, so skipped updates cost one clock read.
+- `--debug` traces of the consolidation phase become one structured line
+  per commit instead of several formatted lines per pattern.
+
+Command results printed with rich are the same in both modes. Library code
+defaults to the human mode. Only the standard library is imported at module
+level.
+"""
+
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Values of --output-mode (environment variable: RELEASE_TOOL_OUTPUT_MODE)
+MODES = ('auto', 'human', 'machine')
+
+# Minimum seconds between two progress lines of a task in machine mode
+PROGRESS_INTERVAL = 5.0
+
+_machine = False
+_write_lock = threading.Lock()
+
+
+def resolve_mode(mode: str, stream=None) -> bool:
+    """
+    Resolve an --output-mode value.
+
+    Args:
+        mode: 'auto', 'human' or 'machine'
+        stream: Stream checked for a terminal in auto mode (default: stdout)
+
+    Returns:
+        True for the machine mode
+    """
+    if mode == 'auto':
+        stream = stream if stream is not None else sys.stdout
+        isatty = getattr(stream, 'isatty', None)
+        return not (isatty is not None and isatty())
+    return mode == 'machine'
+
+
+def machine_mode() -> bool:
+    """Whether output is in machine mode."""
+    return _machine
+
+
+def set_machine_mode(enabled: bool) -> bool:
+    """Switch the machine mode on or off and return the previous setting."""
+    global _machine
+    previous, _machine = _machine, enabled
+    return previous
+
+
+def emit(event: str, level: str = 'info', **fields: Any) -> None:
+    """Write one JSON log line to stderr."""
+    record = {
+        'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+        'level': level,
+        'event': event,
+        **fields,
+    }
+    line = json.dumps(record, default=str)
+    with _write_lock:
+        sys.stderr.write(line + '\n')
+        sys.stderr.flush()
+
+
+class Progress:
+    """
+    Progress of a long-running loop: a rich spinner, or JSON lines.
+
+        with Progress('github.issues', "Fetching issues...", console) as progress:
+            for item in items:
+                ...
+                if progress.due():
+                    progress.update(f"Fetching issues... {count} found", items=count)
+
+    In human mode every update changes the spinner text and `due()` is
+    always true. In machine mode updates are rate limited; the description
+    is ignored and the keyword fields are logged.
+    """
+
+    def __init__(self, task: str, description: str, console, interval: float = PROGRESS_INTERVAL):
+        self.task = task
+        self.description = description
+        self.console = console
+        self.interval = interval
+        self.machine = _machine
+        self._fields: Dict[str, Any] = {}
+        self._next = 0.0
+        self._start = 0.0
+        self._rich = None
+        self._task_id = None
+
+    def __enter__(self) -> "Progress":
+        self._start = time.monotonic()
+        if not self.machine:
+            from rich.progress import Progress as RichProgress, SpinnerColumn, TextColumn
+
+            self._rich = RichProgress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=self.console
+            )
+            self._rich.__enter__()
+            self._task_id = self._rich.add_task(self.description, total=None)
+        return self
+
+    def due(self) -> bool:
+        """Whether an update would be shown now (check before formatting one)."""
+        return not self.machine or time.monotonic() >= self._next
+
+    def update(self, description: Optional[str] = None, **fields: Any) -> None:
+        """
+        Report progress.
+
+        Args:
+            description: Spinner text (human mode)
+            **fields: Values logged in machine mode (also kept for the final line)
+        """
+        if not self.machine:
+            if description is not None:
+                self._rich.update(self._task_id, description=description)
+            return
+        self._fields.update(fields)
+        now = time.monotonic()
+        if now < self._next:
+            return
+        self._next = now + self.interval
+        emit('progress', task=self.task, elapsed=round(now - self._start, 1), **self._fields)
+
+    def __exit__(self, *exc_info) -> None:
+        if not self.machine:
+            self._rich.__exit__(*exc_info)
+            return
+        emit('progress.done', task=self.task, elapsed=round(time.monotonic() - self._start, 1),
+             **self._fields)
@@ -4,18 +4,25 @@
 
 """Policy implementations for issue extraction, consolidation, and release notes."""
 
+import hashlib
 import re
+import threading
+from contextlib import contextmanager
+from functools import partial
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Tuple, Callable, TextIO
 from enum import Enum
+from pathlib import Path
 from rich.console import Console
 
 from .models import (
     Commit, PullRequest, Issue, ReleaseNote, ConsolidatedChange, Label, SemanticVersion
 )
 from .config import (
-    Config, PolicyAction, IssueExtractionStrategy
+    Config, PolicyAction, IssueExtractionStrategy, IssuePattern
 )
+from .output import emit, machine_mode
+from .profiling import timed
 
 console = Console()
 
@@ -62,44 +69,175 @@ class PartialIssueMatch:
     potential_reasons: Set[PartialIssueReason] = field(default_factory=set)  # Set of potential causes
 
 
+
+class CompiledPolicy:
+    """
+    Precompiled issue extraction and categorization rules for a config.
+
+    Built once per distinct policy configuration (see compile_policy) and
+    shared by all extractors and note generators using it:
+    - issue patterns are compiled once and grouped per strategy in priority order
+    - labels map directly to the first matching category index per source
+    - extraction results are memoized per (strategy, text)
+    """
+
+    # Memoized extraction results kept before the cache is reset
+    MAX_MEMO_ENTRIES = 100_000
+
+    def __init__(self, config: Config):
+        self.pattern_configs: List[IssuePattern] = sorted(
+            config.issue_policy.patterns, key=lambda p: p.order
+        )
+        self.compiled_patterns: List[re.Pattern] = [
+            re.compile(p.pattern) for p in self.pattern_configs
+        ]
+        self.patterns_by_strategy: Dict[IssueExtractionStrategy, List[re.Pattern]] = {}
+        # (strategy, position within that strategy) for each pattern in priority order
+        self.pattern_slots: List[Tuple[IssueExtractionStrategy, int]] = []
+        for pattern_config, compiled in zip(self.pattern_configs, self.compiled_patterns):
+            strategy_patterns = self.patterns_by_strategy.setdefault(pattern_config.strategy, [])
+            self.pattern_slots.append((pattern_config.strategy, len(strategy_patterns)))
+            strategy_patterns.append(compiled)
+
+        # Label lookup: first category (in config order) matching each label per source
+        categories = config.release_notes.categories
+        self.category_names: List[str] = [c.name for c in categories]
+        self.label_category: Dict[str, Dict[str, int]] = {'issue': {}, 'pr': {}}
+        for index, category in enumerate(categories):
+            for pattern in category.labels:
+                if pattern.startswith("pr:"):
+                    sources, label = ('pr',), pattern[3:]
+                elif pattern.startswith("issue:"):
+                    sources, label = ('issue',), pattern[6:]
+                else:
+                    sources, label = ('issue', 'pr'), pattern
+                for source in sources:
+                    self.label_category[source].setdefault(label, index)
+
+        self.fallback_category: str = next(
+            (c.name for c in categories if c.alias == "other"), "Other"
+        )
+        self.excluded_labels: frozenset = frozenset(config.release_notes.excluded_labels)
+
+        # Identifies the commit message patterns, so issue keys extracted
+        # when commits were indexed are only reused while they still apply
+        self.commit_patterns_key: str = hashlib.sha1("\0".join(
+            p.pattern for p in self.pattern_configs if p.strategy == IssueExtractionStrategy.COMMIT_MESSAGE
+        ).encode()).hexdigest()
+
+        self._memo: Dict[Tuple[IssueExtractionStrategy, str], Tuple[Tuple[str, ...], ...]] = {}
+
+    @staticmethod
+    def extract_with_pattern(text: str, pattern: re.Pattern) -> List[str]:
+        """Extract issue references from text with a single pattern."""
+        issues = []
+        for match in pattern.finditer(text):
+            # Prefer the 'issue' named group, then the first group, then the whole match
+            try:
+                issues.append(match.group('issue'))
+            except IndexError:
+                issues.append(match.group(1) if match.groups() else match.group(0))
+        return issues
+
+    def matches_for(self, strategy: IssueExtractionStrategy, text: str) -> Tuple[Tuple[str, ...], ...]:
+        """
+        Get the matches of every pattern of a strategy against a text.
+
+        Returns:
+            One tuple of extracted issue keys per pattern, in priority order
+        """
+        key = (strategy, text)
+        result = self._memo.get(key)
+        if result is None:
+            result = tuple(
+                tuple(self.extract_with_pattern(text, pattern))
+                for pattern in self.patterns_by_strategy.get(strategy, [])
+            )
+            if len(self._memo) >= self.MAX_MEMO_ENTRIES:
+                self._memo.clear()
+            self._memo[key] = result
+        return result
+
+    def extract(self, strategy: IssueExtractionStrategy, text: str) -> List[str]:
+        """Extract issue references from text using all patterns of a strategy."""
+        return [issue for matches in self.matches_for(strategy, text) for issue in matches]
+
+    def category_for(self, issue_labels: List[str], pr_labels: List[str]) -> str:
+        """
+        Determine the category for a set of issue and PR labels.
+
+        Categories are checked in config order, so the category with the
+        lowest index matching any label wins.
+        """
+        best: Optional[int] = None
+        for source, labels in (('issue', issue_labels), ('pr', pr_labels)):
+            lookup = self.label_category[source]
+            for label in labels:
+                index = lookup.get(label)
+                if index is not None and (best is None or index < best):
+                    best = index
+        if best is None:
+            return self.fallback_category
+        return self.category_names[best]
+
+
+_compiled_policies: Dict[Tuple, CompiledPolicy] = {}
+
+
+def compile_policy(config: Config) -> CompiledPolicy:
+    """
+    Get the compiled policy for a config.
+
+    Policies are cached by the settings they are built from, so every
+    extractor and note generator created for the same config shares the
+    compiled patterns, lookup tables and extraction memo.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        CompiledPolicy for the config
+    """
+    key = (
+        tuple((p.order, p.strategy, p.pattern) for p in config.issue_policy.patterns),
+        tuple((c.name, c.alias, tuple(c.labels)) for c in config.release_notes.categories),
+        tuple(config.release_notes.excluded_labels),
+    )
+    policy = _compiled_policies.get(key)
+    if policy is None:
+        policy = CompiledPolicy(config)
+        _compiled_policies[key] = policy
+    return policy
+
+
 class IssueExtractor:
     """Extract issue references from various sources."""
 
     def __init__(self, config: Config, debug: bool = False):
         self.config = config
-        self.debug = debug
-        # Sort patterns by order field, then group by strategy for efficient lookup
-        sorted_patterns = sorted(config.issue_policy.patterns, key=lambda p: p.order)
-        self.pattern_configs = sorted_patterns  # Store for debug output
-        self.patterns_by_strategy: Dict[IssueExtractionStrategy, List[re.Pattern]] = {}
-        for issue_pattern in sorted_patterns:
-            strategy = issue_pattern.strategy
-            if strategy not in self.patterns_by_strategy:
-                self.patterns_by_strategy[strategy] = []
-            self.patterns_by_strategy[strategy].append(re.compile(issue_pattern.pattern))
+        # Per-pattern traces are for terminals; CommitConsolidator logs a
+        # structured line per commit in machine mode instead
+        self.debug = debug and not machine_mode()
+        self.policy = compile_policy(config)
+        self.pattern_configs = self.policy.pattern_configs  # Store for debug output
+        self.patterns_by_strategy = self.policy.patterns_by_strategy
+
+    @property
+    def commit_patterns_key(self) -> str:
+        """Fingerprint of the commit message patterns (see Commit.issue_patterns_key)."""
+        return self.policy.commit_patterns_key
+
+    def index_commit(self, commit: Commit) -> None:
+        """Store a commit's issue keys on it before it is indexed, for reuse by consolidation."""
+        commit.issue_keys = self.extract_from_commit(commit)
+        commit.issue_patterns_key = self.commit_patterns_key
 
     def _extract_with_patterns(self, text: str, patterns: List[re.Pattern], show_results: bool = False) -> List[str]:
         """Extract issue references using a list of patterns."""
         issues = []
-        for i, pattern in enumerate(patterns):
-            matches_found = []
-            # Use finditer to get match objects and extract named groups
-            for match in pattern.finditer(text):
-                # Try to extract the 'issue' named group
-                try:
-                    issue = match.group('issue')
-                    issues.append(issue)
-                    matches_found.append(issue)
-                except IndexError:
-                    # If no 'issue' group, fall back to the entire match or first group
-                    if match.groups():
-                        issue = match.group(1)
-                        issues.append(issue)
-                        matches_found.append(issue)
-                    else:
-                        issue = match.group(0)
-                        issues.append(issue)
-                        matches_found.append(issue)
+        for pattern in patterns:
+            matches_found = CompiledPolicy.extract_with_pattern(text, pattern)
+            issues.extend(matches_found)
 
             if self.debug and show_results:
                 if matches_found:
@@ -126,7 +264,11 @@ class IssueExtractor:
                 console.print(f"    Regex: {pattern_config.pattern}")
                 console.print(f"    Text: \"{commit.message[:100]}{'...' if len(commit.message) > 100 else ''}\"")
 
-        issues = list(set(self._extract_with_patterns(commit.message, patterns, show_results=self.debug)))
+        if self.debug:
+            extracted = self._extract_with_patterns(commit.message, patterns, show_results=True)
+        else:
+            extracted = self.policy.extract(IssueExtractionStrategy.COMMIT_MESSAGE, commit.message)
+        issues = list(set(extracted))
 
         if self.debug:
             if issues:
@@ -143,10 +285,10 @@ class IssueExtractor:
 
         issues = []
 
-        # Try patterns in order (sorted by order field)
-        sorted_patterns = sorted(self.config.issue_policy.patterns, key=lambda p: p.order)
-        for issue_pattern in sorted_patterns:
-            strategy = issue_pattern.strategy
+        # Try patterns in priority order (precompiled, sorted by order field)
+        for issue_pattern, compiled, (strategy, slot) in zip(
+            self.policy.pattern_configs, self.policy.compiled_patterns, self.policy.pattern_slots
+        ):
             text = None
             source_name = None
 
@@ -171,8 +313,10 @@ class IssueExtractor:
                     console.print(f"    Source: {source_name}")
                     console.print(f"    Text: \"{text[:100]}{'...' if len(text) > 100 else ''}\"")
 
-                pattern = re.compile(issue_pattern.pattern)
-                extracted = self._extract_with_patterns(text, [pattern], show_results=self.debug)
+                if self.debug:
+                    extracted = self._extract_with_patterns(text, [compiled], show_results=True)
+                else:
+                    extracted = list(self.policy.matches_for(strategy, text)[slot])
                 if extracted:
                     issues.extend(extracted)
                     if self.debug:
@@ -208,7 +352,11 @@ class IssueExtractor:
                 console.print(f"    Regex: {pattern_config.pattern}")
                 console.print(f"    Text: \"{branch_name}\"")
 
-        issues = list(set(self._extract_with_patterns(branch_name, patterns, show_results=self.debug)))
+        if self.debug:
+            extracted = self._extract_with_patterns(branch_name, patterns, show_results=True)
+        else:
+            extracted = self.policy.extract(IssueExtractionStrategy.BRANCH_NAME, branch_name)
+        issues = list(set(extracted))
 
         if self.debug:
             if issues:
@@ -225,8 +373,11 @@ class CommitConsolidator:
     def __init__(self, config: Config, extractor: IssueExtractor, debug: bool = False):
         self.config = config
         self.extractor = extractor
-        self.debug = debug
+        self.debug = debug and not machine_mode()
+        # Machine mode: one structured debug line per commit
+        self.trace = debug and machine_mode()
 
+    @timed('consolidation.consolidate')
     def consolidate(
         self,
         commits: List[Commit],
@@ -258,11 +409,16 @@ class CommitConsolidator:
             if self.debug:
                 console.print(f"\n📦 [bold]Consolidating commit {commit.sha[:7]}:[/bold] \"{commit.message[:60]}{'...' if len(commit.message) > 60 else ''}\"")
 
-            # Try to find issue from commit
-            issues = self.extractor.extract_from_commit(commit)
+            # Try to find issue from commit, reusing the keys extracted when it was indexed
+            indexed = commit.issue_patterns_key == self.extractor.commit_patterns_key
+            if indexed:
+                issues = list(commit.issue_keys)
+            else:
+                issues = self.extractor.extract_from_commit(commit)
 
             if self.debug:
-                console.print(f"  → Issues from commit: {issues if issues else '(none)'}")
+                source = "indexed commit" if indexed else "commit"
+                console.print(f"  → Issues from {source}: {issues if issues else '(none)'}")
 
             # Try to find associated PR
             pr = prs.get(commit.pr_number) if commit.pr_number else None
@@ -278,6 +434,10 @@ class CommitConsolidator:
 
             issues = list(set(issues))  # Remove duplicates
 
+            if self.trace:
+                emit('consolidation.commit', level='debug', sha=commit.sha[:7],
+                     pr=pr.number if pr else None, issues=issues)
+
             if issues:
                 # Use first issue as the parent
                 issue_key = issues[0]
@@ -321,6 +481,7 @@ class CommitConsolidator:
 
         return list(consolidated.values())
 
+    @timed('consolidation.handle_missing_issues')
     def handle_missing_issues(
         self,
         consolidated_changes: List[ConsolidatedChange]
@@ -350,14 +511,113 @@ class CommitConsolidator:
                     console.print(f"  - {msg[:80]}")
 
 
+
+class HtmlWhitespaceStream:
+    """
+    Apply HTML-like whitespace processing incrementally to streamed output.
+
+    Chunks (e.g. from Jinja's Template.generate()) are buffered and flushed
+    to the output file in pieces. A piece is only cut after a non-whitespace
+    character that cannot start a <br>/&nbsp; token or marker, so every
+    whitespace run and token is processed in one piece. The result equals
+    processing the whole document at once, without ever holding it in memory.
+    """
+
+    # Tokens handled by _process_html_like_whitespace that must not be split
+    TOKENS = ('&nbsp;', '<br/>', '<br>', '<NBSP_MARKER>', '<BR_MARKER>')
+    # Buffered characters before a piece is processed and written
+    FLUSH_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        out: TextIO,
+        process: Callable[[str, bool], str],
+        intermediate_pass: bool = False
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            out: Text file to write processed output to
+            process: Whitespace processing function (text, intermediate_pass) -> text
+            intermediate_pass: Keep <br>/&nbsp; markers (see _process_html_like_whitespace)
+        """
+        self.out = out
+        self.process = process
+        self.intermediate_pass = intermediate_pass
+        self.chars_written = 0
+        self._pending: List[str] = []
+        self._pending_size = 0
+        # Last raw character already processed (always non-whitespace)
+        self._prev: Optional[str] = None
+        self._max_partial = max(len(t) for t in self.TOKENS) - 1
+
+    def write(self, chunk: str) -> None:
+        """Add a chunk of raw template output."""
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        if self._pending_size >= self.FLUSH_SIZE:
+            self._flush(final=False)
+
+    def close(self) -> None:
+        """Process and write any remaining output."""
+        self._flush(final=True)
+
+    def _safe_cut(self, text: str) -> int:
+        """Find the end of the longest prefix that can be processed on its own."""
+        cut = len(text)
+        while True:
+            new_cut = cut
+            # Hold back trailing whitespace (the run may continue)
+            while new_cut > 0 and text[new_cut - 1].isspace():
+                new_cut -= 1
+            # Hold back a trailing partial token
+            for n in range(min(self._max_partial, new_cut), 0, -1):
+                suffix = text[new_cut - n:new_cut]
+                if any(len(t) > n and t.startswith(suffix) for t in self.TOKENS):
+                    new_cut -= n
+                    break
+            if new_cut == cut:
+                return cut
+            cut = new_cut
+
+    def _flush(self, final: bool) -> None:
+        text = ''.join(self._pending)
+        cut = len(text) if final else self._safe_cut(text)
+        head, tail = text[:cut], text[cut:]
+
+        if head:
+            if self._prev is None:
+                # Start of document: leading whitespace is stripped as usual
+                processed = self.process(head, self.intermediate_pass)
+            else:
+                # Prefix the previous character so a leading whitespace run is
+                # treated as mid-document, then drop it again
+                processed = self.process(self._prev + head, self.intermediate_pass)[1:]
+            self.out.write(processed)
+            self.chars_written += len(processed)
+            self._prev = head[-1]
+
+        self._pending = [tail] if tail else []
+        self._pending_size = len(tail)
+
 class ReleaseNoteGenerator:
     """Generate release notes from consolidated changes."""
 
     # NOTE: release_output_template is now configured via config.release_notes.release_output_template
     # This constant is kept for reference but is no longer used
 
+    # Maximum number of output templates rendered concurrently
+    MAX_RENDER_WORKERS = 8
+
     def __init__(self, config: Config):
         self.config = config
+        self.policy = compile_policy(config)
+        # Per-format_markdown caches shared across output templates
+        self._note_contexts: Optional[Dict[tuple, Dict[str, Any]]] = None
+        # id of each shared note context -> its rendered entry (None until rendered)
+        self._rendered_entries: Optional[Dict[int, Optional[str]]] = None
+        self._context_lock = threading.RLock()
 
     def _get_fallback_category_name(self) -> str:
         """
@@ -370,12 +630,9 @@ class ReleaseNoteGenerator:
             The name of the category with alias='other', or "Other" as hardcoded fallback
             if no category has that alias.
         """
-        for category in self.config.release_notes.categories:
-            if category.alias == "other":
-                return category.name
-        # Fallback to hardcoded "Other" if no category with alias='other' found
-        return "Other"
+        return self.policy.fallback_category
 
+    @timed('notes.create_release_note')
     def create_release_note(
         self,
         change: ConsolidatedChange,
@@ -404,7 +661,11 @@ class ReleaseNoteGenerator:
         # Extract description and migration notes if we have a issue
         description = None
         migration_notes = None
-        if issue and issue.body:
+        if issue and issue.sections_extracted:
+            # Already extracted at upsert time with the configured regexes
+            description = issue.description
+            migration_notes = issue.migration_notes
+        elif issue and issue.body:
             description = self._extract_section(
                 issue.body,
                 self.config.issue_policy.description_section_regex
@@ -529,19 +790,8 @@ class ReleaseNoteGenerator:
             for pr in change.prs:
                 pr_labels.extend([label.name for label in pr.labels])
 
-        # Check against category mappings (respecting pr: and issue: prefixes)
-        for category_config in self.config.release_notes.categories:
-            # Check issue labels
-            for label in issue_labels:
-                if category_config.matches_label(label, "issue"):
-                    return category_config.name
-
-            # Check PR labels
-            for label in pr_labels:
-                if category_config.matches_label(label, "pr"):
-                    return category_config.name
-
-        return self._get_fallback_category_name()
+        # Look up category mappings (respecting pr: and issue: prefixes)
+        return self.policy.category_for(issue_labels, pr_labels)
 
     def _extract_section(self, text: str, regex: Optional[str]) -> Optional[str]:
         """Extract a section from text using regex."""
@@ -582,13 +832,14 @@ class ReleaseNoteGenerator:
 
         return (None, None)
 
+    @timed('notes.group_by_category')
     def group_by_category(
         self,
         notes: List[ReleaseNote]
     ) -> Dict[str, List[ReleaseNote]]:
         """Group release notes by category."""
         # Filter out excluded notes
-        excluded_labels = set(self.config.release_notes.excluded_labels)
+        excluded_labels = self.policy.excluded_labels
         notes = [
             note for note in notes
             if not any(label in excluded_labels for label in note.labels)
@@ -721,7 +972,37 @@ class ReleaseNoteGenerator:
         Prepare a release note for template rendering.
 
         Returns a dict with processed description/migration and author dicts.
+        Within format_markdown the dict is built once per note and output
+        directory (media links are relative to it) and shared by all templates.
         """
+        if self._note_contexts is not None:
+            media_dir = str(Path(output_path).parent) if media_downloader and output_path else None
+            cache_key = (id(note), version, media_dir, convert_html_to_markdown)
+            # Concurrent templates build each shared context only once
+            with self._context_lock:
+                note_dict = self._note_contexts.get(cache_key)
+                if note_dict is None:
+                    note_dict = self._build_note_context(
+                        note, version, output_path, media_downloader, convert_html_to_markdown
+                    )
+                    self._note_contexts[cache_key] = note_dict
+                    # Kept alive by _note_contexts, so its id is not reused
+                    self._rendered_entries[id(note_dict)] = None
+            return note_dict
+
+        return self._build_note_context(
+            note, version, output_path, media_downloader, convert_html_to_markdown
+        )
+
+    def _build_note_context(
+        self,
+        note: ReleaseNote,
+        version: str,
+        output_path: Optional[str],
+        media_downloader,
+        convert_html_to_markdown: bool
+    ) -> Dict[str, Any]:
+        """Build the template context dict for a release note."""
         # Process media in description and migration notes if enabled
         processed_description = note.description
         processed_migration = note.migration_notes
@@ -756,6 +1037,122 @@ class ReleaseNoteGenerator:
             'commit_shas': note.commit_shas
         }
 
+    def _render_output(self, template, context: Dict[str, Any], out: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Render a top-level output template with final whitespace processing.
+
+        Args:
+            template: Compiled Jinja2 template
+            context: Template variables
+            out: If given, stream the output to this file and return None
+
+        Returns:
+            Rendered content, or None when streamed to out
+        """
+        if out is None:
+            output = template.render(**context)
+            # Process HTML-like whitespace WITHOUT intermediate_pass
+            # This will convert <br> tags to proper newlines without extra blank lines
+            return self._process_html_like_whitespace(output, intermediate_pass=False)
+
+        stream = HtmlWhitespaceStream(out, self._process_html_like_whitespace)
+        for chunk in template.generate(**context):
+            stream.write(chunk)
+        stream.close()
+        return None
+
+    def _render_entry(self, entry_template, note_dict: Dict[str, Any]) -> str:
+        """
+        Render a note with the entry template, reusing renders shared across templates.
+
+        Only the shared note contexts are cached; other dicts (e.g. a copy a
+        template makes with dict(note, title=...)) are always rendered.
+        """
+        cache = self._rendered_entries
+        shared = cache is not None and id(note_dict) in cache
+        if shared:
+            rendered = cache[id(note_dict)]
+            if rendered is not None:
+                return rendered
+        rendered = self._process_html_like_whitespace(
+            entry_template.render(**note_dict), intermediate_pass=True
+        )
+        if shared:
+            cache[id(note_dict)] = rendered
+        return rendered
+
+    @contextmanager
+    def shared_rendering(self):
+        """
+        Share note contexts and rendered entries across the outputs rendered in the block.
+
+        Within the block each note's context is built once per output
+        directory (see _prepare_note_for_template), whichever template or
+        thread renders it first.
+        """
+        self._note_contexts = {}
+        self._rendered_entries = {}
+        try:
+            yield
+        finally:
+            self._note_contexts = None
+            self._rendered_entries = None
+
+    def prefetch_media(
+        self,
+        note_groups: List[Dict[str, List[ReleaseNote]]],
+        include_html: bool = False
+    ):
+        """
+        Fetch all media referenced by the notes up front, concurrently, through the shared cache.
+
+        Args:
+            note_groups: Grouped notes of every output about to be rendered
+            include_html: Also fetch media referenced by HTML img tags
+
+        Returns:
+            The media store (see media_utils.get_media_store), for the
+            MediaDownloaders of the outputs
+        """
+        from .media_utils import MediaDownloader, get_media_store
+
+        media_store = get_media_store(self.config)
+        MediaDownloader(self.config.output.assets_path, store=media_store).prefetch(
+            (text
+             for grouped_notes in note_groups
+             for notes in grouped_notes.values()
+             for note in notes
+             for text in (note.description, note.migration_notes)),
+            include_html=include_html
+        )
+        return media_store
+
+    def _media_downloader(self, output_path: Optional[str], media_store):
+        """MediaDownloader for an output, or None when media is not downloaded for it."""
+        from .media_utils import MediaDownloader
+
+        if not self.config.output.download_media or not output_path:
+            return None
+        return MediaDownloader(self.config.output.assets_path, download_enabled=True, store=media_store)
+
+    def render_concurrently(self, jobs: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Run independent render jobs concurrently.
+
+        Args:
+            jobs: Callables rendering one output each
+
+        Returns:
+            The results, in the order of the jobs
+        """
+        if len(jobs) == 1:
+            return [jobs[0]()]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(len(jobs), self.MAX_RENDER_WORKERS)) as executor:
+            futures = [executor.submit(job) for job in jobs]
+            return [future.result() for future in futures]
+
+    @timed('notes.format_markdown')
     def format_markdown(
         self,
         grouped_notes: Dict[str, List[ReleaseNote]],
@@ -765,6 +1162,9 @@ class ReleaseNoteGenerator:
         """
         Format release notes as markdown using pr_code templates.
 
+        Note contexts and rendered entries are built once and shared by all
+        output templates, which are rendered concurrently.
+
         Args:
             grouped_notes: Release notes grouped by category
             version: Version string
@@ -774,9 +1174,16 @@ class ReleaseNoteGenerator:
             List of tuples: [(content, output_path), ...]
             For backward compatibility: if only one output, returns just the content string
         """
-        from jinja2 import Template
-        from .media_utils import MediaDownloader
+        with self.shared_rendering():
+            return self._format_markdown(grouped_notes, version, output_paths)
 
+    def _format_markdown(
+        self,
+        grouped_notes: Dict[str, List[ReleaseNote]],
+        version: str,
+        output_paths: Optional[List[str]] = None
+    ):
+        """Implementation of format_markdown, run with the shared caches enabled."""
         results = []
 
         # Check if pr_code templates are configured (handle both old and new format)
@@ -793,57 +1200,54 @@ class ReleaseNoteGenerator:
                     has_pr_code_templates = True
                     pr_code_templates.extend(pr_code_config.templates)
 
+        # Fetch all referenced media up front, concurrently, through the shared cache
+        media_store = None
+        if self.config.output.download_media and output_paths and any(output_paths):
+            include_html = not has_pr_code_templates and bool(self.config.release_notes.doc_output_template)
+            media_store = self.prefetch_media([grouped_notes], include_html=include_html)
+
         if has_pr_code_templates:
             # Use pr_code templates
-            for i, template_config in enumerate(pr_code_templates):
+            def render_pr_code(i: int, template_config) -> tuple:
                 # Get output path (from output_paths list or from template config)
                 output_path = None
                 if output_paths and i < len(output_paths):
                     output_path = output_paths[i]
 
-                # Initialize media downloader if enabled
-                media_downloader = None
-                if self.config.output.download_media and output_path:
-                    media_downloader = MediaDownloader(
-                        self.config.output.assets_path,
-                        download_enabled=True
-                    )
-
                 # Render the template
                 content = self._format_with_pr_code_template(
                     template_config.output_template,
                     grouped_notes,
                     version,
                     output_path,
-                    media_downloader
+                    self._media_downloader(output_path, media_store)
                 )
+                return (content, output_path)
 
-                results.append((content, output_path))
-
-            # Check if there's an additional output_path for draft file (added by generate.py)
-            # This happens when pr_code templates are configured but we also need a draft file
-            num_templates = len(pr_code_templates)
-            if output_paths and len(output_paths) > num_templates:
-                # Generate draft file using standard release notes template
-                draft_path = output_paths[num_templates]  # The extra path is the draft
-
-                # Initialize media downloader if enabled
-                draft_media_downloader = None
-                if self.config.output.download_media and draft_path:
-                    draft_media_downloader = MediaDownloader(
-                        self.config.output.assets_path,
-                        download_enabled=True
-                    )
-
+            def render_draft(draft_path: str) -> tuple:
                 # Generate standard release notes for draft
                 draft_content = self._format_with_master_template(
                     grouped_notes,
                     version,
                     draft_path,
-                    draft_media_downloader
+                    self._media_downloader(draft_path, media_store)
                 )
+                return (draft_content, draft_path)
 
-                results.append((draft_content, draft_path))
+            jobs = [
+                partial(render_pr_code, i, template_config)
+                for i, template_config in enumerate(pr_code_templates)
+            ]
+
+            # Check if there's an additional output_path for draft file (added by generate.py)
+            # This happens when pr_code templates are configured but we also need a draft file
+            num_templates = len(pr_code_templates)
+            if output_paths and len(output_paths) > num_templates:
+                # The extra path is the draft, rendered with the standard release notes template
+                jobs.append(partial(render_draft, output_paths[num_templates]))
+
+            # Templates are independent: render them concurrently, keeping output order
+            results = self.render_concurrently(jobs)
 
         # Backward compatibility: support doc_output_template
         elif self.config.release_notes.doc_output_template:
@@ -851,27 +1255,15 @@ class ReleaseNoteGenerator:
             release_output_path = output_paths[0] if output_paths and len(output_paths) > 0 else None
             doc_output_path = output_paths[1] if output_paths and len(output_paths) > 1 else None
 
-            media_downloader = None
-            if self.config.output.download_media and release_output_path:
-                media_downloader = MediaDownloader(
-                    self.config.output.assets_path,
-                    download_enabled=True
-                )
-
             release_notes = self._format_with_master_template(
-                grouped_notes, version, release_output_path, media_downloader
+                grouped_notes, version, release_output_path,
+                self._media_downloader(release_output_path, media_store)
             )
 
             # Create doc notes with doc_output_template
-            doc_media_downloader = None
-            if self.config.output.download_media and doc_output_path:
-                doc_media_downloader = MediaDownloader(
-                    self.config.output.assets_path,
-                    download_enabled=True
-                )
-
             doc_notes = self._format_with_doc_template(
-                grouped_notes, version, doc_output_path, doc_media_downloader, release_notes
+                grouped_notes, version, doc_output_path,
+                self._media_downloader(doc_output_path, media_store), release_notes
             )
 
             # Return legacy tuple format
@@ -880,15 +1272,8 @@ class ReleaseNoteGenerator:
         else:
             # No templates configured - return base release notes
             output_path = output_paths[0] if output_paths and len(output_paths) > 0 else None
-            media_downloader = None
-            if self.config.output.download_media and output_path:
-                media_downloader = MediaDownloader(
-                    self.config.output.assets_path,
-                    download_enabled=True
-                )
-
             release_notes = self._format_with_master_template(
-                grouped_notes, version, output_path, media_downloader
+                grouped_notes, version, output_path, self._media_downloader(output_path, media_store)
             )
             return release_notes
 
@@ -904,8 +1289,9 @@ class ReleaseNoteGenerator:
         grouped_notes: Dict[str, List[ReleaseNote]],
         version: str,
         output_path: Optional[str],
-        media_downloader
-    ) -> str:
+        media_downloader,
+        out: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Format using a pr_code template.
 
@@ -915,20 +1301,20 @@ class ReleaseNoteGenerator:
             version: Version string
             output_path: Output file path (for media processing)
             media_downloader: Media downloader instance
+            out: If given, stream the rendered content to this file
 
         Returns:
-            Rendered template content
+            Rendered template content, or None when streamed to out
         """
-        from jinja2 import Template
+        from .template_utils import get_template
 
         # Create entry template for sub-rendering
-        entry_template = Template(self.config.release_notes.entry_template)
+        entry_template = get_template(self.config.release_notes.entry_template, strict=False)
 
         # Create a render_entry function
         def render_entry(note_dict: Dict[str, Any]) -> str:
             """Render a single entry using the entry_template."""
-            rendered = entry_template.render(**note_dict)
-            return self._process_html_like_whitespace(rendered, intermediate_pass=True)
+            return self._render_entry(entry_template, note_dict)
 
         # Prepare all notes with processed data
         categories_data = []
@@ -968,13 +1354,13 @@ class ReleaseNoteGenerator:
         )
 
         # Render title
-        title_template = Template(self.config.release_notes.title_template)
+        title_template = get_template(self.config.release_notes.title_template, strict=False)
         title = title_template.render(version=version)
 
         # Create render_release_notes function that renders the base release notes
         def render_release_notes() -> str:
             """Render the base release notes content using the configured template."""
-            base_template = Template(self.config.release_notes.release_output_template)
+            base_template = get_template(self.config.release_notes.release_output_template, strict=False)
             output = base_template.render(
                 version=version,
                 title=title,
@@ -1001,8 +1387,8 @@ class ReleaseNoteGenerator:
 
         # Render the pr_code template
         from datetime import datetime
-        pr_code_template = Template(template_str)
-        output = pr_code_template.render(
+        pr_code_template = get_template(template_str, strict=False)
+        return self._render_output(pr_code_template, dict(
             version=version,
             major=major,
             minor=minor,
@@ -1014,12 +1400,7 @@ class ReleaseNoteGenerator:
             render_entry=render_entry,
             render_release_notes=render_release_notes,
             year=datetime.now().year
-        )
-
-        # Process HTML-like whitespace
-        output = self._process_html_like_whitespace(output, intermediate_pass=False)
-
-        return output
+        ), out)
 
     def _format_with_master_template(
         self,
@@ -1027,19 +1408,23 @@ class ReleaseNoteGenerator:
         version: str,
         output_path: Optional[str],
         media_downloader,
-        intermediate_pass: bool = False
-    ) -> str:
-        """Format using the configured release_output_template."""
-        from jinja2 import Template
+        intermediate_pass: bool = False,
+        out: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """
+        Format using the configured release_output_template.
+
+        When out is given, the content is streamed to it and None is returned.
+        """
+        from .template_utils import get_template
 
         # Create entry template for sub-rendering
-        entry_template = Template(self.config.release_notes.entry_template)
+        entry_template = get_template(self.config.release_notes.entry_template, strict=False)
 
         # Create a render_entry function that can be called from the master template
         def render_entry(note_dict: Dict[str, Any]) -> str:
             """Render a single entry using the entry_template."""
-            rendered = entry_template.render(**note_dict)
-            return self._process_html_like_whitespace(rendered, intermediate_pass=True)
+            return self._render_entry(entry_template, note_dict)
 
         # Prepare all notes with processed data
         categories_data = []
@@ -1079,26 +1464,20 @@ class ReleaseNoteGenerator:
         )
 
         # Render title
-        title_template = Template(self.config.release_notes.title_template)
+        title_template = get_template(self.config.release_notes.title_template, strict=False)
         title = title_template.render(version=version)
 
         # Render master template using configured release_output_template
         from datetime import datetime
-        master_template = Template(self.config.release_notes.release_output_template)
-        output = master_template.render(
+        master_template = get_template(self.config.release_notes.release_output_template, strict=False)
+        return self._render_output(master_template, dict(
             version=version,
             title=title,
             categories=categories_data,
             all_notes=all_notes_data,
             render_entry=render_entry,
             year=datetime.now().year
-        )
-
-        # Process HTML-like whitespace WITHOUT intermediate_pass
-        # This will convert <br> tags to proper newlines without extra blank lines
-        output = self._process_html_like_whitespace(output, intermediate_pass=False)
-
-        return output
+        ), out)
 
     def _format_with_doc_template(
         self,
@@ -1109,16 +1488,15 @@ class ReleaseNoteGenerator:
         release_notes: str
     ) -> str:
         """Format using the doc_output_template with render_release_notes() function."""
-        from jinja2 import Template
+        from .template_utils import get_template
 
         # Create entry template for sub-rendering
-        entry_template = Template(self.config.release_notes.entry_template)
+        entry_template = get_template(self.config.release_notes.entry_template, strict=False)
 
         # Create a render_entry function
         def render_entry(note_dict: Dict[str, Any]) -> str:
             """Render a single entry using the entry_template."""
-            rendered = entry_template.render(**note_dict)
-            return self._process_html_like_whitespace(rendered, intermediate_pass=True)
+            return self._render_entry(entry_template, note_dict)
 
         # Create a render_release_notes function that returns the already-rendered release notes
         # wrapped in a marker to prevent re-processing
@@ -1159,12 +1537,12 @@ class ReleaseNoteGenerator:
             })
 
         # Render title
-        title_template = Template(self.config.release_notes.title_template)
+        title_template = get_template(self.config.release_notes.title_template, strict=False)
         title = title_template.render(version=version)
 
         # Render doc template
         from datetime import datetime
-        doc_template = Template(self.config.release_notes.doc_output_template)
+        doc_template = get_template(self.config.release_notes.doc_output_template, strict=False)
         output = doc_template.render(
             version=version,
             title=title,
@@ -1190,26 +1568,26 @@ class ReleaseNoteGenerator:
         intermediate_pass: bool = False
     ) -> str:
         """Format using the legacy category-based layout."""
-        from jinja2 import Template
+        from .template_utils import get_template
 
         lines = []
         rendered_note_count = 0
 
         # Title
-        title_template = Template(self.config.release_notes.title_template)
+        title_template = get_template(self.config.release_notes.title_template, strict=False)
         title = title_template.render(version=version)
         lines.append(f"# {title}")
         lines.append("")
 
         # Description (legacy)
         if self.config.release_notes.description_template:
-            desc_template = Template(self.config.release_notes.description_template)
+            desc_template = get_template(self.config.release_notes.description_template, strict=False)
             description = desc_template.render(version=version)
             lines.append(description)
             lines.append("")
 
         # Categories
-        entry_template = Template(self.config.release_notes.entry_template)
+        entry_template = get_template(self.config.release_notes.entry_template, strict=False)
 
         for category in self.config.get_ordered_categories():
             notes = grouped_notes.get(category, [])
@@ -1224,9 +1602,7 @@ class ReleaseNoteGenerator:
                     note, version, output_path, media_downloader
                 )
 
-                rendered_entry = entry_template.render(**note_dict)
-                processed_entry = self._process_html_like_whitespace(rendered_entry, intermediate_pass=True)
-                lines.append(processed_entry)
+                lines.append(self._render_entry(entry_template, note_dict))
 
                 # Add description if present and not already in template
                 if note_dict['description'] and '{{ description }}' not in self.config.release_notes.entry_template:
@@ -0,0 +1,460 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Lightweight spans, counters and cache statistics behind `--profile`.
+
+Instrumented code uses `span()` (a context manager), the `@timed()`
+decorator, `count()` and `cache()`. While no profiler is active, the
+default, each hook costs a single global lookup, so the hooks stay in
+place in normal runs.
+
+`release-tool --profile trace.json <command>` starts a Profiler. At exit
+it writes a Chrome trace (open it in chrome://tracing or Perfetto) and
+prints a summary: time per stage, API calls per endpoint, database
+statements and rows, and cache hit rates. While profiling is active:
+
+- every HTTP request made through `requests` (PyGithub included) is
+  recorded as an `http` span named after its endpoint;
+- SQLite connections opened by `Database` count their statements and rows.
+
+Cache hits and misses are also tallied per process while profiling is
+off (see `cache_totals()`), so each run can store them with its run
+metrics. Other code can watch HTTP traffic with `add_http_observer()`.
+
+Only the standard library is imported at module level.
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Endpoint templates for API call statistics, applied in order to URL paths
+_ENDPOINT_RULES = [
+    (re.compile(r'^(.*?)/repos/[^/]+/[^/]+'), r'\1/repos/{repo}'),
+    (re.compile(r'^(.*?)/users/[^/]+'), r'\1/users/{user}'),
+    (re.compile(r'/git/(ref|refs|matching-refs)/.+$'), r'/git/\1/{ref}'),
+    (re.compile(r'/contents/.+$'), '/contents/{path}'),
+    (re.compile(r'/releases/tags/.+$'), '/releases/tags/{tag}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{n}'),
+]
+
+_active: Optional["Profiler"] = None
+
+# Cache name -> [hits, misses] for the whole process (see cache())
+_cache_totals: Dict[str, List[int]] = {}
+_cache_lock = threading.Lock()
+
+# Called after every request sent through requests.Session
+_http_observers: List[Callable] = []
+_http_send = None
+
+
+def endpoint_of(url: str) -> str:
+    """Collapse a request URL into its endpoint template (e.g. /repos/{repo}/issues/{n})."""
+    from urllib.parse import urlsplit
+
+    path = urlsplit(url).path or '/'
+    for pattern, replacement in _ENDPOINT_RULES:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+class _Span:
+    """One timed region; also tracks time spent in nested spans for self time."""
+
+    __slots__ = ('profiler', 'name', 'category', 'args', 'start', 'children')
+
+    def __init__(self, profiler: "Profiler", name: str, category: str, args: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.children = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.profiler._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter()
+        stack = self.profiler._stack()
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].children += duration
+        self.profiler._record(self, duration)
+
+
+class _NoSpan:
+    """Shared stand-in returned by span() while profiling is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Profiler:
+    """Collects spans, counters and cache statistics for one run."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        # name -> {'category', 'calls', 'total', 'self', 'max'}
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        # group -> key -> amount (e.g. 'db' -> 'SELECT' -> 120)
+        self.counters: Dict[str, Dict[str, int]] = {}
+        # cache name -> [hits, misses]
+        self.caches: Dict[str, List[int]] = {}
+        self._threads: Dict[int, str] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # sqlite3 connection -> total_changes when it was instrumented
+        self._connections: Dict[Any, int] = {}
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, category: str = 'stage', **args: Any) -> _Span:
+        return _Span(self, name, category, args)
+
+    def _record(self, span: _Span, duration: float) -> None:
+        self._add_event(span.name, span.category, span.start, duration, span.children, span.args)
+
+    def record_complete(self, name: str, category: str, start: float, duration: float) -> None:
+        """Record a region timed by the caller, nested in the current span if any."""
+        stack = self._stack()
+        if stack:
+            stack[-1].children += duration
+        self._add_event(name, category, start, duration, 0.0, None)
+
+    def _add_event(self, name: str, category: str, start: float, duration: float,
+                   children: float, args: Optional[Dict[str, Any]]) -> None:
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self.origin) * 1e6, 1),
+            'dur': round(duration * 1e6, 1),
+            'pid': self.pid,
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = {
+                    'category': category, 'calls': 0, 'total': 0.0, 'self': 0.0, 'max': 0.0
+                }
+            stage['calls'] += 1
+            stage['total'] += duration
+            stage['self'] += duration - children
+            stage['max'] = max(stage['max'], duration)
+
+    def count(self, group: str, key: str, amount: int = 1) -> None:
+        with self._lock:
+            counters = self.counters.setdefault(group, {})
+            counters[key] = counters.get(key, 0) + amount
+
+    def cache(self, name: str, hits: int = 0, misses: int = 0) -> None:
+        with self._lock:
+            stats = self.caches.setdefault(name, [0, 0])
+            stats[0] += hits
+            stats[1] += misses
+
+    # -- SQLite ----------------------------------------------------------------
+
+    def instrument_sqlite(self, conn) -> None:
+        """Count statements, rows read and rows written on a sqlite3 connection."""
+        row_factory = conn.row_factory
+
+        def trace(statement: str) -> None:
+            verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else 'EMPTY'
+            self.count('db', verb)
+
+        def counting_row_factory(cursor, row):
+            self.count('db_rows', 'read')
+            return row_factory(cursor, row) if row_factory else row
+
+        conn.set_trace_callback(trace)
+        conn.row_factory = counting_row_factory
+        with self._lock:
+            self._connections[conn] = conn.total_changes
+
+    def release_sqlite(self, conn) -> None:
+        """Record the rows written on a connection before it is closed."""
+        with self._lock:
+            baseline = self._connections.pop(conn, None)
+        if baseline is None:
+            return
+        try:
+            self.count('db_rows', 'written', conn.total_changes - baseline)
+            conn.set_trace_callback(None)
+        except Exception:
+            # Already closed: its writes are lost to the statistics
+            pass
+
+    # -- HTTP ------------------------------------------------------------------
+
+    def observe_http(self, request, response, start: float, duration: float) -> None:
+        """HTTP observer: an `http` span and an API call count per request."""
+        endpoint = f"{request.method} {endpoint_of(request.url)}"
+        self.record_complete(endpoint, 'http', start, duration)
+        self.count('api', endpoint)
+        self.count('api_status', str(response.status_code))
+
+    # -- Output ----------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregated statistics (also embedded in the trace file)."""
+        for conn in list(self._connections):
+            self.release_sqlite(conn)
+        return {
+            'wall': time.perf_counter() - self.origin,
+            'stages': {
+                name: dict(stage) for name, stage in
+                sorted(self.stages.items(), key=lambda item: item[1]['total'], reverse=True)
+            },
+            'counters': {group: dict(values) for group, values in self.counters.items()},
+            'caches': {
+                name: {'hits': hits, 'misses': misses,
+                       'hit_rate': hits / (hits + misses) if hits + misses else None}
+                for name, (hits, misses) in self.caches.items()
+            },
+        }
+
+    def trace(self, command: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Chrome trace event format: complete events plus thread names."""
+        metadata = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+            'args': {'name': 'release-tool'},
+        }]
+        metadata += [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': ident, 'args': {'name': name}}
+            for ident, name in self._threads.items()
+        ]
+        return {
+            'traceEvents': metadata + sorted(self.events, key=lambda event: event['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {'command': command or [], 'summary': self.summary()},
+        }
+
+    def write_trace(self, path: str, command: Optional[List[str]] = None) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(self.trace(command)))
+
+    def print_summary(self, console, limit: int = 20) -> None:
+        """Print the summary tables to a rich console."""
+        from rich.table import Table
+
+        summary = self.summary()
+        wall = summary['wall']
+
+        stages = [(name, stage) for name, stage in summary['stages'].items() if stage['category'] != 'http']
+        table = Table(title=f"Profile ({wall * 1000:.0f} ms wall)")
+        for column in ("Stage", "Calls", "Total (ms)", "Self (ms)", "% of wall"):
+            table.add_column(column, justify="left" if column == "Stage" else "right")
+        for name, stage in stages[:limit]:
+            table.add_row(name, str(stage['calls']), f"{stage['total'] * 1000:.1f}",
+                          f"{stage['self'] * 1000:.1f}", f"{stage['total'] / wall:.0%}" if wall else "-")
+        console.print(table)
+
+        api = summary['counters'].get('api', {})
+        if api:
+            table = Table(title="API calls")
+            for column in ("Endpoint", "Calls", "Total (ms)"):
+                table.add_column(column, justify="left" if column == "Endpoint" else "right")
+            for endpoint, calls in sorted(api.items(), key=lambda item: item[1], reverse=True):
+                table.add_row(endpoint, str(calls), f"{summary['stages'][endpoint]['total'] * 1000:.1f}")
+            console.print(table)
+            statuses = summary['counters'].get('api_status', {})
+            console.print("Responses: " + ", ".join(f"{status}: {n}" for status, n in sorted(statuses.items())))
+
+        statements = summary['counters'].get('db', {})
+        rows = summary['counters'].get('db_rows', {})
+        if statements or rows:
+            by_verb = ", ".join(f"{verb} {n}" for verb, n in sorted(statements.items(), key=lambda i: -i[1]))
+            console.print(
+                f"Database: {sum(statements.values())} statements ({by_verb or 'none'}), "
+                f"{rows.get('read', 0)} rows read, {rows.get('written', 0)} rows written"
+            )
+
+        if summary['caches']:
+            table = Table(title="Caches")
+            for column in ("Cache", "Hits", "Misses", "Hit rate"):
+                table.add_column(column, justify="left" if column == "Cache" else "right")
+            for name, stats in sorted(summary['caches'].items()):
+                rate = stats['hit_rate']
+                table.add_row(name, str(stats['hits']), str(stats['misses']),
+                              f"{rate:.0%}" if rate is not None else "-")
+            console.print(table)
+
+
+def active() -> Optional[Profiler]:
+    """The running profiler, or None when profiling is off."""
+    return _active
+
+
+def start() -> Profiler:
+    """Start profiling this process (replacing any running profiler)."""
+    global _active
+    stop()
+    profiler = Profiler()
+    add_http_observer(profiler.observe_http)
+    _active = profiler
+    return profiler
+
+
+def stop() -> Optional[Profiler]:
+    """Stop profiling and return the profiler that was running, if any."""
+    global _active
+    profiler = _active
+    _active = None
+    if profiler is not None:
+        remove_http_observer(profiler.observe_http)
+    return profiler
+
+
+def add_http_observer(callback: Callable) -> None:
+    """
+    Call callback(request, response, start, duration) after every request
+    sent through requests.Session (PyGithub included).
+
+    start is a time.perf_counter() value. requests.Session.send is wrapped
+    while at least one observer is registered.
+    """
+    global _http_send
+    if callback in _http_observers:
+        return
+    _http_observers.append(callback)
+    if _http_send is not None:
+        return
+    try:
+        import requests
+    except ImportError:
+        return
+    original = requests.Session.send
+
+    def send(session, request, **kwargs):
+        start = time.perf_counter()
+        response = original(session, request, **kwargs)
+        duration = time.perf_counter() - start
+        for observer in list(_http_observers):
+            observer(request, response, start, duration)
+        return response
+
+    requests.Session.send = send
+    _http_send = original
+
+
+def remove_http_observer(callback: Callable) -> None:
+    """Unregister an observer; requests.Session.send is restored after the last one."""
+    global _http_send
+    if callback in _http_observers:
+        _http_observers.remove(callback)
+    if not _http_observers and _http_send is not None:
+        import requests
+        requests.Session.send = _http_send
+        _http_send = None
+
+
+def span(name: str, category: str = 'stage', **args: Any):
+    """
+    Time a block of code while profiling is on.
+
+        with span('generate.notes', policy=policy):
+            ...
+
+    Args:
+        name: Stage name (spans with the same name are aggregated)
+        category: Chrome trace category ('stage', 'http', ...)
+        **args: Extra values shown with the event in the trace
+    """
+    profiler = _active
+    if profiler is None:
+        return _NO_SPAN
+    return profiler.span(name, category, **args)
+
+
+def timed(name: Optional[str] = None, category: str = 'stage') -> Callable:
+    """
+    Decorator recording each call of a function as a span.
+
+    Args:
+        name: Stage name (default: the function's qualified name)
+        category: Chrome trace category
+    """
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(label, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(group: str, key: str, amount: int = 1) -> None:
+    """Add to a named counter (no-op while profiling is off)."""
+    profiler = _active
+    if profiler is not None:
+        profiler.count(group, key, amount)
+
+
+def cache(name: str, hits: int = 0, misses: int = 0) -> None:
+    """Record cache hits and misses (per process, and in the profile while profiling)."""
+    with _cache_lock:
+        totals = _cache_totals.get(name)
+        if totals is None:
+            totals = _cache_totals[name] = [0, 0]
+        totals[0] += hits
+        totals[1] += misses
+    profiler = _active
+    if profiler is not None:
+        profiler.cache(name, hits, misses)
+
+
+def cache_totals() -> Dict[str, List[int]]:
+    """Snapshot of this process's cache counters: name -> [hits, misses]."""
+    with _cache_lock:
+        return {name: list(totals) for name, totals in _cache_totals.items()}
+
+
+def instrument_sqlite(conn) -> None:
+    """Collect statement and row statistics for a new sqlite3 connection, if profiling."""
+    profiler = _active
+    if profiler is not None:
+        profiler.instrument_sqlite(conn)
+
+
+def release_sqlite(conn) -> None:
+    """Record a connection's written rows before it is closed, if profiling."""
+    profiler = _active
+    if profiler is not None:
+        profiler.release_sqlite(conn)
@@ -7,6 +7,7 @@
 import asyncio
 import subprocess
 import shutil
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Callable
@@ -19,6 +20,7 @@ from .config import Config
 from .db import Database
 from .github_utils import GitHubClient
 from .models import Issue, PullRequest
+from .profiling import timed
 
 console = Console()
 
@@ -32,6 +34,7 @@ class PullManager:
         self.github = github_client
         self.parallel_workers = config.pull.parallel_workers
 
+    @timed('pull')
     def pull_all(self) -> Dict[str, Any]:
         """
         Pull all data from GitHub (issues, PRs, commits).
@@ -78,12 +81,15 @@ class PullManager:
             git_path = self._pull_git_repository(code_repo)
             git_repos_paths.append(f"{code_repo_info.alias}:{git_path}")
 
+            stats['commits'] += self._index_commits_for_repo(code_repo, git_path)
+
         stats['git_repo_paths'] = git_repos_paths
 
         if self.config.pull.show_progress:
             console.print("[bold green]Pull completed successfully![/bold green]")
             console.print(f"  Issues: {stats['issues']}")
             console.print(f"  Pull Requests: {stats['pull_requests']}")
+            console.print(f"  Commits indexed: {stats['commits']}")
             if stats.get('git_repo_paths'):
                 console.print(f"  Git repos pulled:")
                 for repo_path in stats['git_repo_paths']:
@@ -92,6 +98,175 @@ class PullManager:
         stats['repos_pulled'] = list(stats['repos_pulled'])
         return stats
 
+    # Events API event types -> what they touch
+    ISSUE_EVENTS = frozenset({'IssuesEvent', 'IssueCommentEvent'})
+    PR_EVENTS = frozenset({'PullRequestEvent', 'PullRequestReviewEvent', 'PullRequestReviewCommentEvent'})
+
+    def watch(
+        self,
+        max_polls: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> Dict[str, int]:
+        """
+        Keep the database fresh by polling each repository's events feed.
+
+        Each poll sends the stored ETag (If-None-Match), so unchanged feeds
+        cost a free 304. New events are turned into targeted refreshes of
+        the touched issues, PRs and releases (one request each); pushes
+        fetch the local clone and index the new commits. Between polls the
+        manager sleeps for the longest X-Poll-Interval GitHub asked for.
+        The ETag, newest processed event and interval are kept per
+        repository in sync_metadata, so a restarted watcher resumes.
+
+        Args:
+            max_polls: Stop after this many polling rounds (None: until interrupted)
+            sleep: Sleep function (injectable for tests)
+
+        Returns:
+            Dictionary with counts of 'polls', 'not_modified' responses and
+            refreshed 'issues', 'pull_requests', 'releases' and 'commits'
+        """
+        totals = {'polls': 0, 'not_modified': 0, 'issues': 0, 'pull_requests': 0, 'releases': 0, 'commits': 0}
+        code_repos = [repo.link for repo in self.config.repository.code_repos]
+        issue_repos = self.config.get_issue_repos()
+        repos = list(dict.fromkeys(issue_repos + code_repos))
+
+        while max_polls is None or totals['polls'] < max_polls:
+            interval = 0
+            for repo_full_name in repos:
+                try:
+                    interval = max(interval, self._poll_repository_events(
+                        repo_full_name,
+                        totals,
+                        issues=repo_full_name in issue_repos,
+                        code=repo_full_name in code_repos
+                    ))
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not poll events of {repo_full_name}: {e}[/yellow]")
+            totals['polls'] += 1
+            if max_polls is not None and totals['polls'] >= max_polls:
+                break
+            sleep(interval or GitHubClient.DEFAULT_EVENTS_POLL_INTERVAL)
+
+        return totals
+
+    @timed('pull.poll_events')
+    def _poll_repository_events(self, repo_full_name: str, totals: Dict[str, int], issues: bool, code: bool) -> int:
+        """Poll one events feed and refresh what it touched; returns the poll interval."""
+        state = self.db.get_watch_state(repo_full_name)
+        status, events, etag, poll_interval = self.github.fetch_repository_events(
+            repo_full_name, etag=state.get('etag')
+        )
+        if status == 304:
+            totals['not_modified'] += 1
+            return poll_interval
+
+        last_event_id = state.get('last_event_id')
+        newest_id = max((int(event['id']) for event in events), default=None)
+        refreshed = 0
+        if last_event_id is None:
+            # First poll: the pull that precedes watching already caught up
+            new_events = []
+        else:
+            new_events = [event for event in events if int(event['id']) > int(last_event_id)]
+
+        if new_events and len(new_events) >= GitHubClient.EVENTS_PAGE_SIZE:
+            # Events may have been missed beyond the first page: catch up fully
+            if self.config.pull.show_progress:
+                console.print(f"[cyan]{repo_full_name}: too many new events, running an incremental pull...[/cyan]")
+            if issues:
+                pulled = self._pull_issues_for_repo(repo_full_name)
+                totals['issues'] += pulled
+                refreshed += pulled
+            if code:
+                prs = self._pull_pull_requests_for_repo(repo_full_name)
+                commits = self._index_commits_for_repo(repo_full_name, self._pull_git_repository(repo_full_name))
+                totals['pull_requests'] += prs
+                totals['commits'] += commits
+                refreshed += prs + commits
+        elif new_events:
+            refreshed = self._refresh_from_events(repo_full_name, new_events, totals, issues=issues, code=code)
+
+        self.db.update_watch_state(
+            repo_full_name,
+            etag=etag,
+            # An empty first feed still starts the watch: later events are all new
+            last_event_id=str(newest_id) if newest_id is not None else (last_event_id or '0'),
+            poll_interval=poll_interval,
+            total_fetched=refreshed
+        )
+        return poll_interval
+
+    @timed('pull.refresh_from_events')
+    def _refresh_from_events(
+        self,
+        repo_full_name: str,
+        events: List[Dict[str, Any]],
+        totals: Dict[str, int],
+        issues: bool,
+        code: bool
+    ) -> int:
+        """Refresh only the issues, PRs, releases and commits touched by events."""
+        issue_numbers, pr_numbers, release_ids = set(), set(), set()
+        pushed = False
+        for event in events:
+            event_type = event.get('type')
+            payload = event.get('payload') or {}
+            if event_type in self.ISSUE_EVENTS:
+                issue = payload.get('issue') or {}
+                # Comments on PRs arrive as issue events: PRs come from PR events
+                if issue.get('pull_request') is None and issue.get('number'):
+                    issue_numbers.add(issue['number'])
+            elif event_type in self.PR_EVENTS:
+                number = (payload.get('pull_request') or {}).get('number') or payload.get('number')
+                if number:
+                    pr_numbers.add(number)
+            elif event_type == 'ReleaseEvent':
+                release_id = (payload.get('release') or {}).get('id')
+                if release_id:
+                    release_ids.add(release_id)
+            elif event_type == 'PushEvent':
+                pushed = True
+
+        repo_id = self.db.get_repository_id(repo_full_name)
+        if repo_id is None:
+            repo_id = self.db.upsert_repository(self.github.get_repository_info(repo_full_name))
+
+        counts = {'issues': 0, 'pull_requests': 0, 'releases': 0, 'commits': 0}
+        if issues:
+            for number in sorted(issue_numbers):
+                issue = self.github.refetch_issue(repo_full_name, number, repo_id)
+                if issue is not None:
+                    self.db.upsert_issue(issue)
+                    counts['issues'] += 1
+        if code:
+            for number in sorted(pr_numbers):
+                pr = self.github.refetch_pull_request(repo_full_name, number, repo_id)
+                # Same rule as a full pull: only merged PRs are stored
+                if pr is not None and pr.merged_at:
+                    self.db.upsert_pull_request(pr)
+                    counts['pull_requests'] += 1
+            for release_id in sorted(release_ids):
+                release = self.github.refetch_release(repo_full_name, release_id, repo_id)
+                if release is not None:
+                    self.db.upsert_release(release)
+                    counts['releases'] += 1
+            if pushed:
+                counts['commits'] = self._index_commits_for_repo(
+                    repo_full_name, self._pull_git_repository(repo_full_name)
+                )
+
+        for key, count in counts.items():
+            totals[key] += count
+        if self.config.pull.show_progress and any(counts.values()):
+            console.print(
+                f"[green]✓[/green] {repo_full_name}: {len(events)} new event(s) → "
+                f"{counts['issues']} issue(s), {counts['pull_requests']} PR(s), "
+                f"{counts['releases']} release(s), {counts['commits']} commit(s)"
+            )
+        return sum(counts.values())
+
+    @timed('pull.issues')
     def _pull_issues_for_repo(self, repo_full_name: str) -> int:
         """
         Pull issues for a specific repository with parallel fetching.
@@ -159,6 +334,7 @@ class PullManager:
 
         return len(issues)
 
+    @timed('pull.pull_requests')
     def _pull_pull_requests_for_repo(self, repo_full_name: str) -> int:
         """
         Pull pull requests for a specific repository with parallel fetching.
@@ -326,6 +502,7 @@ class PullManager:
                     console.print(f"  [yellow]Warning: No GitHub token available, private repos will fail[/yellow]")
                 return url
 
+    @timed('pull.git')
     def _pull_git_repository(self, repo_full_name: str) -> str:
         """
         Clone or update the git repository for offline operation.
@@ -489,6 +666,69 @@ class PullManager:
 
         return str(repo_path)
 
+    @timed('pull.index_commits')
+    def _index_commits_for_repo(self, repo_full_name: str, repo_path: str) -> int:
+        """
+        Incrementally index new commits of every remote branch into the database.
+
+        For each branch whose head moved since the last pull, only commits not
+        reachable from any previously indexed head are read (one `git log`
+        call) and stored with their PR number and issue keys, so generate can
+        look commits up by SHA instead of converting them again.
+
+        Args:
+            repo_full_name: Full repository name (owner/repo)
+            repo_path: Path to the local clone
+
+        Returns:
+            Number of newly indexed commits
+        """
+        from git.exc import GitCommandError
+        from .git_ops import GitOperations
+        from .policies import IssueExtractor
+
+        repo_id = self.db.get_repository_id(repo_full_name)
+        if repo_id is None:
+            return 0
+
+        try:
+            git_ops = GitOperations(repo_path)
+            branch_heads = git_ops.get_remote_branch_heads()
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not index commits for {repo_full_name}: {e}[/yellow]")
+            return 0
+
+        extractor = IssueExtractor(self.config)
+        indexed_heads = self.db.get_commit_index_heads(repo_id)
+        total_indexed = 0
+
+        for ref, head_sha in sorted(branch_heads.items()):
+            if indexed_heads.get(ref) == head_sha:
+                continue
+
+            # Everything reachable from an indexed head is already stored
+            exclusions = [f"^{sha}" for sha in sorted(set(indexed_heads.values()))]
+            try:
+                commits = list(git_ops.iter_commit_models([head_sha] + exclusions, repo_id))
+            except GitCommandError:
+                # An old head may no longer exist (force push + gc): walk the full branch
+                commits = list(git_ops.iter_commit_models([head_sha], repo_id))
+
+            existing = self.db.get_existing_commit_shas([c.sha for c in commits])
+            new_commits = [c for c in commits if c.sha not in existing]
+            for commit in new_commits:
+                extractor.index_commit(commit)
+
+            self.db.upsert_commits(new_commits)
+            self.db.set_commit_index_head(repo_id, ref, head_sha)
+            indexed_heads[ref] = head_sha
+            total_indexed += len(new_commits)
+
+        if self.config.pull.show_progress:
+            console.print(f"  [green]✓[/green] Indexed {total_indexed} new commits")
+
+        return total_indexed
+
     def _fetch_issues_streaming(
         self,
         repo_full_name: str,
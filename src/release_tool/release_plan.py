@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Release plans: what `generate` resolved for a release, reused by `push`.
+
+`generate` writes one plan per repository next to its drafts (the
+`output.draft_output_path` template rendered with `output_file_type`
+"plan" and a .json suffix, e.g. `1.2.0-plan.json`). A plan records:
+
+- the target version and the comparison version of each policy
+- the release and source branches, and whether push should create the
+  release branch
+- the commit the notes were generated from (head ref and SHA)
+- the draft files with their SHA-256 content hashes
+- when the remote refs were fetched
+
+`push` uses a repository's plan instead of fetching the remote refs and
+working out the branches again while the refs are fresh (REFS_MAX_AGE)
+and the head ref still points at the same commit. It also takes the
+draft files from the plans instead of globbing for them. A missing,
+stale or unreadable plan only means push does that work itself.
+
+Only the standard library is imported at module level.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Bumped when the plan format changes; plans of other versions are ignored
+PLAN_VERSION = 1
+
+# How long fetched remote refs are trusted by push
+REFS_MAX_AGE = timedelta(minutes=15)
+
+# output_file_type of plan files in output.draft_output_path
+PLAN_FILE_TYPE = 'plan'
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of a draft's text, as recorded in plans."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def plan_path(config, repo_alias: str, version: str) -> Path:
+    """
+    Path of a repository's plan for a version.
+
+    Args:
+        config: Configuration object
+        repo_alias: Code repository alias
+        version: Release version (e.g. "1.2.0-rc.1")
+    """
+    from .models import SemanticVersion
+    from .template_utils import build_repo_context, render_template
+
+    target_version = SemanticVersion.parse(version)
+    context = build_repo_context(config, current_repo_alias=repo_alias)
+    context.update({
+        'version': version,
+        'major': str(target_version.major),
+        'minor': str(target_version.minor),
+        'patch': str(target_version.patch),
+        'output_file_type': PLAN_FILE_TYPE,
+    })
+    return Path(render_template(config.output.draft_output_path, context)).with_suffix('.json')
+
+
+def is_plan_file(path: Path) -> bool:
+    """Whether a file found among the drafts is a plan."""
+    return path.suffix == '.json' and path.stem.endswith(f"-{PLAN_FILE_TYPE}")
+
+
+def write_plan(path: Path, plan: Dict[str, Any]) -> None:
+    """
+    Write a plan atomically (a reader never sees a partial file).
+
+    Args:
+        path: Plan path (see plan_path)
+        plan: Plan contents; plan_version and generated_at are added
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {'plan_version': PLAN_VERSION, 'generated_at': datetime.now().isoformat(), **plan}
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True) + '\n')
+    os.replace(tmp_path, path)
+
+
+def load_plans(config, version: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the plans of every code repository for a version.
+
+    Args:
+        config: Configuration object
+        version: Release version
+
+    Returns:
+        Dictionary of repository alias -> plan, for the repositories with a
+        readable plan of the current format for this version (none if the
+        draft path template cannot be rendered for plans)
+    """
+    from .template_utils import TemplateError
+
+    plans = {}
+    for repo in config.repository.code_repos:
+        try:
+            plan = json.loads(plan_path(config, repo.alias, version).read_text())
+        except (OSError, ValueError, TemplateError):
+            continue
+        if plan.get('plan_version') == PLAN_VERSION and plan.get('version') == version \
+                and plan.get('repo') == repo.link:
+            plans[repo.alias] = plan
+    return plans
+
+
+def draft_paths(plan: Dict[str, Any]) -> Optional[List[Path]]:
+    """
+    Draft files of a plan.
+
+    Returns:
+        The paths, or None if any of them no longer exists (the drafts must
+        then be searched for)
+    """
+    paths = [Path(draft['path']) for draft in plan.get('drafts', [])]
+    if not all(path.is_file() for path in paths):
+        return None
+    return paths
+
+
+def edited_drafts(plan: Dict[str, Any]) -> List[str]:
+    """Paths of a plan's drafts whose content changed since generate wrote them."""
+    edited = []
+    for draft in plan.get('drafts', []):
+        try:
+            if content_hash(Path(draft['path']).read_text()) != draft['sha256']:
+                edited.append(draft['path'])
+        except OSError:
+            edited.append(draft['path'])
+    return edited
+
+
+def refs_are_fresh(plan: Dict[str, Any], git_ops, now: Optional[datetime] = None) -> bool:
+    """
+    Whether a plan's branch decisions can be used without fetching refs.
+
+    True if the remote refs were fetched less than REFS_MAX_AGE ago and
+    the plan's head ref still points at the commit the notes came from.
+
+    Args:
+        plan: Plan (see load_plans)
+        git_ops: GitOperations of the plan's repository
+        now: Reference time (default: now)
+    """
+    fetched_at = plan.get('refs_fetched_at')
+    if not fetched_at or not plan.get('head_sha'):
+        return False
+    now = now or datetime.now()
+    if not timedelta(0) <= now - datetime.fromisoformat(fetched_at) < REFS_MAX_AGE:
+        return False
+    try:
+        return git_ops.repo.commit(plan['head_ref']).hexsha == plan['head_sha']
+    except Exception:
+        return False
@@ -4,8 +4,21 @@
 
 """Template rendering utilities using Jinja2."""
 
-from typing import Dict, Set, Any, List, Optional, TYPE_CHECKING
-from jinja2 import Template, TemplateSyntaxError, UndefinedError, StrictUndefined
+import hashlib
+from pathlib import Path
+from typing import Dict, Set, Any, List, Optional, Tuple, TYPE_CHECKING
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    StrictUndefined,
+    Template,
+    TemplateNotFound,
+    TemplateSyntaxError,
+    UndefinedError,
+)
+
+from .profiling import cache as record_cache
 
 if TYPE_CHECKING:
     from .config import Config
@@ -16,6 +29,123 @@ class TemplateError(Exception):
     pass
 
 
+# Number of compiled templates kept per environment
+TEMPLATE_CACHE_SIZE = 512
+
+
+class _SourceLoader(BaseLoader):
+    """
+    Loader that serves inline template strings by content hash.
+
+    Template sources are registered under the SHA-1 of their text, so the
+    Environment's template cache (and the optional bytecode cache) are keyed
+    by source: identical template strings are parsed and compiled only once.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, str] = {}
+        # Number of sources handed to Jinja2, i.e. template cache misses
+        self.loads = 0
+
+    def register(self, source: str) -> str:
+        """Register a template source and return its cache name."""
+        name = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        self._sources.setdefault(name, source)
+        return name
+
+    def get_source(self, environment: Environment, name: str):
+        try:
+            source = self._sources[name]
+        except KeyError:
+            raise TemplateNotFound(name)
+        self.loads += 1
+        # Sources are immutable for a given name, so never stale
+        return source, None, lambda: True
+
+
+class _CountingBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that records its hits and misses."""
+
+    def load_bytecode(self, bucket) -> None:
+        super().load_bytecode(bucket)
+        found = bucket.code is not None
+        record_cache('templates.bytecode', hits=int(found), misses=int(not found))
+
+
+_loader = _SourceLoader()
+
+# Strict environment: used for paths, branch names, PR/issue templates
+_strict_env = Environment(
+    loader=_loader,
+    undefined=StrictUndefined,
+    cache_size=TEMPLATE_CACHE_SIZE,
+    auto_reload=False,
+)
+
+# Lenient environment: release note templates tolerate missing fields
+_lenient_env = Environment(
+    loader=_loader,
+    cache_size=TEMPLATE_CACHE_SIZE,
+    auto_reload=False,
+)
+
+
+def get_environment(strict: bool = True) -> Environment:
+    """
+    Get the shared Jinja2 environment.
+
+    Args:
+        strict: If True, return the environment using StrictUndefined
+
+    Returns:
+        Shared Environment instance
+    """
+    return _strict_env if strict else _lenient_env
+
+
+def get_template(template_str: str, strict: bool = True) -> Template:
+    """
+    Get a compiled template for a template string.
+
+    Templates are compiled once per source and reused across calls.
+
+    Args:
+        template_str: Jinja2 template string
+        strict: If True, undefined variables raise an error when rendering
+
+    Returns:
+        Compiled Jinja2 Template
+
+    Raises:
+        TemplateSyntaxError: If the template syntax is invalid
+    """
+    loads = _loader.loads
+    template = get_environment(strict).get_template(_loader.register(template_str))
+    compiled = _loader.loads != loads
+    record_cache('templates', hits=int(not compiled), misses=int(compiled))
+    return template
+
+
+def configure_bytecode_cache(directory: Optional[str]) -> None:
+    """
+    Enable (or disable) the on-disk Jinja2 bytecode cache.
+
+    Compiled template code is stored in the directory keyed by template
+    source checksum, so later runs skip compilation entirely.
+
+    Args:
+        directory: Cache directory, or None to disable the bytecode cache
+    """
+    bytecode_cache = None
+    if directory:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = _CountingBytecodeCache(str(path))
+
+    for env in (_strict_env, _lenient_env):
+        env.bytecode_cache = bytecode_cache
+
+
 def render_template(template_str: str, context: Dict[str, Any]) -> str:
     """
     Render a Jinja2 template with the given context.
@@ -31,8 +161,8 @@ def render_template(template_str: str, context: Dict[str, Any]) -> str:
         TemplateError: If template syntax is invalid or uses undefined variables
     """
     try:
-        # Use StrictUndefined to raise errors for undefined variables
-        template = Template(template_str, undefined=StrictUndefined)
+        # Strict environment raises errors for undefined variables
+        template = get_template(template_str, strict=True)
         return template.render(**context)
     except TemplateSyntaxError as e:
         raise TemplateError(f"Invalid template syntax: {e}")
@@ -42,6 +172,65 @@ def render_template(template_str: str, context: Dict[str, Any]) -> str:
         raise TemplateError(f"Template rendering error: {e}")
 
 
+def _config_templates(config: "Config") -> List[Tuple[str, Optional[str], bool]]:
+    """
+    List every template configured in a Config.
+
+    Returns:
+        List of (name, template source, strict) tuples
+    """
+    notes = config.release_notes
+    output = config.output
+    templates: List[Tuple[str, Optional[str], bool]] = [
+        ('release_notes.title_template', notes.title_template, False),
+        ('release_notes.description_template', notes.description_template, False),
+        ('release_notes.entry_template', notes.entry_template, False),
+        ('release_notes.release_output_template', notes.release_output_template, False),
+        ('release_notes.doc_output_template', notes.doc_output_template, False),
+        ('output.draft_output_path', output.draft_output_path, True),
+        ('output.assets_path', output.assets_path, True),
+        ('output.pr_templates.branch_template', output.pr_templates.branch_template, True),
+        ('output.pr_templates.title_template', output.pr_templates.title_template, True),
+        ('output.pr_templates.body_template', output.pr_templates.body_template, True),
+        ('output.issue_templates.title_template', output.issue_templates.title_template, True),
+        ('output.issue_templates.body_template', output.issue_templates.body_template, True),
+    ]
+    for alias, pr_code_config in output.pr_code.items():
+        for i, template_config in enumerate(pr_code_config.templates):
+            prefix = f"output.pr_code.{alias}.templates[{i}]"
+            templates.append((f"{prefix}.output_template", template_config.output_template, False))
+            templates.append((f"{prefix}.output_path", template_config.output_path, True))
+    return templates
+
+
+def compile_config_templates(config: "Config") -> int:
+    """
+    Compile every template configured in a Config.
+
+    Validates template syntax up front and warms the shared template cache,
+    so later renders only execute already-compiled code.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Number of templates compiled
+
+    Raises:
+        TemplateError: If any template has invalid syntax
+    """
+    compiled = 0
+    for name, source, strict in _config_templates(config):
+        if not source:
+            continue
+        try:
+            get_template(source, strict=strict)
+        except TemplateSyntaxError as e:
+            raise TemplateError(f"Invalid {name} syntax: {e}")
+        compiled += 1
+    return compiled
+
+
 def validate_template_vars(
     template_str: str,
     available_vars: Set[str],
@@ -63,9 +252,8 @@ def validate_template_vars(
     """
     try:
         # Parse template to find variable references
-        from jinja2 import meta, Environment
-        env = Environment()
-        ast = env.parse(template_str)
+        from jinja2 import meta
+        ast = _strict_env.parse(template_str)
         referenced_vars = meta.find_undeclared_variables(ast)
 
         # Check if any referenced vars are not in available_vars
@@ -101,9 +289,7 @@ def get_template_variables(template_str: str) -> Set[str]:
     """
     try:
         from jinja2 import meta
-        template = Template(template_str)
-        env = template.environment
-        ast = env.parse(template_str)
+        ast = _strict_env.parse(template_str)
         return meta.find_undeclared_variables(ast)
     except TemplateSyntaxError as e:
         raise TemplateError(f"Invalid template syntax: {e}")
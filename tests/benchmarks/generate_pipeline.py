@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Stage timings of the `generate` pipeline.
+
+Runs the same steps as `generate_notes_for_policy` in
+`release_tool.commands.generate`, for the pending release of a synthetic
+fixture, and times each of them. Keep the stages in step with that
+function when it changes.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from release_tool.config import ReleaseVersionPolicy
+from release_tool.db import Database
+from release_tool.git_ops import GitOperations, find_comparison_version_for_docs, get_release_commit_range
+from release_tool.models import SemanticVersion
+from release_tool.policies import CommitConsolidator, IssueExtractor, ReleaseNoteGenerator
+
+from .synthetic import CODE_REPO, Fixture
+
+STAGES = (
+    'version_tags',
+    'git_walk',
+    'commit_conversion',
+    'pr_map',
+    'consolidation',
+    'issue_resolution',
+    'duplicate_check',
+    'rendering',
+)
+
+
+class StageTimer:
+    """Accumulates wall-clock time per stage."""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def run_pipeline(fixture: Fixture) -> Dict[str, Any]:
+    """
+    Generate the notes of the fixture's pending release once.
+
+    Returns:
+        Dictionary with 'stages' (seconds per stage) and 'counts' (sizes
+        of the intermediate results, to check runs did the same work).
+    """
+    from release_tool.commands.generate import _check_inter_release_duplicates, _filter_by_inclusion_policy
+
+    config = fixture.config()
+    timer = StageTimer()
+    target_version = SemanticVersion.parse(fixture.target_version)
+    policy = ReleaseVersionPolicy.INCLUDE_RCS
+
+    db = Database(str(fixture.db_path))
+    db.connect()
+    db.configure_note_sections(
+        config.issue_policy.description_section_regex,
+        config.issue_policy.migration_section_regex
+    )
+    try:
+        repo_id = db.get_repository_id(CODE_REPO)
+        if not fixture.scale.index_commits:
+            # Every run converts from git, as without a prior pull
+            db.cursor.execute("DELETE FROM commits WHERE repo_id = ?", (repo_id,))
+            db.conn.commit()
+        git_ops = GitOperations(str(fixture.repo_path))
+
+        with timer.stage('version_tags'):
+            available_versions = git_ops.get_version_tags()
+            from_ver = find_comparison_version_for_docs(target_version, available_versions, policy=policy)
+
+        with timer.stage('git_walk'):
+            comparison_version, commits = get_release_commit_range(
+                git_ops, target_version, from_ver, head_ref='main'
+            )
+
+        with timer.stage('commit_conversion'):
+            indexed_commits = db.get_commits_by_shas(repo_id, [c.hexsha for c in commits])
+            commit_models = []
+            for git_commit in commits:
+                commit_model = indexed_commits.get(git_commit.hexsha)
+                if commit_model is None:
+                    commit_model = git_ops.commit_to_model(git_commit, repo_id)
+                    db.upsert_commit(commit_model)
+                commit_models.append(commit_model)
+
+        with timer.stage('pr_map'):
+            pr_map = {}
+            for commit in commit_models:
+                if commit.pr_number:
+                    pr = db.get_pull_request(repo_id, commit.pr_number)
+                    if pr:
+                        pr_map[commit.pr_number] = pr
+
+        with timer.stage('consolidation'):
+            extractor = IssueExtractor(config)
+            consolidator = CommitConsolidator(config, extractor)
+            changes = consolidator.consolidate(commit_models, pr_map)
+            consolidator.handle_missing_issues(changes)
+
+        with timer.stage('issue_resolution'):
+            expected_repo_ids = {db.get_repository_id(name) for name in config.get_issue_repos()}
+            unresolved = 0
+            for change in changes:
+                if change.issue_key:
+                    issue = db.get_issue_by_key(change.issue_key)
+                    if not issue or issue.repo_id not in expected_repo_ids:
+                        unresolved += 1
+                    change.issue = issue
+
+        with timer.stage('duplicate_check'):
+            deduplicated = _check_inter_release_duplicates(
+                changes, target_version, db, repo_id, config, False
+            )
+            deduplicated = _filter_by_inclusion_policy(deduplicated, config, False)
+
+        with timer.stage('rendering'):
+            note_generator = ReleaseNoteGenerator(config)
+            notes = [note_generator.create_release_note(change, change.issue) for change in deduplicated]
+            grouped_notes = note_generator.group_by_category(notes)
+            content = note_generator._format_with_master_template(
+                grouped_notes, fixture.target_version, None, None
+            )
+    finally:
+        db.close()
+
+    return {
+        'stages': timer.timings,
+        'counts': {
+            'commits': len(commits),
+            'prs': len(pr_map),
+            'changes': len(changes),
+            'unresolved_issues': unresolved,
+            'duplicates_removed': len(changes) - len(deduplicated),
+            'notes': len(notes),
+            'rendered_bytes': len((content or '').encode('utf-8')),
+        },
+        'comparison_version': comparison_version.to_string() if comparison_version else None,
+    }
+
+
+def benchmark(fixture: Fixture, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Run the pipeline `repeat` times and keep the fastest time of each stage.
+
+    The minimum is the least noisy estimate on a shared machine; all runs
+    are kept under 'runs'.
+    """
+    runs: List[Dict[str, Any]] = [run_pipeline(fixture) for _ in range(max(repeat, 1))]
+    stages = {name: min(run['stages'][name] for run in runs) for name in STAGES}
+    return {
+        'stages': stages,
+        'total': sum(stages.values()),
+        'counts': runs[-1]['counts'],
+        'comparison_version': runs[-1]['comparison_version'],
+        'runs': [run['stages'] for run in runs],
+    }
+
+
+def compare_to_baseline(
+    stages: Dict[str, float],
+    baseline: Optional[Dict[str, float]],
+    threshold: float = 0.25,
+    min_delta: float = 0.005
+) -> List[Dict[str, Any]]:
+    """
+    Compare stage timings with a baseline.
+
+    A stage regresses when it is more than `threshold` (relative) and
+    `min_delta` seconds (absolute, to ignore jitter on fast stages)
+    slower than the baseline, and improves in the symmetric case.
+
+    Returns:
+        One row per stage with 'stage', 'baseline', 'current', 'change'
+        (relative, None without baseline) and 'status' ('regression',
+        'improvement', 'ok' or 'new').
+    """
+    rows = []
+    for name, current in stages.items():
+        previous = (baseline or {}).get(name)
+        if previous is None:
+            rows.append({'stage': name, 'baseline': None, 'current': current, 'change': None, 'status': 'new'})
+            continue
+        change = (current - previous) / previous if previous > 0 else 0.0
+        if change > threshold and current - previous > min_delta:
+            status = 'regression'
+        elif change < -threshold and previous - current > min_delta:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'stage': name, 'baseline': previous, 'current': current, 'change': change, 'status': status})
+    return rows
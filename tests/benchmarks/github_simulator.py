@@ -0,0 +1,1027 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Local stand-in for the GitHub API.
+
+Serves the subset of REST and GraphQL endpoints release-tool uses, from
+seeded synthetic data, so `pull` can be load-tested offline: point
+`github.api_url` at `GitHubSimulator.url`.
+
+    with GitHubSimulator([SimulatedRepository("test/meta", issues=100_000)]) as sim:
+        config.github.api_url = sim.url
+        ...
+        print(sim.stats)
+
+REST: repositories, issues and pulls (list with pagination, single
+items), releases, git refs, blobs, trees and commits, contents, repository
+events, issue search, /user and /rate_limit. GraphQL (/graphql): issue node IDs, issue types,
+projectsV2 lookups, fields and item mutations.
+
+Items are generated from their number, so 100k-item repositories cost
+nothing until requested. Issues take the numbers 1..issues and pull
+requests the numbers after them; `/issues` lists both, like GitHub.
+
+Behaviour knobs: per-request latency, maximum page size, ETags with 304
+responses (which, like on GitHub, do not count against the rate limit),
+a primary rate limit per window, a secondary rate limit on concurrent
+requests, and fault injection (random or after N requests).
+"""
+
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+BASE_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+LABELS = ["bug", "feature", "docs", "enhancement", "security"]
+USERS = 25
+SEARCH_RESULT_LIMIT = 1000
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _parse_iso(value: str) -> datetime:
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _sha(*parts: Any) -> str:
+    return hashlib.sha1("/".join(str(p) for p in parts).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class SimulatedRepository:
+    """A seeded repository: item counts drive the synthetic data."""
+
+    full_name: str
+    issues: int = 0
+    pull_requests: int = 0
+    releases: int = 0
+    default_branch: str = "main"
+    unmerged_every: int = 10
+
+    @property
+    def owner(self) -> str:
+        return self.full_name.split('/')[0]
+
+    @property
+    def name(self) -> str:
+        return self.full_name.split('/')[1]
+
+    def is_pull_request(self, number: int) -> bool:
+        return self.issues < number <= self.issues + self.pull_requests
+
+    def created_at(self, number: int) -> datetime:
+        return BASE_DATE + timedelta(hours=number)
+
+
+class GitHubSimulator:
+    """Threaded HTTP server answering like api.github.com."""
+
+    def __init__(
+        self,
+        repositories: List[SimulatedRepository],
+        latency: float = 0.0,
+        max_page_size: int = 100,
+        etags: bool = True,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: float = 3600.0,
+        max_concurrency: Optional[int] = None,
+        secondary_retry_after: int = 1,
+        fault_rate: float = 0.0,
+        fault_status: int = 502,
+        fault_paths: Optional[str] = None,
+        outage_after: Optional[int] = None,
+        poll_interval: int = 60,
+        projects: int = 1,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            repositories: Seeded repositories
+            latency: Seconds added to every response
+            max_page_size: Cap on per_page (GitHub: 100)
+            etags: Send ETags and answer matching If-None-Match with 304
+            rate_limit: Requests per window before 403 rate limit errors (None: unlimited)
+            rate_limit_window: Length of the primary rate limit window in seconds
+            max_concurrency: In-flight requests above which secondary rate limit errors are returned
+            secondary_retry_after: Retry-After seconds sent with secondary rate limit errors
+            fault_rate: Fraction of requests failing with fault_status
+            fault_status: HTTP status of injected faults
+            fault_paths: Regex limiting faults (and outages) to matching paths
+            outage_after: Fail every matching request after this many requests
+            poll_interval: X-Poll-Interval sent by the events feed
+            projects: Number of projectsV2 per organization
+            seed: Seed for fault injection
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.repositories = {repo.full_name: repo for repo in repositories}
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.etags = etags
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.max_concurrency = max_concurrency
+        self.secondary_retry_after = secondary_retry_after
+        self.fault_rate = fault_rate
+        self.fault_status = fault_status
+        self.fault_paths = re.compile(fault_paths) if fault_paths else None
+        self.outage_after = outage_after
+        self.poll_interval = poll_interval
+        self.projects = projects
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._overrides: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._created_releases: Dict[str, List[Dict[str, Any]]] = {}
+        self._refs: Dict[str, Dict[str, str]] = {}
+        # Git objects by SHA: {'type': 'blob', 'data'}, {'type': 'tree', 'files'}
+        # (files: path -> (mode, blob SHA), flattened) or {'type': 'commit', ...}.
+        # Commits not in the store (seeded branch heads) have an empty tree.
+        self._objects: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._listings: Dict[tuple, List[int]] = {}
+        self._next_event_id = 1
+        self._window_start = time.time()
+        self._window_used = 0
+        self._in_flight = 0
+        self.stats = self._empty_stats()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "GitHubSimulator":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "GitHubSimulator":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            'requests': 0,
+            'by_route': {},
+            'by_status': {},
+            'not_modified': 0,
+            'rate_limited': 0,
+            'secondary_rate_limited': 0,
+            'faults': 0,
+            'max_in_flight': 0,
+            'items_served': 0,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = self._empty_stats()
+
+    def clear_faults(self) -> None:
+        """Stop injecting faults (e.g. to resume after a simulated outage)."""
+        self.fault_rate = 0.0
+        self.outage_after = None
+
+    # -- data mutations ----------------------------------------------------
+
+    def update_issue(self, full_name: str, number: int, **fields: Any) -> None:
+        """Change an issue or PR and record the matching event."""
+        repo = self.repositories[full_name]
+        with self._lock:
+            override = self._overrides.setdefault((full_name, number), {})
+            override.update(fields)
+            override['updated_at'] = _iso(datetime.now(timezone.utc))
+            self._listings.clear()
+        kind = 'PullRequestEvent' if repo.is_pull_request(number) else 'IssuesEvent'
+        key = 'pull_request' if repo.is_pull_request(number) else 'issue'
+        self.add_event(full_name, kind, {'action': fields.get('state', 'edited'), key: {'number': number}})
+
+    def add_issue(self, full_name: str, **fields: Any) -> int:
+        """Append a new issue (numbered after all existing issues and PRs)."""
+        repo = self.repositories[full_name]
+        with self._lock:
+            # Keep PR numbers stable: new issues go after the PR range
+            repo.pull_requests += 1
+            number = repo.issues + repo.pull_requests
+            self._overrides[(full_name, number)] = dict(fields, _kind='issue',
+                                                        updated_at=_iso(datetime.now(timezone.utc)))
+            self._listings.clear()
+        self.add_event(full_name, 'IssuesEvent', {'action': 'opened', 'issue': {'number': number}})
+        return number
+
+    def add_event(self, full_name: str, event_type: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            event = {
+                'id': str(self._next_event_id),
+                'type': event_type,
+                'payload': payload,
+                'repo': {'name': full_name},
+                'created_at': _iso(datetime.now(timezone.utc)),
+            }
+            self._next_event_id += 1
+            self._events.setdefault(full_name, []).insert(0, event)
+
+    def set_file(self, full_name: str, branch: str, path: str, data: bytes) -> str:
+        """Commit a file to a branch (creating the branch) and return the commit SHA."""
+        repo = self.repositories[full_name]
+        refs = self._refs_for(repo)
+        ref = f"refs/heads/{branch}"
+        parent = refs.get(ref) or refs[f"refs/heads/{repo.default_branch}"]
+        files = dict(self._tree_files(self._commit_of(parent)['tree']))
+        files[path] = ('100644', self._store_blob(data))
+        commit_sha = self._store_commit(f"Update {path}", self._store_tree(files), [parent])
+        refs[ref] = commit_sha
+        return commit_sha
+
+    def read_file(self, full_name: str, ref: str, path: str) -> Optional[bytes]:
+        """Content of a file at a branch or commit (None if missing)."""
+        files = self._files_at(self.repositories[full_name], ref)
+        if files is None or path not in files:
+            return None
+        return self._objects[files[path][1]]['data']
+
+    # -- git objects -------------------------------------------------------
+
+    def _store_blob(self, data: bytes) -> str:
+        sha = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+        with self._lock:
+            self._objects.setdefault(sha, {'type': 'blob', 'data': data})
+        return sha
+
+    def _store_tree(self, files: Dict[str, Tuple[str, str]]) -> str:
+        sha = _sha('tree', *(f"{mode} {path} {blob}" for path, (mode, blob) in sorted(files.items())))
+        with self._lock:
+            self._objects.setdefault(sha, {'type': 'tree', 'files': dict(files)})
+        return sha
+
+    def _store_commit(self, message: str, tree: str, parents: List[str]) -> str:
+        sha = _sha('commit', tree, *parents, message, time.time_ns())
+        with self._lock:
+            self._objects[sha] = {'type': 'commit', 'message': message, 'tree': tree, 'parents': parents}
+        return sha
+
+    def _commit_of(self, sha: str) -> Dict[str, Any]:
+        commit = self._objects.get(sha)
+        if commit is None or commit['type'] != 'commit':
+            # Seeded head or tag: an empty commit
+            return {'type': 'commit', 'message': 'Initial commit', 'tree': self._store_tree({}), 'parents': []}
+        return commit
+
+    def _tree_files(self, sha: str) -> Dict[str, Tuple[str, str]]:
+        return self._objects[sha]['files']
+
+    def _files_at(self, repo: SimulatedRepository, ref: str) -> Optional[Dict[str, Tuple[str, str]]]:
+        refs = self._refs_for(repo)
+        sha = refs.get(f"refs/heads/{ref}") or refs.get(f"refs/tags/{ref}")
+        if sha is None:
+            if ref not in self._objects:
+                return None
+            sha = ref
+        return self._tree_files(self._commit_of(sha)['tree'])
+
+    def _commit_json(self, repo: str, sha: str) -> Dict[str, Any]:
+        commit = self._commit_of(sha)
+        person = {'name': 'sim', 'email': 'sim@example.com', 'date': _iso(BASE_DATE)}
+        return {
+            'sha': sha, 'node_id': f"C_{sha[:16]}", 'message': commit['message'],
+            'url': f"{self.url}/repos/{repo}/git/commits/{sha}",
+            'html_url': f"https://github.com/{repo}/commit/{sha}",
+            'author': person, 'committer': person,
+            'tree': {'sha': commit['tree'], 'url': f"{self.url}/repos/{repo}/git/trees/{commit['tree']}"},
+            'parents': [{'sha': parent, 'url': f"{self.url}/repos/{repo}/git/commits/{parent}"}
+                        for parent in commit['parents']],
+        }
+
+    def _tree_json(self, repo: str, sha: str) -> Dict[str, Any]:
+        entries = [
+            {'path': path, 'mode': mode, 'type': 'blob', 'sha': blob,
+             'size': len(self._objects[blob]['data']),
+             'url': f"{self.url}/repos/{repo}/git/blobs/{blob}"}
+            for path, (mode, blob) in sorted(self._tree_files(sha).items())
+        ]
+        return {'sha': sha, 'url': f"{self.url}/repos/{repo}/git/trees/{sha}", 'tree': entries,
+                'truncated': False}
+
+    # -- synthetic items ---------------------------------------------------
+
+    def _is_pr(self, repo: SimulatedRepository, number: int) -> bool:
+        override = self._overrides.get((repo.full_name, number), {})
+        if '_kind' in override:
+            return override['_kind'] == 'pull_request'
+        return repo.is_pull_request(number)
+
+    def _exists(self, repo: SimulatedRepository, number: int) -> bool:
+        return 1 <= number <= repo.issues + repo.pull_requests
+
+    def _user(self, index: int) -> Dict[str, Any]:
+        login = f"dev{index % USERS}"
+        return {
+            'login': login, 'id': 1000 + index % USERS, 'node_id': f"U_{login}", 'type': 'User',
+            'avatar_url': f"https://avatars.example.com/{login}", 'html_url': f"https://github.com/{login}",
+            'url': f"{self.url}/users/{login}",
+        }
+
+    def _labels(self, number: int) -> List[Dict[str, Any]]:
+        name = LABELS[number % len(LABELS)]
+        return [{'id': number % len(LABELS) + 1, 'node_id': f"LA_{name}", 'name': name,
+                 'color': 'ededed', 'description': None, 'default': False}]
+
+    def _issue(self, repo: SimulatedRepository, number: int) -> Dict[str, Any]:
+        created = repo.created_at(number)
+        closed = number % 4 != 0
+        item = {
+            'url': f"{self.url}/repos/{repo.full_name}/issues/{number}",
+            'repository_url': f"{self.url}/repos/{repo.full_name}",
+            'html_url': f"https://github.com/{repo.full_name}/issues/{number}",
+            'id': number, 'node_id': f"I_{_sha(repo.full_name, number)[:16]}", 'number': number,
+            'title': f"Issue {number}: module {number % 50} behaviour",
+            'body': f"Issue body {number}.\n\n## Description\nDetails for issue {number}.\n",
+            'state': 'closed' if closed else 'open',
+            'labels': self._labels(number), 'user': self._user(number), 'assignees': [],
+            'comments': 0, 'locked': False,
+            'created_at': _iso(created),
+            'updated_at': _iso(created + timedelta(days=1)),
+            'closed_at': _iso(created + timedelta(days=1)) if closed else None,
+        }
+        if self._is_pr(repo, number):
+            item['html_url'] = f"https://github.com/{repo.full_name}/pull/{number}"
+            item['pull_request'] = {
+                'url': f"{self.url}/repos/{repo.full_name}/pulls/{number}",
+                'html_url': item['html_url'],
+                'merged_at': self._pull_request(repo, number)['merged_at'],
+            }
+        item.update({k: v for k, v in self._overrides.get((repo.full_name, number), {}).items()
+                     if not k.startswith('_')})
+        return item
+
+    def _pull_request(self, repo: SimulatedRepository, number: int) -> Dict[str, Any]:
+        created = repo.created_at(number)
+        merged = number % repo.unmerged_every != 0
+        issue = (number - repo.issues) // 2 + 1
+        branch = f"feat/meta-{issue}/main"
+        item = {
+            'url': f"{self.url}/repos/{repo.full_name}/pulls/{number}",
+            'html_url': f"https://github.com/{repo.full_name}/pull/{number}",
+            'issue_url': f"{self.url}/repos/{repo.full_name}/issues/{number}",
+            'id': number, 'node_id': f"PR_{_sha(repo.full_name, number)[:16]}", 'number': number,
+            'title': f"Improve module {number % 50} handling",
+            'body': f"Parent issue: https://github.com/{repo.owner}/meta/issues/{issue}",
+            'state': 'closed', 'locked': False, 'draft': False,
+            'user': self._user(number), 'labels': self._labels(number),
+            'created_at': _iso(created),
+            'updated_at': _iso(created + timedelta(hours=2)),
+            'closed_at': _iso(created + timedelta(hours=2)),
+            'merged_at': _iso(created + timedelta(hours=2)) if merged else None,
+            'merge_commit_sha': _sha(repo.full_name, 'merge', number) if merged else None,
+            'base': {'ref': repo.default_branch, 'sha': _sha(repo.full_name, 'base', number),
+                     'label': f"{repo.owner}:{repo.default_branch}"},
+            'head': {'ref': branch, 'sha': _sha(repo.full_name, 'head', number),
+                     'label': f"{repo.owner}:{branch}"},
+        }
+        item.update({k: v for k, v in self._overrides.get((repo.full_name, number), {}).items()
+                     if not k.startswith('_')})
+        return item
+
+    def _release(self, repo: SimulatedRepository, release_id: int) -> Dict[str, Any]:
+        tag = f"v{release_id // 100}.{(release_id // 10) % 10}.{release_id % 10}"
+        created = BASE_DATE + timedelta(days=release_id)
+        return {
+            'url': f"{self.url}/repos/{repo.full_name}/releases/{release_id}",
+            'html_url': f"https://github.com/{repo.full_name}/releases/tag/{tag}",
+            'id': release_id, 'node_id': f"RE_{release_id}", 'tag_name': tag, 'name': tag,
+            'body': f"Release {tag}\n\n- Improve module {release_id % 50} handling #{release_id}",
+            'draft': False, 'prerelease': False, 'target_commitish': repo.default_branch,
+            'created_at': _iso(created), 'published_at': _iso(created),
+            'author': self._user(release_id), 'assets': [],
+        }
+
+    def _repository(self, repo: SimulatedRepository) -> Dict[str, Any]:
+        return {
+            'id': int(_sha(repo.full_name)[:8], 16), 'node_id': f"R_{_sha(repo.full_name)[:16]}",
+            'name': repo.name, 'full_name': repo.full_name, 'private': False,
+            'owner': {'login': repo.owner, 'id': 1, 'type': 'Organization'},
+            'html_url': f"https://github.com/{repo.full_name}",
+            'url': f"{self.url}/repos/{repo.full_name}",
+            'default_branch': repo.default_branch,
+            'clone_url': f"https://github.com/{repo.full_name}.git",
+        }
+
+    def _refs_for(self, repo: SimulatedRepository) -> Dict[str, str]:
+        refs = self._refs.get(repo.full_name)
+        if refs is None:
+            refs = {f"refs/heads/{repo.default_branch}": _sha(repo.full_name, 'head')}
+            for release_id in range(1, repo.releases + 1):
+                refs[f"refs/tags/{self._release(repo, release_id)['tag_name']}"] = _sha(repo.full_name, 'tag', release_id)
+            self._refs[repo.full_name] = refs
+        return refs
+
+    def _ref_json(self, repo: SimulatedRepository, ref: str, sha: str) -> Dict[str, Any]:
+        return {
+            'ref': ref, 'node_id': f"REF_{_sha(ref)[:12]}",
+            'url': f"{self.url}/repos/{repo.full_name}/git/{ref}",
+            'object': {'sha': sha, 'type': 'commit',
+                       'url': f"{self.url}/repos/{repo.full_name}/git/commits/{sha}"},
+        }
+
+    def _listing(self, repo: SimulatedRepository, kind: str, params: Dict[str, str]) -> List[int]:
+        """Numbers listed by /issues or /pulls for the query (cached until data changes)."""
+        state = params.get('state', 'open')
+        sort = params.get('sort', 'created')
+        direction = params.get('direction', 'desc')
+        since = params.get('since')
+        key = (repo.full_name, kind, state, sort, direction, since)
+        with self._lock:
+            cached = self._listings.get(key)
+        if cached is not None:
+            return cached
+
+        numbers = []
+        since_value = _parse_iso(since) if since else None
+        for number in range(1, repo.issues + repo.pull_requests + 1):
+            if kind == 'pulls' and not self._is_pr(repo, number):
+                continue
+            item = self._pull_request(repo, number) if kind == 'pulls' else self._issue(repo, number)
+            if state != 'all' and item['state'] != state:
+                continue
+            if since_value and _parse_iso(item['updated_at']) < since_value:
+                continue
+            numbers.append((item['updated_at'] if sort == 'updated' else number, number))
+        numbers.sort(reverse=direction == 'desc')
+        result = [number for _, number in numbers]
+        with self._lock:
+            self._listings[key] = result
+        return result
+
+    # -- routing -----------------------------------------------------------
+
+    def _handler_class(self):
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002 - silence request logging
+                pass
+
+            def do_GET(self):
+                simulator._dispatch(self, 'GET')
+
+            def do_POST(self):
+                simulator._dispatch(self, 'POST')
+
+            def do_PUT(self):
+                simulator._dispatch(self, 'PUT')
+
+            def do_PATCH(self):
+                simulator._dispatch(self, 'PATCH')
+
+            def do_DELETE(self):
+                simulator._dispatch(self, 'DELETE')
+
+        return Handler
+
+    ROUTES: List[Tuple[str, str, str]] = [
+        ('GET', r'/user', '_get_user'),
+        ('GET', r'/rate_limit', '_get_rate_limit'),
+        ('GET', r'/search/issues', '_search_issues'),
+        ('POST', r'/graphql', '_graphql'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)', '_get_repo'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/issues', '_list_issues'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/issues/(?P<number>\d+)', '_get_issue'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/pulls', '_list_pulls'),
+        ('POST', r'/repos/(?P<repo>[^/]+/[^/]+)/pulls', '_create_pull'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)', '_get_pull'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/releases', '_list_releases'),
+        ('POST', r'/repos/(?P<repo>[^/]+/[^/]+)/releases', '_create_release'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/releases/tags/(?P<tag>.+)', '_get_release_by_tag'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/releases/(?P<release_id>\d+)', '_get_release'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/git/(?:ref|refs)/(?P<ref>.+)', '_get_ref'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/git/matching-refs/(?P<ref>.+)', '_matching_refs'),
+        ('POST', r'/repos/(?P<repo>[^/]+/[^/]+)/git/refs', '_create_ref'),
+        ('PATCH', r'/repos/(?P<repo>[^/]+/[^/]+)/git/refs/(?P<ref>.+)', '_update_ref'),
+        ('DELETE', r'/repos/(?P<repo>[^/]+/[^/]+)/git/refs/(?P<ref>.+)', '_delete_ref'),
+        ('POST', r'/repos/(?P<repo>[^/]+/[^/]+)/git/blobs', '_create_blob'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/git/trees/(?P<sha>[^/]+)', '_get_tree'),
+        ('POST', r'/repos/(?P<repo>[^/]+/[^/]+)/git/trees', '_create_tree'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/git/commits/(?P<sha>[^/]+)', '_get_commit'),
+        ('POST', r'/repos/(?P<repo>[^/]+/[^/]+)/git/commits', '_create_commit'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/contents/(?P<path>.+)', '_get_contents'),
+        ('PUT', r'/repos/(?P<repo>[^/]+/[^/]+)/contents/(?P<path>.+)', '_put_contents'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/events', '_list_events'),
+    ]
+    _COMPILED = [(method, re.compile(pattern + r'/?$'), handler) for method, pattern, handler in ROUTES]
+
+    def _dispatch(self, request: BaseHTTPRequestHandler, method: str) -> None:
+        parsed = urlparse(request.path)
+        path = unquote(parsed.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        length = int(request.headers.get('Content-Length') or 0)
+        body = json.loads(request.rfile.read(length) or b'{}') if length else {}
+
+        with self._lock:
+            self._in_flight += 1
+            self.stats['requests'] += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+            in_flight = self._in_flight
+            request_index = self.stats['requests']
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+
+            route = None
+            match = None
+            for route_method, pattern, handler in self._COMPILED:
+                if route_method == method:
+                    match = pattern.match(path)
+                    if match:
+                        route = handler
+                        break
+            self._count('by_route', f"{method} {route or 'unknown'}")
+
+            error = self._limits_and_faults(path, in_flight, request_index)
+            if error:
+                status, payload, headers = error
+            elif not request.headers.get('Authorization'):
+                status, payload, headers = 401, {'message': 'Requires authentication'}, {}
+            elif route is None:
+                status, payload, headers = 404, {'message': 'Not Found'}, {}
+            else:
+                result = getattr(self, route)(params=params, body=body, **match.groupdict())
+                status, payload, headers = result if len(result) == 3 else (*result, {})
+            self._respond(request, status, payload, headers)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _count(self, bucket: str, key: str) -> None:
+        with self._lock:
+            self.stats[bucket][key] = self.stats[bucket].get(key, 0) + 1
+
+    def _limits_and_faults(self, path: str, in_flight: int, request_index: int):
+        if self.max_concurrency is not None and in_flight > self.max_concurrency:
+            with self._lock:
+                self.stats['secondary_rate_limited'] += 1
+            return 403, {
+                'message': 'You have exceeded a secondary rate limit. Please wait a few minutes before you try again.',
+                'documentation_url': 'https://docs.github.com/rest/overview/rate-limits-for-the-rest-api',
+            }, {'Retry-After': str(self.secondary_retry_after)}
+
+        if self.rate_limit is not None:
+            with self._lock:
+                if time.time() - self._window_start >= self.rate_limit_window:
+                    self._window_start = time.time()
+                    self._window_used = 0
+                exhausted = self._window_used >= self.rate_limit
+                if exhausted:
+                    self.stats['rate_limited'] += 1
+            if exhausted:
+                return 403, {
+                    'message': 'API rate limit exceeded for user ID 1.',
+                    'documentation_url': 'https://docs.github.com/rest/overview/rate-limits-for-the-rest-api',
+                }, {'X-RateLimit-Remaining': '0'}
+
+        if self.fault_paths is None or self.fault_paths.search(path):
+            outage = self.outage_after is not None and request_index > self.outage_after
+            with self._lock:
+                random_fault = self.fault_rate and self._random.random() < self.fault_rate
+            if outage or random_fault:
+                with self._lock:
+                    self.stats['faults'] += 1
+                return self.fault_status, {'message': 'Server Error (simulated)'}, {}
+        return None
+
+    def _respond(self, request: BaseHTTPRequestHandler, status: int, payload: Any,
+                 headers: Dict[str, str]) -> None:
+        data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        headers = dict(headers)
+
+        if status == 200 and self.etags and request.command == 'GET':
+            etag = f'W/"{hashlib.sha1(data).hexdigest()}"'
+            headers['ETag'] = etag
+            if request.headers.get('If-None-Match') == etag:
+                status, data = 304, b''
+                with self._lock:
+                    self.stats['not_modified'] += 1
+
+        if self.rate_limit is not None:
+            with self._lock:
+                if status not in (304, 403):
+                    # Conditional hits do not count against the rate limit
+                    self._window_used += 1
+                remaining = max(self.rate_limit - self._window_used, 0)
+                reset = int(self._window_start + self.rate_limit_window) + 1
+            headers.setdefault('X-RateLimit-Limit', str(self.rate_limit))
+            headers.setdefault('X-RateLimit-Remaining', str(remaining))
+            headers.setdefault('X-RateLimit-Reset', str(reset))
+            headers.setdefault('X-RateLimit-Resource', 'core')
+
+        self._count('by_status', str(status))
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json; charset=utf-8')
+        request.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        if data:
+            request.wfile.write(data)
+
+    def _paginate(self, items: List[Any], params: Dict[str, str], path: str,
+                  render: Callable[[Any], Dict[str, Any]]):
+        per_page = min(int(params.get('per_page', 30)), self.max_page_size)
+        page = max(int(params.get('page', 1)), 1)
+        chunk = items[(page - 1) * per_page:page * per_page]
+        payload = [render(item) for item in chunk]
+        with self._lock:
+            self.stats['items_served'] += len(payload)
+
+        last = max((len(items) + per_page - 1) // per_page, 1)
+        links = []
+        query = {k: v for k, v in params.items() if k != 'page'}
+        for rel, number in (('next', page + 1), ('last', last), ('first', 1), ('prev', page - 1)):
+            if 1 <= number <= last and number != page:
+                link_query = "&".join(f"{k}={v}" for k, v in {**query, 'page': number}.items())
+                links.append(f'<{self.url}{path}?{link_query}>; rel="{rel}"')
+        return 200, payload, ({'Link': ", ".join(links)} if links else {})
+
+    def _repo(self, repo: str) -> Optional[SimulatedRepository]:
+        return self.repositories.get(repo)
+
+    @staticmethod
+    def _not_found():
+        return 404, {'message': 'Not Found', 'documentation_url': 'https://docs.github.com/rest'}
+
+    # -- REST handlers -----------------------------------------------------
+
+    def _get_user(self, params, body):
+        return 200, self._user(0)
+
+    def _get_rate_limit(self, params, body):
+        with self._lock:
+            used = self._window_used
+        limit = self.rate_limit or 5000
+        core = {'limit': limit, 'used': used, 'remaining': max(limit - used, 0),
+                'reset': int(self._window_start + self.rate_limit_window)}
+        return 200, {'resources': {'core': core, 'search': core, 'graphql': core}, 'rate': core}
+
+    def _get_repo(self, params, body, repo):
+        found = self._repo(repo)
+        return (200, self._repository(found)) if found else self._not_found()
+
+    def _list_issues(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        numbers = self._listing(found, 'issues', params)
+        return self._paginate(numbers, params, f"/repos/{repo}/issues", lambda n: self._issue(found, n))
+
+    def _get_issue(self, params, body, repo, number):
+        found = self._repo(repo)
+        if not found or not self._exists(found, int(number)):
+            return self._not_found()
+        return 200, self._issue(found, int(number))
+
+    def _list_pulls(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        numbers = self._listing(found, 'pulls', params)
+        if params.get('head'):
+            branch = params['head'].split(':', 1)[-1]
+            numbers = [n for n in numbers if self._pull_request(found, n)['head']['ref'] == branch]
+        return self._paginate(numbers, params, f"/repos/{repo}/pulls", lambda n: self._pull_request(found, n))
+
+    def _get_pull(self, params, body, repo, number):
+        found = self._repo(repo)
+        if not found or not self._is_pr(found, int(number)) or not self._exists(found, int(number)):
+            return self._not_found()
+        return 200, self._pull_request(found, int(number))
+
+    def _create_pull(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        with self._lock:
+            found.pull_requests += 1
+            number = found.issues + found.pull_requests
+            self._overrides[(repo, number)] = {
+                '_kind': 'pull_request', 'title': body.get('title', ''), 'body': body.get('body'),
+                'state': 'open', 'merged_at': None, 'closed_at': None, 'merge_commit_sha': None,
+                'head': {'ref': body.get('head', ''), 'sha': _sha(repo, 'head', number)},
+                'base': {'ref': body.get('base', found.default_branch), 'sha': _sha(repo, 'base', number)},
+            }
+            self._listings.clear()
+        return 201, self._pull_request(found, number)
+
+    def _releases_of(self, repo: SimulatedRepository) -> List[Dict[str, Any]]:
+        created = self._created_releases.get(repo.full_name, [])
+        return created[::-1] + [self._release(repo, i) for i in range(repo.releases, 0, -1)]
+
+    def _list_releases(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        return self._paginate(self._releases_of(found), params, f"/repos/{repo}/releases", lambda r: r)
+
+    def _create_release(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        with self._lock:
+            created = self._created_releases.setdefault(repo, [])
+            release_id = 1_000_000 + len(created)
+            release = dict(self._release(found, release_id), id=release_id, tag_name=body.get('tag_name'),
+                           name=body.get('name'), body=body.get('body'), draft=bool(body.get('draft')),
+                           prerelease=bool(body.get('prerelease')),
+                           target_commitish=body.get('target_commitish', found.default_branch),
+                           html_url=f"https://github.com/{repo}/releases/tag/{body.get('tag_name')}")
+            created.append(release)
+        return 201, release
+
+    def _get_release(self, params, body, repo, release_id):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        for release in self._releases_of(found):
+            if release['id'] == int(release_id):
+                return 200, release
+        return self._not_found()
+
+    def _get_release_by_tag(self, params, body, repo, tag):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        for release in self._releases_of(found):
+            if release['tag_name'] == tag:
+                return 200, release
+        return self._not_found()
+
+    def _get_ref(self, params, body, repo, ref):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        full_ref = ref if ref.startswith('refs/') else f"refs/{ref}"
+        sha = self._refs_for(found).get(full_ref)
+        return (200, self._ref_json(found, full_ref, sha)) if sha else self._not_found()
+
+    def _matching_refs(self, params, body, repo, ref):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        prefix = f"refs/{ref}"
+        refs = [(name, sha) for name, sha in sorted(self._refs_for(found).items()) if name.startswith(prefix)]
+        return self._paginate(refs, params, f"/repos/{repo}/git/matching-refs/{ref}",
+                              lambda entry: self._ref_json(found, *entry))
+
+    def _create_ref(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        refs = self._refs_for(found)
+        if body.get('ref') in refs:
+            return 422, {'message': 'Reference already exists'}
+        refs[body['ref']] = body['sha']
+        return 201, self._ref_json(found, body['ref'], body['sha'])
+
+    def _update_ref(self, params, body, repo, ref):
+        found = self._repo(repo)
+        full_ref = f"refs/{ref}"
+        if not found or full_ref not in self._refs_for(found):
+            return self._not_found()
+        current = self._refs_for(found)[full_ref]
+        if not body.get('force') and current not in self._commit_of(body['sha'])['parents'] \
+                and current != body['sha']:
+            return 422, {'message': 'Update is not a fast forward'}
+        self._refs_for(found)[full_ref] = body['sha']
+        return 200, self._ref_json(found, full_ref, body['sha'])
+
+    def _delete_ref(self, params, body, repo, ref):
+        found = self._repo(repo)
+        full_ref = f"refs/{ref}"
+        if not found or full_ref not in self._refs_for(found):
+            return 422, {'message': 'Reference does not exist'}
+        del self._refs_for(found)[full_ref]
+        return 204, None
+
+    def _content_json(self, repo: str, path: str, data: bytes, ref: str) -> Dict[str, Any]:
+        return {
+            'type': 'file', 'encoding': 'base64', 'size': len(data),
+            'name': path.rsplit('/', 1)[-1], 'path': path,
+            'content': base64.b64encode(data).decode('ascii'),
+            'sha': hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest(),
+            'url': f"{self.url}/repos/{repo}/contents/{path}?ref={ref}",
+            'html_url': f"https://github.com/{repo}/blob/{ref}/{path}",
+        }
+
+    def _get_contents(self, params, body, repo, path):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        ref = params.get('ref', found.default_branch)
+        data = self.read_file(repo, ref, path)
+        return (200, self._content_json(repo, path, data, ref)) if data is not None else self._not_found()
+
+    def _put_contents(self, params, body, repo, path):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        branch = body.get('branch', found.default_branch)
+        existing = self.read_file(repo, branch, path)
+        if existing is not None and body.get('sha') != self._content_json(repo, path, existing, branch)['sha']:
+            return 409, {'message': f"{path} does not match {body.get('sha')}"}
+        data = base64.b64decode(body.get('content', ''))
+        commit_sha = self.set_file(repo, branch, path, data)
+        return (200 if existing is not None else 201), {
+            'content': self._content_json(repo, path, data, branch),
+            'commit': self._commit_json(repo, commit_sha),
+        }
+
+    def _create_blob(self, params, body, repo):
+        if not self._repo(repo):
+            return self._not_found()
+        content = body.get('content', '')
+        data = base64.b64decode(content) if body.get('encoding') == 'base64' else content.encode('utf-8')
+        sha = self._store_blob(data)
+        return 201, {'sha': sha, 'url': f"{self.url}/repos/{repo}/git/blobs/{sha}"}
+
+    def _get_tree(self, params, body, repo, sha):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        obj = self._objects.get(sha)
+        if obj is not None and obj['type'] == 'commit':
+            sha = obj['tree']
+        elif obj is None or obj['type'] != 'tree':
+            files = self._files_at(found, sha)
+            if files is None:
+                return self._not_found()
+            sha = self._store_tree(files)
+        return 200, self._tree_json(repo, sha)
+
+    def _create_tree(self, params, body, repo):
+        if not self._repo(repo):
+            return self._not_found()
+        base = body.get('base_tree')
+        if base and (base not in self._objects or self._objects[base]['type'] != 'tree'):
+            return 422, {'message': 'Invalid base_tree'}
+        files = dict(self._tree_files(base)) if base else {}
+        for entry in body.get('tree', []):
+            if 'content' in entry:
+                files[entry['path']] = (entry['mode'], self._store_blob(entry['content'].encode('utf-8')))
+            elif entry.get('sha') is None:
+                files.pop(entry['path'], None)
+            elif entry['sha'] in self._objects:
+                files[entry['path']] = (entry['mode'], entry['sha'])
+            else:
+                return 422, {'message': f"Invalid sha for {entry['path']}"}
+        return 201, self._tree_json(repo, self._store_tree(files))
+
+    def _get_commit(self, params, body, repo, sha):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        known = sha in self._objects or sha in self._refs_for(found).values()
+        return (200, self._commit_json(repo, sha)) if known else self._not_found()
+
+    def _create_commit(self, params, body, repo):
+        if not self._repo(repo):
+            return self._not_found()
+        tree = body.get('tree')
+        if tree not in self._objects or self._objects[tree]['type'] != 'tree':
+            return 422, {'message': 'Invalid tree'}
+        sha = self._store_commit(body.get('message', ''), tree, list(body.get('parents', [])))
+        return 201, self._commit_json(repo, sha)
+
+    def _list_events(self, params, body, repo):
+        found = self._repo(repo)
+        if not found:
+            return self._not_found()
+        with self._lock:
+            events = list(self._events.get(repo, []))
+        status, payload, headers = self._paginate(events, params, f"/repos/{repo}/events", lambda e: e)
+        headers['X-Poll-Interval'] = str(self.poll_interval)
+        return status, payload, headers
+
+    def _search_issues(self, params, body):
+        """Issue search: supports repo:, is:/type: issue|pr and created: qualifiers."""
+        repo = None
+        kind = None
+        created_from = created_to = None
+        for token in params.get('q', '').split():
+            qualifier, _, value = token.partition(':')
+            if qualifier == 'repo':
+                repo = self._repo(value)
+            elif qualifier in ('is', 'type') and value in ('issue', 'pr'):
+                kind = value
+            elif qualifier == 'created':
+                if '..' in value:
+                    start, end = value.split('..')
+                    created_from, created_to = _parse_iso(start), _parse_iso(end)
+                elif value.startswith('>='):
+                    created_from = _parse_iso(value[2:])
+                elif value.startswith('>'):
+                    created_from = _parse_iso(value[1:])
+        if repo is None:
+            return 422, {'message': 'Validation Failed', 'errors': [{'message': 'repo: qualifier required'}]}
+
+        numbers = []
+        for number in range(1, repo.issues + repo.pull_requests + 1):
+            is_pr = self._is_pr(repo, number)
+            if (kind == 'pr' and not is_pr) or (kind == 'issue' and is_pr):
+                continue
+            created = repo.created_at(number)
+            if (created_from and created < created_from) or (created_to and created > created_to):
+                continue
+            numbers.append(number)
+        total = len(numbers)
+        status, items, headers = self._paginate(
+            numbers[:SEARCH_RESULT_LIMIT], params, "/search/issues", lambda n: dict(self._issue(repo, n), score=1.0)
+        )
+        return status, {'total_count': total, 'incomplete_results': False, 'items': items}, headers
+
+    # -- GraphQL -----------------------------------------------------------
+
+    def _graphql(self, params, body):
+        query = body.get('query', '')
+        variables = body.get('variables') or {}
+
+        if 'addProjectV2ItemById' in query:
+            item_id = f"PVTI_{_sha(variables.get('projectId'), variables.get('contentId'))[:16]}"
+            return 200, {'data': {'addProjectV2ItemById': {'item': {'id': item_id}}}}
+        if 'updateProjectV2ItemFieldValue' in query:
+            return 200, {'data': {'updateProjectV2ItemFieldValue': {'projectV2Item': {'id': variables.get('itemId')}}}}
+        if 'updateIssue' in query:
+            return 200, {'data': {'updateIssue': {'issue': {'id': variables.get('issueId')}}}}
+        if 'projectsV2' in query:
+            org = variables.get('org', '')
+            nodes = [
+                {'id': f"PVT_{org}_{number}", 'title': f"Project {number}",
+                 'url': f"https://github.com/orgs/{org}/projects/{number}"}
+                for number in range(1, self.projects + 1)
+            ]
+            return 200, {'data': {'organization': {'projectsV2': {'nodes': nodes}}}}
+        if 'fields(' in query:
+            return 200, {'data': {'node': {'fields': {'nodes': self._project_fields(variables.get('projectId', ''))}}}}
+        if 'repository(' in query:
+            repo = self._repo(f"{variables.get('owner')}/{variables.get('repo')}")
+            number = int(variables.get('number') or 0)
+            if not repo or not self._exists(repo, number):
+                return 200, {'data': {'repository': None},
+                             'errors': [{'type': 'NOT_FOUND', 'message': 'Could not resolve to an Issue'}]}
+            data = {'issue': {'id': self._issue(repo, number)['node_id']}}
+            if 'issueTypes' in query:
+                data['issueTypes'] = {'nodes': [
+                    {'id': f"IT_{name}", 'name': name} for name in ('Bug', 'Feature', 'Task')
+                ]}
+            return 200, {'data': {'repository': data}}
+        return 200, {'errors': [{'message': 'Query not supported by the simulator'}]}
+
+    @staticmethod
+    def _project_fields(project_id: str) -> List[Dict[str, Any]]:
+        today = datetime.now(timezone.utc).date()
+        return [
+            {'id': f"{project_id}_status", 'name': 'Status', 'dataType': 'SINGLE_SELECT',
+             'options': [{'id': f"{project_id}_status_{i}", 'name': name}
+                         for i, name in enumerate(('Todo', 'In Progress', 'Done'))]},
+            {'id': f"{project_id}_iteration", 'name': 'Iteration', 'dataType': 'ITERATION',
+             'configuration': {'iterations': [
+                 {'id': f"{project_id}_iteration_{i}", 'title': f"Iteration {i}",
+                  'startDate': (today + timedelta(days=14 * (i - 1))).isoformat(), 'duration': 14}
+                 for i in range(3)
+             ]}},
+            {'id': f"{project_id}_notes", 'name': 'Notes', 'dataType': 'TEXT'},
+            {'id': f"{project_id}_points", 'name': 'Points', 'dataType': 'NUMBER'},
+            {'id': f"{project_id}_due", 'name': 'Due', 'dataType': 'DATE'},
+        ]
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Run `pull` against the GitHub simulator and measure it.
+
+Each scenario pulls one simulated repository (issues and PRs) into a
+fresh or existing database, with `github.api_url` pointing at the
+simulator and the clone URL at a local git repository, then reports wall
+time, requests, throughput, rate limiting, faults and how much of the
+repository ended up in the database.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+from helpers.config_helpers import create_test_config
+from helpers.git_helpers import init_git_repo
+
+from .github_simulator import GitHubSimulator, SimulatedRepository
+
+REPOSITORY = "bench/meta"
+
+
+@dataclass(frozen=True)
+class PullScale:
+    """Size of the simulated repository."""
+
+    issues: int
+    prs: int
+    releases: int
+
+    def with_overrides(self, **overrides: Any) -> "PullScale":
+        values = {key: getattr(self, key) for key in self.__dataclass_fields__}
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return PullScale(**values)
+
+
+PULL_SCALES: Dict[str, PullScale] = {
+    'tiny': PullScale(issues=500, prs=300, releases=20),
+    'small': PullScale(issues=10_000, prs=10_000, releases=100),
+    'medium': PullScale(issues=50_000, prs=50_000, releases=500),
+    'large': PullScale(issues=100_000, prs=100_000, releases=1_000),
+}
+
+
+def simulated_repository(scale: PullScale) -> SimulatedRepository:
+    return SimulatedRepository(REPOSITORY, issues=scale.issues, pull_requests=scale.prs, releases=scale.releases)
+
+
+def expected_counts(repository: SimulatedRepository) -> Dict[str, int]:
+    """What a complete pull stores: every issue and every merged PR."""
+    prs = range(repository.issues + 1, repository.issues + repository.pull_requests + 1)
+    return {
+        'issues': repository.issues,
+        'pull_requests': sum(1 for number in prs if number % repository.unmerged_every != 0),
+    }
+
+
+def _config(api_url: str, workdir: Path, workers: int):
+    from release_tool.config import Config
+
+    origin = workdir / "origin"
+    if not (origin / ".git").exists():
+        init_git_repo(origin)
+    config = create_test_config(
+        code_repo=REPOSITORY,
+        database={'path': str(workdir / "release_tool.db")},
+        github={'api_url': api_url},
+        pull={'clone_url_template': str(origin), 'parallel_workers': workers, 'show_progress': False},
+    )
+    return Config.from_dict(config)
+
+
+def run_pull(simulator: GitHubSimulator, workdir: Path, workers: int = 10) -> Dict[str, Any]:
+    """
+    Pull the simulated repository into workdir/release_tool.db.
+
+    Mirrors the `pull` command: PullManager.pull_all, then the releases of
+    the code repository. The database is kept between calls, so a second
+    call measures an incremental pull.
+
+    Returns:
+        Timing, request and completeness metrics of this pull
+    """
+    from release_tool.db import Database
+    from release_tool.github_utils import GitHubClient
+    from release_tool.pull_manager import PullManager
+
+    workdir.mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault('GITHUB_TOKEN', 'simulated-token')
+    config = _config(simulator.url, workdir, workers)
+    simulator.reset_stats()
+
+    cwd = os.getcwd()
+    # The clone goes to ./.release_tool_cache/<alias>
+    os.chdir(workdir)
+    db = Database(config.database.path)
+    db.connect()
+    interrupted = None
+    start = time.perf_counter()
+    try:
+        github = GitHubClient(config)
+        PullManager(config, db, github).pull_all()
+        repo_id = db.upsert_repository(github.get_repository_info(REPOSITORY))
+        for release in github.fetch_releases(REPOSITORY, repo_id):
+            db.upsert_release(release)
+    except (Exception, SystemExit) as e:
+        interrupted = f"{type(e).__name__}: {e}"
+    finally:
+        wall = time.perf_counter() - start
+        stored = {
+            'issues': len(db.get_existing_issue_numbers(REPOSITORY)),
+            'pull_requests': len(db.get_existing_pr_numbers(REPOSITORY)),
+        }
+        db.close()
+        os.chdir(cwd)
+
+    stats = simulator.stats
+    expected = expected_counts(simulator.repositories[REPOSITORY])
+    return {
+        'wall': wall,
+        'requests': stats['requests'],
+        'items_served': stats['items_served'],
+        'items_per_second': stats['items_served'] / wall if wall else 0.0,
+        'requests_per_second': stats['requests'] / wall if wall else 0.0,
+        'not_modified': stats['not_modified'],
+        'rate_limited': stats['rate_limited'],
+        'secondary_rate_limited': stats['secondary_rate_limited'],
+        'faults': stats['faults'],
+        'max_in_flight': stats['max_in_flight'],
+        'by_route': stats['by_route'],
+        'stored': stored,
+        'expected': expected,
+        'complete': stored == expected,
+        'interrupted': interrupted,
+    }
+
+
+def run_scenarios(simulator: GitHubSimulator, workdir: Path, workers: int = 10,
+                  outage_after: int = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Full pull, incremental re-pull and, with outage_after, an interrupted
+    pull followed by a resume once the simulated outage is over.
+
+    Returns:
+        Metrics per scenario ('full', 'incremental', 'outage', 'resume')
+    """
+    results = {
+        'full': run_pull(simulator, workdir / "full", workers),
+        'incremental': run_pull(simulator, workdir / "full", workers),
+    }
+    if outage_after is not None:
+        simulator.outage_after = outage_after
+        results['outage'] = run_pull(simulator, workdir / "resume", workers)
+        simulator.clear_faults()
+        results['resume'] = run_pull(simulator, workdir / "resume", workers)
+    return results
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark the generate pipeline on a synthetic fixture.
+
+    poetry run python tests/benchmarks/run.py --scale small
+    poetry run python tests/benchmarks/run.py --scale medium --output bench.json
+    poetry run python tests/benchmarks/run.py --scale small --update-baseline
+
+Exits with status 1 when a stage regressed against the stored baseline.
+"""
+
+import json
+import platform
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+if __package__ in (None, ''):
+    # Run as a script: make `benchmarks` and `helpers` importable like under pytest
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    __package__ = 'benchmarks'
+
+from .generate_pipeline import benchmark, compare_to_baseline  # noqa: E402
+from .synthetic import SCALES, build_fixture  # noqa: E402
+
+console = Console()
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_WORKDIR = Path(".release_tool_cache") / "benchmarks"
+STATUS_STYLES = {'regression': 'red', 'improvement': 'green', 'ok': 'white', 'new': 'dim'}
+
+
+def _baseline_key(scale_name: str, scale) -> str:
+    """Baselines are stored per named scale; overridden sizes get their own key."""
+    if scale == SCALES[scale_name]:
+        return scale_name
+    return f"{scale_name}:" + ",".join(
+        f"{key}={value}" for key, value in sorted(asdict(scale).items())
+        if value != getattr(SCALES[scale_name], key)
+    )
+
+
+def _print_report(rows, total: float, counts) -> None:
+    table = Table(title="generate pipeline")
+    table.add_column("Stage")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Current (ms)", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Status")
+    for row in rows:
+        style = STATUS_STYLES[row['status']]
+        table.add_row(
+            row['stage'],
+            f"{row['baseline'] * 1000:.1f}" if row['baseline'] is not None else "-",
+            f"{row['current'] * 1000:.1f}",
+            f"{row['change']:+.0%}" if row['change'] is not None else "-",
+            f"[{style}]{row['status']}[/{style}]",
+        )
+    console.print(table)
+    console.print(
+        f"Total {total * 1000:.1f} ms for {counts['commits']} commits, "
+        f"{counts['changes']} changes, {counts['notes']} notes"
+    )
+
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option('--scale', 'scale_name', type=click.Choice(sorted(SCALES)), default='small', show_default=True,
+              help='Named fixture size')
+@click.option('--commits', type=int, help='Override the number of commits')
+@click.option('--issues', type=int, help='Override the number of issues')
+@click.option('--prs', type=int, help='Override the number of pull requests')
+@click.option('--tags', type=int, help='Override the number of tags')
+@click.option('--release-commits', type=int, help='Override the size of the generated release')
+@click.option('--cold-index', is_flag=True, help='Do not index commits, so generate converts them from git')
+@click.option('--repeat', type=int, default=3, show_default=True, help='Runs per stage (fastest is kept)')
+@click.option('--workdir', type=click.Path(file_okay=False, path_type=Path), default=DEFAULT_WORKDIR,
+              show_default=True, help='Where fixtures are built and reused')
+@click.option('--output', '-o', type=click.Path(dir_okay=False, path_type=Path), help='Write results as JSON')
+@click.option('--baseline', type=click.Path(dir_okay=False, path_type=Path), default=DEFAULT_BASELINE,
+              show_default=True, help='Baseline JSON to compare against')
+@click.option('--threshold', type=float, default=0.25, show_default=True,
+              help='Relative slowdown of a stage reported as a regression')
+@click.option('--min-delta', type=float, default=5.0, show_default=True,
+              help='Slowdown in milliseconds below which a stage is never a regression')
+@click.option('--update-baseline', is_flag=True, help='Store these results as the baseline for this scale')
+def main(scale_name: str, commits: Optional[int], issues: Optional[int], prs: Optional[int],
+         tags: Optional[int], release_commits: Optional[int], cold_index: bool, repeat: int,
+         workdir: Path, output: Optional[Path], baseline: Path, threshold: float, min_delta: float,
+         update_baseline: bool):
+    """Time each stage of generate on a synthetic repository and compare with the baseline."""
+    scale = SCALES[scale_name].with_overrides(
+        commits=commits, issues=issues, prs=prs, tags=tags, release_commits=release_commits,
+        index_commits=False if cold_index else None,
+    )
+    key = _baseline_key(scale_name, scale)
+
+    with console.status(f"Building fixture '{key}'..."):
+        fixture = build_fixture(workdir / key.replace(':', '-').replace(',', '-').replace('=', ''), scale)
+    console.print(f"[blue]Fixture: {fixture.commit_count} commits, {fixture.tag_count} tags, "
+                  f"{scale.issues} issues, {scale.prs} PRs → {fixture.target_version}[/blue]")
+
+    result = benchmark(fixture, repeat=repeat)
+
+    baselines = json.loads(baseline.read_text()) if baseline.exists() else {}
+    previous = baselines.get(key)
+    rows = compare_to_baseline(result['stages'], previous['stages'] if previous else None,
+                               threshold, min_delta / 1000)
+    _print_report(rows, result['total'], result['counts'])
+
+    record = {
+        'scale': key,
+        'params': asdict(scale),
+        'recorded_at': datetime.now(timezone.utc).isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        },
+        'threshold': threshold,
+        'min_delta': min_delta / 1000,
+        **result,
+        'comparison': rows,
+    }
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(record, indent=2) + "\n")
+        console.print(f"[green]✓ Results written to {output}[/green]")
+
+    if update_baseline:
+        baselines[key] = {
+            name: record[name]
+            for name in ('params', 'recorded_at', 'environment', 'stages', 'total', 'counts')
+        }
+        baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        console.print(f"[green]✓ Baseline '{key}' updated in {baseline}[/green]")
+        return
+
+    if previous and previous.get('counts') != result['counts']:
+        console.print("[yellow]Warning: the pipeline did different work than in the baseline "
+                      f"(baseline {previous.get('counts')}, now {result['counts']})[/yellow]")
+
+    regressions = [row['stage'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        console.print(f"[red]Regression over {threshold:.0%} in: {', '.join(regressions)}[/red]")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark `pull` against the local GitHub simulator.
+
+    poetry run python tests/benchmarks/run_pull.py --scale small
+    poetry run python tests/benchmarks/run_pull.py --scale large --latency 0.05 --output pull.json
+    poetry run python tests/benchmarks/run_pull.py --scale tiny --outage-after 5 --rate-limit 200
+
+Exits with status 1 when a pull left the database incomplete after the
+simulator stopped failing.
+"""
+
+import json
+import platform
+import shutil
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+if __package__ in (None, ''):
+    # Run as a script: make `benchmarks` and `helpers` importable like under pytest
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    __package__ = 'benchmarks'
+
+from .github_simulator import GitHubSimulator  # noqa: E402
+from .pull_benchmark import PULL_SCALES, run_scenarios, simulated_repository  # noqa: E402
+
+console = Console()
+
+DEFAULT_WORKDIR = Path(".release_tool_cache") / "benchmarks" / "pull"
+
+
+def _print_report(results) -> None:
+    table = Table(title="pull against the GitHub simulator")
+    for column in ("Scenario", "Wall (s)", "Requests", "Items/s", "304", "Rate limited",
+                   "Faults", "Max in flight", "Issues", "PRs", "Complete"):
+        table.add_column(column, justify="left" if column == "Scenario" else "right")
+    for name, row in results.items():
+        stored, expected = row['stored'], row['expected']
+        table.add_row(
+            name,
+            f"{row['wall']:.2f}",
+            str(row['requests']),
+            f"{row['items_per_second']:.0f}",
+            str(row['not_modified']),
+            str(row['rate_limited'] + row['secondary_rate_limited']),
+            str(row['faults']),
+            str(row['max_in_flight']),
+            f"{stored['issues']}/{expected['issues']}",
+            f"{stored['pull_requests']}/{expected['pull_requests']}",
+            "[green]yes[/green]" if row['complete'] else "[red]no[/red]",
+        )
+    console.print(table)
+
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option('--scale', 'scale_name', type=click.Choice(sorted(PULL_SCALES)), default='tiny', show_default=True,
+              help='Named repository size')
+@click.option('--issues', type=int, help='Override the number of issues')
+@click.option('--prs', type=int, help='Override the number of pull requests')
+@click.option('--releases', type=int, help='Override the number of releases')
+@click.option('--workers', type=int, default=10, show_default=True, help='pull.parallel_workers')
+@click.option('--latency', type=float, default=0.0, show_default=True, help='Seconds added to every response')
+@click.option('--page-size', type=int, default=100, show_default=True, help='Maximum per_page served')
+@click.option('--no-etags', is_flag=True, help='Do not send ETags or answer 304')
+@click.option('--rate-limit', type=int, help='Requests per window before primary rate limit errors')
+@click.option('--rate-limit-window', type=float, default=60.0, show_default=True,
+              help='Primary rate limit window in seconds')
+@click.option('--max-concurrency', type=int, help='In-flight requests above which secondary rate limit errors start')
+@click.option('--fault-rate', type=float, default=0.0, show_default=True, help='Fraction of requests failing with 502')
+@click.option('--outage-after', type=int,
+              help='Also run an outage scenario: fail every request after this many, then resume')
+@click.option('--workdir', type=click.Path(file_okay=False, path_type=Path), default=DEFAULT_WORKDIR,
+              show_default=True, help='Where databases and clones are created (emptied first)')
+@click.option('--output', '-o', type=click.Path(dir_okay=False, path_type=Path), help='Write results as JSON')
+def main(scale_name: str, issues: Optional[int], prs: Optional[int], releases: Optional[int], workers: int,
+         latency: float, page_size: int, no_etags: bool, rate_limit: Optional[int], rate_limit_window: float,
+         max_concurrency: Optional[int], fault_rate: float, outage_after: Optional[int], workdir: Path,
+         output: Optional[Path]):
+    """Measure pull throughput, rate limiting and resume behaviour against a simulated GitHub."""
+    scale = PULL_SCALES[scale_name].with_overrides(issues=issues, prs=prs, releases=releases)
+    simulator_options = {
+        'latency': latency,
+        'max_page_size': page_size,
+        'etags': not no_etags,
+        'rate_limit': rate_limit,
+        'rate_limit_window': rate_limit_window,
+        'max_concurrency': max_concurrency,
+        'fault_rate': fault_rate,
+    }
+    if workdir.exists():
+        shutil.rmtree(workdir)
+    workdir = workdir.resolve()
+
+    console.print(f"[blue]Simulating {scale.issues} issues, {scale.prs} PRs and {scale.releases} releases[/blue]")
+    with GitHubSimulator([simulated_repository(scale)], **simulator_options) as simulator:
+        results = run_scenarios(simulator, workdir, workers, outage_after)
+    _print_report(results)
+
+    for name, row in results.items():
+        if row['interrupted']:
+            console.print(f"[yellow]{name}: pull stopped with {row['interrupted']}[/yellow]")
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            'params': {'scale': scale_name, **vars(scale), 'workers': workers, 'outage_after': outage_after,
+                       **simulator_options},
+            'recorded_at': datetime.now(timezone.utc).isoformat(),
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'machine': platform.machine(),
+            },
+            'scenarios': results,
+        }
+        output.write_text(json.dumps(record, indent=2) + "\n")
+        console.print(f"[green]✓ Results written to {output}[/green]")
+
+    # The outage run is expected to be incomplete; everything after it must not be
+    incomplete = [name for name, row in results.items() if name != 'outage' and not row['complete']]
+    if incomplete:
+        console.print(f"[red]Database incomplete after: {', '.join(incomplete)}[/red]")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Synthetic repositories and databases for the benchmarks.
+
+A fixture is a git repository (built on `init_git_repo` and the
+`GitScenario` timeline) plus a release-tool database holding what `pull`
+would have stored for it: issues, merged PRs, one release per tag and,
+optionally, the commit index. Histories are streamed through
+`git fast-import`, because committing through the index (`create_commit`)
+takes minutes for 100k commits.
+
+The shape is deterministic for a given scale:
+
+- PRs land as squash commits `Title (#N)`; every `merge_every`-th PR is a
+  feature commit plus a `Merge pull request #N` merge commit, like
+  `create_merge_commit` produces. Commits beyond the number of PRs are
+  direct pushes without a PR.
+- PR head branches (`feat/meta-<issue>/main`) and bodies
+  (`Parent issue: .../issues/<issue>`) point at issues in a separate
+  issue repository. Consecutive PRs share an issue, every 10th PR reopens
+  an issue from an earlier release, every 17th PR has no issue and every
+  23rd points at an issue missing from the database.
+- Tags are spread over the history, leaving the last `release_commits`
+  commits untagged: that range is what the benchmark generates notes for.
+"""
+
+import json
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from release_tool.config import Config
+from release_tool.db import Database
+from release_tool.models import Author, Issue, Label, PullRequest, Release, Repository, SemanticVersion
+from helpers.config_helpers import create_test_config
+from helpers.git_helpers import GitScenario, init_git_repo
+
+CODE_REPO = "test/repo"
+ISSUE_REPO = "test/meta"
+LABELS = ["bug", "feature", "docs", "enhancement", "security"]
+AUTHORS = 25
+MODULES = 50
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a synthetic fixture."""
+
+    commits: int
+    issues: int
+    prs: int
+    tags: int
+    release_commits: int
+    merge_every: int = 5
+    index_commits: bool = True
+
+    def with_overrides(self, **overrides: Any) -> "Scale":
+        """Return a copy with the non-None overrides applied."""
+        values = asdict(self)
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return Scale(**values)
+
+
+SCALES: Dict[str, Scale] = {
+    'tiny': Scale(commits=200, issues=500, prs=300, tags=20, release_commits=100),
+    'small': Scale(commits=1_000, issues=10_000, prs=10_000, tags=100, release_commits=500),
+    'medium': Scale(commits=10_000, issues=50_000, prs=50_000, tags=1_000, release_commits=2_000),
+    'large': Scale(commits=100_000, issues=200_000, prs=200_000, tags=5_000, release_commits=10_000),
+}
+
+
+@dataclass
+class Fixture:
+    """A built fixture on disk."""
+
+    path: Path
+    scale: Scale
+    target_version: str
+    commit_count: int
+    tag_count: int
+
+    @property
+    def repo_path(self) -> Path:
+        return self.path / "repo"
+
+    @property
+    def db_path(self) -> Path:
+        return self.path / "release_tool.db"
+
+    def config(self) -> Config:
+        """Configuration that points generate at this fixture."""
+        return Config.from_dict(benchmark_config(self.db_path))
+
+
+def benchmark_config(db_path: Path) -> Dict[str, Any]:
+    """
+    Configuration dictionary for a fixture.
+
+    Policies that only print warnings are set to ignore, so the benchmark
+    times the pipeline rather than the console. The default `#N` commit
+    message pattern is left out: it matches the PR number of squash
+    commits, which would make each PR its own issue.
+    """
+    return create_test_config(
+        code_repo=CODE_REPO,
+        repository={
+            "code_repos": [{"link": CODE_REPO, "alias": "repo"}],
+            "issue_repos": [{"link": ISSUE_REPO, "alias": "meta"}],
+        },
+        issue_policy={
+            "patterns": [
+                {"order": 1, "strategy": "branch_name", "pattern": r"/(?P<repo>\w+)-(?P<issue>\d+)"},
+                {"order": 2, "strategy": "pr_body", "pattern": r"Parent issue:.*?/issues/(?P<issue>\d+)"},
+                {"order": 3, "strategy": "commit_message", "pattern": r"(?P<project>[A-Z]+)-(?P<issue>\d+)"},
+            ],
+            "no_issue_action": "ignore",
+            "partial_issue_action": "ignore",
+            "inter_release_duplicate_action": "ignore",
+        },
+        version_policy={"gap_detection": "ignore"},
+        database={"path": str(db_path)},
+    )
+
+
+def issue_for_pr(pr_number: int, scale: Scale) -> Optional[int]:
+    """Parent issue number of a synthetic PR (None for PRs without issue)."""
+    if pr_number % 17 == 0:
+        return None
+    if pr_number % 23 == 0:
+        # Not in the database: a partial match
+        return scale.issues + pr_number
+    if pr_number % 10 == 0 and pr_number > 200:
+        # Reopened from an earlier release: an inter-release duplicate
+        return (pr_number // 2 - 50) % scale.issues + 1
+    return (pr_number // 2) % scale.issues + 1
+
+
+def pr_title(pr_number: int) -> str:
+    return f"Improve module {pr_number % MODULES} handling"
+
+
+def version_sequence(count: int) -> List[str]:
+    """Tag names in release order: patch releases, with an RC before each minor."""
+    versions: List[str] = []
+    k = 10
+    while len(versions) < count:
+        major, minor, patch = k // 100, (k // 10) % 10, k % 10
+        if patch == 0:
+            versions.append(f"v{major}.{minor}.0-rc.1")
+        versions.append(f"v{major}.{minor}.{patch}")
+        k += 1
+    versions = versions[:count]
+    if versions and '-' in versions[-1]:
+        # End on a final release so the target is the next minor
+        versions.pop()
+    return versions
+
+
+def _data(payload: str) -> bytes:
+    raw = payload.encode('utf-8')
+    return b"data %d\n%s\n" % (len(raw), raw)
+
+
+def _commit(ref: str, mark: int, author: int, timestamp: int, message: str,
+            parent: str, merge: Optional[int], module: int, revision: int) -> bytes:
+    ident = f"Dev {author} <dev{author}@example.com> {timestamp} +0000"
+    parts = [
+        f"commit {ref}\nmark :{mark}\nauthor {ident}\ncommitter {ident}\n".encode('utf-8'),
+        _data(message),
+        f"from {parent}\n".encode('utf-8'),
+    ]
+    if merge is not None:
+        parts.append(f"merge :{merge}\n".encode('utf-8'))
+    parts.append(f"M 100644 inline src/module_{module}.py\n".encode('utf-8'))
+    parts.append(_data(f"# revision {revision}\n"))
+    return b"".join(parts)
+
+
+def build_history(repo, scale: Scale, base_date: datetime) -> Dict[str, Any]:
+    """
+    Stream the synthetic history into a repository.
+
+    Returns:
+        Dictionary with the 'commit_count', the 'tags' in order and, per
+        tag, the (pr_number, issue) pairs released with it ('released').
+    """
+    prefix = max(scale.commits - scale.release_commits, 1)
+    tags = version_sequence(scale.tags)
+    # Commit position after which each tag is placed
+    tag_positions: Dict[int, List[str]] = {}
+    for index, tag in enumerate(tags):
+        position = max(1, round((index + 1) * prefix / len(tags)))
+        tag_positions.setdefault(position, []).append(tag)
+
+    stream: List[bytes] = []
+    released: Dict[str, List[Any]] = {}
+    pending: List[Any] = []
+    parent = "refs/heads/main^0"
+    mark = 0
+    count = 0
+    pr_number = 0
+    epoch = int(base_date.timestamp())
+
+    while count < scale.commits:
+        before = count
+        pr_number += 1
+        timestamp = epoch + count * 3600
+        author = pr_number % AUTHORS
+        module = pr_number % MODULES
+        if pr_number > scale.prs:
+            mark += 1
+            stream.append(_commit("refs/heads/main", mark, author, timestamp,
+                                  f"Bump dependencies ({count})", parent, None, module, count))
+            parent = f":{mark}"
+            count += 1
+        else:
+            issue = issue_for_pr(pr_number, scale)
+            title = pr_title(pr_number)
+            if pr_number % scale.merge_every == 0 and count + 2 <= scale.commits:
+                mark += 1
+                feature = mark
+                stream.append(_commit("refs/heads/bench-feature", mark, author, timestamp,
+                                      f"{title} - wip", parent, None, module, count))
+                mark += 1
+                branch = f"feat/meta-{issue}/main" if issue else f"fix/change-{pr_number}"
+                stream.append(_commit("refs/heads/main", mark, author, timestamp + 60,
+                                      f"Merge pull request #{pr_number} from test/{branch}\n\n{title}",
+                                      parent, feature, module, count + 1))
+                count += 2
+            else:
+                mark += 1
+                stream.append(_commit("refs/heads/main", mark, author, timestamp,
+                                      f"{title} (#{pr_number})", parent, None, module, count))
+                count += 1
+            parent = f":{mark}"
+            pending.append((pr_number, issue))
+
+        for position in range(before + 1, count + 1):
+            for tag in tag_positions.pop(position, []):
+                stream.append(f"reset refs/tags/{tag}\nfrom :{mark}\n\n".encode('utf-8'))
+                released[tag] = pending
+                pending = []
+
+    stream.append(b"done\n")
+    subprocess.run(
+        ['git', 'fast-import', '--quiet', '--done'],
+        cwd=repo.working_dir, input=b"".join(stream), check=True
+    )
+    if 'bench-feature' in repo.heads:
+        repo.git.branch('-D', 'bench-feature')
+    repo.git.reset('--hard', 'main')
+
+    return {'commit_count': count, 'tags': [t for t in tags if t in released], 'released': released}
+
+
+def populate_database(db: Database, scale: Scale, history: Dict[str, Any], base_date: datetime) -> None:
+    """Store what `pull` would have fetched for the synthetic history."""
+    code_repo_id = db.upsert_repository(Repository(
+        owner="test", name="repo", full_name=CODE_REPO, url=f"https://github.com/{CODE_REPO}"
+    ))
+    issue_repo_id = db.upsert_repository(Repository(
+        owner="test", name="meta", full_name=ISSUE_REPO, url=f"https://github.com/{ISSUE_REPO}"
+    ))
+    labels = [Label(name=name) for name in LABELS]
+    authors = [
+        Author(name=f"Dev {n}", username=f"dev{n}", email=f"dev{n}@example.com")
+        for n in range(AUTHORS)
+    ]
+
+    for number in range(1, scale.issues + 1):
+        created = base_date + timedelta(hours=number)
+        body = f"Issue body {number}.\n\n## Description\nDetails for issue {number}.\n"
+        if number % 7 == 0:
+            body += f"\n## Migration\nRun the migration for issue {number}.\n"
+        db.upsert_issue(Issue(
+            repo_id=issue_repo_id, number=number, key=str(number),
+            title=f"Issue {number}: module {number % MODULES} behaviour",
+            body=body, state="closed", labels=[labels[number % len(labels)]],
+            url=f"https://github.com/{ISSUE_REPO}/issues/{number}",
+            created_at=created, closed_at=created + timedelta(days=1),
+        ))
+
+    for number in range(1, scale.prs + 1):
+        issue = issue_for_pr(number, scale)
+        body = f"Parent issue: https://github.com/{ISSUE_REPO}/issues/{issue}" if issue else "No issue"
+        db.upsert_pull_request(PullRequest(
+            repo_id=code_repo_id, number=number, title=pr_title(number), body=body,
+            state="closed", merged_at=base_date + timedelta(hours=number),
+            author=authors[number % AUTHORS], labels=[labels[number % len(labels)]],
+            base_branch="main",
+            head_branch=f"feat/meta-{issue}/main" if issue else f"fix/change-{number}",
+            url=f"https://github.com/{CODE_REPO}/pull/{number}",
+        ))
+
+    for tag in history['tags']:
+        entries = history['released'][tag]
+        body = "\n".join(
+            f"- {pr_title(pr)} #{issue}" if issue else f"- {pr_title(pr)}"
+            for pr, issue in entries
+        )
+        version = SemanticVersion.parse(tag)
+        db.upsert_release(Release(
+            repo_id=code_repo_id, version=tag.lstrip('v'), tag_name=tag, name=tag,
+            body=body, created_at=base_date, published_at=base_date,
+            is_draft=False, is_prerelease=not version.is_final(),
+            url=f"https://github.com/{CODE_REPO}/releases/tag/{tag}",
+        ))
+
+
+def index_commits(db: Database, config: Config, repo_path: Path) -> None:
+    """Index the branch like `pull` does, so generate looks commits up by SHA."""
+    from release_tool.git_ops import GitOperations
+    from release_tool.policies import IssueExtractor
+
+    repo_id = db.get_repository_id(CODE_REPO)
+    extractor = IssueExtractor(config)
+    commits = list(GitOperations(str(repo_path)).iter_commit_models(['main'], repo_id))
+    for commit in commits:
+        commit.issue_keys = extractor.extract_from_commit(commit)
+    db.upsert_commits(commits)
+
+
+def build_fixture(path: Path, scale: Scale) -> Fixture:
+    """
+    Build a fixture, or reuse the one already at `path` if built for the same scale.
+
+    Args:
+        path: Directory for the repository, database and fixture.json
+        scale: Fixture size
+
+    Returns:
+        The fixture
+    """
+    manifest = path / "fixture.json"
+    if manifest.exists():
+        data = json.loads(manifest.read_text())
+        if data.get('scale') == asdict(scale):
+            return Fixture(path, scale, data['target_version'], data['commit_count'], data['tag_count'])
+
+    if path.exists():
+        import shutil
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+    repo = init_git_repo(path / "repo")
+    base_date = GitScenario(repo).base_date
+    history = build_history(repo, scale, base_date)
+
+    last = SemanticVersion.parse(history['tags'][-1]) if history['tags'] else SemanticVersion.parse("0.0.0")
+    target_version = last.bump_minor().to_string()
+
+    fixture = Fixture(path, scale, target_version, history['commit_count'], len(history['tags']))
+    config = fixture.config()
+    db = Database(str(fixture.db_path))
+    db.connect()
+    # A throwaway fixture does not need durable writes
+    db.conn.execute("PRAGMA synchronous=OFF")
+    db.configure_note_sections(
+        config.issue_policy.description_section_regex,
+        config.issue_policy.migration_section_regex
+    )
+    try:
+        populate_database(db, scale, history, base_date.replace(tzinfo=None))
+        if scale.index_commits:
+            index_commits(db, config, fixture.repo_path)
+    finally:
+        db.close()
+
+    manifest.write_text(json.dumps({
+        'scale': asdict(scale),
+        'target_version': target_version,
+        'commit_count': fixture.commit_count,
+        'tag_count': fixture.tag_count,
+    }, indent=2))
+    return fixture
@@ -29,6 +29,12 @@ def mock_github_token(monkeypatch):
     monkeypatch.setenv("GITHUB_TOKEN", "test_token")
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_cache(monkeypatch, tmp_path_factory):
+    """Keep the config cache used by tests out of the user's cache directory."""
+    monkeypatch.setenv("RELEASE_TOOL_CONFIG_CACHE_DIR", str(tmp_path_factory.getbasetemp() / "config-cache"))
+
+
 @pytest.fixture
 def tmp_git_repo(tmp_path):
     """
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Smoke tests for the generate benchmark suite."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from git import Repo
+
+from benchmarks.generate_pipeline import STAGES, benchmark, compare_to_baseline
+from benchmarks.run import main
+from benchmarks.synthetic import Scale, build_fixture
+
+MICRO = Scale(commits=60, issues=80, prs=50, tags=6, release_commits=30)
+
+
+@pytest.fixture
+def fixture(tmp_path):
+    return build_fixture(tmp_path / "micro", MICRO)
+
+
+def test_synthetic_fixture_shape(fixture):
+    """Test that the fixture has the requested history, tags and pending release."""
+    repo = Repo(fixture.repo_path)
+    # Initial commit from init_git_repo plus the synthetic history
+    assert len(list(repo.iter_commits('main'))) == MICRO.commits + 1
+    assert fixture.tag_count == len(repo.tags) == MICRO.tags
+    assert any(len(c.parents) == 2 for c in repo.iter_commits('main'))
+    assert 'bench-feature' not in repo.heads
+    assert fixture.target_version == "0.2.0"
+
+
+def test_fixture_is_reused_for_the_same_scale(fixture):
+    """Test that an existing fixture is reused and rebuilt when the scale changes."""
+    mtime = fixture.db_path.stat().st_mtime_ns
+    assert build_fixture(fixture.path, MICRO).db_path.stat().st_mtime_ns == mtime
+
+    rebuilt = build_fixture(fixture.path, MICRO.with_overrides(tags=3))
+    assert rebuilt.tag_count == 3
+
+
+def test_benchmark_times_every_stage(fixture):
+    """Test that each generate stage is timed on the pending release."""
+    result = benchmark(fixture, repeat=2)
+
+    assert list(result['stages']) == list(STAGES)
+    assert len(result['runs']) == 2
+    assert result['total'] == pytest.approx(sum(result['stages'].values()))
+    counts = result['counts']
+    assert counts['commits'] == MICRO.release_commits
+    assert 0 < counts['notes'] <= counts['changes']
+    assert counts['unresolved_issues'] > 0
+    assert counts['rendered_bytes'] > 0
+
+
+def test_compare_to_baseline():
+    """Test regression detection with the relative threshold and absolute floor."""
+    rows = compare_to_baseline(
+        {'slow': 0.2, 'fast': 0.05, 'jitter': 0.002, 'same': 0.1, 'added': 0.1},
+        {'slow': 0.1, 'fast': 0.1, 'jitter': 0.001, 'same': 0.11},
+        threshold=0.25,
+    )
+    status = {row['stage']: row['status'] for row in rows}
+    assert status == {
+        'slow': 'regression', 'fast': 'improvement', 'jitter': 'ok', 'same': 'ok', 'added': 'new'
+    }
+    assert rows[0]['change'] == pytest.approx(1.0)
+
+
+def test_run_writes_results_and_fails_on_regression(tmp_path):
+    """Test the runner's JSON output, baseline update and regression exit status."""
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "results.json"
+    args = ['--scale', 'tiny', '--commits', '60', '--issues', '80', '--prs', '50', '--tags', '6',
+            '--release-commits', '30', '--repeat', '1', '--workdir', str(tmp_path / "work"),
+            '--baseline', str(baseline)]
+
+    result = CliRunner().invoke(main, args + ['--update-baseline', '-o', str(output)])
+    assert result.exit_code == 0, result.output
+    record = json.loads(output.read_text())
+    key = record['scale']
+    assert key.startswith("tiny:") and "commits=60" in key
+    assert set(record['stages']) == set(STAGES)
+    assert json.loads(baseline.read_text())[key]['stages'] == record['stages']
+
+    # A baseline far faster than anything possible is a regression
+    stored = json.loads(baseline.read_text())
+    stored[key]['stages'] = {name: 1e-9 for name in STAGES}
+    baseline.write_text(json.dumps(stored))
+    result = CliRunner().invoke(main, args + ['--threshold', '0.5', '--min-delta', '0'])
+    assert result.exit_code == 1
+    assert "Regression over 50%" in " ".join(result.output.split())
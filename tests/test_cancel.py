@@ -7,9 +7,12 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from click.testing import CliRunner
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from release_tool.commands.cancel import cancel, _check_published_status, _resolve_version_pr_issue, find_pr_for_issue_using_patterns
+from release_tool.commands.cancel import (
+    cancel, _check_published_status, _find_release_pr, _resolve_version_pr_issue, _select_batch_targets,
+    find_pr_for_issue_using_patterns
+)
 from release_tool.config import Config
 from release_tool.db import Database
 from release_tool.models import Release, PullRequest, Issue, Repository
@@ -739,3 +742,160 @@ def test_cancel_uses_issue_repo_when_issue_not_in_db(tmp_path):
     # Should use issue_repo even when issue wasn't found in database
     assert repo_arg == "test/issue-repo", f"Should use issue-repo when issue not in DB, but got {repo_arg}"
     assert result.exit_code == 0
+
+
+def test_select_batch_targets():
+    """Test batch selection by pattern, keep-last, age and published state."""
+    now = datetime(2025, 6, 1)
+
+    def release(version, days_old, published=False):
+        timestamp = (now - timedelta(days=days_old)).isoformat()
+        return {
+            'version': version, 'tag_name': f"v{version}", 'created_at': timestamp,
+            'published_at': timestamp if published else None, 'is_draft': not published, 'issue_number': None
+        }
+
+    releases = [
+        release("9.2.0-rc.2", 10), release("9.2.0-rc.10", 1), release("9.2.0-rc.1", 40),
+        release("9.2.0", 5, published=True), release("9.1.0-rc.1", 90),
+    ]
+
+    selected, published = _select_batch_targets(releases, "9.2.*-rc.*", None, 1, False, now)
+    assert [r['version'] for r in selected] == ["9.2.0-rc.1", "9.2.0-rc.2"]
+    assert published == []
+
+    selected, _ = _select_batch_targets(releases, "9.2.*-rc.*", timedelta(days=30), None, False, now)
+    assert [r['version'] for r in selected] == ["9.2.0-rc.1"]
+
+    selected, published = _select_batch_targets(releases, "9.2.*", None, None, False, now)
+    assert "9.2.0" not in [r['version'] for r in selected]
+    assert [r['version'] for r in published] == ["9.2.0"]
+    selected, _ = _select_batch_targets(releases, "9.2.*", None, None, True, now)
+    assert [r['version'] for r in selected][-1] == "9.2.0"
+
+
+def _add_draft_releases(db, repo_id, versions):
+    for version in versions:
+        db.upsert_release(Release(
+            repo_id=repo_id, version=version, tag_name=f"v{version}",
+            is_draft=True, is_prerelease=True, created_at=datetime.now()
+        ))
+
+
+def test_batch_cancel_deletes_matching_releases(test_config, test_db):
+    """Test that batch mode cancels every selected release and its issue, keeping the newest."""
+    db, repo_id = test_db
+    _add_draft_releases(db, repo_id, ["2.0.0-rc.1", "2.0.0-rc.2", "2.0.0-rc.3", "1.0.0"])
+    db.save_issue_association("test/repo", "2.0.0-rc.1", 11, "https://github.com/test/repo/issues/11")
+
+    with patch('release_tool.commands.cancel.GitHubClient') as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.get_rate_limit_budget.return_value = (5000, 0)
+        mock_client.delete_release.return_value = True
+        mock_client.delete_tag.return_value = True
+        mock_client.close_issue.return_value = True
+
+        result = CliRunner().invoke(
+            cancel,
+            ['--pattern', '2.0.0-rc.*', '--keep-last', '1'],
+            obj={'config': test_config, 'debug': False, 'assume_yes': True},
+            catch_exceptions=False
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Successfully cancelled 2 release(s)" in result.output
+    assert sorted(c.args[1] for c in mock_client.delete_release.call_args_list) == ["v2.0.0-rc.1", "v2.0.0-rc.2"]
+    assert sorted(c.args[1] for c in mock_client.delete_tag.call_args_list) == ["v2.0.0-rc.1", "v2.0.0-rc.2"]
+    mock_client.close_issue.assert_called_once_with("test/repo", 11)
+    assert db.get_release(repo_id, "2.0.0-rc.1") is None
+    assert db.get_release(repo_id, "2.0.0-rc.3") is not None
+    assert db.get_release(repo_id, "1.0.0") is not None
+
+
+def test_batch_cancel_checks_rate_limit_budget(test_config, test_db):
+    """Test that batch mode stops before any deletion when the rate limit budget is too small."""
+    db, repo_id = test_db
+    _add_draft_releases(db, repo_id, ["2.0.0-rc.1", "2.0.0-rc.2"])
+
+    with patch('release_tool.commands.cancel.GitHubClient') as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.get_rate_limit_budget.return_value = (3, 0)
+
+        result = CliRunner().invoke(
+            cancel,
+            ['--pattern', '2.0.0-*'],
+            obj={'config': test_config, 'debug': False, 'assume_yes': True}
+        )
+
+    assert result.exit_code == 1
+    assert "API calls" in result.output
+    mock_client.delete_release.assert_not_called()
+    assert db.get_release(repo_id, "2.0.0-rc.1") is not None
+
+
+def test_batch_mode_rejects_version(test_config):
+    """Test that a version cannot be combined with batch options."""
+    result = CliRunner().invoke(
+        cancel, ['1.0.0', '--keep-last', '2'], obj={'config': test_config, 'debug': False}
+    )
+
+    assert result.exit_code == 1
+    assert "cannot be combined" in result.output
+
+
+def _add_release_pr(db, repo_id, number, title, body=""):
+    db.upsert_pull_request(PullRequest(
+        repo_id=repo_id, number=number, title=title, body=body, state="open",
+        url=f"https://github.com/test/repo/pull/{number}", head_branch=f"docs/{number}", base_branch="main"
+    ))
+
+
+def test_batch_cancel_matches_pr_versions_as_whole_tokens(test_config, test_db):
+    """Test that the PR of 9.2.0-rc.10 is not taken for the PR of 9.2.0-rc.1."""
+    db, repo_id = test_db
+    _add_draft_releases(db, repo_id, ["9.2.0-rc.1", "9.2.0-rc.10"])
+    _add_release_pr(db, repo_id, 101, "Release notes for 9.2.0-rc.1.")
+    _add_release_pr(db, repo_id, 110, "Release notes for 9.2.0-rc.10")
+
+    assert _find_release_pr(db, repo_id, "test/repo", test_config, "9.2.0-rc.1", None,
+                            db.find_prs_for_issue("test/repo", 0, limit=1000)) == 101
+
+    with patch('release_tool.commands.cancel.GitHubClient') as mock_client_class:
+        mock_client = mock_client_class.return_value
+        mock_client.get_rate_limit_budget.return_value = (5000, 0)
+        mock_client.get_pull_request.return_value.head.ref = "docs/101"
+        for method in ('close_pull_request', 'delete_branch', 'delete_release', 'delete_tag'):
+            getattr(mock_client, method).return_value = True
+
+        result = CliRunner().invoke(
+            cancel,
+            ['--pattern', '9.2.*-rc.*', '--keep-last', '1'],
+            obj={'config': test_config, 'debug': False, 'assume_yes': True},
+            catch_exceptions=False
+        )
+
+    assert result.exit_code == 0, result.output
+    mock_client.close_pull_request.assert_called_once_with("test/repo", 101)
+    mock_client.delete_branch.assert_called_once_with("test/repo", "docs/101")
+    assert db.get_release(repo_id, "9.2.0-rc.10") is not None
+
+
+def test_batch_cancel_refuses_shared_prs(test_config, test_db):
+    """Test that batch mode stops when a selected release's PR also belongs to a kept release."""
+    db, repo_id = test_db
+    _add_draft_releases(db, repo_id, ["2.0.0-rc.1", "2.0.0-rc.2"])
+    _add_release_pr(db, repo_id, 120, "Release notes for 2.0.0-rc.2", body="Replaces 2.0.0-rc.1")
+
+    with patch('release_tool.commands.cancel.GitHubClient') as mock_client_class:
+        mock_client = mock_client_class.return_value
+
+        result = CliRunner().invoke(
+            cancel,
+            ['--pattern', '2.0.0-rc.*', '--keep-last', '1'],
+            obj={'config': test_config, 'debug': False, 'assume_yes': True}
+        )
+
+    assert result.exit_code == 1
+    assert "PR #120 belongs to several releases (2.0.0-rc.1, 2.0.0-rc.2)" in result.output
+    mock_client.close_pull_request.assert_not_called()
+    mock_client.delete_release.assert_not_called()
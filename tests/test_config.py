@@ -7,7 +7,7 @@
 import os
 import pytest
 from pathlib import Path
-from release_tool.config import Config, load_config
+from release_tool.config import Config, GitHubConfig, load_config
 
 
 def test_config_from_dict(monkeypatch):
@@ -313,3 +313,70 @@ def test_migration_v1_8_to_v1_9_preserves_other_fields():
     # But clone_code_repo and code_repo_path should be removed
     assert 'clone_code_repo' not in new_config['pull']
     assert 'code_repo_path' not in new_config['pull']
+
+
+def _write_current_config(path: Path, extra: str = "") -> None:
+    """Write a minimal config file at the current config version."""
+    from release_tool.migrations import MigrationManager
+
+    path.write_text(
+        f'config_version = "{MigrationManager.CURRENT_VERSION}"\n'
+        '[repository]\n'
+        'code_repos = [{link = "test/repo", alias = "repo"}]\n'
+        + extra
+    )
+
+
+def test_config_cache_skips_validation_on_repeated_loads(tmp_path, monkeypatch):
+    """Test that a second load of an unchanged file comes from the cache."""
+    monkeypatch.setenv("RELEASE_TOOL_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_path = tmp_path / "release_tool.toml"
+    _write_current_config(config_path)
+
+    first = Config.from_file(str(config_path))
+    assert list((tmp_path / "cache").glob("*.pickle"))
+
+    monkeypatch.setattr(
+        "release_tool.config.tomli.loads",
+        lambda *a, **kw: pytest.fail("config was parsed again")
+    )
+    second = Config.from_file(str(config_path))
+    assert second is not first
+    assert second.model_dump() == first.model_dump()
+
+
+def test_config_cache_invalidated_by_file_change(tmp_path, monkeypatch):
+    """Test that editing the config file bypasses the cached entry."""
+    monkeypatch.setenv("RELEASE_TOOL_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    config_path = tmp_path / "release_tool.toml"
+    _write_current_config(config_path)
+    assert Config.from_file(str(config_path)).database.path == "release_tool.db"
+
+    _write_current_config(config_path, '[database]\npath = "other.db"\n')
+    assert Config.from_file(str(config_path)).database.path == "other.db"
+
+
+def test_config_cache_can_be_disabled(tmp_path, monkeypatch):
+    """Test that RELEASE_TOOL_NO_CONFIG_CACHE disables the cache."""
+    monkeypatch.setenv("RELEASE_TOOL_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("RELEASE_TOOL_NO_CONFIG_CACHE", "1")
+    config_path = tmp_path / "release_tool.toml"
+    _write_current_config(config_path)
+
+    Config.from_file(str(config_path))
+    assert not (tmp_path / "cache").exists()
+
+
+def test_migration_registry_covers_all_migration_modules():
+    """Test that every migration module is listed in the static registry."""
+    from release_tool.migrations import manager
+
+    files = {p.stem for p in Path(manager.__file__).parent.glob("v*_to_v*.py")}
+    assert set(manager.MIGRATIONS.values()) == files
+
+
+def test_github_graphql_url_follows_api_url():
+    """Test that GraphQL requests go to the endpoint matching api_url."""
+    assert GitHubConfig().graphql_url == "https://api.github.com/graphql"
+    assert GitHubConfig(api_url="https://ghe.example.com/api/v3/").graphql_url == "https://ghe.example.com/api/graphql"
+    assert GitHubConfig(api_url="http://127.0.0.1:8123").graphql_url == "http://127.0.0.1:8123/graphql"
@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the release-tool daemon and its thin client."""
+
+import io
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from release_tool.daemon import (
+    ReleaseToolDaemon, enable_warm_state, close_warm_state, forward, ping, stop, subcommand_of,
+)
+from release_tool.db import Database
+from release_tool.main import cli
+from release_tool.migrations import MigrationManager
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "release_tool.toml"
+    path.write_text(
+        f'config_version = "{MigrationManager.CURRENT_VERSION}"\n'
+        '[repository]\n'
+        'code_repos = [{link = "test/repo", alias = "repo"}]\n'
+        '[database]\n'
+        f'path = "{tmp_path / "test.db"}"\n'
+    )
+    db = Database(str(tmp_path / "test.db"))
+    db.connect()
+    db.close()
+    return path
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon in a background thread; yields its socket path."""
+    socket_path = str(tmp_path / "daemon.sock")
+    enable_warm_state()
+    server = ReleaseToolDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    assert server.ready.wait(5)
+    yield socket_path
+    stop(socket_path)
+    thread.join(5)
+    assert not thread.is_alive()
+    close_warm_state()
+
+
+def test_subcommand_of():
+    """Test finding the subcommand after the global options."""
+    assert subcommand_of(['generate', '1.0.0']) == 'generate'
+    assert subcommand_of(['-c', 'x.toml', '--auto', '-y', 'push', '1.0.0']) == 'push'
+    assert subcommand_of(['--config=x.toml', '--debug', 'issues']) == 'issues'
+    assert subcommand_of(['--output-mode', 'machine', '--output-mode=human', 'cancel']) == 'cancel'
+    assert subcommand_of(['--profile', 'trace.json', '--profile-pstats=run.pstats', 'generate']) == 'generate'
+    assert subcommand_of(['-h']) is None
+    assert subcommand_of([]) is None
+
+
+def test_forward_matches_local_run(daemon, config_path, tmp_path):
+    """Test that a forwarded command produces the same output and exit code as a local run."""
+    args = ['-c', str(config_path), 'issues', '--limit', '1']
+    local = CliRunner().invoke(cli, args, obj={})
+
+    out, err = io.StringIO(), io.StringIO()
+    assert forward(args, daemon, stdout=out, stderr=err) == local.exit_code == 0
+    assert out.getvalue() == local.output
+
+    # Errors keep their exit code too
+    out = io.StringIO()
+    assert forward(['-c', str(config_path), 'issues', '--format', 'bogus'], daemon, stdout=out, stderr=out) == 2
+
+
+def test_daemon_reuses_database_connection(daemon, config_path):
+    """Test that requests share one SQLite connection."""
+    args = ['-c', str(config_path), 'issues', '--limit', '1']
+    assert forward(args, daemon, stdout=io.StringIO()) == 0
+    connections = dict(Database._shared_connections)
+    assert len(connections) == 1
+
+    assert forward(args, daemon, stdout=io.StringIO()) == 0
+    assert Database._shared_connections == connections
+
+
+def test_daemon_rejects_unsupported_commands(daemon, config_path):
+    """Test that only the served commands run on the daemon."""
+    err = io.StringIO()
+    assert forward(['-c', str(config_path), 'init-config'], daemon, stdout=io.StringIO(), stderr=err) == 2
+    assert 'not served by the daemon' in err.getvalue()
+
+
+def test_forward_sends_client_environment(daemon, monkeypatch):
+    """Test that requests carry the client's GitHub and release-tool variables."""
+    received = []
+    monkeypatch.setattr(ReleaseToolDaemon, 'run', lambda self, *args, env=None: received.append(env) or 0)
+    monkeypatch.setenv('GITHUB_TOKEN', 'client-token')
+    monkeypatch.setenv('RELEASE_TOOL_NO_CONFIG_CACHE', '1')
+
+    assert forward(['issues'], daemon, stdout=io.StringIO()) == 0
+    assert received[0]['GITHUB_TOKEN'] == 'client-token'
+    assert received[0]['RELEASE_TOOL_NO_CONFIG_CACHE'] == '1'
+    assert 'PATH' not in received[0]
+
+
+def test_run_uses_request_environment(tmp_path, monkeypatch):
+    """Test that a request runs with the client's variables in place of the daemon's."""
+    import os
+
+    seen = {}
+
+    def fake_main(**kwargs):
+        seen.update(token=os.environ.get('GITHUB_TOKEN'), cache=os.environ.get('RELEASE_TOOL_NO_CONFIG_CACHE'))
+
+    monkeypatch.setattr(cli, 'main', fake_main)
+    monkeypatch.setenv('GITHUB_TOKEN', 'daemon-token')
+    monkeypatch.setenv('RELEASE_TOOL_NO_CONFIG_CACHE', '1')
+    server = ReleaseToolDaemon(str(tmp_path / "daemon.sock"))
+
+    assert server.run(['issues'], str(tmp_path), io.StringIO(), io.StringIO(), env={'GITHUB_TOKEN': 'client-token'}) == 0
+    assert seen == {'token': 'client-token', 'cache': None}
+    # The daemon's own variables are back afterwards
+    assert os.environ['GITHUB_TOKEN'] == 'daemon-token'
+    assert os.environ['RELEASE_TOOL_NO_CONFIG_CACHE'] == '1'
+
+
+def test_forward_without_daemon(tmp_path):
+    """Test that the client reports a missing daemon so the caller can run locally."""
+    socket_path = str(tmp_path / "missing.sock")
+    assert forward(['issues'], socket_path) is None
+    assert not ping(socket_path)
+
+
+def test_shared_connection_survives_close(tmp_path):
+    """Test that closing a shared Database keeps the connection for the next instance."""
+    Database.enable_shared_connections()
+    try:
+        first = Database(str(tmp_path / "test.db"))
+        first.connect()
+        conn = first.conn
+        first.close()
+
+        second = Database(str(tmp_path / "test.db"))
+        second.connect()
+        assert second.conn is conn
+        second.close()
+    finally:
+        Database.close_shared_connections()
+
+    # Sharing is off again: instances get their own connections
+    third = Database(str(tmp_path / "test.db"))
+    third.connect()
+    assert third.conn is not conn
+    third.close()
@@ -96,6 +96,14 @@ def test_upsert_commit(db):
     assert fetched_commit.message == "Test commit"
     assert fetched_commit.author.name == "dev"
     assert fetched_commit.author.email == "dev@example.com"
+    assert fetched_commit.issue_patterns_key is None
+
+    commit.issue_keys = ["12"]
+    commit.issue_patterns_key = "patterns"
+    db.upsert_commit(commit)
+    fetched_commit = db.get_commit("abc123")
+    assert fetched_commit.issue_keys == ["12"]
+    assert fetched_commit.issue_patterns_key == "patterns"
 
 
 def test_upsert_issue(db):
@@ -657,3 +665,193 @@ def test_get_all_releases_backwards_compatibility(db):
     assert len(releases) == 2
     assert releases[0].version == "1.1.0"
     assert releases[1].version == "1.1.0-rc.1"
+
+
+def test_authors_and_labels_are_interned(db):
+    """Test that repeated authors/labels are stored once and shared on read."""
+    repo_id = db.upsert_repository(Repository(owner="test", name="repo"))
+
+    author = Author(username="dev", github_id=42, display_name="Dev")
+    for number in (1, 2):
+        db.upsert_pull_request(PullRequest(
+            repo_id=repo_id,
+            number=number,
+            title=f"PR {number}",
+            state="closed",
+            merged_at=datetime(2024, 1, number),
+            author=author,
+            labels=[Label(name="feature", color="00ff00"), Label(name="bug")]
+        ))
+    db.upsert_issue(Issue(
+        repo_id=repo_id, number=7, key="7", title="Issue", state="open",
+        labels=[Label(name="bug")]
+    ))
+
+    assert db.conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0] == 1
+    assert db.conn.execute("SELECT COUNT(*) FROM labels").fetchone()[0] == 2
+    assert db.conn.execute(
+        "SELECT COUNT(*) FROM pull_requests WHERE author_json IS NOT NULL OR labels IS NOT NULL"
+    ).fetchone()[0] == 0
+
+    prs = db.get_merged_prs_between_dates(repo_id, None, None)
+    assert [pr.number for pr in prs] == [1, 2]
+    assert prs[0].author is prs[1].author
+    assert prs[0].author.display_name == "Dev"
+    # Label order is preserved
+    assert [l.name for l in prs[0].labels] == ["feature", "bug"]
+    assert prs[0].labels[1] is db.get_issue(repo_id, "7").labels[0]
+
+
+def test_interned_author_keeps_known_fields(db):
+    """Test that a sparser copy of an author does not erase stored fields."""
+    repo_id = db.upsert_repository(Repository(owner="test", name="repo"))
+
+    db.upsert_commit(Commit(
+        sha="a1", repo_id=repo_id, message="first", date=datetime(2024, 1, 1),
+        author=Author(name="Dev", email="Dev@Example.com")
+    ))
+    db.upsert_commit(Commit(
+        sha="a2", repo_id=repo_id, message="second", date=datetime(2024, 1, 2),
+        author=Author(email="dev@example.com", username="dev")
+    ))
+
+    commits = db.get_commits_by_repo(repo_id)
+    assert db.conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0] == 1
+    assert commits[1].author.name == "Dev"
+    assert commits[1].author.username == "dev"
+
+
+def test_legacy_json_rows_are_migrated(tmp_path):
+    """Test that author_json/labels blobs from older schemas move to interned tables."""
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript("""
+        CREATE TABLE repositories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, owner TEXT NOT NULL, name TEXT NOT NULL,
+            full_name TEXT NOT NULL UNIQUE, url TEXT, default_branch TEXT DEFAULT 'main'
+        );
+        CREATE TABLE pull_requests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, repo_id INTEGER NOT NULL,
+            number INTEGER NOT NULL, title TEXT NOT NULL, body TEXT, state TEXT,
+            merged_at TEXT, author_json TEXT, base_branch TEXT, head_branch TEXT,
+            head_sha TEXT, labels TEXT, url TEXT, UNIQUE(repo_id, number)
+        );
+        CREATE TABLE commits (
+            sha TEXT PRIMARY KEY, repo_id INTEGER NOT NULL, message TEXT NOT NULL,
+            author_json TEXT NOT NULL, date TEXT NOT NULL, url TEXT, pr_number INTEGER
+        );
+        INSERT INTO repositories (owner, name, full_name) VALUES ('test', 'repo', 'test/repo');
+        INSERT INTO pull_requests (repo_id, number, title, state, author_json, labels)
+        VALUES (1, 5, 'Legacy PR', 'closed', '{"username": "dev", "github_id": 9}',
+                '[{"name": "bug", "color": "ff0000", "description": null}]');
+        INSERT INTO commits (sha, repo_id, message, author_json, date)
+        VALUES ('abc', 1, 'Legacy commit', '{"username": "dev", "github_id": 9}',
+                '2024-01-01T00:00:00');
+    """)
+    conn.commit()
+    conn.close()
+
+    database = Database(str(db_path))
+    database.connect()
+    try:
+        pr = database.get_pull_request(1, 5)
+        commit = database.get_commit("abc")
+        assert pr.author.username == "dev"
+        assert pr.labels[0].color == "ff0000"
+        assert commit.author is pr.author
+        assert database.conn.execute(
+            "SELECT COUNT(*) FROM commits WHERE author_json IS NOT NULL"
+        ).fetchone()[0] == 0
+        assert database.conn.execute("SELECT COUNT(*) FROM authors").fetchone()[0] == 1
+    finally:
+        database.close()
+
+
+def test_issue_note_sections_pre_extracted(db):
+    """Test description/migration sections are extracted at upsert and on regex change."""
+    repo_id = db.upsert_repository(Repository(owner="test", name="repo"))
+    body = "## Description\nAdds X.\n\n## Migration\nRun Y.\n"
+
+    # Issues stored before configuration are extracted when configuring
+    db.upsert_issue(Issue(repo_id=repo_id, number=1, key="1", title="One", state="closed", body=body))
+    assert db.get_issue(repo_id, "1").sections_extracted is False
+    assert db.configure_note_sections(r'## Description\n(.*?)(?=\n## |\Z)', r'## Migration\n(.*?)(?=\n## |\Z)') == 1
+
+    db.upsert_issue(Issue(repo_id=repo_id, number=2, key="2", title="Two", state="closed", body=body))
+    for key in ("1", "2"):
+        issue = db.get_issue(repo_id, key)
+        assert issue.sections_extracted is True
+        assert issue.description == "Adds X."
+        assert issue.migration_notes == "Run Y."
+        assert issue.body == body
+
+    # Same regexes: nothing to re-extract
+    assert db.configure_note_sections(r'## Description\n(.*?)(?=\n## |\Z)', r'## Migration\n(.*?)(?=\n## |\Z)') == 0
+    # Changed regexes: everything re-extracted
+    assert db.configure_note_sections(r'## Migration\n(.*?)(?=\n## |\Z)', None) == 2
+    issue = db.get_issue(repo_id, "2")
+    assert issue.description == "Run Y."
+    assert issue.migration_notes is None
+
+
+def test_issue_bodies_are_compressed(db):
+    """Test that issue bodies are stored compressed and decoded transparently."""
+    repo_id = db.upsert_repository(Repository(owner="test", name="repo"))
+    body = "Long body. " * 200
+    db.upsert_issue(Issue(repo_id=repo_id, number=1, key="1", title="One", state="open", body=body))
+
+    row = db.conn.execute("SELECT body, body_z FROM issues").fetchone()
+    assert row["body"] is None
+    assert len(row["body_z"]) < len(body)
+    assert db.get_issue_by_key("1").body == body
+    assert db.query_issues(issue_key="1")[0].body == body
+
+
+def test_compact_drops_old_bodies(db):
+    """Test compaction compresses legacy bodies and drops bodies past retention."""
+    repo_id = db.upsert_repository(Repository(owner="test", name="repo"))
+    db.configure_note_sections(r'## Description\n(.*)', None)
+    db.upsert_issue(Issue(
+        repo_id=repo_id, number=1, key="1", title="Old", state="closed",
+        body="## Description\nOld change", closed_at=datetime(2020, 1, 1)
+    ))
+    db.upsert_issue(Issue(
+        repo_id=repo_id, number=2, key="2", title="Recent", state="closed",
+        body="Recent body", closed_at=datetime(2024, 6, 1)
+    ))
+    # Simulate a plain-text body written by an older version
+    db.conn.execute("UPDATE issues SET body='Recent body', body_z=NULL WHERE key='2'")
+    db.conn.commit()
+
+    stats = db.compact(drop_bodies_before=datetime(2023, 1, 1))
+    assert stats['compressed'] == 1
+    assert stats['dropped'] == 1
+
+    old = db.get_issue(repo_id, "1")
+    assert old.body is None
+    assert old.description == "Old change"
+    assert db.get_issue(repo_id, "2").body == "Recent body"
+    assert db.conn.execute("SELECT COUNT(*) FROM issues WHERE body IS NOT NULL").fetchone()[0] == 0
+
+
+def test_publish_state(db):
+    """Test recording, replacing and clearing the publish state of a release."""
+    from release_tool.db import publish_hash
+
+    assert publish_hash({'body': "notes", 'draft': True}) == publish_hash({'draft': True, 'body': "notes"})
+    db.record_publish_state("test/repo", "1.0.0", "release", "a" * 64, "https://github.com/test/repo/releases/1")
+    db.record_publish_state("test/repo", "1.0.0", "release", "b" * 64, "https://github.com/test/repo/releases/1")
+    db.record_publish_state("test/repo", "1.0.0", "issue", "c" * 64)
+    db.record_publish_state("test/repo", "2.0.0", "release", "d" * 64)
+
+    state = db.get_publish_state("test/repo", "1.0.0")
+    assert state == {
+        'release': {'hash': "b" * 64, 'url': "https://github.com/test/repo/releases/1"},
+        'issue': {'hash': "c" * 64, 'url': None},
+    }
+
+    db.clear_publish_state("test/repo", "1.0.0", ['issue'])
+    assert list(db.get_publish_state("test/repo", "1.0.0")) == ['release']
+    db.clear_publish_state("test/repo", "1.0.0")
+    assert db.get_publish_state("test/repo", "1.0.0") == {}
+    assert list(db.get_publish_state("test/repo", "2.0.0")) == ['release']
@@ -4,10 +4,12 @@
 
 """End-to-end tests for generate command with release_version_policy."""
 
+import json
+
 import pytest
 from pathlib import Path
 from click.testing import CliRunner
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from release_tool.commands.generate import generate
 from release_tool.config import Config
@@ -130,6 +132,14 @@ class TestE2EGeneratePolicyFinalOnly:
         # Verify version appears in pr_code title
         assert pr_code_parsed['title'] and "1.1.0-rc.4" in pr_code_parsed['title']
 
+        # generate leaves a release plan for push next to the drafts
+        plan = json.loads((tmp_path / "draft" / "1.1.0-rc.4-plan.json").read_text())
+        assert plan['version'] == "1.1.0-rc.4"
+        assert plan['comparison_versions'] == {'final-only': "1.0.0", 'include-rcs': "1.1.0-rc.3"}
+        assert plan['release_branch'] == "main"
+        assert plan['head_sha'] == git_scenario.repo.head.commit.hexsha
+        assert {Path(draft['path']) for draft in plan['drafts']} == {pr_code_file, draft_file}
+
     def test_include_rcs_policy_rc4_shows_changes_since_rc3(
         self, git_scenario, populated_db, mock_github_api, tmp_path
     ):
@@ -194,8 +204,9 @@ class TestE2EGeneratePolicyFinalOnly:
 
         assert len(pr_code_parsed['all_notes']) == 2
 
+    @pytest.mark.parametrize("extra_args", [[], ['--stream']])
     def test_multiple_templates_different_policies(
-        self, git_scenario, populated_db, mock_github_api, tmp_path
+        self, git_scenario, populated_db, mock_github_api, tmp_path, extra_args
     ):
         """
         Test multiple pr_code templates each using their own policy.
@@ -239,7 +250,7 @@ class TestE2EGeneratePolicyFinalOnly:
         with patch('release_tool.commands.generate.GitHubClient'):
             result = runner.invoke(
                 generate,
-                ['1.1.0-rc.4', '--repo-path', str(repo_path)],
+                ['1.1.0-rc.4', '--repo-path', str(repo_path)] + extra_args,
                 obj={'config': config, 'debug': False},
                 catch_exceptions=False
             )
@@ -459,3 +470,121 @@ class TestE2EGenerateEdgeCases:
         pr_code_parsed = parse_markdown_output(pr_code_file.read_text())
 
         assert set(pr_code_parsed['pr_numbers']) == {101, 102}
+
+
+class TestE2EGenerateRendering:
+    """End-to-end tests for how generate renders its outputs."""
+
+    @staticmethod
+    def _config(tmp_path, db, templates, **output):
+        config_dict = create_test_config(
+            code_repo="test/repo",
+            pr_code_templates=templates,
+            draft_output_path=str(tmp_path / "draft" / "{{version}}-{{output_file_type}}.md"),
+            database={"path": db.db_path},
+            branch_policy={
+                "create_branches": False,
+                "default_branch": "main",
+                "release_branch_template": "main",
+                "branch_from_previous_release": False
+            },
+            output=output
+        )
+        return Config.from_dict(config_dict)
+
+    @staticmethod
+    def _generate(config, repo_path, *args):
+        with patch('release_tool.commands.generate.GitHubClient'):
+            result = CliRunner().invoke(
+                generate,
+                ['1.1.0-rc.4', '--repo-path', str(repo_path), *args],
+                obj={'config': config, 'debug': False},
+                catch_exceptions=False
+            )
+        assert result.exit_code == 0, result.output
+
+    def test_media_goes_through_the_configured_store(
+        self, git_scenario, populated_db, mock_github_api, tmp_path
+    ):
+        """Test that media is fetched once per run into output.media_cache_dir and copied to the assets."""
+        git_scenario.create_release_scenario_rc_sequence()
+        repo_path = Path(git_scenario.repo.working_dir)
+        db, repo_id, test_data = populated_db
+        issue = test_data['issues'][109]
+        issue.key = "109"
+        issue.body = "## Description\n![shot](https://example.com/shot.png)\n"
+        db.upsert_issue(issue)
+        pr = test_data['prs'][109]
+        pr.body = "Parent issue: https://github.com/test/repo/issues/109"
+        db.upsert_pull_request(pr)
+
+        config = self._config(
+            tmp_path, db,
+            [
+                default_pr_code_template(output_path="unused", release_version_policy="final-only"),
+                default_pr_code_template(output_path="unused", release_version_policy="include-rcs"),
+            ],
+            download_media=True,
+            media_cache_dir=str(tmp_path / "media"),
+            assets_path=str(tmp_path / "draft" / "assets" / "{{version}}")
+        )
+
+        response = Mock(status_code=200, headers={'ETag': '"v1"'})
+        response.iter_content.return_value = [b"png-bytes"]
+        with patch('release_tool.media_utils.requests.get', return_value=response) as mock_get:
+            self._generate(config, repo_path)
+
+        # Two templates and the draft reference the image; it is fetched once
+        assert mock_get.call_count == 1
+        manifest = json.loads((tmp_path / "media" / "manifest.json").read_text())
+        assert "https://example.com/shot.png" in manifest['urls']
+        [asset] = (tmp_path / "draft" / "assets" / "1.1.0-rc.4").iterdir()
+        assert asset.read_bytes() == b"png-bytes"
+        assert f"assets/1.1.0-rc.4/{asset.name}" in (tmp_path / "draft" / "1.1.0-rc.4-release.md").read_text()
+
+    @pytest.mark.parametrize("extra_args", [[], ['--stream']])
+    def test_note_contexts_built_once_per_output_directory(
+        self, git_scenario, populated_db, mock_github_api, tmp_path, extra_args
+    ):
+        """Test that the templates and the draft share each note's context instead of rebuilding it."""
+        from release_tool.policies import ReleaseNoteGenerator
+
+        git_scenario.create_release_scenario_rc_sequence()
+        repo_path = Path(git_scenario.repo.working_dir)
+        db, repo_id, test_data = populated_db
+        config = self._config(tmp_path, db, [
+            default_pr_code_template(output_path="unused", release_version_policy="include-rcs"),
+            default_pr_code_template(output_path="unused", release_version_policy="include-rcs"),
+        ])
+
+        built = []
+        build = ReleaseNoteGenerator._build_note_context
+
+        def counting_build(self, note, version, output_path, *args):
+            built.append((note.title, str(Path(output_path).parent)))
+            return build(self, note, version, output_path, *args)
+
+        with patch.object(ReleaseNoteGenerator, '_build_note_context', counting_build):
+            self._generate(config, repo_path, *extra_args)
+
+        # Two notes (#109, #110) since rc.3, rendered by two templates and the draft
+        assert sorted(built) == [("Test PR #109", str(tmp_path / "draft")), ("Test PR #110", str(tmp_path / "draft"))]
+        for name in ("1.1.0-rc.4-code-0.md", "1.1.0-rc.4-code-1.md", "1.1.0-rc.4-release.md"):
+            assert "Test PR #109" in (tmp_path / "draft" / name).read_text()
+
+
+class TestStreamToFile:
+    """Tests for the atomic writer used by --stream."""
+
+    def test_written_file_gets_default_mode(self, tmp_path):
+        """Test that streamed output gets the umask-based mode rather than mkstemp's 0600."""
+        import stat
+        from release_tool.commands.generate import _stream_to_file
+
+        target = tmp_path / "out" / "notes.md"
+        with patch('release_tool.commands.generate.ASSET_FILE_MODE', 0o640):
+            assert _stream_to_file(str(target), lambda out: out.write("# Notes\n"))
+
+        assert target.read_text() == "# Notes\n"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+        assert list(target.parent.iterdir()) == [target]
@@ -360,3 +360,24 @@ class TestPushBranch:
         git_ops.push_branch("release/0.0", remote="upstream", set_upstream=True)
 
         git_ops.repo.git.push.assert_called_once_with("-u", "upstream", "release/0.0")
+
+    def test_delete_remote_tags_single_push(self):
+        """Test deleting remote tags with one push, skipping tags missing on the remote."""
+        from unittest.mock import Mock, MagicMock
+        from release_tool.git_ops import GitOperations
+
+        git_ops = GitOperations(".")
+        git_ops.repo = MagicMock()
+        git_ops.repo.git = Mock()
+        git_ops.repo.git.ls_remote.return_value = (
+            "abc\trefs/tags/v1.0.0-rc.1\n"
+            "def\trefs/tags/v1.0.0-rc.1^{}\n"
+            "123\trefs/tags/v1.0.0-rc.3"
+        )
+
+        deleted = git_ops.delete_remote_tags(["v1.0.0-rc.1", "v1.0.0-rc.2", "v1.0.0-rc.3"])
+
+        assert deleted == ["v1.0.0-rc.1", "v1.0.0-rc.3"]
+        git_ops.repo.git.push.assert_called_once_with(
+            "origin", "--delete", "refs/tags/v1.0.0-rc.1", "refs/tags/v1.0.0-rc.3"
+        )
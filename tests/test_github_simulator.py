@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the local GitHub API simulator used by the pull benchmarks."""
+
+import pytest
+import requests
+
+from benchmarks.github_simulator import GitHubSimulator, SimulatedRepository
+from benchmarks.pull_benchmark import PullScale, run_scenarios, simulated_repository
+from helpers.config_helpers import create_test_config
+from release_tool.config import Config
+from release_tool.github_utils import GitHubClient
+
+AUTH = {'Authorization': 'token simulated'}
+
+
+@pytest.fixture
+def repository():
+    return SimulatedRepository("test/meta", issues=45, pull_requests=30, releases=3)
+
+
+def _client(monkeypatch, simulator):
+    monkeypatch.setenv('GITHUB_TOKEN', 'simulated-token')
+    config = Config.from_dict(create_test_config("test/meta", github={'api_url': simulator.url}))
+    return GitHubClient(config)
+
+
+def test_client_paginates_issues_and_pull_requests(monkeypatch, repository):
+    """Test that GitHubClient pages through issues (without PRs), PRs and releases."""
+    with GitHubSimulator([repository], max_page_size=20) as simulator:
+        client = _client(monkeypatch, simulator)
+        issues = client.fetch_all_issues("test/meta", 1)
+        prs = client.fetch_all_pull_requests("test/meta", 1)
+        releases = client.fetch_releases("test/meta", 1)
+
+        assert [issue.number for issue in issues] == list(range(1, 46))
+        assert sorted(pr.number for pr in prs) == list(range(46, 76))
+        # Every tenth PR is closed without merging
+        assert sum(1 for pr in prs if pr.merged_at is None) == 3
+        assert len(releases) == 3
+        # Pages of 20 are capped below per_page=100; the client stops at the first empty page
+        assert simulator.stats['by_route']['GET _list_issues'] == 5
+        assert simulator.stats['by_route']['GET _list_pulls'] == 3
+
+
+def test_etags_answer_not_modified_without_using_rate_limit(repository):
+    """Test that a matching If-None-Match gets a 304 that does not count against the limit."""
+    with GitHubSimulator([repository], rate_limit=10) as simulator:
+        url = f"{simulator.url}/repos/test/meta/issues/1"
+        first = requests.get(url, headers=AUTH)
+        assert first.status_code == 200
+        assert first.headers['X-RateLimit-Remaining'] == '9'
+
+        second = requests.get(url, headers={**AUTH, 'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+        assert second.headers['X-RateLimit-Remaining'] == '9'
+        assert simulator.stats['not_modified'] == 1
+
+        simulator.update_issue("test/meta", 1, state='open')
+        third = requests.get(url, headers={**AUTH, 'If-None-Match': first.headers['ETag']})
+        assert third.status_code == 200
+        assert third.json()['state'] == 'open'
+
+
+def test_rate_limits_and_faults(repository):
+    """Test primary and secondary rate limit responses and injected outages."""
+    with GitHubSimulator([repository], rate_limit=2) as simulator:
+        url = f"{simulator.url}/repos/test/meta"
+        assert [requests.get(url, headers=AUTH).status_code for _ in range(2)] == [200, 200]
+        limited = requests.get(url, headers=AUTH)
+        assert limited.status_code == 403
+        assert limited.headers['X-RateLimit-Remaining'] == '0'
+        assert 'rate limit' in limited.json()['message']
+
+    with GitHubSimulator([repository], max_concurrency=0, secondary_retry_after=7) as simulator:
+        limited = requests.get(f"{simulator.url}/repos/test/meta", headers=AUTH)
+        assert limited.status_code == 403
+        assert limited.headers['Retry-After'] == '7'
+        assert simulator.stats['secondary_rate_limited'] == 1
+
+    with GitHubSimulator([repository], outage_after=1, fault_paths='/issues') as simulator:
+        assert requests.get(f"{simulator.url}/repos/test/meta/issues/1", headers=AUTH).status_code == 200
+        assert requests.get(f"{simulator.url}/repos/test/meta/issues/1", headers=AUTH).status_code == 502
+        assert requests.get(f"{simulator.url}/repos/test/meta", headers=AUTH).status_code == 200
+        simulator.clear_faults()
+        assert requests.get(f"{simulator.url}/repos/test/meta/issues/1", headers=AUTH).status_code == 200
+
+
+def test_graphql_goes_to_the_configured_api(monkeypatch, repository):
+    """Test that GraphQL lookups use the endpoint derived from github.api_url."""
+    with GitHubSimulator([repository], projects=2) as simulator:
+        client = _client(monkeypatch, simulator)
+        assert client.config.github.graphql_url == f"{simulator.url}/graphql"
+
+        response = requests.post(
+            client.config.github.graphql_url,
+            json={'query': 'query($org: String!) { organization(login: $org) { projectsV2(first: 100) '
+                           '{ nodes { id title } } } }', 'variables': {'org': 'test'}},
+            headers=AUTH,
+        )
+        nodes = response.json()['data']['organization']['projectsV2']['nodes']
+        assert [node['title'] for node in nodes] == ["Project 1", "Project 2"]
+        assert simulator.stats['by_route']['POST _graphql'] == 1
+
+
+def test_pull_scenarios_store_the_whole_repository(tmp_path):
+    """Test that a full pull against the simulator stores every issue and merged PR."""
+    scale = PullScale(issues=120, prs=80, releases=2)
+    with GitHubSimulator([simulated_repository(scale)]) as simulator:
+        results = run_scenarios(simulator, tmp_path)
+
+    full, incremental = results['full'], results['incremental']
+    assert full['interrupted'] is None
+    assert full['complete']
+    assert full['stored'] == {'issues': 120, 'pull_requests': 72}
+    assert incremental['complete']
+    assert incremental['requests'] < full['requests']
+
+
+def test_release_notes_pr_is_one_commit(monkeypatch, repository):
+    """Test that release note files are published as one commit with a fixed number of calls."""
+    with GitHubSimulator([repository]) as simulator:
+        simulator.set_file("test/meta", "main", "docs/index.md", b"# Releases\n")
+        client = _client(monkeypatch, simulator)
+        # PyGithub spaces out requests, writes by a second (secondary rate limits)
+        requester = client.gh._Github__requester
+        monkeypatch.setattr(requester, '_Requester__seconds_between_requests', None)
+        monkeypatch.setattr(requester, '_Requester__seconds_between_writes', None)
+        files = {'docs/index.md': "# Releases\n", 'docs/releases/1.0.0.md': "Notes 1.0.0"}
+
+        url = client.create_pr_for_release_notes(
+            "test/meta", "Release 1.0.0", "CHANGELOG.md", "Changelog", "release/1.0.0", "main",
+            additional_files=files
+        )
+
+        assert url
+        routes = simulator.stats['by_route']
+        assert simulator.stats['requests'] <= 9
+        assert routes['POST _create_tree'] == 1 and routes['POST _create_commit'] == 1
+        assert not [route for route in routes if 'contents' in route]
+        assert simulator.read_file("test/meta", "release/1.0.0", "CHANGELOG.md") == b"Changelog"
+        assert simulator.read_file("test/meta", "release/1.0.0", "docs/releases/1.0.0.md") == b"Notes 1.0.0"
+        head = client.gh.get_repo("test/meta").get_git_ref("heads/release/1.0.0").object.sha
+
+        # Same content again: no commit, the branch stays put
+        simulator.reset_stats()
+        client.create_pr_for_release_notes(
+            "test/meta", "Release 1.0.0", "CHANGELOG.md", "Changelog", "release/1.0.0", "main",
+            additional_files=files
+        )
+        assert 'POST _create_commit' not in simulator.stats['by_route']
+        assert 'PATCH _update_ref' not in simulator.stats['by_route']
+
+        # A changed file fast-forwards the existing branch
+        client.create_pr_for_release_notes(
+            "test/meta", "Release 1.0.0", "CHANGELOG.md", "Changelog v2", "release/1.0.0", "main",
+            additional_files=files
+        )
+        assert simulator.stats['by_route']['PATCH _update_ref'] == 1
+        new_head = client.gh.get_repo("test/meta").get_git_commit(
+            client.gh.get_repo("test/meta").get_git_ref("heads/release/1.0.0").object.sha
+        )
+        assert [parent.sha for parent in new_head.parents] == [head]
+        assert new_head.message == "Update CHANGELOG.md"
+        assert simulator.read_file("test/meta", "release/1.0.0", "CHANGELOG.md") == b"Changelog v2"
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for ingesting GitHub event payloads."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from release_tool.db import Database
+from release_tool.event_ingest import detect_event_name
+from release_tool.main import cli
+from release_tool.migrations import MigrationManager
+from helpers.config_helpers import create_test_config, write_config_file
+
+REPOSITORY = {
+    "name": "repo",
+    "full_name": "test/repo",
+    "owner": {"login": "test"},
+    "html_url": "https://github.com/test/repo",
+    "default_branch": "main",
+}
+USER = {"login": "dev", "id": 7, "avatar_url": None, "html_url": None, "type": "User"}
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """Write a config and return a helper that runs ingest-event on payloads."""
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    monkeypatch.delenv("GITHUB_EVENT_NAME", raising=False)
+    db_path = tmp_path / "release_tool.db"
+    config_path = tmp_path / "release_tool.toml"
+    write_config_file(config_path, create_test_config(
+        config_version=MigrationManager.CURRENT_VERSION, database={"path": str(db_path)}
+    ))
+
+    def run(*payloads, args=()):
+        files = []
+        for i, payload in enumerate(payloads):
+            path = tmp_path / f"event-{i}.json"
+            path.write_text(json.dumps(payload))
+            files.append(str(path))
+        result = CliRunner().invoke(cli, ['-c', str(config_path), 'ingest-event', *args, *files], obj={})
+        db = Database(str(db_path))
+        db.connect()
+        return result, db
+
+    return run
+
+
+def test_ingest_issue_pr_and_release(env):
+    """Test that issue, merged PR and release payloads are upserted with the pull converters."""
+    issue_event = {
+        "action": "closed",
+        "issue": {
+            "number": 5, "title": "Broken login", "body": "Details", "state": "closed",
+            "labels": [{"name": "bug", "color": "ff0000"}],
+            "html_url": "https://github.com/test/repo/issues/5",
+            "created_at": "2024-02-01T09:30:00Z", "closed_at": "2024-02-02T09:30:00Z",
+        },
+        "repository": REPOSITORY,
+    }
+    pr_event = {
+        "action": "closed",
+        "pull_request": {
+            "number": 12, "title": "Fix login", "body": "Fixes #5", "state": "closed",
+            "merged_at": "2024-02-02T09:00:00Z", "user": USER,
+            "base": {"ref": "main"}, "head": {"ref": "fix/5", "sha": "abc"},
+            "labels": [], "html_url": "https://github.com/test/repo/pull/12",
+        },
+        "repository": REPOSITORY,
+    }
+    release_event = {
+        "action": "published",
+        "release": {
+            "tag_name": "v1.2.0", "name": "1.2.0", "body": "Notes", "draft": False,
+            "prerelease": False, "created_at": "2024-02-03T00:00:00Z",
+            "published_at": "2024-02-03T00:00:00Z", "target_commitish": "main",
+            "html_url": "https://github.com/test/repo/releases/tag/v1.2.0",
+        },
+        "repository": REPOSITORY,
+    }
+
+    result, db = env(issue_event, pr_event, release_event)
+    assert result.exit_code == 0, result.output
+    assert "1 issue(s), 1 PR(s), 1 release(s)" in result.output
+
+    repo_id = db.get_repository_id("test/repo")
+    issue = db.get_issue(repo_id, "5")
+    assert issue.state == "closed"
+    assert [label.name for label in issue.labels] == ["bug"]
+    pr = db.get_pull_request(repo_id, 12)
+    assert pr.author.username == "dev"
+    assert pr.merged_at is not None
+    release = db.get_release(repo_id, "1.2.0")
+    assert release.tag_name == "v1.2.0"
+    assert release.target_commitish == "main"
+    db.close()
+
+    # Deleting the release removes it again
+    result, db = env(dict(release_event, action="deleted"))
+    assert result.exit_code == 0, result.output
+    assert db.get_release(repo_id, "1.2.0") is None
+    db.close()
+
+
+def test_ingest_push_commits(env):
+    """Test that pushed commits are indexed with PR numbers and issue keys."""
+    push_event = {
+        "ref": "refs/heads/main",
+        "after": "b" * 40,
+        "commits": [
+            {
+                "id": "a" * 40, "message": "Fix login (#12)\n\nFixes #5",
+                "timestamp": "2024-02-02T10:00:00+01:00",
+                "author": {"name": "Dev", "email": "dev@example.com", "username": "dev"},
+                "url": "https://github.com/test/repo/commit/" + "a" * 40,
+            },
+        ],
+        "repository": REPOSITORY,
+    }
+
+    result, db = env(push_event)
+    assert result.exit_code == 0, result.output
+    repo_id = db.get_repository_id("test/repo")
+    commit = db.get_commits_by_shas(repo_id, ["a" * 40])["a" * 40]
+    assert commit.pr_number == 12
+    assert commit.author.email == "dev@example.com"
+    assert commit.date.tzinfo is None
+    db.close()
+
+    # Tag pushes carry no branch commits
+    result, db = env(dict(push_event, ref="refs/tags/v1.2.0"))
+    assert "is not a branch" in " ".join(result.output.split())
+    db.close()
+
+
+def test_ingest_skips_unmerged_prs_and_unknown_repos(env):
+    """Test that ingestion follows the pull rules for PRs and configured repositories."""
+    open_pr = {
+        "action": "opened",
+        "pull_request": {"number": 3, "title": "WIP", "state": "open", "merged_at": None, "user": USER},
+        "repository": REPOSITORY,
+    }
+    other_repo = {
+        "action": "opened",
+        "issue": {"number": 1, "title": "Elsewhere", "state": "open"},
+        "repository": dict(REPOSITORY, full_name="other/repo", name="repo"),
+    }
+
+    result, db = env(open_pr, other_repo)
+    assert result.exit_code == 0, result.output
+    output = " ".join(result.output.split())
+    assert "PR #3 is not merged" in output
+    assert "'other/repo' is not configured" in output
+    assert db.get_repository_id("other/repo") is None
+    db.close()
+
+
+def test_ingest_reads_actions_event_path(env, tmp_path, monkeypatch):
+    """Test that without arguments the running workflow's event is ingested."""
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps({
+        "action": "opened",
+        "issue": {"number": 9, "title": "New", "state": "open"},
+        "repository": REPOSITORY,
+    }))
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+    monkeypatch.setenv("GITHUB_EVENT_NAME", "issues")
+
+    result, db = env()
+    assert result.exit_code == 0, result.output
+    assert db.get_issue(db.get_repository_id("test/repo"), "9").title == "New"
+    db.close()
+
+
+def test_detect_event_name():
+    """Test event detection from payload shape."""
+    assert detect_event_name({"pull_request": {}}) == "pull_request"
+    assert detect_event_name({"release": {}}) == "release"
+    assert detect_event_name({"issue": {}}) == "issues"
+    assert detect_event_name({"issue": {}, "comment": {}}) == "issue_comment"
+    assert detect_event_name({"ref": "refs/heads/main", "commits": []}) == "push"
+    assert detect_event_name({"zen": "Keep it simple"}) is None
@@ -7,14 +7,14 @@
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-from release_tool.media_utils import MediaDownloader
+from release_tool.media_utils import MediaDownloader, MediaStore
 
 
 @pytest.fixture
 def media_downloader(tmp_path):
     """Create a MediaDownloader instance for testing."""
     assets_path = str(tmp_path / "assets" / "v{{ major }}.{{ minor }}")
-    return MediaDownloader(assets_path, download_enabled=True)
+    return MediaDownloader(assets_path, download_enabled=True, store=MediaStore(str(tmp_path / "media")))
 
 
 def test_process_markdown_images(media_downloader, tmp_path):
@@ -185,3 +185,119 @@ def test_disabled_media_downloader(tmp_path):
     
     # Nothing should be changed
     assert result == description
+
+
+def _mock_response(status_code=200, content=b"", headers=None):
+    """Build a mocked streaming requests response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content = Mock(return_value=[content] if content else [])
+    response.raise_for_status = Mock()
+    return response
+
+
+def test_media_store_revalidates_instead_of_redownloading(tmp_path):
+    """Test that a later run sends a conditional request and reuses the cached blob."""
+    from release_tool.media_utils import MediaStore
+
+    url = "https://example.com/screenshot.png"
+    with patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.return_value = _mock_response(200, b"png-bytes", {'ETag': '"v1"'})
+        blob = MediaStore(str(tmp_path / "media")).fetch_many([url])[url]
+    assert blob.read_bytes() == b"png-bytes"
+
+    # New store instance = new run, reading the persisted manifest
+    store = MediaStore(str(tmp_path / "media"))
+    with patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.return_value = _mock_response(304)
+        assert store.fetch_many([url])[url] == blob
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        # Validated once per run
+        store.fetch_many([url])
+        assert mock_get.call_count == 1
+    assert store.stats['not_modified'] == 1
+
+
+def test_media_store_deduplicates_identical_content(tmp_path):
+    """Test that identical media under different URLs is stored once."""
+    from release_tool.media_utils import MediaStore
+
+    store = MediaStore(str(tmp_path / "media"), max_workers=4)
+    urls = ["https://example.com/v1/logo.png", "https://example.com/v2/logo.png"]
+    with patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.side_effect = lambda *a, **kw: _mock_response(200, b"same-bytes")
+        result = store.fetch_many(urls)
+
+    assert result[urls[0]] == result[urls[1]]
+    assert len(list((tmp_path / "media" / "blobs").rglob("*"))) == 2  # one dir + one blob
+    assert store.stats['deduplicated'] == 1
+
+
+def test_media_store_enforces_file_size_limit(tmp_path):
+    """Test that media over the per-file limit is not stored."""
+    from release_tool.media_utils import MediaStore
+
+    store = MediaStore(str(tmp_path / "media"), max_file_bytes=4)
+    url = "https://example.com/huge.mp4"
+    with patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.return_value = _mock_response(200, b"too-large", {'Content-Length': '9'})
+        assert store.fetch_many([url])[url] is None
+
+
+def test_download_media_copies_from_store(tmp_path):
+    """Test that downloaded media is placed in the versioned assets directory."""
+    from release_tool.media_utils import MediaStore
+
+    store = MediaStore(str(tmp_path / "media"))
+    downloader = MediaDownloader(str(tmp_path / "docs" / "assets" / "{{ version }}"), store=store)
+    with patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.return_value = _mock_response(200, b"img")
+        downloader.prefetch(["![a](https://example.com/a.png)"])
+        relative = downloader._download_media(
+            "https://example.com/a.png", "1.0.0", str(tmp_path / "docs" / "notes.md")
+        )
+
+    assert mock_get.call_count == 1
+    assert relative.startswith("assets/1.0.0/")
+    assert (tmp_path / "docs" / relative).read_bytes() == b"img"
+
+
+def test_media_downloader_requires_a_store(tmp_path):
+    """Test that downloads cannot fall back to a store outside the configured cache."""
+    with pytest.raises(ValueError, match="media store"):
+        MediaDownloader(str(tmp_path / "assets"), download_enabled=True)
+    assert MediaDownloader(str(tmp_path / "assets"), download_enabled=False).store is None
+
+
+def test_download_media_replaces_changed_asset_of_same_size(tmp_path):
+    """Test that an image changed in place at the same URL and size is copied again."""
+    url = "https://example.com/a.png"
+    output_path = str(tmp_path / "docs" / "notes.md")
+    with patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.return_value = _mock_response(200, b"old")
+        first = MediaDownloader(str(tmp_path / "docs" / "assets"), store=MediaStore(str(tmp_path / "media")))
+        relative = first._download_media(url, "1.0.0", output_path)
+
+        # Next run: the image changed on the server, with the same byte size
+        mock_get.return_value = _mock_response(200, b"new")
+        second = MediaDownloader(str(tmp_path / "docs" / "assets"), store=MediaStore(str(tmp_path / "media")))
+        assert second._download_media(url, "1.0.0", output_path) == relative
+
+    assert (tmp_path / "docs" / relative).read_bytes() == b"new"
+
+
+def test_downloaded_assets_get_the_default_file_mode(tmp_path):
+    """Test that assets get the umask-based mode rather than mkstemp's 0600."""
+    import stat
+
+    store = MediaStore(str(tmp_path / "media"))
+    downloader = MediaDownloader(str(tmp_path / "docs" / "assets"), store=store)
+    with patch('release_tool.media_utils.ASSET_FILE_MODE', 0o640), \
+         patch('release_tool.media_utils.requests.get') as mock_get:
+        mock_get.return_value = _mock_response(200, b"img")
+        relative = downloader._download_media(
+            "https://example.com/a.png", "1.0.0", str(tmp_path / "docs" / "notes.md")
+        )
+
+    assert stat.S_IMODE((tmp_path / "docs" / relative).stat().st_mode) == 0o640
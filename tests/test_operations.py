@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the dependency-aware operation executor."""
+
+import threading
+
+import pytest
+
+from release_tool.operations import OperationGraph
+
+
+def test_independent_steps_overlap_and_dependents_wait():
+    """Test that independent steps run at once and a step sees its requirements' results."""
+    both_running = threading.Barrier(2, timeout=5)
+
+    def independent(value):
+        def run(results):
+            both_running.wait()
+            return value
+        return run
+
+    graph = OperationGraph()
+    graph.add('release', independent('url'))
+    graph.add('pr', independent({'number': '1'}))
+    graph.add('issue', lambda results: (results['release'], results['pr']['number']), requires=['release', 'pr'])
+
+    assert graph.run()['issue'] == ('url', '1')
+
+
+def test_one_worker_runs_steps_in_order():
+    """Test that a single worker runs steps in the order they were added."""
+    order = []
+    graph = OperationGraph()
+    for name in ('branch', 'release', 'pr:a', 'pr:b'):
+        graph.add(name, lambda results, name=name: order.append(name))
+
+    graph.run(max_workers=1)
+
+    assert order == ['branch', 'release', 'pr:a', 'pr:b']
+
+
+def test_one_worker_keeps_order_around_dependencies():
+    """Test that a single worker does not start a later independent step before a dependent one."""
+    order = []
+    graph = OperationGraph()
+    graph.add('branch', lambda results: order.append('branch'))
+    graph.add('release', lambda results: order.append('release'), requires=['branch'])
+    graph.add('pr', lambda results: order.append('pr'))
+
+    graph.run(max_workers=1)
+
+    assert order == ['branch', 'release', 'pr']
+
+
+def test_failed_run_resumes_from_journal():
+    """Test that a failure stops dependent steps and a rerun skips the journaled ones."""
+    calls = []
+    fail = {'pr': True}
+
+    def step(name, requires=()):
+        def run(results):
+            calls.append(name)
+            if fail.get(name):
+                raise RuntimeError(f"{name} failed")
+            return name.upper()
+        graph.add(name, run, requires=requires)
+
+    graph = OperationGraph()
+    step('branch')
+    step('release', ['branch'])
+    step('pr', ['branch'])
+    step('issue', ['pr'])
+    journal = {}
+
+    with pytest.raises(RuntimeError, match="pr failed"):
+        graph.run(journal={}, record=journal.__setitem__)
+    assert 'issue' not in calls
+    assert journal == {'branch': 'BRANCH', 'release': 'RELEASE'}
+
+    calls.clear()
+    fail.clear()
+    results = graph.run(journal=journal, record=journal.__setitem__)
+
+    assert calls == ['pr', 'issue']
+    assert graph.skipped == {'branch', 'release'}
+    assert results == {'branch': 'BRANCH', 'release': 'RELEASE', 'pr': 'PR', 'issue': 'ISSUE'}
+
+
+def test_journaled_step_reruns_after_its_requirement():
+    """Test that a journaled step runs again when a step it requires runs again."""
+    calls = []
+    graph = OperationGraph()
+    graph.add('pr', lambda results: calls.append('pr'))
+    graph.add('issue', lambda results: calls.append('issue'), requires=['pr'])
+
+    # 'pr' returned None last time, so it was not journaled
+    graph.run(journal={'issue': 7})
+
+    assert calls == ['pr', 'issue']
+
+
+def test_requirements_must_be_added_first():
+    """Test that unknown requirements and duplicate names are rejected."""
+    graph = OperationGraph()
+    graph.add('branch', lambda results: None)
+
+    with pytest.raises(ValueError, match="unknown operation"):
+        graph.add('release', lambda results: None, requires=['tag'])
+    with pytest.raises(ValueError, match="Duplicate"):
+        graph.add('branch', lambda results: None)
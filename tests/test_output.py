@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the human and machine output modes."""
+
+import io
+import json
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from benchmarks.github_simulator import GitHubSimulator, SimulatedRepository
+from helpers.config_helpers import create_test_config, write_config_file
+from release_tool import output
+from release_tool.config import Config
+from release_tool.main import cli
+from release_tool.migrations import MigrationManager
+from release_tool.models import Author, Commit
+from release_tool.policies import CommitConsolidator, IssueExtractor
+
+
+class _Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def machine():
+    previous = output.set_machine_mode(True)
+    yield
+    output.set_machine_mode(previous)
+
+
+def _lines(text):
+    return [json.loads(line) for line in text.splitlines() if line.startswith('{')]
+
+
+def test_resolve_mode():
+    """Test that auto picks the machine mode only when the stream is not a terminal."""
+    assert output.resolve_mode('auto', io.StringIO()) is True
+    assert output.resolve_mode('auto', _Terminal()) is False
+    assert output.resolve_mode('machine', _Terminal()) is True
+    assert output.resolve_mode('human', io.StringIO()) is False
+
+
+def test_machine_progress_is_rate_limited(machine, capsys):
+    """Test that machine progress logs one line per interval plus a final line."""
+    with output.Progress('test.items', "Working...", console=None, interval=60) as progress:
+        for n in range(1, 101):
+            if progress.due():
+                progress.update(f"Working... {n}", items=n)
+        progress.update(f"Done {n}", items=n)
+
+    lines = _lines(capsys.readouterr().err)
+    assert [line['event'] for line in lines] == ['progress', 'progress.done']
+    assert lines[0]['items'] == 1 and lines[0]['task'] == 'test.items'
+    assert lines[1]['items'] == 100
+    assert 'ts' in lines[1] and lines[1]['level'] == 'info'
+
+
+def test_human_progress_updates_every_time():
+    """Test that human progress always reports and writes no JSON."""
+    console = Console(file=io.StringIO())
+    with output.Progress('test.items', "Working...", console) as progress:
+        assert progress.due()
+        progress.update("Working... 1", items=1)
+    assert '{' not in console.file.getvalue()
+
+
+def test_fetch_all_issues_logs_json_progress(machine, monkeypatch, capsys):
+    """Test that paginated fetches report JSON progress instead of a spinner."""
+    from release_tool.github_utils import GitHubClient
+
+    monkeypatch.setenv('GITHUB_TOKEN', 'simulated-token')
+    with GitHubSimulator([SimulatedRepository("test/meta", issues=25)], max_page_size=10) as simulator:
+        config = Config.from_dict(create_test_config("test/meta", github={'api_url': simulator.url}))
+        issues = GitHubClient(config).fetch_all_issues("test/meta", 1)
+
+    assert len(issues) == 25
+    captured = capsys.readouterr()
+    done = [line for line in _lines(captured.err) if line['event'] == 'progress.done']
+    assert done == [{**done[0], 'task': 'github.issues', 'items': 25, 'pages': 3}]
+    assert "Fetching issues..." not in captured.out
+
+
+def test_consolidation_debug_is_structured_in_machine_mode(machine, capsys):
+    """Test that --debug consolidation traces become one JSON line per commit."""
+    config = Config.from_dict(create_test_config())
+    extractor = IssueExtractor(config, debug=True)
+    consolidator = CommitConsolidator(config, extractor, debug=True)
+    commits = [
+        Commit(sha=f"{n:07d}abc", repo_id=1, message=message, author=Author(name="dev"), date=datetime.now())
+        for n, message in enumerate(["Fix login #12", "Tidy up"])
+    ]
+
+    consolidator.consolidate(commits, {})
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    lines = _lines(captured.err)
+    assert [(line['event'], line['level'], line['issues']) for line in lines] == [
+        ('consolidation.commit', 'debug', ['12']),
+        ('consolidation.commit', 'debug', []),
+    ]
+
+
+def test_output_mode_option_is_scoped_to_the_invocation(tmp_path):
+    """Test that --output-mode applies to one run and is reset afterwards."""
+    config_path = tmp_path / "release_tool.toml"
+    write_config_file(config_path, create_test_config(
+        config_version=MigrationManager.CURRENT_VERSION, database={'path': str(tmp_path / "test.db")}
+    ))
+    seen = []
+
+    @cli.command('probe-output')
+    def probe():
+        seen.append(output.machine_mode())
+
+    try:
+        runner = CliRunner()
+        runner.invoke(cli, ['--config', str(config_path), '--output-mode', 'human', 'probe-output'])
+        runner.invoke(cli, ['--config', str(config_path), 'probe-output'])
+        runner.invoke(cli, ['--config', str(config_path), 'probe-output'],
+                      env={'RELEASE_TOOL_OUTPUT_MODE': 'human'})
+    finally:
+        cli.commands.pop('probe-output')
+
+    assert seen == [False, True, False]
+    assert output.machine_mode() is False
@@ -408,3 +408,107 @@ def test_nbsp_in_entry_template():
 
     # Should have two spaces (from &nbsp;&nbsp;) before "by"
     assert "  by @alice" in output
+
+
+def test_multiple_templates_share_note_contexts(sample_notes):
+    """Test that note contexts are built once and shared by all output templates."""
+    from unittest.mock import patch
+
+    templates = [
+        {"output_template": f"T{i}: {{% for note in all_notes %}}{{{{ render_entry(note) }}}}{{% endfor %}}",
+         "output_path": f"out-{i}.md"}
+        for i in range(3)
+    ]
+    config = Config.from_dict({
+        "repository": {"code_repos": [{"link": "test/repo", "alias": "repo"}]},
+        "release_notes": {
+            "categories": [
+                {"name": "Features", "labels": ["feature"], "order": 1},
+                {"name": "Bug Fixes", "labels": ["bug"], "order": 2},
+                {"name": "Documentation", "labels": ["docs"], "order": 3},
+            ]
+        },
+        "output": {"pr_code": {"repo": {"templates": templates}}}
+    })
+    generator = ReleaseNoteGenerator(config)
+    grouped = generator.group_by_category(sample_notes)
+
+    with patch.object(generator, '_build_note_context', wraps=generator._build_note_context) as build:
+        results = generator.format_markdown(grouped, "1.0.0", ["out-0.md", "out-1.md", "out-2.md", "draft.md"])
+
+    assert build.call_count == len(sample_notes)
+    # Output order follows the configured templates, then the draft
+    assert [path for _, path in results] == ["out-0.md", "out-1.md", "out-2.md", "draft.md"]
+    for i in range(3):
+        assert results[i][0].startswith(f"T{i}:")
+        assert "Fix critical bug" in results[i][0]
+
+
+def test_render_entry_caches_only_shared_note_contexts(sample_notes):
+    """Test that a dict that is not a shared note context is rendered every time."""
+    from unittest.mock import patch
+    from release_tool.template_utils import get_template
+
+    config = Config.from_dict({
+        "repository": {"code_repos": [{"link": "test/repo", "alias": "repo"}]},
+        "release_notes": {"entry_template": "[{{ title }}]"}
+    })
+    generator = ReleaseNoteGenerator(config)
+    entry_template = get_template(config.release_notes.entry_template, strict=False)
+
+    with generator.shared_rendering():
+        # A template's temporary dict; a later one may get the same id once it is freed
+        temporary = {'title': "First"}
+        assert generator._render_entry(entry_template, temporary) == "[First]"
+        temporary['title'] = "Second"
+        assert generator._render_entry(entry_template, temporary) == "[Second]"
+
+        shared = generator._prepare_note_for_template(sample_notes[0], "1.0.0", None, None)
+        with patch.object(entry_template, 'render', wraps=entry_template.render) as render:
+            first = generator._render_entry(entry_template, shared)
+            assert generator._render_entry(entry_template, shared) == first
+        assert render.call_count == 1
+
+
+def test_whitespace_stream_matches_whole_document_processing():
+    """Test that incremental whitespace processing equals processing the whole text."""
+    import io
+    import random
+    from release_tool.config import Config
+    from release_tool.policies import HtmlWhitespaceStream
+
+    generator = ReleaseNoteGenerator(Config.from_dict({
+        "repository": {"code_repos": [{"link": "test/repo", "alias": "repo"}]}
+    }))
+    pieces = ["  # Title", "\n\n", "word", " \t ", "&nbsp;", "<br>", "<br/>", "<BR_MARKER>",
+              "<NBSP_MARKER>", "\n  ", "- item", "x", "&amp;", "<b>", "\t\n\n  "]
+    rng = random.Random(42)
+    for _ in range(200):
+        text = ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 40)))
+        expected = generator._process_html_like_whitespace(text, intermediate_pass=False)
+
+        out = io.StringIO()
+        stream = HtmlWhitespaceStream(out, generator._process_html_like_whitespace)
+        stream.FLUSH_SIZE = rng.randint(1, 8)
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 7)
+            stream.write(text[pos:pos + step])
+            pos += step
+        stream.close()
+
+        assert out.getvalue() == expected, repr(text)
+
+
+def test_pr_code_template_streams_to_file(test_config_with_release_output_template, sample_notes):
+    """Test that streaming a pr_code template writes the same content as rendering it."""
+    import io
+
+    generator = ReleaseNoteGenerator(test_config_with_release_output_template)
+    grouped = generator.group_by_category(sample_notes)
+    template = test_config_with_release_output_template.output.pr_code["repo"].templates[0].output_template
+
+    expected = generator._format_with_pr_code_template(template, grouped, "1.0.0", None, None)
+    out = io.StringIO()
+    assert generator._format_with_pr_code_template(template, grouped, "1.0.0", None, None, out=out) is None
+    assert out.getvalue() == expected
@@ -210,6 +210,29 @@ class TestCommitConsolidator:
         assert len(consolidated) == len(commits)
 
 
+    def test_indexed_commits_reuse_stored_issue_keys(self, test_config):
+        """Test that keys extracted when a commit was indexed are reused while the patterns match."""
+        from unittest.mock import patch
+
+        extractor = IssueExtractor(test_config)
+        consolidator = CommitConsolidator(test_config, extractor)
+        indexed = Commit(sha="1", repo_id=1, message="ISSUE-1: Part 1", author=Author(name="dev"),
+                         date=datetime.now())
+        extractor.index_commit(indexed)
+        assert indexed.issue_keys == ["1"]
+        from_git = Commit(sha="2", repo_id=1, message="ISSUE-1: Part 2", author=Author(name="dev"),
+                          date=datetime.now())
+        stale = Commit(sha="3", repo_id=1, message="ISSUE-2: Part 1", author=Author(name="dev"),
+                       date=datetime.now(), issue_keys=["9"], issue_patterns_key="other patterns")
+
+        with patch.object(extractor, 'extract_from_commit', wraps=extractor.extract_from_commit) as extract:
+            consolidated = consolidator.consolidate([indexed, from_git, stale], {})
+
+        # Only the commit from git and the one indexed with other patterns are extracted again
+        assert [call.args[0].sha for call in extract.call_args_list] == ["2", "3"]
+        assert {c.issue_key: [commit.sha for commit in c.commits] for c in consolidated} == {"1": ["1", "2"], "2": ["3"]}
+
+
 class TestReleaseNoteGenerator:
     """Tests for release note generation."""
 
@@ -1364,3 +1387,46 @@ Also should not be included."""
         assert "Testing" not in note.migration_notes
         assert "Testing section" not in note.migration_notes
         assert "Tasks" not in note.migration_notes
+
+
+class TestCompiledPolicy:
+    """Tests for the precompiled policy engine."""
+
+    def test_policy_shared_across_instances(self, test_config):
+        """Test that extractors and generators for one config share the compiled policy."""
+        from release_tool.policies import compile_policy
+
+        policy = compile_policy(test_config)
+        assert IssueExtractor(test_config).policy is policy
+        assert ReleaseNoteGenerator(test_config).policy is policy
+
+    def test_extraction_is_memoized(self, test_config):
+        """Test that extraction results are cached per strategy and text."""
+        from release_tool.config import IssueExtractionStrategy
+        from release_tool.policies import compile_policy
+
+        policy = compile_policy(test_config)
+        first = policy.matches_for(IssueExtractionStrategy.COMMIT_MESSAGE, "Fix #9876 memo")
+        second = policy.matches_for(IssueExtractionStrategy.COMMIT_MESSAGE, "Fix #9876 memo")
+        assert first is second
+        assert "9876" in policy.extract(IssueExtractionStrategy.COMMIT_MESSAGE, "Fix #9876 memo")
+
+    def test_category_lookup_respects_order_and_prefixes(self):
+        """Test that the label lookup matches the first category in config order."""
+        from release_tool.policies import compile_policy
+
+        config = Config.from_dict({
+            "repository": {"code_repos": [{"link": "test/repo", "alias": "repo"}]},
+            "release_notes": {
+                "categories": [
+                    {"name": "Breaking", "labels": ["pr:breaking"], "order": 1},
+                    {"name": "Bugs", "labels": ["bug", "issue:breaking"], "order": 2},
+                    {"name": "Misc", "labels": [], "order": 3, "alias": "other"},
+                ]
+            }
+        })
+        policy = compile_policy(config)
+
+        assert policy.category_for(["bug"], ["breaking"]) == "Breaking"
+        assert policy.category_for(["breaking"], []) == "Bugs"
+        assert policy.category_for([], ["unknown"]) == "Misc"
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the span/counter instrumentation and the --profile option."""
+
+import json
+import pstats
+import threading
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from benchmarks.github_simulator import GitHubSimulator, SimulatedRepository
+from helpers.config_helpers import create_test_config, write_config_file
+from release_tool import metrics, profiling
+from release_tool.config import Config
+from release_tool.db import Database
+from release_tool.main import cli
+from release_tool.migrations import MigrationManager
+from release_tool.models import Repository
+
+
+@pytest.fixture
+def profiler():
+    profiler = profiling.start()
+    yield profiler
+    profiling.stop()
+
+
+def test_hooks_are_no_ops_without_a_profiler():
+    """Test that spans, timers and counters do nothing while profiling is off."""
+    assert profiling.active() is None
+
+    @profiling.timed('double')
+    def double(value):
+        return value * 2
+
+    with profiling.span('idle') as span:
+        assert double(2) == 4
+    profiling.count('db', 'SELECT')
+    profiling.cache('config', hits=1)
+    assert span is profiling.span('other')
+
+
+def test_spans_aggregate_with_self_time(profiler):
+    """Test nesting, self time, counters, caches and the Chrome trace layout."""
+    @profiling.timed()
+    def inner():
+        profiling.count('db', 'SELECT', 2)
+
+    with profiling.span('outer', policy='default'):
+        inner()
+        inner()
+    worker = threading.Thread(target=inner, name='worker')
+    worker.start()
+    worker.join()
+    profiling.cache('config', hits=3, misses=1)
+
+    summary = profiler.summary()
+    outer = summary['stages']['outer']
+    inner_stage = summary['stages'][inner.__qualname__]
+    assert (outer['calls'], inner_stage['calls']) == (1, 3)
+    assert outer['self'] == pytest.approx(outer['total'] - 2 / 3 * inner_stage['total'], abs=1e-3)
+    assert summary['counters']['db'] == {'SELECT': 6}
+    assert summary['caches']['config'] == {'hits': 3, 'misses': 1, 'hit_rate': 0.75}
+
+    trace = profiler.trace(['generate', '1.0.0'])
+    events = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+    assert [event['ts'] for event in events] == sorted(event['ts'] for event in events)
+    assert events[0]['name'] == 'outer' and events[0]['args'] == {'policy': 'default'}
+    thread_names = {event['args']['name'] for event in trace['traceEvents'] if event['name'] == 'thread_name'}
+    assert {'MainThread', 'worker'} <= thread_names
+    assert trace['otherData']['command'] == ['generate', '1.0.0']
+
+
+@pytest.mark.parametrize("url,endpoint", [
+    ("https://api.github.com/repos/org/repo/issues/12", "/repos/{repo}/issues/{n}"),
+    ("https://api.github.com/repos/org/repo/pulls?state=closed&page=3", "/repos/{repo}/pulls"),
+    ("https://api.github.com/repos/org/repo/git/refs/heads/release/1.2", "/repos/{repo}/git/refs/{ref}"),
+    ("https://api.github.com/repos/org/repo/releases/tags/v1.0.0", "/repos/{repo}/releases/tags/{tag}"),
+    ("https://ghe.example.com/api/v3/repos/org/repo/contents/docs/notes.md", "/api/v3/repos/{repo}/contents/{path}"),
+    ("https://api.github.com/graphql", "/graphql"),
+])
+def test_endpoint_templates(url, endpoint):
+    """Test that request URLs are grouped by endpoint."""
+    assert profiling.endpoint_of(url) == endpoint
+
+
+def test_database_statements_and_rows(profiler, tmp_path):
+    """Test that Database connections report statements, rows read and rows written."""
+    db = Database(str(tmp_path / "profile.db"))
+    db.connect()
+    db.upsert_repository(Repository(owner="org", name="repo"))
+    db.upsert_repository(Repository(owner="org", name="other"))
+    assert db.get_repository("org/repo").full_name == "org/repo"
+    db.close()
+
+    counters = profiler.summary()['counters']
+    assert counters['db']['SELECT'] >= 1
+    assert counters['db']['INSERT'] >= 2
+    assert counters['db_rows']['read'] >= 1
+    assert counters['db_rows']['written'] >= 2
+
+
+def test_api_calls_per_endpoint(profiler, tmp_path):
+    """Test that HTTP requests are counted per endpoint, with conditional hits as a cache."""
+    with GitHubSimulator([SimulatedRepository("org/repo", issues=3)]) as simulator:
+        metrics.begin_run('pull')
+        config = Config.from_dict(create_test_config("org/repo", github={'api_url': simulator.url}))
+        metrics.track_api_usage(config)
+        headers = {'Authorization': 'token simulated'}
+        first = requests.get(f"{simulator.url}/repos/org/repo/issues/1", headers=headers)
+        requests.get(f"{simulator.url}/repos/org/repo/issues/2", headers=headers)
+        requests.get(f"{simulator.url}/repos/org/repo/issues/1",
+                     headers={**headers, 'If-None-Match': first.headers['ETag']})
+        metrics.finish_run(str(tmp_path / "missing.db"))
+
+    summary = profiler.summary()
+    assert summary['counters']['api'] == {'GET /repos/{repo}/issues/{n}': 3}
+    assert summary['counters']['api_status'] == {'200': 2, '304': 1}
+    assert summary['caches']['github.conditional']['hits'] == 1
+    assert summary['stages']['GET /repos/{repo}/issues/{n}']['category'] == 'http'
+
+    profiling.stop()
+    assert requests.Session.send.__name__ == 'send'
+    assert requests.Session.send.__module__.startswith('requests')
+
+
+def test_profile_option_writes_trace_and_pstats(tmp_path):
+    """Test that --profile writes a Chrome trace and --profile-pstats a cProfile dump."""
+    config_path = tmp_path / "release_tool.toml"
+    db_path = tmp_path / "release_tool.db"
+    write_config_file(config_path, create_test_config(
+        config_version=MigrationManager.CURRENT_VERSION, database={'path': str(db_path)}
+    ))
+    db = Database(str(db_path))
+    db.connect()
+    db.close()
+    trace_path = tmp_path / "trace.json"
+    pstats_path = tmp_path / "run.pstats"
+
+    result = CliRunner().invoke(cli, [
+        '--config', str(config_path), '--profile', str(trace_path),
+        '--profile-pstats', str(pstats_path), 'issues', '1'
+    ])
+
+    assert profiling.active() is None
+    trace = json.loads(trace_path.read_text())
+    names = {event['name'] for event in trace['traceEvents']}
+    assert {'release-tool', 'config.load'} <= names
+    summary = trace['otherData']['summary']
+    assert summary['stages']['release-tool']['calls'] == 1
+    assert summary['counters']['db']['SELECT'] >= 1
+    assert pstats.Stats(str(pstats_path)).total_calls > 0
+    report = " ".join(result.stderr.split())
+    assert "Profile (" in report and f"Trace written to {trace_path}" in report
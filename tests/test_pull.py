@@ -319,3 +319,194 @@ def test_parallel_workers_config():
 
     sync_manager = PullManager(config, mock_db, mock_github)
     assert sync_manager.parallel_workers == 20
+
+
+def test_pr_and_issue_conversion_from_raw_payload(test_config):
+    """Test that ingest converts raw GitHub payloads without pydantic validation."""
+    from types import SimpleNamespace
+
+    client = GitHubClient(test_config)
+    user = {"login": "dev", "id": 7, "avatar_url": None, "html_url": None, "type": "User"}
+    gh_pr = SimpleNamespace(_rawData={
+        "number": 12,
+        "title": "Add feature",
+        "body": "Body",
+        "state": "closed",
+        "merged_at": "2024-03-01T10:00:00Z",
+        "user": user,
+        "base": {"ref": "main"},
+        "head": {"ref": "feat/1", "sha": "abc"},
+        "labels": [{"name": "feature", "color": "00ff00", "description": None}],
+        "html_url": "https://github.com/sequentech/step/pull/12",
+    })
+    gh_issue = SimpleNamespace(_rawData={
+        "number": 5,
+        "title": "Issue",
+        "state": "open",
+        "labels": [],
+        "created_at": "2024-02-01T09:30:00Z",
+        "closed_at": None,
+    })
+
+    pr = client._pr_to_model(gh_pr, repo_id=1)
+    issue = client._issue_to_issue(gh_issue, repo_id=2)
+
+    assert pr.merged_at == datetime.fromisoformat("2024-03-01T10:00:00+00:00")
+    assert pr.author.username == "dev"
+    assert pr.labels[0].name == "feature"
+    assert issue.key == "5"
+    assert issue.created_at.year == 2024
+    assert issue.closed_at is None
+    assert issue.tags == {}
+
+
+def test_index_commits_is_incremental(test_config, test_db, mock_github, tmp_path):
+    """Test that pull indexes only commits not reachable from previously indexed heads."""
+    from datetime import timezone
+    from git import Repo
+    from release_tool.models import Repository
+    from helpers.git_helpers import init_git_repo, create_commit
+
+    date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    origin = init_git_repo(tmp_path / "origin")
+    create_commit(origin, "Add feature", pr_number=10, date=date)
+    create_commit(origin, "Fix #42 crash", date=date)
+
+    clone_path = tmp_path / "clone"
+    Repo.clone_from(str(tmp_path / "origin"), str(clone_path))
+    repo_id = test_db.upsert_repository(Repository(owner="sequentech", name="step"))
+
+    manager = PullManager(test_config, test_db, mock_github)
+    assert manager._index_commits_for_repo("sequentech/step", str(clone_path)) == 3
+
+    commits = test_db.get_commits_by_repo(repo_id)
+    by_message = {c.message.strip(): c for c in commits}
+    assert by_message["Add feature (#10)"].pr_number == 10
+
+    # Nothing new: branch head unchanged
+    assert manager._index_commits_for_repo("sequentech/step", str(clone_path)) == 0
+
+    # New commit on the remote branch and a new branch: only new commits are read
+    create_commit(origin, "Another change", date=date)
+    origin.create_head("release/1.0")
+    Repo(str(clone_path)).remotes.origin.fetch()
+    assert manager._index_commits_for_repo("sequentech/step", str(clone_path)) == 1
+    assert set(test_db.get_commit_index_heads(repo_id)) == {"origin/main", "origin/release/1.0"}
+
+    head_sha = origin.head.commit.hexsha
+    indexed = test_db.get_commits_by_shas(repo_id, [head_sha, "0" * 40])
+    assert list(indexed) == [head_sha]
+
+
+def test_sync_metadata_keeps_one_row_per_entity_type(test_db):
+    """Test that pull metadata of different entity types and the watch state coexist."""
+    test_db.update_pull_metadata("sequentech/step", "issues")
+    test_db.update_pull_metadata("sequentech/step", "pull_requests")
+    test_db.update_watch_state("sequentech/step", etag='"abc"', last_event_id="10", poll_interval=60)
+
+    assert test_db.get_last_pull("sequentech/step", "issues") is not None
+    assert test_db.get_last_pull("sequentech/step", "pull_requests") is not None
+    state = test_db.get_watch_state("sequentech/step")
+    assert state['etag'] == '"abc"'
+    assert state['last_event_id'] == "10"
+    assert state['poll_interval'] == 60
+
+
+def test_watch_refreshes_only_touched_objects(test_config, test_db, mock_github):
+    """Test that watch uses ETags, honors X-Poll-Interval and refreshes only what events touched."""
+    from release_tool.models import Repository, Release
+
+    for full_name in ("sequentech/step", "sequentech/meta"):
+        owner, name = full_name.split('/')
+        test_db.upsert_repository(Repository(owner=owner, name=name))
+
+    feeds = {
+        "sequentech/meta": [
+            # First poll (state unknown): only recorded, nothing replayed
+            (200, [{"id": "5", "type": "IssuesEvent", "payload": {"issue": {"number": 1}}}], '"m1"', 60),
+            (200, [
+                {"id": "7", "type": "IssueCommentEvent", "payload": {"issue": {"number": 2}}},
+                {"id": "6", "type": "IssuesEvent", "payload": {"issue": {"number": 2}}},
+                {"id": "5", "type": "IssuesEvent", "payload": {"issue": {"number": 1}}},
+            ], '"m2"', 90),
+        ],
+        "sequentech/step": [
+            (200, [], '"s1"', 60),
+            (200, [
+                {"id": "9", "type": "PullRequestEvent", "payload": {"number": 12}},
+                {"id": "8", "type": "ReleaseEvent", "payload": {"release": {"id": 77}}},
+            ], '"s2"', 60),
+        ],
+    }
+    requests_seen = []
+
+    def fetch_events(repo_full_name, etag=None):
+        requests_seen.append((repo_full_name, etag))
+        pending = feeds[repo_full_name]
+        return pending.pop(0) if pending else (304, [], etag, 60)
+
+    mock_github.fetch_repository_events.side_effect = fetch_events
+    mock_github.refetch_issue.side_effect = lambda repo, number, repo_id: Issue(
+        repo_id=repo_id, number=number, key=str(number), title=f"Issue {number}", state="open"
+    )
+    mock_github.refetch_pull_request.side_effect = lambda repo, number, repo_id: PullRequest(
+        repo_id=repo_id, number=number, title="PR", state="closed", merged_at=datetime(2024, 1, 1)
+    )
+    mock_github.refetch_release.side_effect = lambda repo, release_id, repo_id: Release(
+        repo_id=repo_id, version="1.0.0", tag_name="v1.0.0"
+    )
+    sleeps = []
+
+    manager = PullManager(test_config, test_db, mock_github)
+    totals = manager.watch(max_polls=3, sleep=sleeps.append)
+
+    # Issue #2 touched twice, refreshed once; issue #1 was before the watch started
+    mock_github.refetch_issue.assert_called_once_with("sequentech/meta", 2, test_db.get_repository_id("sequentech/meta"))
+    mock_github.refetch_pull_request.assert_called_once()
+    mock_github.refetch_release.assert_called_once()
+    assert totals == {
+        'polls': 3, 'not_modified': 2, 'issues': 1, 'pull_requests': 1, 'releases': 1, 'commits': 0
+    }
+    # Stored ETags are sent back, and the longest X-Poll-Interval is honored
+    assert ("sequentech/meta", '"m2"') in requests_seen
+    assert sleeps == [60, 90]
+
+    # State survives in sync_metadata for the next watcher
+    state = test_db.get_watch_state("sequentech/meta")
+    assert state['etag'] == '"m2"'
+    assert state['last_event_id'] == "7"
+    assert test_db.get_issue(test_db.get_repository_id("sequentech/meta"), "2").title == "Issue 2"
+
+
+def test_legacy_sync_metadata_is_rebuilt(tmp_path):
+    """Test that databases with the old per-repository UNIQUE constraint are migrated."""
+    import sqlite3
+
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE sync_metadata (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            repo_full_name TEXT NOT NULL UNIQUE,
+            entity_type TEXT NOT NULL,
+            last_sync_at TEXT NOT NULL,
+            cutoff_date TEXT,
+            total_fetched INTEGER DEFAULT 0,
+            UNIQUE(repo_full_name, entity_type)
+        )
+    """)
+    conn.execute(
+        "INSERT INTO sync_metadata (repo_full_name, entity_type, last_sync_at) VALUES (?, ?, ?)",
+        ("sequentech/step", "pull_requests", "2024-01-01T00:00:00")
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(str(db_path))
+    db.connect()
+    try:
+        db.update_pull_metadata("sequentech/step", "issues")
+        assert db.get_last_pull("sequentech/step", "pull_requests") == datetime(2024, 1, 1)
+        assert db.get_last_pull("sequentech/step", "issues") is not None
+    finally:
+        db.close()
@@ -14,7 +14,7 @@ from release_tool.config import Config
 
 
 @pytest.fixture
-def test_config():
+def test_config(tmp_path):
     """Create a test configuration."""
     config_dict = {
         "repository": {
@@ -23,6 +23,9 @@ def test_config():
         "github": {
             "token": "test_token"
         },
+        "database": {
+            "path": str(tmp_path / "release_tool.db")
+        },
         "output": {
             "create_github_release": False,
             "create_pr": False,
@@ -1169,3 +1172,189 @@ def test_existing_untagged_release_with_force_updates(mock_gh_client, mock_strat
     
     # Verify update_release was called (which will internally delete and recreate)
     mock_gh_instance.update_release.assert_called_once()
+
+
+@patch("release_tool.commands.push.time.sleep")
+@patch("release_tool.commands.push._find_draft_releases")
+@patch("release_tool.commands.push.GitOperations")
+@patch("release_tool.commands.push.determine_release_branch_strategy")
+@patch("release_tool.commands.push.GitHubClient")
+def test_failed_push_resumes_after_finished_steps(mock_gh_client, mock_strategy, mock_git_ops, mock_find_drafts,
+                                                  mock_sleep, test_config, test_notes_file, tmp_path):
+    """Test that rerunning a failed push skips the steps it already finished."""
+    from release_tool.config import PRCodeConfig, PRCodeTemplateConfig
+    from release_tool.db import Database
+
+    test_config.database.path = str(tmp_path / "release_tool.db")
+    test_config.output.pr_code = {
+        "repo": PRCodeConfig(templates=[
+            PRCodeTemplateConfig(output_template="# Release {{ version }}", output_path="RELEASE.md")
+        ])
+    }
+    draft = tmp_path / "1.0.0-code-0.md"
+    draft.write_text("# Release 1.0.0")
+    mock_find_drafts.return_value = [draft]
+
+    mock_git_instance = MagicMock()
+    mock_git_ops.return_value = mock_git_instance
+    mock_git_instance.get_version_tags.return_value = []
+    mock_git_instance.tag_exists.return_value = False
+    mock_strategy.return_value = ("release/1.0", "main", False)
+
+    mock_gh_instance = MagicMock()
+    mock_gh_client.return_value = mock_gh_instance
+    mock_gh_instance.get_release_by_tag.return_value = None
+    mock_gh_instance.create_release.return_value = "https://github.com/test/repo/releases/tag/v1.0.0"
+    mock_gh_instance.create_pr_for_release_notes.side_effect = [
+        RuntimeError("Service unavailable"), "https://github.com/test/repo/pull/7"
+    ]
+    mock_gh_instance.create_issue.return_value = {'number': '9', 'url': "https://github.com/test/repo/issues/9"}
+    mock_gh_instance.get_authenticated_user.return_value = "release-bot"
+
+    args = ['1.0.0', '-f', str(test_notes_file), '--release', '--pr']
+    runner = CliRunner()
+
+    result = runner.invoke(push, args, obj={'config': test_config})
+    assert result.exit_code == 1
+    assert "Rerun the same command to resume" in " ".join(result.output.split())
+
+    result = runner.invoke(push, args, obj={'config': test_config})
+    assert result.exit_code == 0, result.output
+    assert "Resuming push of 1.0.0" in result.output
+    # The tag (and the release, if it finished before the PR failed) is not redone
+    mock_gh_instance.create_release.assert_called_once()
+    mock_git_instance.create_tag.assert_called_once()
+    assert mock_gh_instance.create_pr_for_release_notes.call_count == 2
+    mock_gh_instance.assign_issue.assert_called_once()
+
+    # A finished push leaves nothing to resume
+    db = Database(test_config.database.path)
+    db.connect()
+    assert db.conn.execute("SELECT COUNT(*) FROM push_journal").fetchone()[0] == 0
+    db.close()
+
+
+@patch("release_tool.commands.push.time.sleep")
+@patch("release_tool.commands.push._find_draft_releases")
+@patch("release_tool.commands.push.GitOperations")
+@patch("release_tool.commands.push.determine_release_branch_strategy")
+@patch("release_tool.commands.push.GitHubClient")
+def test_unchanged_push_skips_github_writes(mock_gh_client, mock_strategy, mock_git_ops, mock_find_drafts,
+                                            mock_sleep, test_config, test_notes_file, tmp_path):
+    """Test that pushing the same content again skips the release, PR and issue calls."""
+    from release_tool.config import PRCodeConfig, PRCodeTemplateConfig
+
+    test_config.database.path = str(tmp_path / "release_tool.db")
+    test_config.output.pr_code = {
+        "repo": PRCodeConfig(templates=[
+            PRCodeTemplateConfig(output_template="# Release {{ version }}", output_path="RELEASE.md")
+        ])
+    }
+    draft = tmp_path / "1.0.0-code-0.md"
+    draft.write_text("# Release 1.0.0")
+    mock_find_drafts.return_value = [draft]
+
+    mock_git_instance = MagicMock()
+    mock_git_ops.return_value = mock_git_instance
+    mock_git_instance.get_version_tags.return_value = []
+    mock_git_instance.tag_exists.return_value = True
+    mock_strategy.return_value = ("release/1.0", "main", False)
+
+    mock_gh_instance = MagicMock()
+    mock_gh_client.return_value = mock_gh_instance
+    mock_gh_instance.get_release_by_tag.return_value = None
+    mock_gh_instance.create_release.return_value = "https://github.com/test/repo/releases/tag/v1.0.0"
+    mock_gh_instance.update_release.return_value = "https://github.com/test/repo/releases/tag/v1.0.0"
+    mock_gh_instance.create_pr_for_release_notes.return_value = "https://github.com/test/repo/pull/7"
+    mock_gh_instance.create_issue.return_value = {'number': '9', 'url': "https://github.com/test/repo/issues/9"}
+    mock_gh_instance.get_authenticated_user.return_value = "release-bot"
+
+    args = ['1.0.0', '-f', str(test_notes_file), '--release', '--pr', '--force', 'draft']
+    runner = CliRunner()
+
+    result = runner.invoke(push, args, obj={'config': test_config})
+    assert result.exit_code == 0, result.output
+    mock_gh_instance.reset_mock()
+    mock_sleep.reset_mock()
+
+    result = runner.invoke(push, args, obj={'config': test_config})
+    assert result.exit_code == 0, result.output
+    assert "unchanged since the last push" in result.output
+    mock_gh_instance.get_release_by_tag.assert_not_called()
+    mock_gh_instance.create_release.assert_not_called()
+    mock_gh_instance.update_release.assert_not_called()
+    mock_gh_instance.create_pr_for_release_notes.assert_not_called()
+    mock_gh_instance.update_issue.assert_not_called()
+    mock_gh_instance.assign_issue.assert_not_called()
+    mock_sleep.assert_not_called()
+
+    # Changed notes are written again
+    test_notes_file.write_text(test_notes_file.read_text() + "\n- One more change\n")
+    mock_gh_instance.get_release_by_tag.return_value = MagicMock(html_url="https://github.com/test/repo/releases/tag/v1.0.0")
+    result = runner.invoke(push, args, obj={'config': test_config})
+    assert result.exit_code == 0, result.output
+    mock_gh_instance.update_release.assert_called_once()
+    mock_gh_instance.create_pr_for_release_notes.assert_not_called()
+
+
+def test_fresh_release_plan_skips_fetch_and_branch_strategy(test_config, test_notes_file, tmp_path, monkeypatch):
+    """Test that push reuses generate's plan while its refs are fresh."""
+    from datetime import datetime
+    from release_tool.release_plan import plan_path, write_plan
+
+    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
+
+    with patch('release_tool.commands.push.GitHubClient') as mock_gh_client, \
+         patch('release_tool.commands.push.GitOperations') as mock_git_ops, \
+         patch('release_tool.commands.push.determine_release_branch_strategy') as mock_strategy, \
+         patch('release_tool.commands.push.Database') as mock_db_class:
+
+        write_plan(plan_path(test_config, 'repo', '0.0.1-rc.0'), {
+            'repo': 'test/repo',
+            'version': '0.0.1-rc.0',
+            'release_branch': 'release/0.0',
+            'source_branch': 'main',
+            'should_create_branch': True,
+            'head_ref': 'main',
+            'head_sha': 'abc123',
+            'refs_fetched_at': datetime.now().isoformat(),
+            'drafts': [],
+        })
+
+        mock_db_class.return_value.get_repository.return_value = None
+        mock_git_instance = MagicMock()
+        mock_git_ops.return_value = mock_git_instance
+        mock_git_instance.repo.commit.return_value.hexsha = 'abc123'
+        mock_git_instance.tag_exists.return_value = False
+        mock_git_instance.branch_exists.return_value = False
+        mock_gh_instance = MagicMock()
+        mock_gh_client.return_value = mock_gh_instance
+        mock_gh_instance.get_release_by_tag.return_value = None
+
+        result = runner.invoke(
+            push,
+            ['0.0.1-rc.0', '-f', str(test_notes_file), '--release'],
+            obj={'config': test_config}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Using the release plan from generate" in result.output
+        mock_git_instance.fetch_remote_refs.assert_not_called()
+        mock_strategy.assert_not_called()
+        mock_git_instance.create_branch.assert_called_once_with("release/0.0", "main")
+
+        # Once the head moved, the plan is stale and push works the branches out again
+        mock_git_instance.repo.commit.return_value.hexsha = 'def456'
+        mock_git_instance.create_branch.reset_mock()
+        mock_strategy.return_value = ("release/0.0", "main", False)
+
+        result = runner.invoke(
+            push,
+            ['0.0.1-rc.0', '-f', str(test_notes_file), '--release', '--no-skip-unchanged'],
+            obj={'config': test_config}
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_git_instance.fetch_remote_refs.assert_called()
+        mock_strategy.assert_called()
@@ -250,6 +250,29 @@ class TestQueryIssuesDatabase:
         # Should have 2 fewer issues
         assert len(issues_offset) == total - 2
 
+    def test_query_keyset_pagination(self, test_db):
+        """Test paging with an after-cursor walks every issue exactly once."""
+        db, _, _ = test_db
+
+        all_issues = db.query_issues(limit=None)
+        seen = []
+        cursor = None
+        while True:
+            page = db.query_issues(limit=2, after=cursor)
+            if not page:
+                break
+            seen.extend(issue.id for issue in page)
+            cursor = Database.encode_issue_cursor(page[-1])
+
+        assert seen == [issue.id for issue in all_issues]
+
+    def test_query_starts_with_is_literal_prefix(self, test_db):
+        """Test starts_with matches the prefix literally (LIKE wildcards are not special)."""
+        db, _, _ = test_db
+
+        assert db.query_issues(starts_with="8_", limit=100) == []
+        assert {t.number for t in db.query_issues(starts_with="11", limit=100)} == {1124}
+
     def test_query_limit_and_offset(self, test_db):
         """Test combined pagination."""
         db, _, _ = test_db
@@ -1009,3 +1032,43 @@ path = "{db_copy_path}"
         # Cleanup
         db.close()
         Path(db_path).unlink()
+
+
+def test_json_format_streams_all_issues(tmp_path, test_db):
+    """Test --format json with --limit 0 exports every issue as a JSON array."""
+    import json
+    import shutil
+
+    db, _, _ = test_db
+    db_copy_path = tmp_path / "release_tool.db"
+    shutil.copy(db.db_path, db_copy_path)
+
+    config_file = tmp_path / "test_config.toml"
+    config_file.write_text(f"""
+config_version = "1.10"
+
+[repository]
+code_repos = [
+    {{link = "test/repo", alias = "repo"}}
+]
+
+[github]
+token = "fake-token"
+
+[database]
+path = "{db_copy_path}"
+""")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        '--config', str(config_file),
+        'issues',
+        '--limit', '0',
+        '--format', 'json'
+    ])
+
+    assert result.exit_code == 0
+    exported = json.loads(result.output)
+    assert len(exported) == 6
+    assert exported[0]['key'] == "1124"
+    assert exported[0]['labels'] == ["security", "high-priority"]
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for the release plans shared by generate and push."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from release_tool.commands.push import _find_draft_releases
+from release_tool.config import Config
+from release_tool.release_plan import (
+    REFS_MAX_AGE, content_hash, draft_paths, edited_drafts, load_plans, plan_path, refs_are_fresh, write_plan
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Configuration with two code repositories and drafts under tmp_path."""
+    return Config.from_dict({
+        "repository": {
+            "code_repos": [{"link": "test/app", "alias": "app"}, {"link": "test/lib", "alias": "lib"}]
+        },
+        "github": {"token": "test_token"},
+        "output": {
+            "draft_output_path": str(tmp_path) + "/{{code_repo.current.slug}}/{{version}}-{{output_file_type}}.md"
+        }
+    })
+
+
+def _plan(tmp_path, repo='test/app', version='1.2.0', **fields):
+    draft = tmp_path / 'test-app' / f'{version}-code.md'
+    draft.parent.mkdir(parents=True, exist_ok=True)
+    draft.write_text("# Notes")
+    plan = {
+        'repo': repo,
+        'version': version,
+        'release_branch': 'release/1.2',
+        'source_branch': 'main',
+        'should_create_branch': False,
+        'head_ref': 'release/1.2',
+        'head_sha': 'abc123',
+        'refs_fetched_at': datetime.now().isoformat(),
+        'drafts': [{'path': str(draft), 'sha256': content_hash("# Notes")}],
+    }
+    plan.update(fields)
+    return plan
+
+
+def test_plan_sits_next_to_the_drafts(config, tmp_path):
+    """Test that a plan's path follows the draft template and is not taken for a draft."""
+    path = plan_path(config, 'app', '1.2.0')
+    assert path == tmp_path / 'test-app' / '1.2.0-plan.json'
+
+    write_plan(path, _plan(tmp_path))
+
+    assert _find_draft_releases(config, version_filter='1.2.0') == [tmp_path / 'test-app' / '1.2.0-code.md']
+
+
+def test_load_plans_keeps_matching_plans(config, tmp_path):
+    """Test that plans of another version or repository are ignored."""
+    write_plan(plan_path(config, 'app', '1.2.0'), _plan(tmp_path))
+    write_plan(plan_path(config, 'lib', '1.2.0'), _plan(tmp_path, repo='test/app'))
+    plan_path(config, 'lib', '1.3.0').write_text("{not json")
+
+    plans = load_plans(config, '1.2.0')
+
+    assert list(plans) == ['app']
+    assert plans['app']['plan_version'] == 1
+    assert load_plans(config, '1.3.0') == {}
+
+
+def test_drafts_from_plan(config, tmp_path):
+    """Test that drafts come from the plan, stay valid when edited and fall back when missing."""
+    plan = _plan(tmp_path)
+    draft = tmp_path / 'test-app' / '1.2.0-code.md'
+
+    assert draft_paths(plan) == [draft]
+    assert _find_draft_releases(config, '1.2.0', 'app', plans={'app': plan}) == [draft]
+    assert edited_drafts(plan) == []
+
+    draft.write_text("# Edited notes")
+    assert edited_drafts(plan) == [str(draft)]
+
+    draft.unlink()
+    assert draft_paths(plan) is None
+
+
+def test_refs_are_fresh(tmp_path):
+    """Test that a plan is trusted only while its refs are recent and the head has not moved."""
+    plan = _plan(tmp_path)
+    git_ops = MagicMock()
+    git_ops.repo.commit.return_value.hexsha = 'abc123'
+    fetched_at = datetime.fromisoformat(plan['refs_fetched_at'])
+
+    assert refs_are_fresh(plan, git_ops)
+    git_ops.repo.commit.assert_called_once_with('release/1.2')
+    assert not refs_are_fresh(plan, git_ops, now=fetched_at + REFS_MAX_AGE)
+    assert not refs_are_fresh(plan, git_ops, now=fetched_at - timedelta(minutes=1))
+    assert not refs_are_fresh({**plan, 'refs_fetched_at': None}, git_ops)
+
+    git_ops.repo.commit.return_value.hexsha = 'def456'
+    assert not refs_are_fresh(plan, git_ops)
+
+    git_ops.repo.commit.side_effect = ValueError("unknown ref")
+    assert not refs_are_fresh(plan, git_ops)
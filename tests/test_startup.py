@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for CLI startup cost (lazy subcommand loading)."""
+
+import json
+import subprocess
+import sys
+
+from release_tool.main import cli, LAZY_COMMANDS
+
+# Wall-clock budget for importing the CLI and printing the top-level help
+STARTUP_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = ('github', 'git', 'requests', 'tomlkit')
+
+
+def _run_cli(args, cwd=None):
+    """Run the CLI in a fresh interpreter; return (elapsed seconds, loaded module names)."""
+    code = f"""
+import json, sys, time
+start = time.perf_counter()
+from release_tool.main import cli
+try:
+    cli({args!r}, obj={{}})
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, cwd=cwd, check=True
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return data['elapsed'], set(data['modules'])
+
+
+def test_help_imports_no_commands():
+    """Test that the top-level help loads no command module or heavy dependency."""
+    elapsed, modules = _run_cli(['-h'])
+
+    assert not [m for m in modules if m.startswith('release_tool.commands.')]
+    assert not [m for m in HEAVY_MODULES if m in modules]
+    assert elapsed < STARTUP_BUDGET_SECONDS, f"startup took {elapsed:.3f}s"
+
+
+def test_offline_commands_skip_github_and_git(tmp_path):
+    """Test that database-only commands do not import PyGithub, GitPython or requests."""
+    from release_tool.migrations import MigrationManager
+
+    config_path = tmp_path / "release_tool.toml"
+    config_path.write_text(
+        f'config_version = "{MigrationManager.CURRENT_VERSION}"\n'
+        '[repository]\n'
+        'code_repos = [{link = "test/repo", alias = "repo"}]\n'
+        '[database]\n'
+        f'path = "{tmp_path / "test.db"}"\n'
+    )
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps({
+        'action': 'opened',
+        'issue': {'number': 1, 'title': 'New', 'state': 'open'},
+        'repository': {'full_name': 'test/repo', 'name': 'repo', 'owner': {'login': 'test'}},
+    }))
+
+    for args in (['issues', '--limit', '1'], ['list-releases'], ['ingest-event', str(event_path)], ['status']):
+        _, modules = _run_cli(['-c', str(config_path)] + args, cwd=tmp_path)
+        assert f"release_tool.commands.{args[0].replace('-', '_')}" in modules
+        assert not [m for m in HEAVY_MODULES if m in modules], args
+
+
+def test_lazy_commands_resolve():
+    """Test that every registered subcommand can be loaded."""
+    ctx = cli.make_context('release-tool', ['-h'], resilient_parsing=True)
+    for name in LAZY_COMMANDS:
+        command = cli.get_command(ctx, name)
+        assert command is not None
+        assert command.name == name
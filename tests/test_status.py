@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2025 Sequent Tech Inc <legal@sequentech.io>
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for run metrics and the status command."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.github_simulator import GitHubSimulator, SimulatedRepository
+from helpers.config_helpers import create_test_config, write_config_file
+from release_tool import metrics, profiling
+from release_tool.config import Config
+from release_tool.db import Database
+from release_tool.main import cli
+from release_tool.migrations import MigrationManager
+from release_tool.models import Repository
+from release_tool.template_utils import configure_bytecode_cache, render_template
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "release_tool.db"
+    db = Database(str(path))
+    db.connect()
+    db.close()
+    return path
+
+
+def test_run_records_api_usage_and_caches(monkeypatch, db_path):
+    """Test that a run stores its API calls, 304s, rate limit and cache deltas."""
+    from release_tool.github_utils import GitHubClient
+
+    monkeypatch.setenv('GITHUB_TOKEN', 'simulated-token')
+    repository = SimulatedRepository("test/meta", issues=3)
+    with GitHubSimulator([repository], rate_limit=100) as simulator:
+        config = Config.from_dict(create_test_config("test/meta", github={'api_url': simulator.url}))
+        metrics.begin_run('pull')
+        client = GitHubClient(config)
+        status, _, etag, _ = client.fetch_repository_events("test/meta")
+        assert status == 200
+        assert client.fetch_repository_events("test/meta", etag=etag)[0] == 304
+        # Requests to other hosts (media downloads) are not API calls
+        profiling.cache('media', hits=2, misses=1)
+        metrics.finish_run(str(db_path))
+
+        # Requests after the run are not tracked
+        client.fetch_repository_events("test/meta")
+
+    db = Database(str(db_path))
+    db.connect()
+    [run] = db.get_last_runs()
+    db.close()
+    assert run['command'] == 'pull'
+    assert (run['api_calls'], run['api_not_modified']) == (2, 1)
+    assert run['rate_limits']['core']['limit'] == 100
+    assert run['rate_limits']['core']['remaining'] == 99
+    assert run['caches'] == {'github.conditional': [1, 0], 'media': [2, 1]}
+
+
+def test_template_caches_are_counted(tmp_path):
+    """Test that template lookups record in-memory and bytecode cache hits."""
+    before = profiling.cache_totals()
+    template = "status {{ value }} " + tmp_path.name
+    configure_bytecode_cache(str(tmp_path / "templates"))
+    try:
+        assert render_template(template, {'value': 1}) == "status 1 " + tmp_path.name
+        assert render_template(template, {'value': 2}) == "status 2 " + tmp_path.name
+    finally:
+        configure_bytecode_cache(None)
+    after = profiling.cache_totals()
+
+    def delta(name):
+        old = before.get(name, [0, 0])
+        return [after[name][0] - old[0], after[name][1] - old[1]]
+
+    assert delta('templates') == [1, 1]
+    assert delta('templates.bytecode') == [0, 1]
+
+
+def test_status_reports_and_exports_openmetrics(tmp_path, db_path):
+    """Test the status report and its OpenMetrics textfile."""
+    db = Database(str(db_path))
+    db.connect()
+    repo_id = db.upsert_repository(Repository(owner="test", name="repo"))
+    db.update_pull_metadata("test/repo", "issues", total_fetched=12)
+    db.set_commit_index_head(repo_id, "origin/main", "a" * 40)
+    db.record_run(
+        'pull', datetime.now() - timedelta(minutes=5), 3.5, api_calls=42, api_not_modified=7,
+        rate_limits={'core': {'limit': 5000, 'remaining': 4958, 'reset': 1760000000}},
+        caches={'github.conditional': [7, 3]},
+    )
+    db.record_run('generate', datetime.now(), 0.8, caches={'templates': [9, 1]})
+    db.close()
+
+    config_path = tmp_path / "release_tool.toml"
+    write_config_file(config_path, create_test_config(
+        config_version=MigrationManager.CURRENT_VERSION, database={'path': str(db_path)}
+    ))
+    prom_path = tmp_path / "textfile" / "release_tool.prom"
+
+    result = CliRunner().invoke(cli, ['--config', str(config_path), 'status', '--openmetrics', str(prom_path)])
+
+    assert result.exit_code == 0, result.output
+    output = " ".join(result.output.split())
+    assert "test/repo" in output and "commits:origin/main" in output
+    assert "core 4958/5000" in output
+    assert "github.conditional" in output and "70%" in output
+
+    text = prom_path.read_text()
+    assert text.endswith("# EOF\n")
+    assert 'release_tool_sync_age_seconds{repo="test/repo",entity="issues"}' in text
+    assert 'release_tool_db_table_rows{table="repositories"} 1' in text
+    assert 'release_tool_last_run_api_calls{command="pull"} 42' in text
+    assert 'release_tool_rate_limit_remaining{command="pull",resource="core"} 4958' in text
+    assert 'release_tool_last_run_cache_hits{command="generate",cache="templates"} 9' in text
+    assert text.count("# TYPE release_tool_last_run_api_calls gauge") == 1
+
+    stdout = CliRunner().invoke(cli, ['--config', str(config_path), 'status', '--openmetrics', '-'])
+    assert stdout.output.startswith("# TYPE release_tool_status_timestamp_seconds gauge")
@@ -320,3 +320,41 @@ def test_build_repo_context_code_repo_list_iteration():
     template = "{% for repo in code_repo_list %}{{ repo.alias }}{% if not loop.last %},{% endif %}{% endfor %}"
     result = render_template(template, context)
     assert result == "step,docs"
+
+
+def test_get_template_compiles_once_per_source():
+    """Test that identical template sources share one compiled template."""
+    from release_tool.template_utils import get_template
+
+    first = get_template("Release {{ version }}")
+    second = get_template("Release " + "{{ version }}")
+    assert first is second
+    assert get_template("Release {{ version }}", strict=False) is not first
+
+
+def test_get_template_lenient_allows_undefined():
+    """Test that the lenient environment renders undefined variables as empty."""
+    from release_tool.template_utils import get_template
+
+    assert get_template("a{{ missing }}b", strict=False).render() == "ab"
+
+
+def test_bytecode_cache_writes_compiled_templates(tmp_path):
+    """Test that the on-disk bytecode cache stores compiled templates."""
+    from release_tool.template_utils import configure_bytecode_cache
+
+    configure_bytecode_cache(str(tmp_path / "templates"))
+    try:
+        assert render_template("Bytecode {{ version }} cached", {'version': '1.0.0'}) == "Bytecode 1.0.0 cached"
+        assert list((tmp_path / "templates").iterdir())
+    finally:
+        configure_bytecode_cache(None)
+
+
+def test_config_load_rejects_invalid_template():
+    """Test that template syntax errors are reported when the config is loaded."""
+    with pytest.raises(ValueError, match="release_notes.entry_template"):
+        Config.from_dict({
+            'repository': {'code_repos': [{'link': 'sequentech/step', 'alias': 'step'}]},
+            'release_notes': {'entry_template': '{{ title'}
+        })